@@ -0,0 +1,169 @@
+"""
+Benchmark: regex JSON extraction vs. the single-pass scanner
+
+Builds a corpus of raw model responses (saved responses from the response
+cache when there are any, plus verse files from data/ wrapped the ways
+models wrap them: plain, fenced, with preamble or trailing prose that
+contains braces, and cut off mid-object), then parses every response with
+the original regex-based parse_json_response and with the scanner-based
+one. Reports successes per shape, timings, and a seeded fuzz pass of
+random mutations checking the scanner never raises and never accepts a
+value json.loads would not produce for the same object text.
+
+Usage:
+    python -m benchmarks.bench_json_extract [--limit N] [--seed S] [--repeat R]
+"""
+
+import argparse
+import json
+import logging
+import random
+import re
+import time
+from pathlib import Path
+
+from src.gemini_client import parse_json_response
+from src.json_stream import extract_json_object
+from src.response_cache import open_response_cache
+
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+
+
+def regex_parse(response_text):
+    """The regex-based parse_json_response this benchmark replaces."""
+    if not response_text or not response_text.strip():
+        return None
+
+    text = response_text.strip()
+
+    json_match = re.search(r'```json\s*\n(.*?)\n```', text, re.DOTALL)
+    if json_match:
+        text = json_match.group(1)
+    else:
+        json_match = re.search(r'\{.*\}', text, re.DOTALL)
+        if json_match:
+            text = json_match.group(0)
+
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError:
+        return None
+
+
+def wrap(body, rng):
+    """Yield (shape, response) pairs wrapping one JSON body."""
+    yield "plain", body
+    yield "fenced", f"```json\n{body}\n```"
+    yield "preamble", f"Here is the analysis for {{verse}}:\n\n{body}"
+    yield "trailing", f"{body}\n\nNote: the {{tags}} field follows the schema."
+    yield "fenced+trailing", f"```json\n{body}\n```\n\nLet me know if you want {{more}}."
+    cut = body.rfind('",', 0, rng.randrange(len(body) // 4, len(body) - 1)) + 2
+    yield "truncated", body[:max(cut, 1)]
+
+
+def build_corpus(limit, seed):
+    """Collect (shape, response) pairs from saved responses and verse files."""
+    rng = random.Random(seed)
+    corpus = [("saved", text) for text in open_response_cache().iter_texts(limit)]
+
+    paths = sorted(DATA_DIR.glob("**/*.json"))[:limit]
+    for path in paths:
+        body = json.dumps(json.loads(path.read_text(encoding="utf-8")), ensure_ascii=False, indent=2)
+        corpus.extend(wrap(body, rng))
+    return corpus
+
+
+def time_parser(parse, corpus, repeat):
+    """Parse the corpus repeat times and return (seconds, results)."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        results = [parse(text) for _, text in corpus]
+    return time.perf_counter() - start, results
+
+
+def count_by_shape(corpus, results):
+    """Count parsed responses per shape."""
+    counts = {}
+    for (shape, _), result in zip(corpus, results):
+        total, ok = counts.get(shape, (0, 0))
+        counts[shape] = (total + 1, ok + (result is not None))
+    return counts
+
+
+def fuzz(corpus, rounds, rng):
+    """Mutate responses at random and check the scanner's invariants."""
+    problems = 0
+    for _ in range(rounds):
+        _, text = rng.choice(corpus)
+        chars = list(text)
+        for _ in range(rng.randrange(1, 4)):
+            pos = rng.randrange(len(chars) + 1)
+            op = rng.randrange(3)
+            if op == 0 and pos < len(chars):
+                del chars[pos]
+            elif op == 1:
+                chars.insert(pos, rng.choice('{}[]",:\\\n x'))
+            else:
+                del chars[pos:]
+        mutated = "".join(chars)
+
+        try:
+            parser = extract_json_object(mutated)
+        except Exception as e:  # the scanner must never raise
+            print(f"  raised {e!r} on {mutated[:60]!r}")
+            problems += 1
+            continue
+        if parser.complete and not parser.repaired:
+            if json.JSONDecoder().raw_decode(mutated, parser.start)[0] != parser.value:
+                problems += 1
+        elif not parser.complete and parser.offset is None:
+            problems += 1
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--limit", type=int, default=200, help="Maximum verse files (and saved responses)")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for truncation points and fuzzing")
+    parser.add_argument("--repeat", type=int, default=5, help="Passes over the corpus per timing")
+    parser.add_argument("--fuzz", type=int, default=2000, help="Fuzz mutations to run")
+    args = parser.parse_args()
+
+    # Every truncated response is repaired; one warning each is just noise here
+    logging.getLogger("src.gemini_client").setLevel(logging.ERROR)
+
+    corpus = build_corpus(args.limit, args.seed)
+    size = sum(len(text) for _, text in corpus)
+    print(f"Responses: {len(corpus)}  ({size / 1e6:.1f} MB)")
+
+    regex_seconds, regex_results = time_parser(regex_parse, corpus, args.repeat)
+    scan_seconds, scan_results = time_parser(parse_json_response, corpus, args.repeat)
+    per = max(len(corpus) * args.repeat, 1)
+    print(f"Regex parse:   {regex_seconds:8.3f}s  ({regex_seconds / per * 1000:.3f} ms/response)")
+    print(f"Scanner parse: {scan_seconds:8.3f}s  ({scan_seconds / per * 1000:.3f} ms/response)")
+
+    regex_counts = count_by_shape(corpus, regex_results)
+    scan_counts = count_by_shape(corpus, scan_results)
+    print(f"{'shape':<18}{'regex':>10}{'scanner':>10}")
+    for shape, (total, ok) in regex_counts.items():
+        print(f"{shape:<18}{ok:>5}/{total:<4}{scan_counts[shape][1]:>5}/{total:<4}")
+
+    # Truncated text full of "{" and no "}" is quadratic for the greedy regex
+    for n in (1_000, 4_000, 16_000):
+        text = '{"a": "x", ' * n
+        start = time.perf_counter()
+        regex_parse(text)
+        regex_seconds = time.perf_counter() - start
+        start = time.perf_counter()
+        parse_json_response(text)
+        scan_seconds = time.perf_counter() - start
+        print(f"Worst case {len(text):>7} chars: regex {regex_seconds * 1000:9.1f} ms  "
+              f"scanner {scan_seconds * 1000:7.1f} ms")
+
+    problems = fuzz(corpus, args.fuzz, random.Random(args.seed))
+    print(f"Fuzz: {args.fuzz} mutations, {problems} problems")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Benchmark: OSHB verse extraction via XML parsing vs. the compiled index
+
+Extracts every OT verse (or a subset) through the original per-verse
+XML parse path (book cache disabled), through the XML path with the
+parsed-book LRU cache, and through the compiled SQLite index. Checks
+that all paths return identical text and reports timings.
+
+Usage:
+    python -m benchmarks.bench_oshb_index [--book Genesis] [--limit N]
+"""
+
+import argparse
+import time
+from itertools import islice
+from pathlib import Path
+
+from src.bible_structure import get_all_verses, get_testament
+from src.config import get_sources_directory
+from src.corpus_index import compile_oshb_index
+from src.source_fetcher import get_oshb_path
+from src.verse_extractor import (
+    extract_hebrew_verse,
+    clear_book_cache,
+    configure_book_cache,
+    get_book_cache_stats,
+    DEFAULT_BOOK_CACHE_BYTES,
+)
+
+
+def ot_verses(book=None, limit=None):
+    """List OT verse references, optionally for one book and capped."""
+    refs = (
+        ref for ref in get_all_verses()
+        if get_testament(ref[0]) == "OT" and (book is None or ref[0].lower() == book.lower())
+    )
+    return list(islice(refs, limit))
+
+
+def time_extraction(refs, oshb_path, use_index):
+    """Extract all refs through one path and return (seconds, results)."""
+    results = []
+    start = time.perf_counter()
+    for book, chapter, verse in refs:
+        results.append(extract_hebrew_verse(book, chapter, verse, oshb_path, use_index=use_index))
+    return time.perf_counter() - start, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--oshb-path", type=Path, default=get_oshb_path(get_sources_directory()))
+    parser.add_argument("--book", help="Restrict to a single OT book")
+    parser.add_argument("--limit", type=int, help="Maximum number of verses")
+    args = parser.parse_args()
+
+    refs = ot_verses(args.book, args.limit)
+    print(f"Verses: {len(refs)}  source: {args.oshb_path}")
+
+    start = time.perf_counter()
+    index_path = compile_oshb_index(args.oshb_path)
+    compile_seconds = time.perf_counter() - start
+    print(f"Compile index:   {compile_seconds:8.2f}s  ({index_path})")
+
+    configure_book_cache(0)
+    xml_seconds, xml_results = time_extraction(refs, args.oshb_path, use_index=False)
+
+    configure_book_cache(DEFAULT_BOOK_CACHE_BYTES)
+    clear_book_cache()
+    cached_seconds, cached_results = time_extraction(refs, args.oshb_path, use_index=False)
+    cache_stats = get_book_cache_stats()
+
+    index_seconds, index_results = time_extraction(refs, args.oshb_path, use_index=True)
+
+    mismatches = sum(
+        1 for a, b, c in zip(xml_results, cached_results, index_results) if not a == b == c
+    )
+    found = sum(1 for r in index_results if r is not None)
+
+    print(f"XML parse path:  {xml_seconds:8.2f}s  ({xml_seconds / max(len(refs), 1) * 1000:.2f} ms/verse)")
+    print(f"Book cache path: {cached_seconds:8.2f}s  ({cached_seconds / max(len(refs), 1) * 1000:.3f} ms/verse, "
+          f"{cache_stats['hits']} hits / {cache_stats['misses']} misses, {cache_stats['bytes'] / 1e6:.1f} MB)")
+    print(f"Index path:      {index_seconds:8.2f}s  ({index_seconds / max(len(refs), 1) * 1000:.3f} ms/verse)")
+    print(f"Speedup:         {xml_seconds / max(index_seconds, 1e-9):8.1f}x")
+    print(f"Found: {found}/{len(refs)}  mismatches: {mismatches}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Benchmark: schema validation of the data tree, per-call vs. cached vs. compiled
+
+Loads every verse JSON under the data directory and validates it against
+the verse schema four ways: the original per-verse path (read and parse
+the schema, check it and build a fresh validator for every verse), the
+cached Draft 7 validator, the compiled check used by validate_verse_json(),
+and one validate_many() batch. Checks that all paths agree and reports
+timings.
+
+Usage:
+    python -m benchmarks.bench_schema_validation [--data-dir data] [--repeat N]
+"""
+
+import argparse
+import json
+import time
+from pathlib import Path
+
+import jsonschema
+
+from src.config import get_project_root
+from src.schema_validator import (
+    load_schema,
+    get_validator,
+    validate_verse_json,
+    validate_many,
+    clear_validator_cache,
+)
+
+
+def load_verses(data_dir):
+    """Load every verse JSON file under data_dir."""
+    verses = []
+    for path in sorted(data_dir.rglob("*.json")):
+        with open(path, 'r', encoding='utf-8') as f:
+            verses.append(json.load(f))
+    return verses
+
+
+def uncached_validate(verse_data, schema_path):
+    """The pre-cache path: reload the schema and validate from scratch."""
+    try:
+        jsonschema.validate(instance=verse_data, schema=load_schema(schema_path))
+        return True
+    except jsonschema.ValidationError:
+        return False
+
+
+def time_path(verses, validate):
+    """Validate all verses through one path and return (seconds, results)."""
+    start = time.perf_counter()
+    results = [validate(verse_data) for verse_data in verses]
+    return time.perf_counter() - start, results
+
+
+def main():
+    root = get_project_root()
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--data-dir", type=Path, default=root / "data")
+    parser.add_argument("--schema", type=Path, default=root / "schemas" / "verse_schema.json")
+    parser.add_argument("--repeat", type=int, default=1, help="Validate the tree this many times")
+    args = parser.parse_args()
+
+    verses = load_verses(args.data_dir) * max(1, args.repeat)
+    print(f"Verses: {len(verses)}  data: {args.data_dir}")
+
+    uncached_seconds, uncached_results = time_path(
+        verses, lambda verse_data: uncached_validate(verse_data, args.schema)
+    )
+
+    clear_validator_cache()
+    draft7 = get_validator(args.schema)
+    cached_seconds, cached_results = time_path(verses, draft7.is_valid)
+
+    compiled_seconds, compiled_results = time_path(
+        verses, lambda verse_data: validate_verse_json(verse_data, args.schema)
+    )
+
+    start = time.perf_counter()
+    batch_results = validate_many(verses, args.schema)
+    batch_seconds = time.perf_counter() - start
+
+    mismatches = sum(
+        1 for a, b, c, d in zip(uncached_results, cached_results, compiled_results, batch_results)
+        if not a == b == c == d
+    )
+    per_verse = 1000 / max(len(verses), 1)
+
+    print(f"Per-call path:   {uncached_seconds:8.3f}s  ({uncached_seconds * per_verse:.3f} ms/verse)")
+    print(f"Cached Draft 7:  {cached_seconds:8.3f}s  ({cached_seconds * per_verse:.3f} ms/verse)")
+    print(f"Compiled check:  {compiled_seconds:8.3f}s  ({compiled_seconds * per_verse:.3f} ms/verse)")
+    print(f"validate_many:   {batch_seconds:8.3f}s  ({batch_seconds * per_verse:.3f} ms/verse)")
+    print(f"Speedup vs cached Draft 7: {cached_seconds / max(compiled_seconds, 1e-9):.1f}x per call, "
+          f"{cached_seconds / max(batch_seconds, 1e-9):.1f}x validate_many")
+    print(f"Valid: {sum(batch_results)}/{len(verses)}  mismatches: {mismatches}")
+
+
+if __name__ == "__main__":
+    main()
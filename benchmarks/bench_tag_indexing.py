@@ -0,0 +1,124 @@
+"""
+Benchmark: full vs. incremental tag indexing on a synthetic full-canon corpus
+
+Writes one verse file per verse of the canon (31,102 files) into a
+temporary data directory, each carrying a copy of a real verse's tags with
+per-verse variations, then times a full index serially and across a
+process pool, a full index and save, the first incremental run (which
+builds the manifest), an incremental run with nothing changed, and an
+incremental run after rewriting one chapter. The outputs of the last
+incremental run are checked against a fresh full index.
+
+Usage:
+    python -m benchmarks.bench_tag_indexing [--template data/NT/Acts/10/01.json] [--workers N]
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from src.bible_structure import get_all_verses, get_testament, generate_verse_id
+from src.config import get_project_root
+from src.tag_indexer import TagIndexer, OUTPUT_FILES
+
+
+def make_tags(template, book, chapter, verse, revision=0):
+    """Template tags with a few values made specific to this verse."""
+    tags = json.loads(json.dumps(template))
+    tags["tier_4_cultural_historical"]["gentiles"].append(f"{book} {chapter}")
+    tags["tier_5_literary_prophetic"]["narrative_history"].append(f"verse {verse % 50} r{revision}")
+    return tags
+
+
+def write_corpus(data_dir, template):
+    """Write a verse file for every verse in the canon."""
+    for book, chapter, verse in get_all_verses():
+        path = data_dir / get_testament(book) / book / str(chapter) / f"{verse:02d}.json"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({
+            "verse_id": generate_verse_id(book, chapter, verse),
+            "tags": make_tags(template, book, chapter, verse)
+        }), encoding='utf-8')
+
+
+def timed(label, fn):
+    """Run fn quietly and print its wall time."""
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = fn()
+    print(f"{label:<40} {time.perf_counter() - start:8.3f}s")
+    return result
+
+
+def main():
+    root = get_project_root()
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--template", type=Path, default=root / "data" / "NT" / "Acts" / "10" / "01.json",
+                        help="Verse file whose tags are copied into every verse")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="Processes for the parallel full index")
+    args = parser.parse_args()
+
+    with open(args.template, 'r', encoding='utf-8') as f:
+        template = json.load(f)["tags"]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        data_dir = tmp / "data"
+        print("Writing corpus...")
+        write_corpus(data_dir, template)
+
+        def index(workers):
+            indexer = TagIndexer(data_dir)
+            indexer.index_all_verses(workers=workers)
+            return indexer
+
+        def full(output_dir):
+            indexer = TagIndexer(data_dir)
+            indexer.index_all_verses()
+            indexer.save_flat_index(output_dir / OUTPUT_FILES["tag_index"])
+            indexer.save_category_summary(output_dir / OUTPUT_FILES["tag_categories"])
+            indexer.save_verse_tags(output_dir / OUTPUT_FILES["verse_tags"])
+            return indexer
+
+        def incremental():
+            indexer = TagIndexer(data_dir, tmp / "manifest.sqlite")
+            counts = indexer.update_index()
+            return counts, indexer.save_affected_outputs(tmp / "incremental")
+
+        serial = timed("Full index, serial", lambda: index(1))
+        parallel = timed(f"Full index, {args.workers} workers", lambda: index(args.workers))
+        assert parallel.tag_index == serial.tag_index and parallel.verse_tags == serial.verse_tags
+
+        indexer = timed("Full index + save", lambda: full(tmp / "full"))
+        print(f"  {len(indexer.verse_tags)} verses, {len(indexer.tag_index)} tag entries")
+        timed("Incremental, first run (builds manifest)", incremental)
+        counts, written = timed("Incremental, nothing changed", incremental)
+        print(f"  {counts}, rewrote {written or 'nothing'}")
+
+        chapter_dir = data_dir / "NT" / "Acts" / "10"
+        for path in sorted(chapter_dir.glob("*.json")):
+            verse = int(path.stem)
+            path.write_text(json.dumps({
+                "verse_id": generate_verse_id("Acts", 10, verse),
+                "tags": make_tags(template, "Acts", 10, verse, revision=1)
+            }), encoding='utf-8')
+
+        counts, written = timed("Incremental, Acts 10 rewritten", incremental)
+        print(f"  {counts}, rewrote {written}")
+
+        timed("Full index + save (reference)", lambda: full(tmp / "full"))
+        for file_name in OUTPUT_FILES.values():
+            if file_name == OUTPUT_FILES["tag_statistics"]:
+                continue
+            same = (tmp / "full" / file_name).read_bytes() == (tmp / "incremental" / file_name).read_bytes()
+            print(f"  {file_name}: {'identical' if same else 'DIFFERENT'}")
+
+
+if __name__ == "__main__":
+    main()
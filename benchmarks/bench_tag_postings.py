@@ -0,0 +1,129 @@
+"""
+Benchmark: tag queries on the inverted postings vs. scanning tag_index
+
+Builds the synthetic full-canon corpus from bench_tag_indexing, indexes
+it, builds the tag postings, and runs AND/OR/NOT queries and category
+counts both ways: a linear scan over the flat tag_index entries (what a
+consumer of tag_index.json has to do) and TagPostings. Checks that both
+agree and reports per-query timings and on-disk sizes.
+
+Usage:
+    python -m benchmarks.bench_tag_postings [--repeat 5]
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import tempfile
+import time
+from collections import defaultdict
+from pathlib import Path
+
+from benchmarks.bench_tag_indexing import write_corpus
+from src.config import get_project_root
+from src.tag_indexer import TagIndexer
+from src.tag_postings import TagPostings, build_tag_postings
+
+SOTERIOLOGY = "tier_1_foundational_theology:soteriology"
+GENTILES = "tier_4_cultural_historical:gentiles"
+NARRATIVE = "tier_5_literary_prophetic:narrative_history"
+
+QUERIES = {
+    "AND (1 verse)": {"all_of": [(GENTILES, "Acts 10"), (NARRATIVE, "verse 7 r0")]},
+    "OR (3 chapters)": {"any_of": [(GENTILES, "Genesis 1"), (GENTILES, "Exodus 2"), (GENTILES, "Psalms 119")]},
+    "NOT (most verses)": {"all_of": [(SOTERIOLOGY, "grace")], "none_of": [(NARRATIVE, "verse 7 r0")]},
+    "AND + NOT": {"all_of": [(SOTERIOLOGY, "grace")], "any_of": [(GENTILES, "Acts 10")],
+                  "none_of": [(NARRATIVE, "verse 1 r0")]},
+}
+
+
+def scan_query(tag_index, all_of=(), any_of=(), none_of=()):
+    """Verse IDs matching a query, by one pass over the flat entries."""
+    wanted = set(all_of) | set(any_of) | set(none_of)
+    verse_terms = defaultdict(set)
+    for entry in tag_index:
+        verse_terms[entry["v"]]  # Every tagged verse is a candidate
+        term = (entry["cat"], entry["val"])
+        if term in wanted:
+            verse_terms[entry["v"]].add(term)
+
+    return {
+        verse_id for verse_id, terms in verse_terms.items()
+        if all(term in terms for term in all_of)
+        and (not any_of or any(term in terms for term in any_of))
+        and not any(term in terms for term in none_of)
+    }
+
+
+def scan_category_counts(tag_index):
+    """Verses per category, by one pass over the flat entries."""
+    verses = defaultdict(set)
+    for entry in tag_index:
+        verses[entry["cat"]].add(entry["v"])
+    return {category: len(verse_ids) for category, verse_ids in verses.items()}
+
+
+def best_of(repeat, fn):
+    """Fastest of repeat runs, in milliseconds, and the last result."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        elapsed = (time.perf_counter() - start) * 1000
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    root = get_project_root()
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--template", type=Path, default=root / "data" / "NT" / "Acts" / "10" / "01.json",
+                        help="Verse file whose tags are copied into every verse")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with open(args.template, 'r', encoding='utf-8') as f:
+        template = json.load(f)["tags"]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        print("Writing corpus...")
+        write_corpus(tmp / "data", template)
+
+        indexer = TagIndexer(tmp / "data")
+        with contextlib.redirect_stdout(io.StringIO()):
+            indexer.index_all_verses()
+            indexer.save_flat_index(tmp / "tag_index.json")
+        tag_index = indexer.tag_index
+
+        start = time.perf_counter()
+        postings = build_tag_postings(indexer)
+        postings.save(tmp / "tag_postings.bin")
+        print(f"Built postings in {time.perf_counter() - start:.2f}s: "
+              f"{len(postings)} tags, {len(postings.columns['deltas'])} postings")
+
+        start = time.perf_counter()
+        postings = TagPostings.load(tmp / "tag_postings.bin")
+        print(f"Loaded postings in {(time.perf_counter() - start) * 1000:.1f} ms")
+        print(f"tag_index.json: {(tmp / 'tag_index.json').stat().st_size / 1e6:.1f} MB, "
+              f"tag_postings.bin: {(tmp / 'tag_postings.bin').stat().st_size / 1e6:.1f} MB")
+
+        print(f"\n{'Query':<22} {'matches':>8} {'scan ms':>10} {'postings ms':>12} {'speedup':>8}")
+        for label, query in QUERIES.items():
+            scan_ms, expected = best_of(args.repeat, lambda: scan_query(tag_index, **query))
+            # First run decodes the posting lists; later runs hit the bitmap cache
+            postings_ms, ordinals = best_of(args.repeat, lambda: postings.query(**query))
+            found = {postings.verse_id(ordinal) for ordinal in ordinals}
+            assert found == expected, f"{label}: postings disagree with scan"
+            print(f"{label:<22} {len(found):>8} {scan_ms:>10.1f} {postings_ms:>12.3f} {scan_ms / postings_ms:>7.0f}x")
+
+        scan_ms, expected = best_of(args.repeat, lambda: scan_category_counts(tag_index))
+        postings_ms, counts = best_of(args.repeat, postings.category_counts)
+        assert counts == expected, "category counts disagree with scan"
+        print(f"{'Category counts':<22} {len(counts):>8} {scan_ms:>10.1f} {postings_ms:>12.3f} "
+              f"{scan_ms / postings_ms:>7.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,28 +5,48 @@ Processes multiple verses with checkpointing and progress tracking.
 
 Functions:
     process_verse: Process a single verse (generate, validate, write)
+    process_verse_batch: Process consecutive verses through one batched request
     process_chapter: Process all verses in a chapter
+    process_book: Process all verses in a book
+    aprocess_verse: Process a single verse (asyncio)
+    process_chapter_async: Process a chapter with N verses in flight
+    flush_verse_writer: Commit verses queued for the verse store
     create_checkpoint: Save progress checkpoint
     load_checkpoint: Load saved checkpoint
     clear_checkpoint: Remove checkpoint file
+
+Classes:
+    OrderedCheckpointer: Checkpoints verses in order as they complete out of order
 """
 
+import asyncio
+import functools
+import itertools
 import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, List, Tuple, Callable
 
-from src.exegesis_generator import generate_verse_exegesis
+from src.exegesis_generator import (
+    generate_verse_exegesis, agenerate_verse_exegesis, generate_batch_exegesis, plan_verse_batches,
+    DEFAULT_BATCH_TOKEN_BUDGET, DEFAULT_OUTPUT_TOKENS_PER_VERSE
+)
+from src.gemini_client import AsyncGeminiClient, DEFAULT_MAX_CONCURRENCY
 from src.schema_validator import validate_verse_json
-from src.data_writer import write_verse_json
-from src.bible_structure import get_verse_count
+from src.data_writer import write_verse_json, FORMAT_PRETTY, STORAGE_FILES
+from src.bible_structure import get_verse_count, get_book_info
+from src.verse_extractor import extract_chapter_verses, iter_book_verses
 
 
 def process_verse(
     book: str,
     chapter: int,
     verse: int,
-    config: Dict[str, Any]
-) -> bool:
+    config: Dict[str, Any],
+    verse_text: Optional[str] = None,
+    on_commit: Optional[Callable[[bool], None]] = None
+) -> Optional[bool]:
     """
     Process a single verse: generate, validate, and write.
 
@@ -35,9 +55,13 @@ def process_verse(
         chapter: Chapter number
         verse: Verse number
         config: Configuration dict with paths and API key
+        verse_text: Pre-extracted source text (extracted on demand if None)
+        on_commit: Outcome callback for verses queued for the verse store
+            (see _save_exegesis)
 
     Returns:
-        True if successful, False otherwise
+        True if successful, False otherwise; None if the verse was queued
+        and on_commit will be told the outcome
     """
     # Generate exegesis
     exegesis_data = generate_verse_exegesis(
@@ -45,9 +69,81 @@ def process_verse(
         config["oshb_path"],
         config["sblgnt_path"],
         config["api_key"],
-        config["study_prompt_path"]
+        config["study_prompt_path"],
+        verse_text=verse_text,
+        rate_limiter=config.get("rate_limiter"),
+        cache=config.get("response_cache"),
+        context_cache=config.get("context_cache"),
+        stream=config.get("stream", False)
+    )
+
+    return _save_exegesis(book, chapter, verse, exegesis_data, config, on_commit)
+
+
+def process_verse_batch(
+    book: str,
+    chapter: int,
+    verse_texts: Dict[int, str],
+    config: Dict[str, Any],
+    on_commit: Optional[Callable[[int, bool], None]] = None
+) -> Dict[int, Optional[bool]]:
+    """
+    Process consecutive verses of a chapter through one batched request.
+
+    Verses the batch does not answer validly are regenerated singly (see
+    generate_batch_exegesis) before being validated and written.
+
+    Args:
+        book: Book name
+        chapter: Chapter number
+        verse_texts: Verse number to source text, consecutive and in order
+        config: Configuration dict with paths and API key
+        on_commit: Called with (verse, success) for verses queued for the
+            verse store (see _save_exegesis)
+
+    Returns:
+        Dict of verse number to True if generated and written (None if
+        queued and on_commit will be told the outcome)
+    """
+    exegesis = generate_batch_exegesis(
+        book, chapter, verse_texts,
+        config["oshb_path"],
+        config["sblgnt_path"],
+        config["api_key"],
+        config["study_prompt_path"],
+        config["base_path"] / "schemas" / "verse_schema.json",
+        rate_limiter=config.get("rate_limiter"),
+        cache=config.get("response_cache"),
+        context_cache=config.get("context_cache"),
+        stream=config.get("stream", False)
     )
 
+    return {
+        verse: _save_exegesis(
+            book, chapter, verse, data, config,
+            None if on_commit is None else functools.partial(on_commit, verse)
+        )
+        for verse, data in exegesis.items()
+    }
+
+
+def _save_exegesis(
+    book: str,
+    chapter: int,
+    verse: int,
+    exegesis_data: Optional[Dict[str, Any]],
+    config: Dict[str, Any],
+    on_commit: Optional[Callable[[bool], None]] = None
+) -> Optional[bool]:
+    """
+    Validate generated exegesis and write it (False if missing or invalid).
+
+    With a verse writer configured the verse is only queued. If on_commit
+    is given the result is then None and on_commit is called with the
+    outcome once the batch commits (or is failed by flush_verse_writer),
+    so callers never report a verse done before it is durable. Without
+    on_commit a queued verse counts as True and the caller must flush.
+    """
     if exegesis_data is None:
         return False
 
@@ -58,21 +154,165 @@ def process_verse(
     if not is_valid:
         return False
 
+    # Queue for the verse store (committed in batches) when one is configured
+    verse_writer = config.get("verse_writer")
+    if verse_writer is not None:
+        if not verse_writer.add(book, chapter, verse, exegesis_data, on_commit=on_commit):
+            return False
+        return True if on_commit is None else None
+
     # Write to file
     success = write_verse_json(
         book, chapter, verse,
         exegesis_data,
-        config["base_path"]
+        config["base_path"],
+        fmt=config.get("write_format", FORMAT_PRETTY),
+        fsync=config.get("fsync", False),
+        storage=config.get("storage", STORAGE_FILES)
     )
 
     return success
 
 
+def flush_verse_writer(config: Dict[str, Any]) -> bool:
+    """
+    Commit verses still queued for the verse store.
+
+    If the commit fails the queued verses are dropped and reported as
+    failed to their on_commit callbacks.
+
+    Args:
+        config: Configuration dict (no-op without a "verse_writer")
+
+    Returns:
+        True if nothing was left uncommitted, False otherwise
+    """
+    verse_writer = config.get("verse_writer")
+    if verse_writer is None or verse_writer.flush():
+        return True
+
+    verse_writer.fail_pending()
+    return False
+
+
+class OrderedCheckpointer:
+    """Checkpoints verses in order as they complete out of order"""
+
+    def __init__(self, book: str, verses: List[Tuple[int, int]], base_path: Path):
+        """
+        Args:
+            book: Book name
+            verses: (chapter, verse) pairs in processing order
+            base_path: Base project directory
+        """
+        self.book = book
+        self.base_path = base_path
+        self.results = {"total": 0, "successful": 0, "failed": 0}
+        self._order = list(verses)
+        self._next = 0
+        self._finished: Dict[Tuple[int, int], bool] = {}
+        self._lock = threading.Lock()
+
+    def record(self, chapter: int, verse: int, success: bool) -> None:
+        """
+        Record a finished verse and checkpoint every verse that now
+        completes an unbroken run, so resuming from the checkpoint never
+        skips an unfinished verse.
+
+        Args:
+            chapter: Chapter number
+            verse: Verse number
+            success: Whether the verse was generated and written
+        """
+        with self._lock:
+            self.results["successful" if success else "failed"] += 1
+            self._finished[(chapter, verse)] = success
+
+            while self._next < len(self._order) and self._order[self._next] in self._finished:
+                done_chapter, done_verse = self._order[self._next]
+                create_checkpoint({
+                    "book": self.book,
+                    "chapter": done_chapter,
+                    "verse": done_verse,
+                    "completed": self._finished.pop((done_chapter, done_verse))
+                }, self.base_path)
+                self._next += 1
+
+
+def _run_verses(
+    book: str,
+    verses: List[Tuple[int, int]],
+    verse_texts: Dict[Tuple[int, int], str],
+    config: Dict[str, Any],
+    workers: int,
+    checkpointer: OrderedCheckpointer
+) -> None:
+    """
+    Process verses sequentially or on a thread pool, checkpointing in order.
+
+    With config["batch_size"] above 1, consecutive verses of a chapter are
+    grouped into multi-verse requests (see plan_verse_batches) and each
+    group is one unit of work. Verses queued for the verse store are
+    recorded when their batch commits.
+    """
+    def run(chapter: int, verse_nums: List[int]) -> None:
+        if len(verse_nums) == 1:
+            verse = verse_nums[0]
+            try:
+                success = process_verse(
+                    book, chapter, verse, config,
+                    verse_text=verse_texts.get((chapter, verse)),
+                    on_commit=functools.partial(checkpointer.record, chapter, verse)
+                )
+            except Exception:
+                success = False
+            if success is not None:
+                checkpointer.record(chapter, verse, success)
+            return
+
+        try:
+            outcomes = process_verse_batch(
+                book, chapter, {verse: verse_texts[(chapter, verse)] for verse in verse_nums}, config,
+                on_commit=functools.partial(checkpointer.record, chapter)
+            )
+        except Exception:
+            outcomes = {}
+        for verse in verse_nums:
+            success = outcomes.get(verse, False)
+            if success is not None:
+                checkpointer.record(chapter, verse, success)
+
+    batch_size = config.get("batch_size", 1)
+    units = []
+    for chapter, chapter_verses in itertools.groupby(verses, key=lambda item: item[0]):
+        verse_nums = [verse for _, verse in chapter_verses]
+        if batch_size <= 1:
+            units.extend((chapter, [verse]) for verse in verse_nums)
+            continue
+        planned = plan_verse_batches(
+            {verse: verse_texts.get((chapter, verse)) for verse in verse_nums},
+            batch_size,
+            token_budget=config.get("batch_token_budget", DEFAULT_BATCH_TOKEN_BUDGET),
+            output_tokens_per_verse=config.get("output_tokens_per_verse", DEFAULT_OUTPUT_TOKENS_PER_VERSE)
+        )
+        units.extend((chapter, batch) for batch in planned)
+
+    if workers <= 1:
+        for chapter, verse_nums in units:
+            run(chapter, verse_nums)
+        return
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for future in [executor.submit(run, chapter, verse_nums) for chapter, verse_nums in units]:
+            future.result()
+
+
 def process_chapter(
     book: str,
     chapter: int,
     config: Dict[str, Any],
-    start_verse: int = 1
+    start_verse: int = 1,
+    workers: int = 1
 ) -> Dict[str, int]:
     """
     Process all verses in a chapter.
@@ -82,6 +322,7 @@ def process_chapter(
         chapter: Chapter number
         config: Configuration dict
         start_verse: Verse to start from (for resuming)
+        workers: Verses to process in parallel (threads)
 
     Returns:
         Dict with processing results (total, successful, failed)
@@ -92,31 +333,176 @@ def process_chapter(
     if verse_count is None:
         return {"total": 0, "successful": 0, "failed": 0}
 
-    results = {
-        "total": verse_count,
-        "successful": 0,
-        "failed": 0
+    # Pull the chapter's source text in one streaming pass
+    chapter_texts = extract_chapter_verses(book, chapter, config["oshb_path"], config["sblgnt_path"])
+    verse_texts = {(chapter, verse): text for verse, text in chapter_texts.items()}
+
+    verses = [(chapter, verse) for verse in range(start_verse, verse_count + 1)]
+    checkpointer = OrderedCheckpointer(book, verses, config["base_path"])
+    _run_verses(book, verses, verse_texts, config, workers, checkpointer)
+    flush_verse_writer(config)
+
+    results = checkpointer.results
+    results["total"] = verse_count
+    return results
+
+
+def process_book(
+    book: str,
+    config: Dict[str, Any],
+    start_chapter: int = 1,
+    start_verse: int = 1,
+    workers: int = 1
+) -> Dict[str, int]:
+    """
+    Process every verse of a book, in parallel across chapters.
+
+    Args:
+        book: Book name
+        config: Configuration dict
+        start_chapter: Chapter to start from (for resuming)
+        start_verse: Verse of start_chapter to start from
+        workers: Verses to process in parallel (threads)
+
+    Returns:
+        Dict with processing results (total, successful, failed)
+    """
+    book_info = get_book_info(book)
+
+    if book_info is None:
+        return {"total": 0, "successful": 0, "failed": 0}
+
+    verses = []
+    for chapter in range(start_chapter, book_info["chapters"] + 1):
+        first_verse = start_verse if chapter == start_chapter else 1
+        verse_count = get_verse_count(book, chapter) or 0
+        verses.extend((chapter, verse) for verse in range(first_verse, verse_count + 1))
+
+    # Pull the whole book's source text in one streaming pass
+    verse_texts = {
+        (chapter, verse): text
+        for chapter, verse, text, _ in iter_book_verses(book, config["oshb_path"], config["sblgnt_path"])
+        if chapter >= start_chapter
     }
 
-    # Process each verse
-    for verse_num in range(start_verse, verse_count + 1):
-        # Process verse
-        success = process_verse(book, chapter, verse_num, config)
-
-        if success:
-            results["successful"] += 1
-        else:
-            results["failed"] += 1
-
-        # Create checkpoint after each verse
-        checkpoint_data = {
-            "book": book,
-            "chapter": chapter,
-            "verse": verse_num,
-            "completed": success
-        }
-        create_checkpoint(checkpoint_data, config["base_path"])
+    checkpointer = OrderedCheckpointer(book, verses, config["base_path"])
+    _run_verses(book, verses, verse_texts, config, workers, checkpointer)
+    flush_verse_writer(config)
+
+    results = checkpointer.results
+    results["total"] = len(verses)
+    return results
+
+
+async def aprocess_verse(
+    book: str,
+    chapter: int,
+    verse: int,
+    config: Dict[str, Any],
+    verse_text: Optional[str] = None,
+    client: Optional[AsyncGeminiClient] = None,
+    on_commit: Optional[Callable[[bool], None]] = None
+) -> Optional[bool]:
+    """
+    Process a single verse without blocking: generate, validate, and write.
+
+    Validation and the write (file, pack rewrite or verse store flush)
+    run in a worker thread so other requests keep flowing meanwhile.
+
+    Args:
+        book: Book name
+        chapter: Chapter number
+        verse: Verse number
+        config: Configuration dict with paths and API key
+        verse_text: Pre-extracted source text (extracted on demand if None)
+        client: Async client to send through (shared client if None)
+        on_commit: Outcome callback for verses queued for the verse store
+            (see _save_exegesis)
+
+    Returns:
+        True if successful, False otherwise; None if the verse was queued
+        and on_commit will be told the outcome
+    """
+    exegesis_data = await agenerate_verse_exegesis(
+        book, chapter, verse,
+        config["oshb_path"],
+        config["sblgnt_path"],
+        config["api_key"],
+        config["study_prompt_path"],
+        verse_text=verse_text,
+        client=client
+    )
+
+    return await asyncio.to_thread(_save_exegesis, book, chapter, verse, exegesis_data, config, on_commit)
+
+
+async def process_chapter_async(
+    book: str,
+    chapter: int,
+    config: Dict[str, Any],
+    start_verse: int = 1,
+    concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    client: Optional[AsyncGeminiClient] = None
+) -> Dict[str, int]:
+    """
+    Process all verses in a chapter with up to `concurrency` API requests in flight.
+
+    Checkpoints are still written in verse order: a verse is only
+    checkpointed once every earlier verse has finished, so resuming from
+    the checkpoint never skips an unfinished verse.
+
+    Args:
+        book: Book name
+        chapter: Chapter number
+        config: Configuration dict
+        start_verse: Verse to start from (for resuming)
+        concurrency: Maximum verses in flight against the API
+        client: Async client to send through (one is created if None)
+
+    Returns:
+        Dict with processing results (total, successful, failed)
+    """
+    verse_count = get_verse_count(book, chapter)
+
+    if verse_count is None:
+        return {"total": 0, "successful": 0, "failed": 0}
+
+    if client is None:
+        client = AsyncGeminiClient(
+            config["api_key"],
+            max_concurrency=concurrency,
+            rate_limiter=config.get("rate_limiter"),
+            cache=config.get("response_cache"),
+            context_cache=config.get("context_cache"),
+            stream=config.get("stream", False)
+        )
+
+    verse_texts = extract_chapter_verses(book, chapter, config["oshb_path"], config["sblgnt_path"])
+
+    verse_nums = range(start_verse, verse_count + 1)
+    checkpointer = OrderedCheckpointer(book, [(chapter, verse) for verse in verse_nums], config["base_path"])
+
+    async def run(verse_num: int) -> None:
+        try:
+            success = await aprocess_verse(
+                book, chapter, verse_num, config,
+                verse_text=verse_texts.get(verse_num),
+                client=client,
+                on_commit=functools.partial(checkpointer.record, chapter, verse_num)
+            )
+        except Exception:
+            success = False
+        if success is not None:
+            checkpointer.record(chapter, verse_num, success)
+
+    try:
+        await asyncio.gather(*(run(verse_num) for verse_num in verse_nums))
+    finally:
+        # Commit (or fail) whatever was queued, even if the run was cancelled
+        await asyncio.to_thread(flush_verse_writer, config)
 
+    results = checkpointer.results
+    results["total"] = verse_count
     return results
 
 
@@ -262,6 +262,40 @@ def get_all_verses() -> Iterator[Tuple[str, int, int]]:
                     yield (book_name, chapter_num, verse_num)
 
 
+# Lazily built lookup: (book name lower-case, chapter, verse) -> ordinal
+_verse_ordinals: Optional[Dict[Tuple[str, int, int], int]] = None
+
+
+def get_verse_ordinal(book_name: str, chapter: int, verse: int) -> Optional[int]:
+    """
+    Get the 0-based canonical position of a verse (Genesis 1:1 is 0).
+
+    Ordinals follow get_all_verses() order, so they are dense (0 to
+    31,101) and sort verses canonically.
+
+    Args:
+        book_name: Name of the book (case-insensitive)
+        chapter: Chapter number
+        verse: Verse number
+
+    Returns:
+        Ordinal, or None if the verse reference is invalid
+
+    Example:
+        >>> get_verse_ordinal("Genesis", 1, 2)
+        1
+        >>> get_verse_ordinal("Revelation", 22, 21)
+        31101
+    """
+    global _verse_ordinals
+    if _verse_ordinals is None:
+        _verse_ordinals = {
+            (book.lower(), ch, vs): ordinal
+            for ordinal, (book, ch, vs) in enumerate(get_all_verses())
+        }
+    return _verse_ordinals.get((book_name.lower(), chapter, verse))
+
+
 def get_total_verse_count() -> int:
     """
     Calculate total number of verses in the Bible.
@@ -6,9 +6,21 @@ Command-line interface for StudyBible generation.
 Commands:
     generate: Generate exegesis for a single verse
     generate-chapter: Generate exegesis for entire chapter
+    generate-book: Generate exegesis for an entire book
+    run: Resumable canon/testament/book run driven by the job ledger
     download-sources: Download biblical source texts
+    build-index: Compile verse-keyed indexes over the source texts
+    build-tokens: Build the columnar interlinear token store
+    cache-stats: Show (or clear) the LLM response cache
+    validate: Re-validate written verse files and write a failure report
+    build-store: Load the verse files into the SQLite verse store
+    build-tag-postings: Build the inverted tag index
+    tag-search: Find verses by tag with AND/OR/NOT
+    pack: Export verse files into per-book packed archives
+    unpack: Import per-book packed archives back into verse files
 """
 
+import asyncio
 import click
 import sys
 from pathlib import Path
@@ -17,10 +29,29 @@ from typing import Dict, Any
 from src.config import (
     get_gemini_api_key,
     get_project_root,
-    get_sources_directory
+    get_sources_directory,
+    get_data_writer_config,
+    get_context_cache_config,
+    get_verse_batch_config
+)
+from src.batch_processor import (
+    process_verse, process_chapter, process_chapter_async, process_book, flush_verse_writer
 )
-from src.batch_processor import process_verse, process_chapter
 from src.source_fetcher import download_all_sources, get_oshb_path, get_sblgnt_path
+from src.corpus_index import compile_oshb_index, find_sblgnt_text_files, open_sblgnt_index
+from src.token_store import build_token_store, get_token_store_path
+from src.rate_limiter import get_rate_limiter
+from src.response_cache import open_response_cache
+from src.gemini_client import ContextCache, GeminiContextBackend, get_request_stats
+from src.job_ledger import JobLedger, run_jobs, DEFAULT_MAX_ATTEMPTS
+from src.data_writer import (
+    get_write_stats, pack_book, unpack_book, list_books, PackedVerseSink,
+    FORMAT_PRETTY, WRITE_FORMATS, STORAGE_FILES, STORAGE_PACKED
+)
+from src.verse_store import VerseStore, VerseBatchWriter
+from src.tag_indexer import TagIndexer
+from src.tag_postings import build_tag_postings, get_tag_postings_path, open_tag_postings, parse_tag_term
+from src.corpus_validator import find_verse_files, validate_files, write_report, get_validation_report_path
 from rich.console import Console
 from rich.progress import Progress
 
@@ -29,6 +60,66 @@ from rich.progress import Progress
 console = Console()
 
 
+def print_cache_stats(cache) -> None:
+    """Print hit-rate statistics for a response cache."""
+    stats = cache.stats()
+    session_total = stats['session_hits'] + stats['session_misses']
+    console.print(
+        f"Response cache: {stats['session_hits']}/{session_total} hits this run, "
+        f"{stats['hit_rate']:.0%} lifetime hit rate, "
+        f"{stats['entries']} entries ({stats['bytes'] / 1024:.0f} KiB)"
+    )
+
+
+def print_request_stats() -> None:
+    """Print time to first byte and latency of this run's API requests."""
+    stats = get_request_stats()
+    if not stats['requests']:
+        return
+
+    console.print(
+        f"API requests: {stats['requests']} ({stats['streamed']} streamed, {stats['aborted']} aborted early), "
+        f"first byte {stats['average_ttfb_seconds']:.1f}s average, "
+        f"latency {stats['average_latency_seconds']:.1f}s average / {stats['max_latency_seconds']:.1f}s max"
+    )
+
+
+def open_context_cache(api_key: str) -> ContextCache:
+    """Context cache for the study prompt prefix, using the configured TTL."""
+    settings = get_context_cache_config()
+    return ContextCache(
+        GeminiContextBackend(api_key),
+        ttl=settings["ttl_seconds"],
+        refresh_margin=settings["refresh_margin_seconds"]
+    )
+
+
+def close_context_cache(config: Dict[str, Any]) -> None:
+    """Print token savings for the run's context cache and delete it."""
+    context_cache = config.get("context_cache")
+    if context_cache is None:
+        return
+
+    stats = context_cache.stats()
+    console.print(
+        f"Context cache: {stats['tokens_saved']:,} input tokens saved over "
+        f"{stats['cached_requests']} requests ({stats['full_requests']} sent in full), "
+        f"{stats['creations']} created, {stats['refreshes']} refreshed"
+    )
+    context_cache.close()
+
+
+def enable_verse_batches(config: Dict[str, Any], batch_size: int) -> None:
+    """Turn on multi-verse requests of up to batch_size verses (no-op for 1)."""
+    if batch_size <= 1:
+        return
+
+    settings = get_verse_batch_config()
+    config["batch_size"] = batch_size
+    config["batch_token_budget"] = settings["token_budget"]
+    config["output_tokens_per_verse"] = settings["output_tokens_per_verse"]
+
+
 def load_config() -> Dict[str, Any]:
     """
     Load configuration for CLI commands.
@@ -38,18 +129,67 @@ def load_config() -> Dict[str, Any]:
     """
     base_path = get_project_root()
     sources_dir = get_sources_directory()
+    writer_settings = get_data_writer_config()
 
     config = {
         "base_path": base_path,
         "oshb_path": get_oshb_path(sources_dir),
         "sblgnt_path": get_sblgnt_path(sources_dir),
         "api_key": get_gemini_api_key(),
-        "study_prompt_path": base_path / "StudyPrompt.md"
+        "study_prompt_path": base_path / "StudyPrompt.md",
+        "rate_limiter": get_rate_limiter("gemini"),
+        "write_format": writer_settings["format"],
+        "fsync": writer_settings["fsync"],
+        "storage": writer_settings["storage"]
     }
 
+    if writer_settings["storage"] == "sqlite":
+        config["verse_writer"] = VerseBatchWriter(VerseStore(), writer_settings["store_batch_size"])
+    elif writer_settings["storage"] == STORAGE_PACKED:
+        # Each flush rewrites a book's pack once instead of once per verse
+        config["verse_writer"] = VerseBatchWriter(
+            PackedVerseSink(base_path, writer_settings["fsync"]), writer_settings["store_batch_size"]
+        )
+
     return config
 
 
+def print_results(results: Dict[str, int], config: Dict[str, Any], scope: str) -> None:
+    """Print batch results plus rate limit and cache statistics."""
+    console.print(f"\n[bold]Results:[/bold]")
+    console.print(f"Total verses: {results['total']}")
+    console.print(f"[green]Successful: {results['successful']}[/green]")
+    if results['failed'] > 0:
+        console.print(f"[red]Failed: {results['failed']}[/red]")
+
+    rate_limiter = config.get("rate_limiter")
+    if rate_limiter is not None:
+        waits = rate_limiter.stats()
+        console.print(
+            f"Rate limit waits: {waits['session_total_wait']:.1f}s total, "
+            f"{waits['session_max_wait']:.1f}s max over {waits['session_acquisitions']} requests this run "
+            f"({waits['total_wait']:.1f}s over {waits['acquisitions']} requests lifetime)"
+        )
+
+    if config.get("response_cache") is not None:
+        print_cache_stats(config["response_cache"])
+
+    close_context_cache(config)
+    print_request_stats()
+
+    writes = get_write_stats()
+    if writes['writes']:
+        console.print(
+            f"Verse writes: {writes['writes']} ({config.get('write_format', FORMAT_PRETTY)}), "
+            f"{writes['average_seconds'] * 1000:.2f} ms average, {writes['max_seconds'] * 1000:.2f} ms max"
+        )
+
+    if results['failed'] == 0:
+        console.print(f"\n[bold green]✓ {scope} completed successfully![/bold green]")
+    else:
+        console.print(f"\n[bold yellow]⚠ {scope} completed with some failures[/bold yellow]")
+
+
 @click.group()
 def cli():
     """StudyBible - High-fidelity biblical exegesis generator."""
@@ -60,7 +200,9 @@ def cli():
 @click.argument('book')
 @click.argument('chapter', type=int)
 @click.argument('verse', type=int)
-def generate(book: str, chapter: int, verse: int):
+@click.option('--cache', is_flag=True, help='Reuse cached API responses for unchanged prompts')
+@click.option('--stream', is_flag=True, help='Stream responses and retry malformed output early')
+def generate(book: str, chapter: int, verse: int, cache: bool, stream: bool):
     """Generate exegesis for a single verse.
 
     Example: studybible generate Genesis 1 1
@@ -69,7 +211,15 @@ def generate(book: str, chapter: int, verse: int):
         console.print(f"[bold blue]Generating exegesis for {book} {chapter}:{verse}[/bold blue]")
 
         config = load_config()
-        success = process_verse(book, chapter, verse, config)
+        if cache:
+            config["response_cache"] = open_response_cache()
+        config["stream"] = stream
+
+        success = process_verse(book, chapter, verse, config) and flush_verse_writer(config)
+
+        if cache:
+            print_cache_stats(config["response_cache"])
+        print_request_stats()
 
         if success:
             console.print(f"[bold green]✓ Successfully generated {book} {chapter}:{verse}[/bold green]")
@@ -86,28 +236,150 @@ def generate(book: str, chapter: int, verse: int):
 @click.argument('book')
 @click.argument('chapter', type=int)
 @click.option('--start-verse', type=int, default=1, help='Verse to start from (for resuming)')
-def generate_chapter(book: str, chapter: int, start_verse: int):
+@click.option('--workers', type=int, default=1, help='Verses to process in parallel (threads)')
+@click.option('--concurrency', type=int, default=1, help='Verses to keep in flight against the API (asyncio)')
+@click.option('--cache', is_flag=True, help='Reuse cached API responses for unchanged prompts')
+@click.option('--context-cache', is_flag=True, help='Send the study prompt once as a cached context')
+@click.option('--stream', is_flag=True, help='Stream responses and retry malformed output early')
+@click.option('--batch-size', type=int, default=1, help='Consecutive verses per API request (thread mode)')
+def generate_chapter(book: str, chapter: int, start_verse: int, workers: int, concurrency: int, cache: bool,
+                     context_cache: bool, stream: bool, batch_size: int):
     """Generate exegesis for an entire chapter.
 
-    Example: studybible generate-chapter Acts 10
+    Example: studybible generate-chapter Acts 10 --workers 4 --cache --context-cache
     """
     try:
         console.print(f"[bold blue]Generating exegesis for {book} {chapter}[/bold blue]")
 
         config = load_config()
-        results = process_chapter(book, chapter, config, start_verse=start_verse)
+        if cache:
+            config["response_cache"] = open_response_cache()
+        config["stream"] = stream
+        if context_cache:
+            config["context_cache"] = open_context_cache(config["api_key"])
+        enable_verse_batches(config, batch_size)
+
+        if concurrency > 1:
+            results = asyncio.run(process_chapter_async(
+                book, chapter, config,
+                start_verse=start_verse,
+                concurrency=concurrency
+            ))
+        else:
+            results = process_chapter(book, chapter, config, start_verse=start_verse, workers=workers)
 
-        # Display results
-        console.print(f"\n[bold]Results:[/bold]")
-        console.print(f"Total verses: {results['total']}")
-        console.print(f"[green]Successful: {results['successful']}[/green]")
-        if results['failed'] > 0:
-            console.print(f"[red]Failed: {results['failed']}[/red]")
+        print_results(results, config, "Chapter")
+
+    except Exception as e:
+        console.print(f"[bold red]Error: {str(e)}[/bold red]")
+        sys.exit(1)
 
-        if results['failed'] == 0:
-            console.print(f"\n[bold green]✓ Chapter completed successfully![/bold green]")
-        else:
-            console.print(f"\n[bold yellow]⚠ Chapter completed with some failures[/bold yellow]")
+
+@cli.command()
+@click.argument('book')
+@click.option('--start-chapter', type=int, default=1, help='Chapter to start from (for resuming)')
+@click.option('--start-verse', type=int, default=1, help='Verse of the start chapter to start from')
+@click.option('--workers', type=int, default=1, help='Verses to process in parallel (threads)')
+@click.option('--cache', is_flag=True, help='Reuse cached API responses for unchanged prompts')
+@click.option('--context-cache', is_flag=True, help='Send the study prompt once as a cached context')
+@click.option('--stream', is_flag=True, help='Stream responses and retry malformed output early')
+@click.option('--batch-size', type=int, default=1, help='Consecutive verses per API request (thread mode)')
+def generate_book(book: str, start_chapter: int, start_verse: int, workers: int, cache: bool, context_cache: bool,
+                  stream: bool, batch_size: int):
+    """Generate exegesis for an entire book.
+
+    Example: studybible generate-book Ruth --workers 4 --batch-size 4
+    """
+    try:
+        console.print(f"[bold blue]Generating exegesis for {book}[/bold blue]")
+
+        config = load_config()
+        if cache:
+            config["response_cache"] = open_response_cache()
+        config["stream"] = stream
+        if context_cache:
+            config["context_cache"] = open_context_cache(config["api_key"])
+        enable_verse_batches(config, batch_size)
+
+        results = process_book(
+            book, config,
+            start_chapter=start_chapter,
+            start_verse=start_verse,
+            workers=workers
+        )
+
+        print_results(results, config, "Book")
+
+    except Exception as e:
+        console.print(f"[bold red]Error: {str(e)}[/bold red]")
+        sys.exit(1)
+
+
+@cli.command()
+@click.option('--scope', type=click.Choice(['canon', 'testament', 'book']), default='canon',
+              help='Part of the Bible to process')
+@click.option('--name', default=None, help='Testament (OT/NT) or book name for narrower scopes')
+@click.option('--workers', type=int, default=1, help='Worker threads in this process')
+@click.option('--max-attempts', type=int, default=DEFAULT_MAX_ATTEMPTS, help='Attempts per verse before giving up')
+@click.option('--cache', is_flag=True, help='Reuse cached API responses for unchanged prompts')
+@click.option('--context-cache', is_flag=True, help='Send the study prompt once as a cached context')
+@click.option('--stream', is_flag=True, help='Stream responses and retry malformed output early')
+def run(scope: str, name: str, workers: int, max_attempts: int, cache: bool, context_cache: bool, stream: bool):
+    """Resumable run over the canon, a testament or a book.
+
+    Every verse is tracked in a persistent job ledger, so rerunning the
+    command resumes where it stopped and retries failures up to
+    --max-attempts. Several processes may run at once against the same
+    ledger without colliding.
+
+    Example: studybible run --scope book --name Ruth --workers 4
+    """
+    try:
+        config = load_config()
+        if cache:
+            config["response_cache"] = open_response_cache()
+        config["stream"] = stream
+        if context_cache:
+            config["context_cache"] = open_context_cache(config["api_key"])
+
+        ledger = JobLedger()
+        ledger.seed()
+
+        label = scope if scope == 'canon' else f"{scope} {name}"
+        console.print(f"[bold blue]Running {label}[/bold blue]")
+
+        results = run_jobs(
+            ledger,
+            lambda book, chapter, verse, on_commit: process_verse(book, chapter, verse, config, on_commit=on_commit),
+            scope=scope,
+            name=name,
+            workers=workers,
+            max_attempts=max_attempts,
+            deferred=True
+        )
+        if not flush_verse_writer(config):
+            console.print("[bold red]✗ Failed to commit queued verses to the verse store[/bold red]")
+
+        summary = ledger.summary(scope, name)
+
+        console.print(f"\n[bold]This run:[/bold] {results['processed']} processed, "
+                      f"[green]{results['successful']} successful[/green], "
+                      f"[red]{results['failed']} failed[/red]")
+        console.print(f"[bold]Ledger:[/bold] {summary['done']}/{summary['total']} done, "
+                      f"{summary['pending']} pending, {summary['in_flight']} in flight, "
+                      f"{summary['failed']} failed")
+
+        if config.get("response_cache") is not None:
+            print_cache_stats(config["response_cache"])
+
+        close_context_cache(config)
+        print_request_stats()
+
+        for failure in ledger.failures(scope, name)[:10]:
+            console.print(
+                f"[red]✗ {failure['book']} {failure['chapter']}:{failure['verse']} "
+                f"({failure['attempts']} attempts): {failure['last_error']}[/red]"
+            )
 
     except Exception as e:
         console.print(f"[bold red]Error: {str(e)}[/bold red]")
@@ -138,5 +410,295 @@ def download_sources():
         sys.exit(1)
 
 
+@cli.command()
+def build_index():
+    """Compile verse-keyed indexes over the biblical sources.
+
+    Parses every OSHB book once so verse extraction no longer
+    re-parses a whole book file per verse, and records the byte
+    offset of every verse in the SBLGNT text files.
+    """
+    try:
+        console.print("[bold blue]Compiling OSHB index...[/bold blue]")
+
+        sources_dir = get_sources_directory()
+        index_path = compile_oshb_index(get_oshb_path(sources_dir))
+
+        console.print(f"[bold green]✓ OSHB index written to {index_path}[/bold green]")
+
+        console.print("[bold blue]Indexing SBLGNT verse offsets...[/bold blue]")
+
+        text_files = find_sblgnt_text_files(get_sblgnt_path(sources_dir))
+        verse_count = sum(len(open_sblgnt_index(text_file).entries) for text_file in text_files)
+
+        console.print(f"[bold green]✓ Indexed {verse_count} verses in {len(text_files)} SBLGNT files[/bold green]")
+
+    except Exception as e:
+        console.print(f"[bold red]Error: {str(e)}[/bold red]")
+        sys.exit(1)
+
+
+@cli.command()
+def build_tokens():
+    """Build the columnar interlinear token store.
+
+    Streams every book once and stores each word's surface form,
+    lemma, Strong's number and morph code for local interlinear
+    pre-fill and fact-checking.
+    """
+    try:
+        console.print("[bold blue]Building interlinear token store...[/bold blue]")
+
+        sources_dir = get_sources_directory()
+        store_path = get_token_store_path(sources_dir)
+        store = build_token_store(get_oshb_path(sources_dir), get_sblgnt_path(sources_dir), store_path)
+
+        console.print(f"[bold green]✓ Stored {len(store)} tokens to {store_path}[/bold green]")
+
+    except Exception as e:
+        console.print(f"[bold red]Error: {str(e)}[/bold red]")
+        sys.exit(1)
+
+
+@cli.command()
+@click.option('--clear', is_flag=True, help='Remove all cached responses')
+def cache_stats(clear: bool):
+    """Show (or clear) the LLM response cache."""
+    try:
+        cache = open_response_cache()
+
+        if clear:
+            cache.clear()
+            console.print("[bold green]✓ Response cache cleared[/bold green]")
+            return
+
+        stats = cache.stats()
+        console.print(f"Entries: {stats['entries']} ({stats['bytes'] / 1024:.0f} KiB compressed)")
+        console.print(f"Hits: {stats['hits']}  Misses: {stats['misses']}  Hit rate: {stats['hit_rate']:.1%}")
+
+    except Exception as e:
+        console.print(f"[bold red]Error: {str(e)}[/bold red]")
+        sys.exit(1)
+
+
+@cli.command()
+@click.argument('files', nargs=-1, type=click.Path(exists=True, dir_okay=False, path_type=Path))
+@click.option('--all', 'validate_all', is_flag=True, help='Validate every verse file under data/OT and data/NT')
+@click.option('--workers', type=int, default=None, help='Worker processes (default: CPU count)')
+@click.option('--report', 'report_path', type=click.Path(dir_okay=False, path_type=Path), default=None,
+              help='Where to write the JSON report (default: .cpf/reports/validation_report.json)')
+def validate(files, validate_all: bool, workers: int, report_path: Path):
+    """Re-validate written verse files against the schema.
+
+    Runs the schema and mandatory field checks on every file (with
+    --all, the whole data tree) across a process pool and writes a
+    JSON report of failing verse IDs and error paths. Exits non-zero
+    if any verse fails.
+
+    Example: studybible validate --all --workers 8
+    """
+    try:
+        base_path = get_project_root()
+        data_dir = base_path / "data"
+        schema_path = base_path / "schemas" / "verse_schema.json"
+        report_path = report_path or get_validation_report_path()
+
+        paths = list(files)
+        if validate_all:
+            paths.extend(find_verse_files(data_dir))
+        if not paths:
+            console.print("[bold red]Error: pass --all or one or more verse files[/bold red]")
+            sys.exit(1)
+
+        with Progress(console=console) as progress:
+            task = progress.add_task("Validating verses", total=len(paths))
+            report = validate_files(
+                paths,
+                schema_path,
+                workers=workers,
+                on_progress=lambda count: progress.advance(task, count),
+                base_dir=data_dir
+            )
+
+        if not write_report(report, report_path):
+            console.print(f"[bold red]Error: could not write report to {report_path}[/bold red]")
+            sys.exit(1)
+
+        console.print(f"\n[bold]Checked:[/bold] {report['checked']} verses in {report['seconds']:.1f}s")
+        if report['failed']:
+            console.print(f"[red]Failed: {report['failed']}[/red]")
+            for failure in report['failures'][:10]:
+                first = failure['errors'][0]
+                console.print(
+                    f"✗ {failure['verse_id'] or failure['file']}: {first['path']}: {first['message'][:200]}",
+                    style="red", markup=False
+                )
+        else:
+            console.print("[bold green]✓ All verses valid[/bold green]")
+        console.print(f"Report: {report_path}")
+
+        if report['failed']:
+            sys.exit(1)
+
+    except SystemExit:
+        raise
+    except Exception as e:
+        console.print(f"[bold red]Error: {str(e)}[/bold red]")
+        sys.exit(1)
+
+
+@cli.command()
+def build_store():
+    """Load the verse files into the SQLite verse store.
+
+    Imports every data/{OT,NT}/{BOOK}/{CH}/{VS}.json file into
+    .cpf/state/verse_store.sqlite (replacing verses already stored),
+    with extracted columns and tags for querying.
+    """
+    try:
+        console.print("[bold blue]Loading verses into the verse store...[/bold blue]")
+
+        store = VerseStore()
+        count = store.import_tree(get_project_root())
+
+        console.print(f"[bold green]✓ Stored {count} verses ({store.count()} total) in {store.db_path}[/bold green]")
+
+    except Exception as e:
+        console.print(f"[bold red]Error: {str(e)}[/bold red]")
+        sys.exit(1)
+
+
+@cli.command(name='build-tag-postings')
+def build_tag_postings_command():
+    """Build the inverted tag index.
+
+    Indexes the tags of every verse file and writes, for each
+    (category, value) pair, the delta-encoded ordinals of the verses
+    carrying it to .cpf/state/tag_postings.bin for tag-search.
+    """
+    try:
+        console.print("[bold blue]Building tag postings...[/bold blue]")
+
+        indexer = TagIndexer(get_project_root() / "data")
+        indexer.index_all_verses(workers=None)
+
+        postings_path = get_tag_postings_path()
+        postings = build_tag_postings(indexer)
+        postings.save(postings_path)
+
+        console.print(
+            f"[bold green]✓ Indexed {len(postings)} tags over {postings.verse_count()} verses "
+            f"to {postings_path}[/bold green]"
+        )
+
+    except Exception as e:
+        console.print(f"[bold red]Error: {str(e)}[/bold red]")
+        sys.exit(1)
+
+
+@cli.command()
+@click.option('--all', 'all_of', multiple=True, metavar='CATEGORY[=VALUE]', help='Tag every verse must have')
+@click.option('--any', 'any_of', multiple=True, metavar='CATEGORY[=VALUE]', help='Tags of which a verse needs one')
+@click.option('--not', 'none_of', multiple=True, metavar='CATEGORY[=VALUE]', help='Tag a verse must not have')
+@click.option('--counts', is_flag=True, help='Show matching verse counts per category')
+@click.option('--limit', default=50, show_default=True, help='Maximum verse IDs to list')
+def tag_search(all_of, any_of, none_of, counts: bool, limit: int):
+    """Find verses by tag with AND/OR/NOT.
+
+    Terms are CATEGORY=VALUE (e.g. themes=grace) or a bare CATEGORY to
+    match any of its values. Uses the index from build-tag-postings.
+    """
+    try:
+        postings = open_tag_postings()
+        if postings is None:
+            console.print("[bold red]Error: No tag postings found; run build-tag-postings first[/bold red]")
+            sys.exit(1)
+
+        terms = {
+            "all_of": [parse_tag_term(t) for t in all_of],
+            "any_of": [parse_tag_term(t) for t in any_of],
+            "none_of": [parse_tag_term(t) for t in none_of],
+        }
+        ordinals = postings.query(**terms)
+
+        console.print(f"[bold]{len(ordinals)} matching verses[/bold]")
+        for ordinal in ordinals[:limit]:
+            console.print(postings.verse_id(ordinal), markup=False)
+        if len(ordinals) > limit:
+            console.print(f"... and {len(ordinals) - limit} more")
+
+        if counts:
+            for category, count in sorted(postings.category_counts(**terms).items(), key=lambda item: -item[1]):
+                console.print(f"  {category}: {count}", markup=False)
+
+    except SystemExit:
+        raise
+    except Exception as e:
+        console.print(f"[bold red]Error: {str(e)}[/bold red]")
+        sys.exit(1)
+
+
+def _resolve_books(books, all_books: bool, storage: str):
+    """Books named on the command line, or every book in a layout with --all."""
+    books = list(books)
+    if all_books:
+        books.extend(book for book in list_books(get_project_root(), storage) if book not in books)
+    if not books:
+        console.print("[bold red]Error: name one or more books or pass --all[/bold red]")
+        sys.exit(1)
+    return books
+
+
+@cli.command()
+@click.argument('books', nargs=-1)
+@click.option('--all', 'all_books', is_flag=True, help='Pack every book that has verse files')
+def pack(books, all_books: bool):
+    """Export verse files into per-book packed archives.
+
+    Writes data/{OT|NT}/{BOOK}.pack holding every verse of the book
+    compressed, with an offset table for random access. Verse files
+    are left in place.
+
+    Example: studybible pack Acts
+    """
+    try:
+        base_path = get_project_root()
+        for book in _resolve_books(books, all_books, STORAGE_FILES):
+            count = pack_book(book, base_path)
+            console.print(f"[green]✓ {book}: packed {count} verses[/green]")
+
+    except SystemExit:
+        raise
+    except Exception as e:
+        console.print(f"[bold red]Error: {str(e)}[/bold red]")
+        sys.exit(1)
+
+
+@cli.command()
+@click.argument('books', nargs=-1)
+@click.option('--all', 'all_books', is_flag=True, help='Unpack every packed book')
+@click.option('--format', 'fmt', type=click.Choice(WRITE_FORMATS), default=FORMAT_PRETTY,
+              help='Verse file format')
+def unpack(books, all_books: bool, fmt: str):
+    """Import per-book packed archives back into verse files.
+
+    Writes data/{OT|NT}/{BOOK}/{CH}/{VS}.json for every verse in each
+    book's pack, overwriting existing files.
+
+    Example: studybible unpack Acts --format compact
+    """
+    try:
+        base_path = get_project_root()
+        for book in _resolve_books(books, all_books, STORAGE_PACKED):
+            count = unpack_book(book, base_path, fmt=fmt)
+            console.print(f"[green]✓ {book}: wrote {count} verse files[/green]")
+
+    except SystemExit:
+        raise
+    except Exception as e:
+        console.print(f"[bold red]Error: {str(e)}[/bold red]")
+        sys.exit(1)
+
+
 if __name__ == '__main__':
     cli()
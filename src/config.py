@@ -147,6 +147,83 @@ def get_data_path(testament: str, book: str, chapter: int, verse: int) -> Path:
     return verse_path
 
 
+def get_rate_limit_config() -> Dict[str, Any]:
+    """
+    Get API rate limit settings (enforced by src.rate_limiter).
+
+    Top-level values apply to Gemini; "providers" overrides them for the
+    fact-checking APIs.
+
+    Returns:
+        Dict: Rate limit settings
+    """
+    return {
+        "requests_per_minute": 15,  # Free tier limit
+        "tokens_per_minute": 1_000_000,  # Free tier limit
+        "delay_between_requests": 4,  # Seconds
+        "max_retries": 3,
+        "backoff_multiplier": 2,
+        "providers": {
+            "grok": {"requests_per_minute": 60, "tokens_per_minute": None, "delay_between_requests": 0},
+            "openai": {"requests_per_minute": 60, "tokens_per_minute": None, "delay_between_requests": 0},
+        },
+    }
+
+
+def get_response_cache_config() -> Dict[str, Any]:
+    """
+    Get LLM response cache settings (used by src.response_cache).
+
+    Returns:
+        Dict: Response cache settings
+    """
+    return {
+        "max_bytes": 512 * 1024 * 1024,  # Compressed size budget
+        "max_age_days": 30,
+    }
+
+
+def get_context_cache_config() -> Dict[str, Any]:
+    """
+    Get Gemini context cache settings (used by src.gemini_client).
+
+    Returns:
+        Dict: Context cache settings
+    """
+    return {
+        "ttl_seconds": 3600,  # Lifetime of the cached study prompt
+        "refresh_margin_seconds": 300,  # Extend the TTL this long before expiry
+    }
+
+
+def get_verse_batch_config() -> Dict[str, Any]:
+    """
+    Get multi-verse batching settings (used by src.exegesis_generator).
+
+    Returns:
+        Dict: Verse batching settings
+    """
+    return {
+        "token_budget": 32_000,  # Tokens per request spent on verses (text plus answer)
+        "output_tokens_per_verse": 4_000,  # Expected answer size per verse
+    }
+
+
+def get_data_writer_config() -> Dict[str, Any]:
+    """
+    Get verse file write settings (used by src.data_writer).
+
+    Returns:
+        Dict: Data writer settings
+    """
+    return {
+        "format": "pretty",  # pretty, compact or canonical
+        "fsync": False,  # Flush each verse file and its directory to disk
+        "storage": "files",  # files (one JSON per verse), packed (one archive per book) or sqlite (verse store)
+        "store_batch_size": 50,  # Verses per verse store transaction (or per pack rewrite)
+    }
+
+
 def load_config() -> Dict[str, Any]:
     """
     Load complete configuration for StudyBible system.
@@ -184,12 +261,11 @@ def load_config() -> Dict[str, Any]:
             "oshb": get_sources_directory() / "morphhb",
             "sblgnt": get_sources_directory() / "sblgnt",
         },
-        "rate_limit": {
-            "requests_per_minute": 15,  # Free tier limit
-            "delay_between_requests": 4,  # Seconds
-            "max_retries": 3,
-            "backoff_multiplier": 2,
-        },
+        "rate_limit": get_rate_limit_config(),
+        "response_cache": get_response_cache_config(),
+        "context_cache": get_context_cache_config(),
+        "verse_batch": get_verse_batch_config(),
+        "data_writer": get_data_writer_config(),
         "generation": {
             "temperature": 0.7,
             "max_tokens": 8192,
@@ -0,0 +1,639 @@
+"""
+Corpus Index Module
+
+Pre-compiled, verse-keyed indexes over the biblical source texts so that
+verse lookups no longer re-parse a whole book file for every verse.
+
+- OSHB (Hebrew): one-time compile of the morphhb XML into a SQLite index
+  holding word text, lemma and morph for every osisID
+- SBLGNT (Greek): byte offset/length of every verse in a text file, read
+  back through mmap so a lookup is one seek-and-slice
+
+Functions:
+    get_oshb_index_path: Default index location for an OSHB path
+    compile_oshb_index: Parse all OSHB book files once and build the index
+    open_oshb_index: Open (and reuse) a compiled index if it is current
+    get_sblgnt_index_path: Offset index location for an SBLGNT text file
+    build_sblgnt_index: Scan an SBLGNT text file once and record verse offsets
+    open_sblgnt_index: Load (or build) the offset index for a text file
+    find_sblgnt_text_files: List the SBLGNT text files under a directory
+
+Classes:
+    OSHBIndex: Read-only verse lookups against a compiled OSHB index
+    SBLGNTIndex: mmap-backed verse lookups against an SBLGNT text file
+"""
+
+import hashlib
+import json
+import mmap
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Optional, List, Dict, Tuple, Any
+from lxml import etree
+
+
+# OSIS namespace used by the morphhb XML files
+OSIS_NS = "http://www.bibletechnologies.net/2003/OSIS/namespace"
+
+# Index file names
+OSHB_INDEX_FILENAME = "oshb_index.sqlite"
+
+# Bump when the index layout changes so old files are rebuilt
+INDEX_FORMAT_VERSION = 1
+
+OSHB_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS sources (
+    path TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS verses (
+    osis_id TEXT PRIMARY KEY,
+    text TEXT NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS words (
+    osis_id TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    text TEXT NOT NULL,
+    lemma TEXT,
+    morph TEXT,
+    PRIMARY KEY (osis_id, position)
+) WITHOUT ROWID;
+"""
+
+# Indexes shared across calls: index path ->
+# (index mtime_ns, source stats, OSHBIndex or None if stale, source paths)
+_open_indexes: Dict[Path, Tuple[int, Tuple, Optional["OSHBIndex"], List[str]]] = {}
+_open_indexes_lock = threading.Lock()
+
+# SBLGNT line layouts recorded in the offset index
+LAYOUT_TAB = "tab"  # Faithlife/SBLGNT: "Acts 10:44<tab>Greek text"
+LAYOUT_MORPHGNT = "morphgnt"  # "44 10 44 word ..." one word per line
+
+# Loaded offset indexes: resolved text file path -> SBLGNTIndex
+_sblgnt_indexes: Dict[Path, "SBLGNTIndex"] = {}
+_sblgnt_indexes_lock = threading.Lock()
+
+
+def get_oshb_index_path(oshb_path: Path) -> Path:
+    """
+    Get the default index location for an OSHB directory or XML file.
+
+    Args:
+        oshb_path: Path to OSHB directory or single book XML file
+
+    Returns:
+        Path to the SQLite index file
+    """
+    if oshb_path.is_dir():
+        return oshb_path / OSHB_INDEX_FILENAME
+    return oshb_path.parent / f"{oshb_path.stem}.index.sqlite"
+
+
+def _find_oshb_book_files(oshb_path: Path) -> List[Path]:
+    """
+    List the OSHB book XML files under a directory (or the file itself).
+
+    Args:
+        oshb_path: Path to OSHB directory or single book XML file
+
+    Returns:
+        Sorted list of XML file paths
+    """
+    if not oshb_path.is_dir():
+        return [oshb_path] if oshb_path.exists() else []
+
+    # OSHB structure: wlc/Gen.xml; fall back to XML files at the top level
+    wlc_dir = oshb_path / "wlc"
+    search_dir = wlc_dir if wlc_dir.is_dir() else oshb_path
+    return sorted(p for p in search_dir.glob("*.xml") if p.is_file())
+
+
+def parse_oshb_book(xml_file: Path) -> List[Tuple[str, List[Tuple[str, Optional[str], Optional[str]]]]]:
+    """
+    Parse one OSHB book file into (osisID, words) pairs.
+
+    Words keep document order and only include elements with text, which
+    matches what extract_hebrew_verse joins into the verse text.
+
+    Args:
+        xml_file: Path to OSHB book XML file
+
+    Returns:
+        List of (osis_id, [(text, lemma, morph), ...])
+    """
+    verse_tag = f"{{{OSIS_NS}}}verse"
+    word_tag = f"{{{OSIS_NS}}}w"
+
+    verses = []
+    tree = etree.parse(str(xml_file))
+    for verse_elem in tree.getroot().iter(verse_tag):
+        osis_id = verse_elem.get("osisID")
+        if not osis_id:
+            continue
+        words = [
+            (word.text, word.get("lemma"), word.get("morph"))
+            for word in verse_elem.iter(word_tag)
+            if word.text
+        ]
+        verses.append((osis_id, words))
+
+    return verses
+
+
+def compile_oshb_index(oshb_path: Path, index_path: Optional[Path] = None) -> Path:
+    """
+    Compile the OSHB XML files into a verse-keyed SQLite index.
+
+    Every book file is parsed exactly once. The index is written to a
+    temporary file and renamed into place, so readers never see a
+    half-built index.
+
+    Args:
+        oshb_path: Path to OSHB directory or single book XML file
+        index_path: Where to write the index (default: get_oshb_index_path)
+
+    Returns:
+        Path to the compiled index
+
+    Raises:
+        FileNotFoundError: If no OSHB XML files are found
+        etree.XMLSyntaxError: If a book file is not well-formed
+    """
+    book_files = _find_oshb_book_files(oshb_path)
+    if not book_files:
+        raise FileNotFoundError(f"No OSHB XML files found at: {oshb_path}")
+
+    if index_path is None:
+        index_path = get_oshb_index_path(oshb_path)
+
+    index_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = index_path.with_suffix(".tmp")
+    if tmp_path.exists():
+        tmp_path.unlink()
+
+    conn = sqlite3.connect(str(tmp_path))
+    try:
+        conn.executescript(OSHB_SCHEMA)
+        conn.execute(
+            "INSERT INTO meta (key, value) VALUES ('format_version', ?)",
+            (str(INDEX_FORMAT_VERSION),)
+        )
+
+        for xml_file in book_files:
+            stat = xml_file.stat()
+            conn.execute(
+                "INSERT INTO sources (path, mtime_ns, size) VALUES (?, ?, ?)",
+                (str(xml_file.resolve()), stat.st_mtime_ns, stat.st_size)
+            )
+
+            for osis_id, words in parse_oshb_book(xml_file):
+                conn.execute(
+                    "INSERT OR REPLACE INTO verses (osis_id, text) VALUES (?, ?)",
+                    (osis_id, " ".join(text for text, _, _ in words))
+                )
+                conn.executemany(
+                    "INSERT OR REPLACE INTO words (osis_id, position, text, lemma, morph) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    [
+                        (osis_id, position, text, lemma, morph)
+                        for position, (text, lemma, morph) in enumerate(words, start=1)
+                    ]
+                )
+
+        conn.commit()
+    finally:
+        conn.close()
+
+    # Drop any cached handle on the old index before replacing it
+    _close_cached_index(index_path)
+    tmp_path.replace(index_path)
+
+    return index_path
+
+
+class OSHBIndex:
+    """Read-only verse lookups against a compiled OSHB index"""
+
+    def __init__(self, index_path: Path):
+        self.index_path = Path(index_path)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            f"file:{self.index_path}?mode=ro", uri=True, check_same_thread=False
+        )
+
+    def is_stale(self) -> bool:
+        """Check whether any source file changed since the index was built"""
+        with self._lock:
+            try:
+                version = self._conn.execute(
+                    "SELECT value FROM meta WHERE key = 'format_version'"
+                ).fetchone()
+                sources = self._conn.execute(
+                    "SELECT path, mtime_ns, size FROM sources"
+                ).fetchall()
+            except sqlite3.DatabaseError:
+                return True
+
+        if version is None or int(version[0]) != INDEX_FORMAT_VERSION:
+            return True
+
+        for path, mtime_ns, size in sources:
+            try:
+                stat = Path(path).stat()
+            except OSError:
+                return True
+            if stat.st_mtime_ns != mtime_ns or stat.st_size != size:
+                return True
+
+        return False
+
+    def source_paths(self) -> List[str]:
+        """Paths of the source files the index was built from"""
+        with self._lock:
+            try:
+                rows = self._conn.execute("SELECT path FROM sources ORDER BY path").fetchall()
+            except sqlite3.DatabaseError:
+                return []
+        return [row[0] for row in rows]
+
+    def get_text(self, osis_id: str) -> Optional[str]:
+        """
+        Get the joined word text for a verse.
+
+        Args:
+            osis_id: OSIS verse ID (e.g., "Gen.1.1")
+
+        Returns:
+            Verse text or None if the verse is not in the index
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT text FROM verses WHERE osis_id = ?", (osis_id,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def get_words(self, osis_id: str) -> List[Dict[str, Optional[str]]]:
+        """
+        Get the words of a verse with their lemma and morph codes.
+
+        Args:
+            osis_id: OSIS verse ID (e.g., "Gen.1.1")
+
+        Returns:
+            List of {"text", "lemma", "morph"} dicts in verse order
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT text, lemma, morph FROM words WHERE osis_id = ? ORDER BY position",
+                (osis_id,)
+            ).fetchall()
+        return [{"text": text, "lemma": lemma, "morph": morph} for text, lemma, morph in rows]
+
+    def close(self) -> None:
+        """Close the underlying database connection"""
+        with self._lock:
+            self._conn.close()
+
+
+def _close_cached_index(index_path: Path) -> None:
+    """Close and forget a cached index handle, if one is open."""
+    with _open_indexes_lock:
+        cached = _open_indexes.pop(index_path.resolve(), None)
+    if cached is not None and cached[2] is not None:
+        cached[2].close()
+
+
+def _stat_sources(paths: List[str]) -> Tuple[Optional[Tuple[int, int]], ...]:
+    """(mtime_ns, size) of each source file, None where it is missing"""
+    stats = []
+    for path in paths:
+        try:
+            stat = Path(path).stat()
+        except OSError:
+            stats.append(None)
+            continue
+        stats.append((stat.st_mtime_ns, stat.st_size))
+    return tuple(stats)
+
+
+def open_oshb_index(oshb_path: Path) -> Optional[OSHBIndex]:
+    """
+    Open the compiled index for an OSHB path if it exists and is current.
+
+    The outcome is cached per index file, stale indexes included, together
+    with the mtimes of the index and its source files. is_stale() is only
+    rerun once one of those changes, so repeated lookups cost a few stats
+    and a single primary-key query.
+
+    Args:
+        oshb_path: Path to OSHB directory or single book XML file
+
+    Returns:
+        OSHBIndex or None if no usable index exists
+    """
+    try:
+        key = get_oshb_index_path(oshb_path).resolve()
+        index_mtime_ns = key.stat().st_mtime_ns
+    except OSError:
+        return None
+
+    with _open_indexes_lock:
+        cached = _open_indexes.get(key)
+        if cached is not None and cached[0] == index_mtime_ns and _stat_sources(cached[3]) == cached[1]:
+            return cached[2]
+
+        if cached is not None and cached[2] is not None:
+            cached[2].close()
+
+        try:
+            index = OSHBIndex(key)
+        except sqlite3.Error:
+            index = None
+
+        source_paths = index.source_paths() if index is not None else []
+        source_stats = _stat_sources(source_paths)
+        if index is not None and index.is_stale():
+            index.close()
+            index = None
+
+        _open_indexes[key] = (index_mtime_ns, source_stats, index, source_paths)
+        return index
+
+
+def get_sblgnt_index_path(text_file: Path) -> Path:
+    """
+    Get the offset index location for an SBLGNT text file.
+
+    Args:
+        text_file: Path to SBLGNT text file
+
+    Returns:
+        Path to the JSON offset index stored next to the text file
+    """
+    return text_file.with_name(f"{text_file.name}.offsets.json")
+
+
+def _hash_file(file_path: Path) -> str:
+    """Compute the SHA-256 of a file's contents."""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def morphgnt_verse_key(book_num: int, chapter: int, verse: int) -> str:
+    """Key for a verse in the space-delimited MorphGNT layout."""
+    return f"{book_num}.{chapter}.{verse}"
+
+
+def build_sblgnt_index(text_file: Path) -> Dict[str, Any]:
+    """
+    Scan an SBLGNT text file once and record where every verse lives.
+
+    Tab-delimited lines map "{book} {chapter}:{verse}" to the byte range of
+    the verse text. Space-delimited MorphGNT lines (one word per line) map
+    "{book_num}.{chapter}.{verse}" to the byte range spanning all of the
+    verse's lines. As with the original scan, the first match wins.
+
+    Args:
+        text_file: Path to SBLGNT text file
+
+    Returns:
+        Index dict with source mtime, size, hash and verse entries
+    """
+    entries: Dict[str, List[Any]] = {}
+    stat = text_file.stat()
+
+    offset = 0
+    with open(text_file, 'rb') as f:
+        for raw_line in f:
+            line_start = offset
+            offset += len(raw_line)
+
+            line = raw_line.decode('utf-8').strip()
+            if not line or line.startswith('#'):
+                continue
+
+            if '\t' in line:
+                ref, sep, _ = raw_line.partition(b'\t')
+                key = ref.decode('utf-8').strip()
+                if sep and key not in entries:
+                    text_start = line_start + len(ref) + 1
+                    entries[key] = [text_start, offset - text_start, LAYOUT_TAB]
+            else:
+                parts = line.split()
+                if len(parts) < 4:
+                    continue
+                try:
+                    key = morphgnt_verse_key(int(parts[0]), int(parts[1]), int(parts[2]))
+                except ValueError:
+                    continue
+
+                entry = entries.get(key)
+                if entry is None:
+                    entries[key] = [line_start, offset - line_start, LAYOUT_MORPHGNT]
+                elif entry[2] == LAYOUT_MORPHGNT:
+                    # Extend the range to cover this verse's later lines
+                    entry[1] = offset - entry[0]
+
+    return {
+        "format_version": INDEX_FORMAT_VERSION,
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "sha256": _hash_file(text_file),
+        "entries": entries,
+    }
+
+
+class SBLGNTIndex:
+    """mmap-backed verse lookups against an SBLGNT text file"""
+
+    def __init__(self, text_file: Path, index_data: Dict[str, Any]):
+        self.text_file = Path(text_file)
+        self.mtime_ns = index_data["mtime_ns"]
+        self.size = index_data["size"]
+        self.entries = index_data["entries"]
+        self._mmap = None
+
+        if self.size > 0:
+            with open(self.text_file, 'rb') as f:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def matches_file(self) -> bool:
+        """Check that the text file is unchanged since it was mapped"""
+        try:
+            stat = self.text_file.stat()
+        except OSError:
+            return False
+        return stat.st_mtime_ns == self.mtime_ns and stat.st_size == self.size
+
+    def get_text(self, key: str) -> Optional[str]:
+        """
+        Get the verse text stored under an index key.
+
+        Args:
+            key: "{book} {chapter}:{verse}" or a morphgnt_verse_key()
+
+        Returns:
+            Verse text or None if the key is not in the index
+        """
+        entry = self.entries.get(key)
+        if entry is None or self._mmap is None:
+            return None
+
+        if entry[2] == LAYOUT_TAB:
+            return self._read(entry).strip()
+
+        words = [fields[3] for fields in self.get_word_fields(key)]
+        return " ".join(words) if words else None
+
+    def get_word_fields(self, key: str) -> List[List[str]]:
+        """
+        Get the whitespace-separated fields of every word in a verse.
+
+        Args:
+            key: "{book} {chapter}:{verse}" or a morphgnt_verse_key()
+
+        Returns:
+            One field list per word: the full MorphGNT line, or just the
+            word itself for the tab-delimited layout
+        """
+        entry = self.entries.get(key)
+        if entry is None or self._mmap is None:
+            return []
+
+        chunk = self._read(entry)
+        if entry[2] == LAYOUT_TAB:
+            return [[word] for word in chunk.split()]
+
+        # MorphGNT: one word per line; keep only lines for this verse
+        fields = []
+        for line in chunk.splitlines():
+            parts = line.split()
+            if len(parts) < 4:
+                continue
+            try:
+                line_key = morphgnt_verse_key(int(parts[0]), int(parts[1]), int(parts[2]))
+            except ValueError:
+                continue
+            if line_key == key:
+                fields.append(parts)
+
+        return fields
+
+    def _read(self, entry: List[Any]) -> str:
+        """Slice and decode the byte range of an index entry."""
+        offset, length, _ = entry
+        return self._mmap[offset:offset + length].decode('utf-8')
+
+    def close(self) -> None:
+        """Release the memory map"""
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+
+def _load_sblgnt_index_data(text_file: Path) -> Dict[str, Any]:
+    """
+    Load the persisted offset index for a text file, rebuilding if needed.
+
+    A stored index is reused when the file's mtime and size still match.
+    If only the mtime changed (e.g. after a fresh checkout), the content
+    hash decides whether the offsets are still valid.
+    """
+    index_path = get_sblgnt_index_path(text_file)
+    stat = text_file.stat()
+
+    index_data = None
+    try:
+        with open(index_path, 'r', encoding='utf-8') as f:
+            index_data = json.load(f)
+    except (IOError, OSError, json.JSONDecodeError):
+        index_data = None
+
+    if index_data is not None:
+        if (index_data.get("format_version") != INDEX_FORMAT_VERSION
+                or index_data.get("size") != stat.st_size):
+            index_data = None
+        elif index_data.get("mtime_ns") != stat.st_mtime_ns:
+            if index_data.get("sha256") == _hash_file(text_file):
+                index_data["mtime_ns"] = stat.st_mtime_ns
+                _save_sblgnt_index_data(index_path, index_data)
+            else:
+                index_data = None
+
+    if index_data is None:
+        index_data = build_sblgnt_index(text_file)
+        _save_sblgnt_index_data(index_path, index_data)
+
+    return index_data
+
+
+def _save_sblgnt_index_data(index_path: Path, index_data: Dict[str, Any]) -> None:
+    """Persist an offset index next to its text file (best effort)."""
+    tmp_path = index_path.with_suffix(".tmp")
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(index_data, f, ensure_ascii=False, separators=(',', ':'))
+        tmp_path.replace(index_path)
+    except (IOError, OSError):
+        # Read-only source trees still get an in-memory index
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+
+
+def open_sblgnt_index(text_file: Path) -> SBLGNTIndex:
+    """
+    Get the offset index for an SBLGNT text file, building it on first use.
+
+    Loaded indexes are shared across calls and threads; a changed text
+    file is detected by its mtime and size and re-indexed.
+
+    Args:
+        text_file: Path to SBLGNT text file
+
+    Returns:
+        SBLGNTIndex for the file
+
+    Raises:
+        OSError: If the text file cannot be read
+    """
+    key = text_file.resolve()
+    with _sblgnt_indexes_lock:
+        index = _sblgnt_indexes.get(key)
+        if index is not None and index.matches_file():
+            return index
+
+        if index is not None:
+            index.close()
+
+        index = SBLGNTIndex(key, _load_sblgnt_index_data(key))
+        _sblgnt_indexes[key] = index
+        return index
+
+
+def find_sblgnt_text_files(sblgnt_path: Path) -> List[Path]:
+    """
+    List the SBLGNT text files in the layouts extract_greek_verse reads.
+
+    Args:
+        sblgnt_path: Path to SBLGNT directory or text file
+
+    Returns:
+        Sorted list of text file paths
+    """
+    if not sblgnt_path.is_dir():
+        return [sblgnt_path] if sblgnt_path.exists() else []
+
+    candidates = list((sblgnt_path / "data" / "sblgnt" / "text").glob("*.txt"))
+    candidates += [sblgnt_path / "sblgnt.txt", sblgnt_path / "data" / "sblgnt.txt"]
+    return sorted(p for p in candidates if p.is_file())
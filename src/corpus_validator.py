@@ -0,0 +1,189 @@
+"""
+Corpus Validator Module
+
+Re-validates every written verse file (data/{OT,NT}/{BOOK}/{CH}/{VS}.json)
+against the verse schema and the mandatory field checks, fanning the work
+out across a process pool, and produces a machine-readable report of the
+failing verses and their error paths.
+
+Functions:
+    find_verse_files: List every verse JSON file under the data directory
+    check_verse_file: Validate one verse file
+    validate_files: Validate many verse files on a process pool
+    get_validation_report_path: Get the default report location
+    write_report: Write a validation report as JSON
+"""
+
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Callable, Sequence, Union
+
+from src.config import get_project_root
+from src.data_writer import atomic_write
+from src.schema_validator import get_fast_validator, get_validator, get_mandatory_field_errors
+
+
+# Files handed to a worker process at a time
+DEFAULT_CHUNK_SIZE = 250
+
+REPORT_VERSION = 1
+
+
+def find_verse_files(data_dir: Path) -> List[Path]:
+    """
+    List every verse JSON file under the data directory.
+
+    Args:
+        data_dir: Data directory containing OT/ and NT/
+
+    Returns:
+        Sorted list of verse file paths
+    """
+    files = []
+    for testament in ("OT", "NT"):
+        testament_dir = Path(data_dir) / testament
+        if testament_dir.is_dir():
+            files.extend(testament_dir.rglob("*.json"))
+    return sorted(files)
+
+
+def _error(kind: str, message: str) -> Dict[str, str]:
+    """Report entry from a "path: message" string."""
+    path, _, text = message.partition(": ")
+    return {"check": kind, "path": path, "message": text}
+
+
+def check_verse_file(path: Union[Path, str], schema_path: Union[Path, str]) -> Optional[Dict[str, Any]]:
+    """
+    Validate one verse file against the schema and mandatory field checks.
+
+    Args:
+        path: Verse JSON file
+        schema_path: Path to schema file
+
+    Returns:
+        None if the verse passes, otherwise a dict with file, verse_id
+        and errors (each with check, path and message)
+    """
+    path = Path(path)
+    failure = {"file": str(path), "verse_id": None, "errors": []}
+
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            verse_data = json.load(f)
+    except (OSError, UnicodeDecodeError, json.JSONDecodeError) as e:
+        failure["errors"].append({"check": "json", "path": "root", "message": str(e)})
+        return failure
+
+    if isinstance(verse_data, dict) and isinstance(verse_data.get("verse_id"), str):
+        failure["verse_id"] = verse_data["verse_id"]
+
+    if not get_fast_validator(schema_path)(verse_data):
+        for error in get_validator(schema_path).iter_errors(verse_data):
+            failure["errors"].append({
+                "check": "schema",
+                "path": ".".join(str(p) for p in error.path) if error.path else "root",
+                "message": error.message
+            })
+
+    if isinstance(verse_data, dict):
+        failure["errors"].extend(_error("mandatory", e) for e in get_mandatory_field_errors(verse_data))
+    else:
+        failure["errors"].append({"check": "mandatory", "path": "root", "message": "not an object"})
+
+    return failure if failure["errors"] else None
+
+
+def _check_chunk(paths: Sequence[str], schema_path: str) -> List[Dict[str, Any]]:
+    """Validate a chunk of files (runs in a worker process)."""
+    return [failure for failure in (check_verse_file(path, schema_path) for path in paths) if failure]
+
+
+def validate_files(
+    paths: Sequence[Path],
+    schema_path: Union[Path, str],
+    workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    on_progress: Optional[Callable[[int], None]] = None,
+    base_dir: Optional[Path] = None
+) -> Dict[str, Any]:
+    """
+    Validate many verse files, in parallel across processes.
+
+    Args:
+        paths: Verse JSON files
+        schema_path: Path to schema file
+        workers: Worker processes (default: CPU count; 1 runs in-process)
+        chunk_size: Files per task handed to a worker
+        on_progress: Called with the number of files finished after each chunk
+        base_dir: Report file paths relative to this directory
+
+    Returns:
+        Report dict with schema, checked, failed, seconds and failures
+        (sorted by file)
+    """
+    start = time.perf_counter()
+    workers = workers or os.cpu_count() or 1
+    chunk_size = max(1, chunk_size)
+    schema_path = str(schema_path)
+
+    names = [str(path) for path in paths]
+    chunks = [names[i:i + chunk_size] for i in range(0, len(names), chunk_size)]
+
+    failures = []
+    if workers == 1 or len(chunks) <= 1:
+        for chunk in chunks:
+            failures.extend(_check_chunk(chunk, schema_path))
+            if on_progress:
+                on_progress(len(chunk))
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as executor:
+            futures = {executor.submit(_check_chunk, chunk, schema_path): len(chunk) for chunk in chunks}
+            for future in as_completed(futures):
+                failures.extend(future.result())
+                if on_progress:
+                    on_progress(futures[future])
+
+    if base_dir is not None:
+        for failure in failures:
+            try:
+                failure["file"] = Path(failure["file"]).relative_to(base_dir).as_posix()
+            except ValueError:
+                pass
+    failures.sort(key=lambda failure: failure["file"])
+
+    return {
+        "version": REPORT_VERSION,
+        "schema": schema_path,
+        "checked": len(names),
+        "failed": len(failures),
+        "seconds": round(time.perf_counter() - start, 3),
+        "failures": failures
+    }
+
+
+def get_validation_report_path() -> Path:
+    """
+    Get the default report location.
+
+    Returns:
+        Path under the project's .cpf/reports directory
+    """
+    return get_project_root() / ".cpf" / "reports" / "validation_report.json"
+
+
+def write_report(report: Dict[str, Any], report_path: Path) -> bool:
+    """
+    Write a validation report as JSON.
+
+    Args:
+        report: Report from validate_files()
+        report_path: Destination file
+
+    Returns:
+        True if written successfully, False otherwise
+    """
+    return atomic_write(Path(report_path), json.dumps(report, indent=2, ensure_ascii=False) + "\n")
@@ -4,18 +4,101 @@ Data Writer Module
 Handles atomic writing of verse JSON data to the file system.
 Structure: data/{OT|NT}/{BOOK}/{CH}/{VS}.json
 
+Verse files can be written pretty-printed (the default), compact or
+canonical (compact with sorted keys). Each write hashes the bytes it
+writes and verifies the file by re-hashing it rather than re-parsing
+the JSON; fsync of the file and its directory is optional. Per-write
+latency is collected in module-level write statistics.
+
+Verses can instead be stored packed: one data/{OT|NT}/{BOOK}.pack file
+per book holding compressed verse records (zstd when the `zstandard`
+package is installed, zlib otherwise) and an offset table for random
+access by (chapter, verse). pack_book/unpack_book convert between the
+two layouts and read_verse reads from either. Adding a verse rewrites
+its whole pack, so generation queues packed verses in a
+verse_store.VerseBatchWriter over a PackedVerseSink, which rewrites
+each book's pack once per batch.
+
 Functions:
     get_verse_path: Get file path for a verse
+    serialize_verse: Serialize verse data in a write format
     write_verse_json: Write verse data to file
     atomic_write: Perform atomic file write
+    atomic_write_bytes: Atomically write bytes and return their hash
     verify_written_file: Verify file was written correctly
+    verify_file_hash: Verify a file by hashing its bytes
+    get_write_stats: Get per-write latency statistics
+    get_pack_path: Get the packed archive path for a book
+    open_verse_pack: Open a pack (cached until the file changes)
+    read_verse: Read a verse from either storage layout
+    pack_book: Copy a book's verse files into its pack
+    unpack_book: Write a book's packed verses out as verse files
+    list_books: List books present in a storage layout
+    reset_write_stats: Clear the write statistics
     get_testament_for_book: Determine testament (OT/NT) for a book
+
+Classes:
+    VersePack: Random-access reader for a packed book archive
+    PackedVerseSink: Writes batches of verses into their books' packs
 """
 
+import hashlib
 import json
-import tempfile
+import logging
+import os
+import struct
+import threading
+import time
+import zlib
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple, List, Iterable
+
+try:
+    import zstandard
+except ImportError:  # Optional dependency
+    zstandard = None
+
+try:
+    import fcntl
+except ImportError:  # Not available on Windows
+    fcntl = None
+
+
+logger = logging.getLogger(__name__)
+
+# Verse file formats
+FORMAT_PRETTY = "pretty"  # Indented, human-readable
+FORMAT_COMPACT = "compact"  # No insignificant whitespace
+FORMAT_CANONICAL = "canonical"  # Compact with sorted keys (byte-stable)
+WRITE_FORMATS = (FORMAT_PRETTY, FORMAT_COMPACT, FORMAT_CANONICAL)
+
+# Verse storage backends
+STORAGE_FILES = "files"  # One JSON file per verse
+STORAGE_PACKED = "packed"  # One compressed archive per book
+
+# Pack file layout: magic, header length, JSON header (with offset table), records
+PACK_MAGIC = b"SBVPACK\x00"
+PACK_FORMAT_VERSION = 1
+PACK_SUFFIX = ".pack"
+
+# Cross-process pack write locks, kept out of data/ (relative to the base path)
+PACK_LOCK_DIR = Path(".cpf") / "state" / "pack_locks"
+
+CODEC_ZSTD = "zstd"
+CODEC_ZLIB = "zlib"
+
+# Open packs: path -> ((mtime_ns, size), VersePack)
+_open_packs: Dict[Path, Tuple[Tuple[int, int], "VersePack"]] = {}
+_open_packs_lock = threading.Lock()
+
+# Per-pack write locks
+_pack_locks: Dict[Path, threading.Lock] = {}
+_pack_locks_lock = threading.Lock()
+
+# Latency totals for write_verse_json (seconds)
+_write_stats: Dict[str, float] = {}
+_write_stats_lock = threading.Lock()
 
 
 # New Testament books for routing
@@ -81,43 +164,105 @@ def get_verse_path(
     return path
 
 
-def atomic_write(target_path: Path, content: str) -> bool:
+def serialize_verse(verse_data: Dict[str, Any], fmt: str = FORMAT_PRETTY) -> bytes:
     """
-    Perform atomic file write using temporary file.
+    Serialize verse data in a write format.
+
+    Args:
+        verse_data: Verse data dictionary
+        fmt: "pretty" (indent=2), "compact" or "canonical" (compact, sorted keys)
+
+    Returns:
+        UTF-8 encoded JSON
+
+    Raises:
+        ValueError: If the format is unknown
+    """
+    if fmt == FORMAT_PRETTY:
+        text = json.dumps(verse_data, indent=2, ensure_ascii=False)
+    elif fmt == FORMAT_COMPACT:
+        text = json.dumps(verse_data, separators=(',', ':'), ensure_ascii=False)
+    elif fmt == FORMAT_CANONICAL:
+        text = json.dumps(verse_data, separators=(',', ':'), ensure_ascii=False, sort_keys=True)
+    else:
+        raise ValueError(f"Unknown write format: {fmt}")
+    return text.encode('utf-8')
+
+
+def _fsync_directory(directory: Path) -> None:
+    """Flush a directory entry (the rename) to disk where supported."""
+    try:
+        fd = os.open(str(directory), os.O_RDONLY)
+    except OSError:
+        return  # Directories cannot be opened on Windows
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def atomic_write_bytes(target_path: Path, data: bytes, fsync: bool = False) -> Optional[str]:
+    """
+    Atomically write bytes, hashing them as they are written.
 
     Writes to a temporary file first, then renames to target.
-    This ensures partial writes don't corrupt data.
 
     Args:
         target_path: Target file path
-        content: Content to write
+        data: Content to write
+        fsync: Flush the file and its directory to disk before returning
 
     Returns:
-        True if successful, False otherwise
+        SHA-256 hex digest of the written bytes, or None on failure
     """
+    tmp_path = target_path.with_suffix('.tmp')
     try:
         # Ensure parent directory exists
         target_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Write to temporary file in same directory
-        tmp_path = target_path.with_suffix('.tmp')
+        digest = hashlib.sha256(data).hexdigest()
 
-        with open(tmp_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+        # Write to temporary file in same directory
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
 
         # Atomic rename
         tmp_path.replace(target_path)
 
-        return True
+        if fsync:
+            _fsync_directory(target_path.parent)
+
+        return digest
 
-    except (IOError, OSError) as e:
+    except (IOError, OSError):
         # Clean up temp file if it exists
         if tmp_path.exists():
             try:
                 tmp_path.unlink()
-            except:
+            except OSError:
                 pass
-        return False
+        return None
+
+
+def atomic_write(target_path: Path, content: str, fsync: bool = False) -> bool:
+    """
+    Perform atomic file write using temporary file.
+
+    Writes to a temporary file first, then renames to target.
+    This ensures partial writes don't corrupt data.
+
+    Args:
+        target_path: Target file path
+        content: Content to write
+        fsync: Flush the file and its directory to disk before returning
+
+    Returns:
+        True if successful, False otherwise
+    """
+    return atomic_write_bytes(target_path, content.encode('utf-8'), fsync=fsync) is not None
 
 
 def verify_written_file(
@@ -147,41 +292,539 @@ def verify_written_file(
         return False
 
 
+def verify_file_hash(file_path: Path, expected_hash: str) -> bool:
+    """
+    Verify a file by hashing its bytes (no JSON parsing).
+
+    Args:
+        file_path: Path to written file
+        expected_hash: SHA-256 hex digest returned by atomic_write_bytes
+
+    Returns:
+        True if the file's contents hash to expected_hash, False otherwise
+    """
+    try:
+        with open(file_path, 'rb') as f:
+            return hashlib.sha256(f.read()).hexdigest() == expected_hash
+    except (IOError, OSError):
+        return False
+
+
+def _record_write(serialize: float, write: float, verify: float, size: int) -> None:
+    """Add one write's latency to the module statistics."""
+    total = serialize + write + verify
+    with _write_stats_lock:
+        _write_stats["writes"] = _write_stats.get("writes", 0) + 1
+        _write_stats["bytes"] = _write_stats.get("bytes", 0) + size
+        _write_stats["serialize_seconds"] = _write_stats.get("serialize_seconds", 0.0) + serialize
+        _write_stats["write_seconds"] = _write_stats.get("write_seconds", 0.0) + write
+        _write_stats["verify_seconds"] = _write_stats.get("verify_seconds", 0.0) + verify
+        _write_stats["total_seconds"] = _write_stats.get("total_seconds", 0.0) + total
+        _write_stats["max_seconds"] = max(_write_stats.get("max_seconds", 0.0), total)
+        _write_stats["last_seconds"] = total
+
+
+def get_write_stats() -> Dict[str, float]:
+    """
+    Get per-write latency statistics for write_verse_json.
+
+    Returns:
+        Dict with writes, bytes, serialize/write/verify/total seconds,
+        max_seconds, last_seconds and average_seconds
+    """
+    with _write_stats_lock:
+        stats = {
+            "writes": 0, "bytes": 0,
+            "serialize_seconds": 0.0, "write_seconds": 0.0, "verify_seconds": 0.0,
+            "total_seconds": 0.0, "max_seconds": 0.0, "last_seconds": 0.0,
+            **_write_stats
+        }
+    stats["average_seconds"] = stats["total_seconds"] / stats["writes"] if stats["writes"] else 0.0
+    return stats
+
+
+def reset_write_stats() -> None:
+    """Clear the write statistics."""
+    with _write_stats_lock:
+        _write_stats.clear()
+
+
+def get_pack_path(book: str, base_path: Path) -> Path:
+    """
+    Get the packed archive path for a book.
+
+    Path format: data/{OT|NT}/{BOOK}.pack (next to the book's directory)
+
+    Args:
+        book: Book name
+        base_path: Base project directory
+
+    Returns:
+        Full path to the book's pack file
+    """
+    return base_path / "data" / get_testament_for_book(book) / f"{book}{PACK_SUFFIX}"
+
+
+def _compress(data: bytes) -> Tuple[str, bytes]:
+    """Compress a record with the best available codec."""
+    if zstandard is not None:
+        return CODEC_ZSTD, zstandard.ZstdCompressor(level=3).compress(data)
+    return CODEC_ZLIB, zlib.compress(data, 6)
+
+
+def _decompress(codec: str, data: bytes) -> bytes:
+    """Decompress a record."""
+    if codec == CODEC_ZLIB:
+        return zlib.decompress(data)
+    if codec == CODEC_ZSTD:
+        if zstandard is None:
+            raise ValueError("Pack is zstd-compressed but the zstandard package is not installed")
+        return zstandard.ZstdDecompressor().decompress(data)
+    raise ValueError(f"Unknown pack codec: {codec}")
+
+
+class VersePack:
+    """Random-access reader for a packed book archive"""
+
+    def __init__(
+        self,
+        path: Path,
+        book: str,
+        codec: str,
+        index: Dict[Tuple[int, int], Tuple[int, int]],
+        data_start: int
+    ):
+        """
+        Args:
+            path: Pack file
+            book: Book name
+            codec: Record compression codec
+            index: (chapter, verse) -> (offset, length) in the record area
+            data_start: File offset of the record area
+        """
+        self.path = path
+        self.book = book
+        self.codec = codec
+        self.index = index
+        self.data_start = data_start
+
+    @classmethod
+    def load(cls, path: Path) -> "VersePack":
+        """
+        Read a pack's header and offset table.
+
+        Args:
+            path: Pack file
+
+        Returns:
+            VersePack
+
+        Raises:
+            ValueError: If the file is not a pack of this version
+            OSError: If the file cannot be read
+        """
+        with open(path, 'rb') as f:
+            if f.read(len(PACK_MAGIC)) != PACK_MAGIC:
+                raise ValueError(f"Not a verse pack: {path}")
+
+            (header_len,) = struct.unpack("<I", f.read(4))
+            header = json.loads(f.read(header_len).decode('utf-8'))
+            if header.get("format_version") != PACK_FORMAT_VERSION:
+                raise ValueError(f"Unsupported verse pack version: {header.get('format_version')}")
+
+        index = {(chapter, verse): (offset, length) for chapter, verse, offset, length in header["index"]}
+        return cls(path, header["book"], header["codec"], index, len(PACK_MAGIC) + 4 + header_len)
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def __contains__(self, key: Tuple[int, int]) -> bool:
+        return key in self.index
+
+    def verses(self) -> List[Tuple[int, int]]:
+        """(chapter, verse) pairs in the pack, in order."""
+        return sorted(self.index)
+
+    def read_compressed(self, chapter: int, verse: int) -> Optional[bytes]:
+        """Stored (compressed) record bytes for a verse, or None if absent."""
+        entry = self.index.get((chapter, verse))
+        if entry is None:
+            return None
+        offset, length = entry
+        with open(self.path, 'rb') as f:
+            f.seek(self.data_start + offset)
+            return f.read(length)
+
+    def read(self, chapter: int, verse: int) -> Optional[Dict[str, Any]]:
+        """
+        Read one verse.
+
+        Args:
+            chapter: Chapter number
+            verse: Verse number
+
+        Returns:
+            Verse data dictionary, or None if the verse is not in the pack
+        """
+        record = self.read_compressed(chapter, verse)
+        if record is None:
+            return None
+        return json.loads(_decompress(self.codec, record).decode('utf-8'))
+
+
+def open_verse_pack(path: Path) -> Optional[VersePack]:
+    """
+    Open a pack, reusing its offset table until the file changes.
+
+    Args:
+        path: Pack file
+
+    Returns:
+        VersePack, or None if the file is missing or unreadable
+    """
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    version = (stat.st_mtime_ns, stat.st_size)
+
+    with _open_packs_lock:
+        cached = _open_packs.get(path)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        try:
+            pack = VersePack.load(path)
+        except (OSError, ValueError, struct.error, json.JSONDecodeError):
+            return None
+
+        _open_packs[path] = (version, pack)
+        return pack
+
+
+@contextmanager
+def _locked_pack(path: Path, lock_path: Path):
+    """Serialise read-modify-write of a pack across threads (and, via lock_path, processes where supported)."""
+    with _pack_locks_lock:
+        lock = _pack_locks.setdefault(path, threading.Lock())
+
+    with lock:
+        if fcntl is None:
+            yield
+            return
+
+        lock_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(lock_path, 'a') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def _update_pack(
+    book: str,
+    base_path: Path,
+    records: Dict[Tuple[int, int], bytes],
+    fsync: bool = False
+) -> Tuple[Path, Optional[str]]:
+    """
+    Add or replace verse records (serialized JSON) in a book's pack.
+
+    The whole pack is rewritten atomically, keeping untouched records
+    as stored unless the codec changed.
+
+    Returns:
+        (pack path, SHA-256 of the written and verified pack, or None on failure)
+    """
+    path = get_pack_path(book, base_path)
+    lock_path = base_path / PACK_LOCK_DIR / get_testament_for_book(book) / f"{book}{PACK_SUFFIX}.lock"
+
+    with _locked_pack(path, lock_path):
+        stored: Dict[Tuple[int, int], bytes] = {}
+        codec = CODEC_ZSTD if zstandard is not None else CODEC_ZLIB
+
+        existing = VersePack.load(path) if path.exists() else None
+        if existing is not None:
+            for key in existing.verses():
+                if key in records:
+                    continue
+                record = existing.read_compressed(*key)
+                if existing.codec != codec:
+                    _, record = _compress(_decompress(existing.codec, record))
+                stored[key] = record
+
+        for key, data in records.items():
+            codec, stored[key] = _compress(data)
+
+        index = []
+        offset = 0
+        for chapter, verse in sorted(stored):
+            length = len(stored[(chapter, verse)])
+            index.append([chapter, verse, offset, length])
+            offset += length
+
+        header = {"format_version": PACK_FORMAT_VERSION, "book": book, "codec": codec, "index": index}
+        header_bytes = json.dumps(header, separators=(',', ':')).encode('utf-8')
+
+        content = b"".join(
+            [PACK_MAGIC, struct.pack("<I", len(header_bytes)), header_bytes]
+            + [stored[(chapter, verse)] for chapter, verse, _, _ in index]
+        )
+        digest = atomic_write_bytes(path, content, fsync=fsync)
+
+        # Verify before releasing the lock; another writer may replace the pack next
+        if digest is not None and not verify_file_hash(path, digest):
+            digest = None
+        return path, digest
+
+
+class PackedVerseSink:
+    """Writes batches of verses into their books' packs"""
+
+    def __init__(self, base_path: Path, fsync: bool = False):
+        """
+        Args:
+            base_path: Base project directory
+            fsync: Flush each rewritten pack and its directory to disk
+        """
+        self.base_path = base_path
+        self.fsync = fsync
+
+    def put_many(self, records: Iterable[Tuple[str, int, int, Dict[str, Any]]]) -> int:
+        """
+        Add or replace verses, rewriting each affected pack once.
+
+        Same interface as VerseStore.put_many, so a VerseBatchWriter can
+        buffer packed writes. Each pack is replaced atomically; if one
+        fails, packs already rewritten keep their new records and
+        retrying the batch rewrites them again.
+
+        Args:
+            records: (book, chapter, verse, verse_data) tuples
+
+        Returns:
+            Number of verses stored
+
+        Raises:
+            OSError: If a pack could not be written and verified
+        """
+        by_book: Dict[str, Dict[Tuple[int, int], bytes]] = {}
+        for book, chapter, verse, verse_data in records:
+            by_book.setdefault(book, {})[(chapter, verse)] = serialize_verse(verse_data, FORMAT_CANONICAL)
+
+        for book, book_records in by_book.items():
+            start = time.perf_counter()
+            path, digest = _update_pack(book, self.base_path, book_records, fsync=self.fsync)
+            if digest is None:
+                raise OSError(f"Failed to write verse pack: {path}")
+            done = time.perf_counter()
+
+            size = sum(len(content) for content in book_records.values())
+            _record_write(0.0, done - start, 0.0, size)
+            logger.debug(f"Wrote {len(book_records)} verses to {path} in {(done - start) * 1000:.2f} ms")
+
+        return sum(len(book_records) for book_records in by_book.values())
+
+
 def write_verse_json(
     book: str,
     chapter: int,
     verse: int,
     verse_data: Dict[str, Any],
-    base_path: Path
+    base_path: Path,
+    fmt: str = FORMAT_PRETTY,
+    fsync: bool = False,
+    storage: str = STORAGE_FILES
 ) -> bool:
     """
     Write verse data to JSON file with atomic write.
 
+    The file is verified by hashing its bytes against the hash of the
+    serialized data, and the write's latency is added to get_write_stats().
+    With packed storage the verse is added to (or replaced in) its book's
+    pack instead; packed records are always stored canonical.
+
     Args:
         book: Book name
         chapter: Chapter number
         verse: Verse number
         verse_data: Complete verse exegesis data
         base_path: Base project directory
+        fmt: "pretty" (indent=2), "compact" or "canonical" (compact, sorted keys)
+        fsync: Flush the file and its directory to disk before returning
+        storage: "files" (data/{OT|NT}/{BOOK}/{CH}/{VS}.json) or "packed"
 
     Returns:
         True if successful, False otherwise
     """
     try:
-        # Get target path
-        target_path = get_verse_path(book, chapter, verse, base_path)
+        start = time.perf_counter()
+
+        if storage == STORAGE_PACKED:
+            fmt = FORMAT_CANONICAL
+            content = serialize_verse(verse_data, fmt)
+            serialized = time.perf_counter()
+
+            target_path, digest = _update_pack(book, base_path, {(chapter, verse): content}, fsync=fsync)
+        elif storage == STORAGE_FILES:
+            # Get target path
+            target_path = get_verse_path(book, chapter, verse, base_path)
 
-        # Convert to pretty-printed JSON
-        json_content = json.dumps(verse_data, indent=2, ensure_ascii=False)
+            content = serialize_verse(verse_data, fmt)
+            serialized = time.perf_counter()
 
-        # Perform atomic write
-        success = atomic_write(target_path, json_content)
+            # Perform atomic write
+            digest = atomic_write_bytes(target_path, content, fsync=fsync)
+        else:
+            raise ValueError(f"Unknown storage: {storage}")
+        written = time.perf_counter()
 
-        if not success:
+        if digest is None:
             return False
 
-        # Verify write
-        return verify_written_file(target_path, verse_data)
+        # Verify write (packs are already verified by _update_pack)
+        verified = storage == STORAGE_PACKED or verify_file_hash(target_path, digest)
+        done = time.perf_counter()
+
+        _record_write(serialized - start, written - serialized, done - written, len(content))
+        logger.debug(f"Wrote {target_path} ({len(content)} bytes, {fmt}) in {(done - start) * 1000:.2f} ms")
+
+        return verified
 
     except Exception as e:
         return False
+
+
+def read_verse(
+    book: str,
+    chapter: int,
+    verse: int,
+    base_path: Path,
+    storage: Optional[str] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    Read a verse from either storage layout.
+
+    Args:
+        book: Book name
+        chapter: Chapter number
+        verse: Verse number
+        base_path: Base project directory
+        storage: "files", "packed", or None to try the verse file first
+            and then the book's pack
+
+    Returns:
+        Verse data dictionary, or None if the verse is not stored
+    """
+    if storage in (None, STORAGE_FILES):
+        try:
+            with open(get_verse_path(book, chapter, verse, base_path), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            if storage == STORAGE_FILES:
+                return None
+        except (OSError, json.JSONDecodeError):
+            return None
+    elif storage != STORAGE_PACKED:
+        raise ValueError(f"Unknown storage: {storage}")
+
+    pack = open_verse_pack(get_pack_path(book, base_path))
+    return pack.read(chapter, verse) if pack is not None else None
+
+
+def _verse_files(book: str, base_path: Path) -> Dict[Tuple[int, int], Path]:
+    """Verse files of a book in the directory layout, keyed by (chapter, verse)."""
+    book_dir = base_path / "data" / get_testament_for_book(book) / book
+    files = {}
+    for path in book_dir.glob("*/*.json"):
+        try:
+            files[(int(path.parent.name), int(path.stem))] = path
+        except ValueError:
+            continue
+    return files
+
+
+def pack_book(book: str, base_path: Path, fsync: bool = False) -> int:
+    """
+    Copy a book's verse files into its pack (export to the packed layout).
+
+    Verse files are left in place; verses already packed are replaced.
+
+    Args:
+        book: Book name
+        base_path: Base project directory
+        fsync: Flush the pack and its directory to disk before returning
+
+    Returns:
+        Number of verses packed
+
+    Raises:
+        ValueError: If a verse file is not valid JSON
+        OSError: If the pack cannot be written
+    """
+    records = {}
+    for key, path in sorted(_verse_files(book, base_path).items()):
+        with open(path, 'r', encoding='utf-8') as f:
+            try:
+                records[key] = serialize_verse(json.load(f), FORMAT_CANONICAL)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"Invalid verse file {path}: {e}")
+
+    if not records:
+        return 0
+
+    pack_path, digest = _update_pack(book, base_path, records, fsync=fsync)
+    if digest is None:
+        raise OSError(f"Failed to write {pack_path}")
+    return len(records)
+
+
+def unpack_book(book: str, base_path: Path, fmt: str = FORMAT_PRETTY, fsync: bool = False) -> int:
+    """
+    Write a book's packed verses out as verse files (import to the directory layout).
+
+    Args:
+        book: Book name
+        base_path: Base project directory
+        fmt: Verse file format ("pretty", "compact" or "canonical")
+        fsync: Flush each file and its directory to disk
+
+    Returns:
+        Number of verses written
+
+    Raises:
+        OSError: If the pack is missing or a verse file cannot be written
+    """
+    pack_path = get_pack_path(book, base_path)
+    pack = open_verse_pack(pack_path)
+    if pack is None:
+        raise OSError(f"No readable pack at {pack_path}")
+
+    for chapter, verse in pack.verses():
+        if not write_verse_json(book, chapter, verse, pack.read(chapter, verse), base_path, fmt=fmt, fsync=fsync):
+            raise OSError(f"Failed to write {get_verse_path(book, chapter, verse, base_path)}")
+    return len(pack)
+
+
+def list_books(base_path: Path, storage: str = STORAGE_FILES) -> List[str]:
+    """
+    List books present in a storage layout.
+
+    Args:
+        base_path: Base project directory
+        storage: "files" (book directories) or "packed" (pack files)
+
+    Returns:
+        Sorted book names
+    """
+    books = []
+    for testament in ("OT", "NT"):
+        testament_dir = base_path / "data" / testament
+        if not testament_dir.is_dir():
+            continue
+        if storage == STORAGE_PACKED:
+            books.extend(path.name[:-len(PACK_SUFFIX)] for path in testament_dir.glob(f"*{PACK_SUFFIX}"))
+        else:
+            books.extend(path.name for path in testament_dir.iterdir() if path.is_dir())
+    return sorted(books)
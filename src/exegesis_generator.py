@@ -8,26 +8,129 @@ Orchestrates the generation of biblical exegesis by:
 4. Calling Gemini API
 5. Returning structured exegesis data
 
+The study prompt is read once per file and reused until its modification
+time changes. Every prompt is the same stable prefix (the study
+instructions) followed by a short per-verse suffix; the prefix is exposed
+as a PromptPrefix so the client layer can send it once (e.g. as a cached
+context) instead of re-uploading it for every verse.
+
+Opt-in multi-verse batching packs runs of consecutive verses into one
+request whose answer is a JSON object keyed by verse ID. Each verse is
+split back out and validated on its own; verses missing from the answer
+or failing validation are retried singly, and a batch whose answer cannot
+be parsed at all (typically truncated output) is halved and retried.
+Batches are planned against a token budget, so short verses share a
+request while long ones go alone.
+
+Classes:
+    PromptPrefix: Stable leading part shared by every verse prompt
+
 Functions:
-    load_study_prompt: Load StudyPrompt.md template
+    load_study_prompt: Load StudyPrompt.md template (cached)
+    get_prompt_prefix: Get the shared prompt prefix for a study prompt
+    clear_study_prompt_cache: Drop all cached study prompts
+    build_verse_suffix: Build the per-verse part of a prompt
     build_exegesis_prompt: Build complete prompt for a verse
+    build_batch_suffix: Build the multi-verse part of a batched prompt
+    build_batch_prompt: Build complete prompt for consecutive verses
+    split_batch_response: Split a batched answer into per-verse data
+    plan_verse_batches: Group consecutive verses into batches within a token budget
     generate_verse_exegesis: Generate exegesis for a single verse
+    agenerate_verse_exegesis: Generate exegesis for a single verse (asyncio)
+    generate_batch_exegesis: Generate exegesis for consecutive verses in one request
+    apply_source_interlinear: Pre-fill interlinear entries from the token store
     format_verse_reference: Format verse reference (Genesis 1:1)
     format_verse_id: Format verse ID (GEN-1-1)
 """
 
+import hashlib
+import os
+import threading
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple, List
 
 # Import required modules
+from src.config import get_sources_directory
 from src.verse_extractor import extract_verse
-from src.gemini_client import generate_exegesis
+from src.bible_structure import get_testament
+from src.token_store import get_token_store_path, open_token_store, prefill_interlinear
+from src.gemini_client import generate_exegesis, agenerate_exegesis, AsyncGeminiClient, ContextCache
+from src.rate_limiter import RateLimiter, estimate_tokens
+from src.response_cache import ResponseCache
+from src.schema_validator import validate_verse_json
+
+
+# Multi-verse batching: tokens a batch may spend on its verses (source text
+# plus expected answer), and the expected answer size per verse (a verse
+# file is ~17 KB of pretty JSON, ~4K tokens)
+DEFAULT_BATCH_TOKEN_BUDGET = 32_000
+DEFAULT_OUTPUT_TOKENS_PER_VERSE = 4_000
+
+
+class PromptPrefix:
+    """Stable leading part shared by every verse prompt."""
+
+    def __init__(self, text: str):
+        self.text = text
+        self.key = hashlib.sha256(text.encode('utf-8')).hexdigest()
+        self.token_estimate = estimate_tokens(text)
+
+    def render(self, suffix: str) -> str:
+        """Complete prompt for a per-verse suffix."""
+        return self.text + suffix
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, PromptPrefix) and other.key == self.key
+
+    def __hash__(self) -> int:
+        return hash(self.key)
+
+    def __repr__(self) -> str:
+        return f"PromptPrefix(key={self.key[:12]}, ~{self.token_estimate} tokens)"
+
+
+# Study prompt path -> ((mtime_ns, size), template text, prompt prefix)
+_study_prompts: Dict[str, Tuple[Tuple[int, int], str, PromptPrefix]] = {}
+_study_prompts_lock = threading.Lock()
+
+
+def _cached_study_prompt(prompt_path: Path) -> Tuple[str, PromptPrefix]:
+    """Template text and prompt prefix, re-read only when the file changes."""
+    key = os.fspath(prompt_path)
+    try:
+        stat = os.stat(key)
+    except OSError:
+        raise FileNotFoundError(f"Study prompt not found: {prompt_path}") from None
+    stamp = (stat.st_mtime_ns, stat.st_size)
+
+    with _study_prompts_lock:
+        cached = _study_prompts.get(key)
+        if cached is not None and cached[0] == stamp:
+            return cached[1], cached[2]
+
+    with open(prompt_path, 'r', encoding='utf-8') as f:
+        template = f.read()
+    prefix = PromptPrefix(f"""
+{template}
+
+---
+
+## VERSE TO ANALYZE
+
+""")
+
+    with _study_prompts_lock:
+        _study_prompts[key] = (stamp, template, prefix)
+    return template, prefix
 
 
 def load_study_prompt(prompt_path: Path) -> str:
     """
     Load the StudyPrompt.md template.
 
+    The file is read once and cached until its modification time or size
+    changes.
+
     Args:
         prompt_path: Path to StudyPrompt.md file
 
@@ -38,11 +141,33 @@ def load_study_prompt(prompt_path: Path) -> str:
         FileNotFoundError: If prompt file doesn't exist
         IOError: If file cannot be read
     """
-    if not prompt_path.exists():
-        raise FileNotFoundError(f"Study prompt not found: {prompt_path}")
+    return _cached_study_prompt(prompt_path)[0]
 
-    with open(prompt_path, 'r', encoding='utf-8') as f:
-        return f.read()
+
+def get_prompt_prefix(study_prompt_path: Path) -> PromptPrefix:
+    """
+    Get the stable prompt prefix for a study prompt.
+
+    The same object is returned for every verse until the study prompt
+    changes on disk, so callers can key context caches on its identity or
+    its `key`.
+
+    Args:
+        study_prompt_path: Path to StudyPrompt.md
+
+    Returns:
+        PromptPrefix holding the study instructions and section header
+
+    Raises:
+        FileNotFoundError: If prompt file doesn't exist
+    """
+    return _cached_study_prompt(study_prompt_path)[1]
+
+
+def clear_study_prompt_cache() -> None:
+    """Drop all cached study prompts (they are re-read on next use)."""
+    with _study_prompts_lock:
+        _study_prompts.clear()
 
 
 def format_verse_reference(book: str, chapter: int, verse: int) -> str:
@@ -101,6 +226,45 @@ def format_verse_id(book: str, chapter: int, verse: int) -> str:
     return f"{book_id}-{chapter}-{verse}"
 
 
+def build_verse_suffix(book: str, chapter: int, verse: int, verse_text: str) -> str:
+    """
+    Build the per-verse part of an exegesis prompt (follows the prefix).
+
+    Args:
+        book: Book name
+        chapter: Chapter number
+        verse: Verse number
+        verse_text: Original language verse text
+
+    Returns:
+        Prompt suffix string
+    """
+    verse_ref = format_verse_reference(book, chapter, verse)
+    verse_id = format_verse_id(book, chapter, verse)
+
+    return f"""**Reference:** {verse_ref}
+**Verse ID:** {verse_id}
+**Original Text:** {verse_text}
+
+---
+
+## INSTRUCTIONS
+
+Generate a complete, high-fidelity exegetical analysis for {verse_ref} following ALL requirements in the study prompt above.
+
+Output the result as a single, valid JSON object matching the verse schema structure.
+
+Ensure you include:
+1. All four translations in section_1_sacred_text
+2. All ten required subsections in section_2_exegetical_synthesis
+3. A practical life application in section_3_life_application
+
+The verse_id field MUST be: {verse_id}
+
+Begin your JSON output now:
+"""
+
+
 def build_exegesis_prompt(
     book: str,
     chapter: int,
@@ -119,46 +283,205 @@ def build_exegesis_prompt(
         study_prompt_path: Path to StudyPrompt.md
 
     Returns:
-        Complete prompt string
+        Complete prompt string (prompt prefix followed by the verse suffix)
     """
-    # Load study prompt template
-    study_instructions = load_study_prompt(study_prompt_path)
+    prefix = get_prompt_prefix(study_prompt_path)
+    return prefix.render(build_verse_suffix(book, chapter, verse, verse_text))
 
-    # Format verse reference
-    verse_ref = format_verse_reference(book, chapter, verse)
-    verse_id = format_verse_id(book, chapter, verse)
 
-    # Build complete prompt
-    prompt = f"""
-{study_instructions}
+def _verse_block(book: str, chapter: int, verse: int, verse_text: str) -> str:
+    """Reference, ID and source text lines for one verse."""
+    return (
+        f"**Reference:** {format_verse_reference(book, chapter, verse)}\n"
+        f"**Verse ID:** {format_verse_id(book, chapter, verse)}\n"
+        f"**Original Text:** {verse_text}\n"
+    )
 
----
 
-## VERSE TO ANALYZE
+def build_batch_suffix(book: str, chapter: int, verses: List[Tuple[int, str]]) -> str:
+    """
+    Build the multi-verse part of a batched prompt (follows the prefix).
 
-**Reference:** {verse_ref}
-**Verse ID:** {verse_id}
-**Original Text:** {verse_text}
+    Args:
+        book: Book name
+        chapter: Chapter number
+        verses: (verse number, original language text) pairs, in order
+
+    Returns:
+        Prompt suffix string asking for a JSON object keyed by verse ID
+    """
+    first, last = verses[0][0], verses[-1][0]
+    verse_ids = ", ".join(format_verse_id(book, chapter, verse) for verse, _ in verses)
+    blocks = "\n".join(_verse_block(book, chapter, verse, text) for verse, text in verses)
+
+    return f"""This request covers {len(verses)} consecutive verses, {book} {chapter}:{first}-{last}.
 
+{blocks}
 ---
 
 ## INSTRUCTIONS
 
-Generate a complete, high-fidelity exegetical analysis for {verse_ref} following ALL requirements in the study prompt above.
+Generate a complete, high-fidelity exegetical analysis for EACH verse above following ALL requirements in the study prompt above. Analyze every verse in full on its own; do not shorten or merge analyses because several verses share this request.
 
-Output the result as a single, valid JSON object matching the verse schema structure.
+Output the result as a single, valid JSON object whose keys are the verse IDs ({verse_ids}) and whose values are complete verse objects matching the verse schema structure.
 
-Ensure you include:
+Ensure every verse object includes:
 1. All four translations in section_1_sacred_text
 2. All ten required subsections in section_2_exegetical_synthesis
 3. A practical life application in section_3_life_application
 
-The verse_id field MUST be: {verse_id}
+Each verse object's verse_id field MUST equal its key.
 
 Begin your JSON output now:
 """
 
-    return prompt
+
+def build_batch_prompt(
+    book: str,
+    chapter: int,
+    verses: List[Tuple[int, str]],
+    study_prompt_path: Path
+) -> str:
+    """
+    Build complete exegesis prompt for consecutive verses of one chapter.
+
+    Args:
+        book: Book name
+        chapter: Chapter number
+        verses: (verse number, original language text) pairs, in order
+        study_prompt_path: Path to StudyPrompt.md
+
+    Returns:
+        Complete prompt string (prompt prefix followed by the batch suffix)
+    """
+    prefix = get_prompt_prefix(study_prompt_path)
+    return prefix.render(build_batch_suffix(book, chapter, verses))
+
+
+def split_batch_response(
+    response: Dict[str, Any],
+    book: str,
+    chapter: int,
+    verse_nums: List[int]
+) -> Dict[int, Optional[Dict[str, Any]]]:
+    """
+    Split a batched answer into per-verse data.
+
+    Args:
+        response: Parsed JSON answer keyed by verse ID
+        book: Book name
+        chapter: Chapter number
+        verse_nums: Verses the batch asked for
+
+    Returns:
+        Dict of verse number to its verse object, or None if the verse is
+        missing, not an object, or carries a different verse_id
+    """
+    results = {}
+    for verse in verse_nums:
+        verse_id = format_verse_id(book, chapter, verse)
+        data = response.get(verse_id) if isinstance(response, dict) else None
+        if not isinstance(data, dict) or data.get("verse_id") != verse_id:
+            data = None
+        results[verse] = data
+    return results
+
+
+def plan_verse_batches(
+    verse_texts: Dict[int, Optional[str]],
+    max_verses: int,
+    token_budget: int = DEFAULT_BATCH_TOKEN_BUDGET,
+    output_tokens_per_verse: int = DEFAULT_OUTPUT_TOKENS_PER_VERSE
+) -> List[List[int]]:
+    """
+    Group consecutive verses into batches that fit a token budget.
+
+    A verse costs its estimated source text tokens plus the expected answer
+    size; a batch is closed when adding the next verse would exceed
+    max_verses or token_budget, or the next verse is not consecutive.
+    Verses without source text always get a batch of their own.
+
+    Args:
+        verse_texts: Verse number to source text (None if unavailable), in order
+        max_verses: Most verses per batch
+        token_budget: Most tokens per batch spent on verses
+        output_tokens_per_verse: Expected answer tokens per verse
+
+    Returns:
+        Lists of verse numbers, one per request, in order
+    """
+    batches: List[List[int]] = []
+    current: List[int] = []
+    used = 0
+
+    for verse, text in verse_texts.items():
+        if text is None:
+            if current:
+                batches.append(current)
+            batches.append([verse])
+            current, used = [], 0
+            continue
+
+        cost = estimate_tokens(text) + output_tokens_per_verse
+        if current and (
+            len(current) >= max_verses or used + cost > token_budget or verse != current[-1] + 1
+        ):
+            batches.append(current)
+            current, used = [], 0
+        current.append(verse)
+        used += cost
+
+    if current:
+        batches.append(current)
+    return batches
+
+
+def apply_source_interlinear(
+    exegesis_data: Optional[Dict[str, Any]],
+    book: str,
+    chapter: int,
+    verse: int,
+    store_path: Optional[Path] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    Pre-fill interlinear entries with the source words from the token store.
+
+    Surface form, Strong's number, source morph code and (for Greek) lemma
+    come from the store and replace whatever the model wrote for the same
+    word number; glosses and parsing stay as generated. A verse the model
+    gave no interlinear gets the source entries. Nothing changes when the
+    store has not been built (see the build-tokens command).
+
+    Args:
+        exegesis_data: Generated exegesis (modified in place), or None
+        book: Book name
+        chapter: Chapter number
+        verse: Verse number
+        store_path: Token store file (default in the sources directory)
+
+    Returns:
+        exegesis_data
+    """
+    if not exegesis_data:
+        return exegesis_data
+
+    store = open_token_store(store_path or get_token_store_path(get_sources_directory()))
+    tokens = store.get_tokens(book, chapter, verse) if store is not None else None
+    if not tokens:
+        return exegesis_data
+
+    prefilled = prefill_interlinear(tokens, get_testament(book))
+    interlinear = exegesis_data.get("interlinear_analysis")
+    if not isinstance(interlinear, list) or not interlinear:
+        exegesis_data["interlinear_analysis"] = prefilled
+        return exegesis_data
+
+    by_position = {entry["word_number"]: entry for entry in prefilled}
+    for entry in interlinear:
+        if isinstance(entry, dict) and entry.get("word_number") in by_position:
+            entry.update(by_position[entry["word_number"]])
+
+    return exegesis_data
 
 
 def generate_verse_exegesis(
@@ -169,7 +492,12 @@ def generate_verse_exegesis(
     sblgnt_path: Path,
     api_key: str,
     study_prompt_path: Path,
-    max_retries: int = 3
+    max_retries: int = 3,
+    verse_text: Optional[str] = None,
+    rate_limiter: Optional[RateLimiter] = None,
+    cache: Optional[ResponseCache] = None,
+    context_cache: Optional[ContextCache] = None,
+    stream: bool = False
 ) -> Optional[Dict[str, Any]]:
     """
     Generate complete exegesis for a single verse.
@@ -183,20 +511,181 @@ def generate_verse_exegesis(
         api_key: Gemini API key
         study_prompt_path: Path to StudyPrompt.md
         max_retries: Maximum API retry attempts
+        verse_text: Source text already extracted by the caller (skips extraction)
+        rate_limiter: Limiter to take API capacity from
+        cache: Response cache consulted before calling the API
+        context_cache: Cached context holding the prompt prefix (sends only the verse suffix)
+        stream: Consume the streaming API (malformed output is retried early)
 
     Returns:
         Complete exegesis data dict or None if failed
     """
     # Extract verse text from sources
-    verse_text = extract_verse(book, chapter, verse, oshb_path, sblgnt_path)
+    if verse_text is None:
+        verse_text = extract_verse(book, chapter, verse, oshb_path, sblgnt_path)
 
     if verse_text is None:
         return None
 
     # Build complete prompt
     prompt = build_exegesis_prompt(book, chapter, verse, verse_text, study_prompt_path)
+    prefix = get_prompt_prefix(study_prompt_path) if context_cache is not None else None
 
     # Call Gemini API
-    exegesis_data = generate_exegesis(prompt, api_key, max_retries=max_retries)
+    exegesis_data = generate_exegesis(
+        prompt, api_key,
+        max_retries=max_retries,
+        rate_limiter=rate_limiter,
+        cache=cache,
+        context_cache=context_cache,
+        prefix=prefix,
+        stream=stream
+    )
 
-    return exegesis_data
+    return apply_source_interlinear(exegesis_data, book, chapter, verse)
+
+
+async def agenerate_verse_exegesis(
+    book: str,
+    chapter: int,
+    verse: int,
+    oshb_path: Path,
+    sblgnt_path: Path,
+    api_key: str,
+    study_prompt_path: Path,
+    max_retries: int = 3,
+    verse_text: Optional[str] = None,
+    client: Optional[AsyncGeminiClient] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    Generate complete exegesis for a single verse without blocking.
+
+    Args:
+        book: Book name
+        chapter: Chapter number
+        verse: Verse number
+        oshb_path: Path to OSHB directory
+        sblgnt_path: Path to SBLGNT directory
+        api_key: Gemini API key
+        study_prompt_path: Path to StudyPrompt.md
+        max_retries: Maximum API retry attempts
+        verse_text: Source text already extracted by the caller (skips extraction)
+        client: Async client to send through (shared client if None)
+
+    Returns:
+        Complete exegesis data dict or None if failed
+    """
+    if verse_text is None:
+        verse_text = extract_verse(book, chapter, verse, oshb_path, sblgnt_path)
+
+    if verse_text is None:
+        return None
+
+    prompt = build_exegesis_prompt(book, chapter, verse, verse_text, study_prompt_path)
+    prefix = None
+    if client is not None and client.context_cache is not None:
+        prefix = get_prompt_prefix(study_prompt_path)
+
+    exegesis_data = await agenerate_exegesis(
+        prompt, api_key,
+        max_retries=max_retries,
+        client=client,
+        prefix=prefix
+    )
+
+    return apply_source_interlinear(exegesis_data, book, chapter, verse)
+
+
+def generate_batch_exegesis(
+    book: str,
+    chapter: int,
+    verse_texts: Dict[int, str],
+    oshb_path: Path,
+    sblgnt_path: Path,
+    api_key: str,
+    study_prompt_path: Path,
+    schema_path: Path,
+    max_retries: int = 3,
+    rate_limiter: Optional[RateLimiter] = None,
+    cache: Optional[ResponseCache] = None,
+    context_cache: Optional[ContextCache] = None,
+    stream: bool = False
+) -> Dict[int, Optional[Dict[str, Any]]]:
+    """
+    Generate exegesis for consecutive verses of a chapter in one request.
+
+    Each verse is split out of the keyed answer and validated on its own.
+    Verses that are missing or invalid are regenerated singly; if the
+    answer cannot be parsed at all, the batch is halved and each half is
+    retried the same way.
+
+    Args:
+        book: Book name
+        chapter: Chapter number
+        verse_texts: Verse number to source text, consecutive and in order
+        oshb_path: Path to OSHB directory
+        sblgnt_path: Path to SBLGNT directory
+        api_key: Gemini API key
+        study_prompt_path: Path to StudyPrompt.md
+        schema_path: Verse schema each split verse is validated against
+        max_retries: Maximum API retry attempts per request
+        rate_limiter: Limiter to take API capacity from
+        cache: Response cache consulted before calling the API
+        context_cache: Cached context holding the prompt prefix
+        stream: Consume the streaming API (malformed output is retried early)
+
+    Returns:
+        Dict of verse number to exegesis data (None if generation failed).
+        Verses regenerated singly are returned unvalidated, like
+        generate_verse_exegesis.
+    """
+    verse_nums = list(verse_texts)
+    results: Dict[int, Optional[Dict[str, Any]]] = dict.fromkeys(verse_nums)
+
+    if len(verse_nums) > 1:
+        prompt = build_batch_prompt(book, chapter, list(verse_texts.items()), study_prompt_path)
+        prefix = get_prompt_prefix(study_prompt_path) if context_cache is not None else None
+
+        response = generate_exegesis(
+            prompt, api_key,
+            max_retries=max_retries,
+            rate_limiter=rate_limiter,
+            cache=cache,
+            context_cache=context_cache,
+            prefix=prefix,
+            stream=stream
+        )
+
+        if response is None:
+            # No usable answer (often output truncated at the token limit)
+            middle = len(verse_nums) // 2
+            for part in (verse_nums[:middle], verse_nums[middle:]):
+                results.update(generate_batch_exegesis(
+                    book, chapter, {verse: verse_texts[verse] for verse in part},
+                    oshb_path, sblgnt_path, api_key, study_prompt_path, schema_path,
+                    max_retries=max_retries,
+                    rate_limiter=rate_limiter,
+                    cache=cache,
+                    context_cache=context_cache,
+                    stream=stream
+                ))
+            return results
+
+        results = split_batch_response(response, book, chapter, verse_nums)
+
+    for verse, data in results.items():
+        if data is not None and validate_verse_json(data, schema_path):
+            apply_source_interlinear(data, book, chapter, verse)
+            continue
+        results[verse] = generate_verse_exegesis(
+            book, chapter, verse,
+            oshb_path, sblgnt_path, api_key, study_prompt_path,
+            max_retries=max_retries,
+            verse_text=verse_texts[verse],
+            rate_limiter=rate_limiter,
+            cache=cache,
+            context_cache=context_cache,
+            stream=stream
+        )
+
+    return results
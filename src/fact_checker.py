@@ -18,6 +18,9 @@ from typing import Dict, List, Tuple, Optional
 import requests
 from src.config import load_config, get_data_path
 from src.bible_structure import validate_verse_reference
+from src.verse_extractor import extract_verse_tokens
+from src.token_store import get_token_store_path, open_token_store
+from src.rate_limiter import get_rate_limiter, estimate_tokens
 
 
 class FactCheckResult:
@@ -87,6 +90,7 @@ class FactChecker:
         # TIER 1: Ground truth checks
         self._check_verse_reference(verse_data, book, chapter, verse, result)
         self._check_original_text(verse_data, book, chapter, verse, result)
+        self._check_interlinear(verse_data, book, chapter, verse, result)
         self._check_cross_references(verse_data, result)
 
         # TIER 2: Database verification
@@ -162,6 +166,51 @@ class FactChecker:
                 "critical"
             )
 
+    def _check_interlinear(self, verse_data: Dict, book: str, chapter: int, verse: int, result: FactCheckResult):
+        """
+        Compare interlinear Strong's numbers to the source tokens
+
+        Source tokens come from the token store when it has been built,
+        otherwise from the source files. Skipped when the verse has no
+        interlinear analysis or the source texts are not available locally.
+        """
+        try:
+            interlinear = verse_data.get('interlinear_analysis') or []
+            if not interlinear:
+                return
+
+            store = open_token_store(get_token_store_path(self.sources_path))
+            if store is not None:
+                tokens = store.get_tokens(book, chapter, verse)
+            else:
+                tokens = extract_verse_tokens(book, chapter, verse, self.oshb_path, self.sblgnt_path)
+            if not tokens:
+                return
+
+            if len(interlinear) != len(tokens):
+                result.add_warning(
+                    "interlinear_analysis",
+                    f"Interlinear has {len(interlinear)} words, source text has {len(tokens)}"
+                )
+
+            source_strongs = {token['position']: token['strongs'] for token in tokens}
+
+            for entry in interlinear:
+                expected = source_strongs.get(entry.get('word_number'))
+                given = entry.get('strongs_number')
+                if not expected or not given:
+                    continue
+
+                if _strongs_key(given) != _strongs_key(expected):
+                    result.add_issue(
+                        f"interlinear_analysis.word_{entry.get('word_number')}.strongs_number",
+                        f"Strong's number {given} does not match source",
+                        f"Source text has {expected}",
+                        "medium"
+                    )
+        except Exception as e:
+            result.add_warning("interlinear_analysis", f"Could not verify interlinear: {str(e)}")
+
     def _check_cross_references(self, verse_data: Dict, result: FactCheckResult):
         """Verify that cross-referenced verses exist"""
         try:
@@ -344,6 +393,8 @@ Be rigorous but fair. Only report clear factual errors with evidence."""
             return None
 
         try:
+            get_rate_limiter("grok").acquire(estimate_tokens(prompt))
+
             url = "https://api.x.ai/v1/chat/completions"
             headers = {
                 "Authorization": f"Bearer {self.xai_api_key}",
@@ -382,6 +433,8 @@ Be rigorous but fair. Only report clear factual errors with evidence."""
             return None
 
         try:
+            get_rate_limiter("openai").acquire(estimate_tokens(prompt))
+
             url = "https://api.openai.com/v1/chat/completions"
             headers = {
                 "Authorization": f"Bearer {self.openai_api_key}",
@@ -433,6 +486,14 @@ Be rigorous but fair. Only report clear factual errors with evidence."""
         result.summary = ai_result.get('summary', result.summary)
 
 
+def _strongs_key(strongs: str) -> Tuple[str, int]:
+    """Normalize a Strong's number for comparison ('G0435' and 'G435' match; OSHB letter suffixes ignored)"""
+    match = re.match(r'\s*([GH])\s*0*(\d+)', strongs.upper())
+    if not match:
+        return (strongs.strip().upper(), 0)
+    return (match.group(1), int(match.group(2)))
+
+
 def fact_check_verse_file(verse_file_path: str) -> FactCheckResult:
     """
     Convenience function to fact-check a verse JSON file
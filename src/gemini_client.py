@@ -4,19 +4,46 @@ Gemini Client Module
 Google Gemini API client for generating biblical exegesis.
 Uses gemini-2.0-flash-thinking-exp model with retry logic.
 
+In context-cache mode the prompt prefix shared by every verse (the study
+instructions) is registered once as a server-side cached context with a
+TTL, refreshed shortly before it expires, and each request sends only the
+per-verse suffix against it. If the cache cannot be created the full
+prompt is sent as before.
+
+In streaming mode responses are consumed chunk by chunk through a
+JSONStreamParser: reading stops as soon as the JSON object closes, and
+output that is malformed or cut off is abandoned mid-stream and retried
+instead of being waited out. Time to first byte and total latency are
+recorded for every request (see get_request_stats).
+
 Functions:
     initialize_client: Create and configure Gemini client
     generate_exegesis: Generate exegesis from prompt
+    get_async_client: Get the shared async client for a key and model
+    agenerate_exegesis: Generate exegesis from prompt without blocking
     parse_json_response: Parse JSON from API response
     retry_with_backoff: Execute function with exponential backoff
+    get_request_stats: Get per-request latency statistics
+    reset_request_stats: Clear the request statistics
+
+Classes:
+    AsyncGeminiClient: Asyncio client with one model and bounded concurrency
+    GeminiContextBackend: Creates and refreshes Gemini cached contents
+    ContextCache: Cached context for a shared prompt prefix, with token accounting
 """
 
-import json
+import asyncio
+import datetime
+import logging
+import threading
 import time
-import re
-from typing import Optional, Dict, Any, Callable
+from typing import Optional, Dict, Any, Callable, Tuple, Iterable
 import google.generativeai as genai
 
+from src.json_stream import JSONStreamParser, extract_json_object
+from src.rate_limiter import RateLimiter, estimate_tokens
+from src.response_cache import ResponseCache, make_cache_key
+
 
 # Default model for exegesis generation
 # Using gemini-2.5-pro for deepest reasoning capability
@@ -27,6 +54,23 @@ DEFAULT_MAX_RETRIES = 3
 DEFAULT_BASE_DELAY = 2.0  # seconds
 DEFAULT_MAX_DELAY = 60.0  # seconds
 
+# Requests in flight at once per async client
+DEFAULT_MAX_CONCURRENCY = 4
+
+# Context cache lifetime and how long before expiry it is refreshed
+DEFAULT_CONTEXT_TTL = 3600  # seconds
+DEFAULT_CONTEXT_REFRESH_MARGIN = 300  # seconds
+
+logger = logging.getLogger(__name__)
+
+# Shared async clients: (api_key, model_name) -> AsyncGeminiClient
+_async_clients: Dict[Tuple[str, str], "AsyncGeminiClient"] = {}
+_async_clients_lock = threading.Lock()
+
+# Request latency totals (see get_request_stats)
+_request_stats: Dict[str, float] = {}
+_request_stats_lock = threading.Lock()
+
 
 def initialize_client(api_key: str, model_name: str = DEFAULT_MODEL):
     """
@@ -51,7 +95,11 @@ def parse_json_response(response_text: str) -> Optional[Dict[str, Any]]:
     Handles:
     - Plain JSON
     - JSON wrapped in markdown code blocks
-    - JSON with preceding text
+    - JSON with preceding or trailing text (braces in it included)
+    - JSON cut off between values (closed if safe; see extract_json_object)
+
+    The response is scanned once (see src.json_stream); failures are
+    logged with the offset where the JSON went wrong.
 
     Args:
         response_text: Raw response text from API
@@ -62,25 +110,17 @@ def parse_json_response(response_text: str) -> Optional[Dict[str, Any]]:
     if not response_text or not response_text.strip():
         return None
 
-    # Remove markdown JSON wrapper if present
-    text = response_text.strip()
-
-    # Try to find JSON in markdown code block
-    json_match = re.search(r'```json\s*\n(.*?)\n```', text, re.DOTALL)
-    if json_match:
-        text = json_match.group(1)
-    else:
-        # Try to find JSON object (starting with {)
-        json_match = re.search(r'\{.*\}', text, re.DOTALL)
-        if json_match:
-            text = json_match.group(0)
+    parser = extract_json_object(response_text)
 
-    # Try to parse JSON
-    try:
-        return json.loads(text)
-    except json.JSONDecodeError:
+    if parser.error is not None:
+        logger.debug(f"No JSON object in response: {parser.error} at offset {parser.offset}")
         return None
 
+    if parser.repaired:
+        logger.warning(f"Repaired JSON response truncated at offset {parser.offset}")
+
+    return parser.value
+
 
 def retry_with_backoff(
     func: Callable,
@@ -115,11 +155,309 @@ def retry_with_backoff(
     return None
 
 
+def _response_token_count(response: Any) -> Optional[int]:
+    """Total tokens reported in a response's usage metadata, if present."""
+    usage = getattr(response, "usage_metadata", None)
+    total = getattr(usage, "total_token_count", None)
+    return total if isinstance(total, int) else None
+
+
+def _record_request(started: float, first_byte: Optional[float], streamed: bool, aborted: bool) -> None:
+    """Add one request's time to first byte and total latency to the module statistics."""
+    finished = time.perf_counter()
+    latency = finished - started
+    ttfb = (first_byte if first_byte is not None else finished) - started
+    with _request_stats_lock:
+        _request_stats["requests"] = _request_stats.get("requests", 0) + 1
+        _request_stats["streamed"] = _request_stats.get("streamed", 0) + int(streamed)
+        _request_stats["aborted"] = _request_stats.get("aborted", 0) + int(aborted)
+        _request_stats["ttfb_seconds"] = _request_stats.get("ttfb_seconds", 0.0) + ttfb
+        _request_stats["latency_seconds"] = _request_stats.get("latency_seconds", 0.0) + latency
+        _request_stats["max_ttfb_seconds"] = max(_request_stats.get("max_ttfb_seconds", 0.0), ttfb)
+        _request_stats["max_latency_seconds"] = max(_request_stats.get("max_latency_seconds", 0.0), latency)
+        _request_stats["last_ttfb_seconds"] = ttfb
+        _request_stats["last_latency_seconds"] = latency
+
+
+def get_request_stats() -> Dict[str, float]:
+    """
+    Get per-request latency statistics for Gemini calls.
+
+    For non-streamed requests the first byte arrives with the whole
+    response, so their time to first byte equals their latency.
+
+    Returns:
+        Dict with requests, streamed, aborted (rejected mid-stream),
+        ttfb/latency totals, maxima and last values, and
+        average_ttfb_seconds / average_latency_seconds
+    """
+    with _request_stats_lock:
+        stats = {
+            "requests": 0, "streamed": 0, "aborted": 0,
+            "ttfb_seconds": 0.0, "latency_seconds": 0.0,
+            "max_ttfb_seconds": 0.0, "max_latency_seconds": 0.0,
+            "last_ttfb_seconds": 0.0, "last_latency_seconds": 0.0,
+            **_request_stats
+        }
+    count = stats["requests"]
+    stats["average_ttfb_seconds"] = stats["ttfb_seconds"] / count if count else 0.0
+    stats["average_latency_seconds"] = stats["latency_seconds"] / count if count else 0.0
+    return stats
+
+
+def reset_request_stats() -> None:
+    """Clear the request statistics."""
+    with _request_stats_lock:
+        _request_stats.clear()
+
+
+def _chunk_text(chunk: Any) -> str:
+    """Text of one streamed chunk ("" for chunks without text parts)."""
+    try:
+        return chunk.text or ""
+    except ValueError:
+        return ""
+
+
+def _stream_result(parser: JSONStreamParser) -> Tuple[str, Any]:
+    """Raw text and parsed object of a finished stream (ValueError if rejected)."""
+    if parser.error is not None:
+        raise ValueError(f"Streamed response rejected: {parser.error} at offset {parser.offset}")
+    return parser.text, parser.value
+
+
+def _read_stream(chunks: Iterable[Any], started: float) -> Tuple[str, Any]:
+    """Consume a streamed response until its JSON object closes or is rejected."""
+    parser = JSONStreamParser()
+    first_byte = None
+    try:
+        for chunk in chunks:
+            if first_byte is None:
+                first_byte = time.perf_counter()
+            parser.feed(_chunk_text(chunk))
+            if parser.done:
+                break
+        parser.close()
+    finally:
+        _record_request(started, first_byte, streamed=True, aborted=parser.error is not None)
+    return _stream_result(parser)
+
+
+async def _aread_stream(chunks: Any, started: float) -> Tuple[str, Any]:
+    """Consume an async streamed response until its JSON object closes or is rejected."""
+    parser = JSONStreamParser()
+    first_byte = None
+    try:
+        async for chunk in chunks:
+            if first_byte is None:
+                first_byte = time.perf_counter()
+            parser.feed(_chunk_text(chunk))
+            if parser.done:
+                break
+        parser.close()
+    finally:
+        _record_request(started, first_byte, streamed=True, aborted=parser.error is not None)
+    return _stream_result(parser)
+
+
+class GeminiContextBackend:
+    """Creates and refreshes Gemini cached contents"""
+
+    def __init__(self, api_key: str):
+        """
+        Configure the API for cache management.
+
+        Args:
+            api_key: Google Gemini API key
+        """
+        genai.configure(api_key=api_key)
+
+    def create(self, model_name: str, text: str, ttl: float) -> Any:
+        """Register text as a cached context for a model."""
+        return genai.caching.CachedContent.create(
+            model=model_name,
+            display_name="studybible-prompt-prefix",
+            contents=[text],
+            ttl=datetime.timedelta(seconds=ttl)
+        )
+
+    def refresh(self, context: Any, ttl: float) -> None:
+        """Extend a cached context's lifetime to ttl seconds from now."""
+        context.update(ttl=datetime.timedelta(seconds=ttl))
+
+    def model(self, context: Any) -> Any:
+        """Model that answers against a cached context."""
+        return genai.GenerativeModel.from_cached_content(cached_content=context)
+
+    def delete(self, context: Any) -> None:
+        """Delete a cached context (stops storage charges)."""
+        context.delete()
+
+
+class ContextCache:
+    """Cached context for a shared prompt prefix, with token accounting"""
+
+    def __init__(
+        self,
+        backend: Any,
+        model_name: str = DEFAULT_MODEL,
+        ttl: float = DEFAULT_CONTEXT_TTL,
+        refresh_margin: float = DEFAULT_CONTEXT_REFRESH_MARGIN,
+        clock: Callable[[], float] = time.time
+    ):
+        """
+        Set up an empty cache; the context is created on first use.
+
+        Args:
+            backend: Object with create/refresh/model/delete (GeminiContextBackend)
+            model_name: Model the context is created for
+            ttl: Context lifetime in seconds
+            refresh_margin: Refresh the context this many seconds before expiry
+            clock: Time source in seconds (for tests)
+        """
+        self.backend = backend
+        self.model_name = model_name
+        self.ttl = ttl
+        self.refresh_margin = min(refresh_margin, ttl / 2)
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._prefix_key = None
+        self._context = None
+        self._model = None
+        self._expires_at = 0.0
+        self._retry_at = 0.0
+        self._stats = {
+            "creations": 0,
+            "refreshes": 0,
+            "failures": 0,
+            "cached_requests": 0,
+            "full_requests": 0,
+            "tokens_saved": 0,
+        }
+
+    def peek(self, prefix: Any) -> Optional[Any]:
+        """Cached-context model for prefix if it needs no create or refresh, else None."""
+        with self._lock:
+            if self._prefix_key == prefix.key and self.clock() < self._expires_at - self.refresh_margin:
+                return self._model
+        return None
+
+    def model_for(self, prefix: Any) -> Optional[Any]:
+        """
+        Get a model bound to the cached context for a prompt prefix.
+
+        Creates the context on first use or when the prefix changes, and
+        refreshes its TTL once it is within refresh_margin of expiring.
+        After a failed create the full prompt is used until the next
+        retry (refresh_margin seconds later).
+
+        Args:
+            prefix: Prompt prefix (anything with `text`, `key` and `token_estimate`)
+
+        Returns:
+            Model to send the prompt suffix to, or None to send the full prompt
+        """
+        with self._lock:
+            now = self.clock()
+            if self._prefix_key == prefix.key and now < self._expires_at:
+                if now < self._expires_at - self.refresh_margin:
+                    return self._model
+                try:
+                    self.backend.refresh(self._context, self.ttl)
+                    self._expires_at = now + self.ttl
+                    self._stats["refreshes"] += 1
+                    return self._model
+                except Exception as e:
+                    logger.warning(f"Context cache refresh failed, recreating: {e}")
+
+            if self._prefix_key == prefix.key and now < self._retry_at:
+                return None
+
+            self._discard()
+            try:
+                context = self.backend.create(self.model_name, prefix.text, self.ttl)
+                model = self.backend.model(context)
+            except Exception as e:
+                logger.warning(f"Context cache unavailable, sending full prompts: {e}")
+                self._stats["failures"] += 1
+                self._prefix_key = prefix.key
+                self._retry_at = now + self.refresh_margin
+                return None
+
+            self._prefix_key = prefix.key
+            self._context = context
+            self._model = model
+            self._expires_at = now + self.ttl
+            self._stats["creations"] += 1
+            return model
+
+    def record(self, prefix: Any, response: Any, cached: bool) -> None:
+        """
+        Account for one answered request.
+
+        Args:
+            prefix: Prompt prefix the request shared
+            response: API response (usage metadata is read if present)
+            cached: True if only the suffix was sent against the cached context
+        """
+        with self._lock:
+            if not cached:
+                self._stats["full_requests"] += 1
+                return
+            usage = getattr(response, "usage_metadata", None)
+            cached_tokens = getattr(usage, "cached_content_token_count", None)
+            self._stats["cached_requests"] += 1
+            self._stats["tokens_saved"] += (
+                cached_tokens if isinstance(cached_tokens, int) and cached_tokens > 0
+                else prefix.token_estimate
+            )
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get context cache counters for this run.
+
+        Returns:
+            Dict with creations, refreshes, failures, cached_requests,
+            full_requests and tokens_saved (prefix input tokens not resent)
+        """
+        with self._lock:
+            return dict(self._stats)
+
+    def close(self) -> None:
+        """Delete the server-side context, if any."""
+        with self._lock:
+            self._discard()
+            self._prefix_key = None
+
+    def _discard(self) -> None:
+        """Delete the current context (best effort); caller holds the lock."""
+        if self._context is not None:
+            try:
+                self.backend.delete(self._context)
+            except Exception as e:
+                logger.warning(f"Could not delete cached context: {e}")
+        self._context = None
+        self._model = None
+        self._expires_at = 0.0
+
+
+def _prompt_suffix(prompt: str, prefix: Any) -> Optional[str]:
+    """Part of prompt after prefix, or None if prompt does not start with it."""
+    if prefix is None or not prompt.startswith(prefix.text):
+        return None
+    return prompt[len(prefix.text):]
+
+
 def generate_exegesis(
     prompt: str,
     api_key: str,
     model_name: str = DEFAULT_MODEL,
-    max_retries: int = DEFAULT_MAX_RETRIES
+    max_retries: int = DEFAULT_MAX_RETRIES,
+    rate_limiter: Optional[RateLimiter] = None,
+    cache: Optional[ResponseCache] = None,
+    context_cache: Optional[ContextCache] = None,
+    prefix: Optional[Any] = None,
+    stream: bool = False
 ) -> Optional[Dict[str, Any]]:
     """
     Generate biblical exegesis using Gemini API.
@@ -129,21 +467,276 @@ def generate_exegesis(
         api_key: Google Gemini API key
         model_name: Model to use
         max_retries: Maximum retry attempts
+        rate_limiter: Limiter to take capacity from before each attempt
+        cache: Response cache consulted before calling the API
+        context_cache: Cached context to send prefix-sharing prompts against
+        prefix: Prompt prefix that prompt starts with (sent once via context_cache)
+        stream: Consume the streaming API, retrying malformed or cut-off output early
 
     Returns:
         Parsed JSON response dict or None if failed
     """
+    cache_key = None
+    if cache is not None:
+        cache_key = make_cache_key(model_name, prompt)
+        cached_text = cache.get(cache_key)
+        if cached_text is not None:
+            return parse_json_response(cached_text)
+
+    model = initialize_client(api_key, model_name)
+    estimated_tokens = estimate_tokens(prompt)
+
+    suffix = None
+    if context_cache is not None and context_cache.model_name == model_name:
+        suffix = _prompt_suffix(prompt, prefix)
+
     def make_request():
         """Inner function for retry logic."""
-        model = initialize_client(api_key, model_name)
-        response = model.generate_content(prompt)
-        return response.text
+        if rate_limiter is not None:
+            rate_limiter.acquire(estimated_tokens)
+
+        cached_model = context_cache.model_for(prefix) if suffix is not None else None
+        request_model, contents = (cached_model, suffix) if cached_model is not None else (model, prompt)
+
+        started = time.perf_counter()
+        if stream:
+            response = request_model.generate_content(contents, stream=True)
+            response_text, data = _read_stream(response, started)
+        else:
+            response = request_model.generate_content(contents)
+            response_text, data = response.text, None
+            _record_request(started, None, streamed=False, aborted=False)
+
+        if context_cache is not None:
+            context_cache.record(prefix, response, cached=cached_model is not None)
+
+        if rate_limiter is not None:
+            actual_tokens = _response_token_count(response)
+            if actual_tokens is not None:
+                rate_limiter.record_usage(estimated_tokens, actual_tokens)
+
+        return response_text, data
 
     # Execute with retry logic
-    response_text = retry_with_backoff(make_request, max_retries=max_retries)
+    result = retry_with_backoff(make_request, max_retries=max_retries)
 
-    if response_text is None:
+    if result is None:
         return None
+    response_text, data = result
+
+    # Keep the raw text so parsing/validation fixes can be replayed
+    if cache is not None:
+        cache.put(cache_key, model_name, response_text)
+
+    # Streamed responses were parsed while they arrived
+    return data if data is not None else parse_json_response(response_text)
+
+
+class AsyncGeminiClient:
+    """Asyncio Gemini client with one model and bounded concurrency"""
+
+    def __init__(
+        self,
+        api_key: str,
+        model_name: str = DEFAULT_MODEL,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        model: Optional[Any] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        cache: Optional[ResponseCache] = None,
+        context_cache: Optional[ContextCache] = None,
+        stream: bool = False
+    ):
+        """
+        Configure the API once and build the model used for every request.
+
+        Args:
+            api_key: Google Gemini API key
+            model_name: Model to use
+            max_concurrency: Maximum requests in flight at once
+            model: Pre-built model (anything with generate_content_async)
+            rate_limiter: Limiter to take capacity from before each attempt
+            cache: Response cache consulted before calling the API
+            context_cache: Cached context to send prefix-sharing prompts against
+            stream: Consume the streaming API, retrying malformed or cut-off output early
+        """
+        self.model_name = model_name
+        self.stream = stream
+        self.rate_limiter = rate_limiter
+        self.cache = cache
+        self.context_cache = context_cache if (
+            context_cache is not None and context_cache.model_name == model_name
+        ) else None
+        self.max_concurrency = max(1, max_concurrency)
+        self.model = model if model is not None else initialize_client(api_key, model_name)
+        self._loop = None
+        self._semaphore_for_loop = None
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        """Get the semaphore for the running event loop (recreated per loop)."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._semaphore_for_loop = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore_for_loop
+
+    async def generate_text(
+        self,
+        prompt: str,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        base_delay: float = DEFAULT_BASE_DELAY,
+        max_delay: float = DEFAULT_MAX_DELAY,
+        prefix: Optional[Any] = None
+    ) -> Optional[str]:
+        """
+        Send a prompt and return the raw response text.
+
+        The concurrency slot is released during backoff so a failing
+        request does not hold up others.
+
+        Args:
+            prompt: Complete prompt
+            max_retries: Maximum number of attempts
+            base_delay: Initial backoff delay in seconds
+            max_delay: Maximum backoff delay in seconds
+            prefix: Prompt prefix that prompt starts with (sent once via the context cache)
+
+        Returns:
+            Response text or None if all attempts failed
+        """
+        cache_key = None
+        if self.cache is not None:
+            cache_key = make_cache_key(self.model_name, prompt)
+            cached_text = await asyncio.to_thread(self.cache.get, cache_key)
+            if cached_text is not None:
+                return cached_text
+
+        semaphore = self._semaphore()
+        estimated_tokens = estimate_tokens(prompt)
+        suffix = _prompt_suffix(prompt, prefix) if self.context_cache is not None else None
+
+        for attempt in range(max_retries):
+            try:
+                cached_model = None
+                if suffix is not None:
+                    # Creating or refreshing the context blocks, so keep it off the loop
+                    cached_model = self.context_cache.peek(prefix)
+                    if cached_model is None:
+                        cached_model = await asyncio.to_thread(self.context_cache.model_for, prefix)
+
+                request_model, contents = (
+                    (cached_model, suffix) if cached_model is not None else (self.model, prompt)
+                )
+
+                async with semaphore:
+                    if self.rate_limiter is not None:
+                        await self.rate_limiter.aacquire(estimated_tokens)
+                    started = time.perf_counter()
+                    if self.stream:
+                        response = await request_model.generate_content_async(contents, stream=True)
+                        response_text, _ = await _aread_stream(response, started)
+                    else:
+                        response = await request_model.generate_content_async(contents)
+                        response_text = response.text
+                        _record_request(started, None, streamed=False, aborted=False)
+
+                if self.context_cache is not None:
+                    self.context_cache.record(prefix, response, cached=cached_model is not None)
+
+                if self.rate_limiter is not None:
+                    actual_tokens = _response_token_count(response)
+                    if actual_tokens is not None:
+                        await asyncio.to_thread(self.rate_limiter.record_usage, estimated_tokens, actual_tokens)
+
+                if self.cache is not None:
+                    await asyncio.to_thread(self.cache.put, cache_key, self.model_name, response_text)
+
+                return response_text
+            except Exception:
+                if attempt == max_retries - 1:
+                    return None
+
+                delay = min(base_delay * (2 ** attempt), max_delay)
+                await asyncio.sleep(delay)
+
+        return None
+
+    async def generate_exegesis(
+        self,
+        prompt: str,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        prefix: Optional[Any] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Generate biblical exegesis without blocking the event loop.
+
+        Args:
+            prompt: Complete prompt including verse and instructions
+            max_retries: Maximum retry attempts
+            prefix: Prompt prefix that prompt starts with (sent once via the context cache)
+
+        Returns:
+            Parsed JSON response dict or None if failed
+        """
+        response_text = await self.generate_text(prompt, max_retries=max_retries, prefix=prefix)
+
+        if response_text is None:
+            return None
+
+        return parse_json_response(response_text)
+
+
+def get_async_client(
+    api_key: str,
+    model_name: str = DEFAULT_MODEL,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+) -> AsyncGeminiClient:
+    """
+    Get the shared async client for an API key and model.
+
+    The client (and its configured model) is created on first use and
+    reused afterwards; max_concurrency only applies on creation.
+
+    Args:
+        api_key: Google Gemini API key
+        model_name: Model to use
+        max_concurrency: Maximum requests in flight at once
+
+    Returns:
+        AsyncGeminiClient instance
+    """
+    key = (api_key, model_name)
+
+    with _async_clients_lock:
+        client = _async_clients.get(key)
+        if client is None:
+            client = AsyncGeminiClient(api_key, model_name, max_concurrency)
+            _async_clients[key] = client
+        return client
+
+
+async def agenerate_exegesis(
+    prompt: str,
+    api_key: str,
+    model_name: str = DEFAULT_MODEL,
+    max_retries: int = DEFAULT_MAX_RETRIES,
+    client: Optional[AsyncGeminiClient] = None,
+    prefix: Optional[Any] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    Generate biblical exegesis using Gemini API without blocking.
+
+    Args:
+        prompt: Complete prompt including verse and instructions
+        api_key: Google Gemini API key
+        model_name: Model to use
+        max_retries: Maximum retry attempts
+        client: Client to send through (shared client if None)
+        prefix: Prompt prefix that prompt starts with (used if the client has a context cache)
+
+    Returns:
+        Parsed JSON response dict or None if failed
+    """
+    if client is None:
+        client = get_async_client(api_key, model_name)
 
-    # Parse JSON response
-    return parse_json_response(response_text)
+    return await client.generate_exegesis(prompt, max_retries=max_retries, prefix=prefix)
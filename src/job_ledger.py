@@ -0,0 +1,438 @@
+"""
+Job Ledger Module
+
+Durable, canon-wide work ledger for verse generation. Every verse from
+bible_structure.get_all_verses() has a row with its status (pending,
+in_flight, done, failed), attempt count and last error, so a run can
+resume exactly where it stopped and failures are never lost.
+
+Claims happen in a single `BEGIN IMMEDIATE` transaction, so several
+threads or worker processes can share one ledger without processing the
+same verse twice. A verse left in flight by a crashed worker becomes
+claimable again once its lease expires (or is marked failed if that was
+its last allowed attempt). Outcomes are only recorded for the worker
+that still holds the claim.
+
+Functions:
+    get_job_ledger_path: Get the default ledger database location
+    run_jobs: Process claimable verses from the ledger on worker threads
+
+Classes:
+    JobLedger: SQLite-backed per-verse job ledger
+"""
+
+import functools
+import itertools
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Any, Optional, Iterable, Tuple, List, Callable
+
+from src.config import get_project_root
+from src.bible_structure import get_all_verses, get_book_info, get_verse_ordinal
+
+
+# Job states
+STATUS_PENDING = "pending"
+STATUS_IN_FLIGHT = "in_flight"
+STATUS_DONE = "done"
+STATUS_FAILED = "failed"
+
+# Scopes accepted by JobLedger and the `run` command
+SCOPE_CANON = "canon"
+SCOPE_TESTAMENT = "testament"
+SCOPE_BOOK = "book"
+
+DEFAULT_MAX_ATTEMPTS = 3
+
+# Seconds before an in-flight claim is considered abandoned
+DEFAULT_LEASE_SECONDS = 3600.0
+
+# Seconds to wait for another process holding the ledger lock
+DB_LOCK_TIMEOUT = 30.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    ordinal INTEGER PRIMARY KEY,
+    testament TEXT NOT NULL,
+    book TEXT NOT NULL,
+    chapter INTEGER NOT NULL,
+    verse INTEGER NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    last_error TEXT,
+    worker TEXT,
+    claimed_at REAL,
+    updated_at REAL
+);
+CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, ordinal);
+CREATE INDEX IF NOT EXISTS jobs_book ON jobs (book, ordinal);
+"""
+
+Job = Tuple[str, int, int]
+
+
+def get_job_ledger_path() -> Path:
+    """
+    Get the default ledger database location.
+
+    Returns:
+        Path under the project's .cpf/state directory
+    """
+    return get_project_root() / ".cpf" / "state" / "job_ledger.sqlite"
+
+
+def _scope_filter(scope: str, name: Optional[str]) -> Tuple[str, List[Any]]:
+    """SQL condition and parameters selecting the jobs in a scope."""
+    if scope == SCOPE_CANON:
+        return "1 = 1", []
+    if scope == SCOPE_TESTAMENT:
+        if not name or name.upper() not in ("OT", "NT"):
+            raise ValueError("Testament scope needs a name of OT or NT")
+        return "testament = ?", [name.upper()]
+    if scope == SCOPE_BOOK:
+        book_info = get_book_info(name) if name else None
+        if book_info is None:
+            raise ValueError(f"Unknown book: {name}")
+        return "book = ?", [book_info["name"]]
+    raise ValueError(f"Unknown scope: {scope}")
+
+
+class JobLedger:
+    """SQLite-backed per-verse job ledger"""
+
+    def __init__(
+        self,
+        db_path: Optional[Path] = None,
+        lease_seconds: float = DEFAULT_LEASE_SECONDS,
+        clock: Callable[[], float] = time.time
+    ):
+        """
+        Open (or create) a ledger.
+
+        Args:
+            db_path: Ledger database (default: get_job_ledger_path())
+            lease_seconds: Seconds before an unfinished claim can be re-claimed
+            clock: Wall-clock source
+        """
+        self.db_path = db_path or get_job_ledger_path()
+        self.lease_seconds = lease_seconds
+        self.clock = clock
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = self._connect()
+        try:
+            conn.executescript(_SCHEMA)
+        finally:
+            conn.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection (one per call, so the ledger is thread-safe)."""
+        return sqlite3.connect(str(self.db_path), timeout=DB_LOCK_TIMEOUT, isolation_level=None)
+
+    def seed(self, verses: Optional[Iterable[Job]] = None) -> int:
+        """
+        Add a pending job for every verse not already in the ledger.
+
+        Args:
+            verses: (book, chapter, verse) references (default: every
+                verse of the canon); invalid references are skipped
+
+        Returns:
+            Number of jobs added
+        """
+        if verses is None:
+            verses = get_all_verses()
+
+        testaments: Dict[str, str] = {}
+        rows = []
+        for book, chapter, verse in verses:
+            ordinal = get_verse_ordinal(book, chapter, verse)
+            if ordinal is None:
+                continue
+            if book not in testaments:
+                testaments[book] = get_book_info(book)["testament"]
+            rows.append((ordinal, testaments[book], book, chapter, verse))
+
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            before = conn.total_changes
+            conn.executemany(
+                "INSERT OR IGNORE INTO jobs (ordinal, testament, book, chapter, verse) VALUES (?, ?, ?, ?, ?)",
+                rows
+            )
+            added = conn.total_changes - before
+            conn.execute("COMMIT")
+        except Exception:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+        return added
+
+    def claim(
+        self,
+        worker: str,
+        scope: str = SCOPE_CANON,
+        name: Optional[str] = None,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS
+    ) -> Optional[Job]:
+        """
+        Atomically claim the next verse to process, in canonical order.
+
+        Claimable jobs are pending ones, failed ones with attempts left,
+        and in-flight ones whose lease has expired. Expired claims that
+        used the last allowed attempt are marked failed first.
+
+        Args:
+            worker: Identifier of the claiming worker
+            scope: canon, testament or book
+            name: Testament (OT/NT) or book name for narrower scopes
+            max_attempts: Attempts after which a failed verse is left alone
+
+        Returns:
+            (book, chapter, verse), or None when nothing is claimable
+        """
+        condition, params = _scope_filter(scope, name)
+
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            now = self.clock()
+
+            conn.execute(
+                f"""UPDATE jobs SET status = ?, last_error = 'lease expired (worker ' || worker || ')',
+                       worker = NULL, updated_at = ?
+                    WHERE {condition} AND status = ? AND claimed_at < ? AND attempts >= ?""",
+                [STATUS_FAILED, now] + params + [STATUS_IN_FLIGHT, now - self.lease_seconds, max_attempts]
+            )
+
+            row = conn.execute(
+                f"""SELECT ordinal, book, chapter, verse FROM jobs
+                    WHERE {condition} AND (
+                        status = ?
+                        OR (status = ? AND attempts < ?)
+                        OR (status = ? AND claimed_at < ? AND attempts < ?)
+                    )
+                    ORDER BY ordinal LIMIT 1""",
+                params + [
+                    STATUS_PENDING,
+                    STATUS_FAILED, max_attempts,
+                    STATUS_IN_FLIGHT, now - self.lease_seconds, max_attempts
+                ]
+            ).fetchone()
+
+            if row is None:
+                conn.execute("COMMIT")
+                return None
+
+            ordinal, book, chapter, verse = row
+            conn.execute(
+                """UPDATE jobs SET status = ?, attempts = attempts + 1, worker = ?,
+                       claimed_at = ?, updated_at = ?
+                   WHERE ordinal = ?""",
+                (STATUS_IN_FLIGHT, worker, now, now, ordinal)
+            )
+            conn.execute("COMMIT")
+            return book, chapter, verse
+        except Exception:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+    def complete(
+        self,
+        book: str,
+        chapter: int,
+        verse: int,
+        success: bool,
+        error: Optional[str] = None,
+        worker: Optional[str] = None
+    ) -> bool:
+        """
+        Record the outcome of a claimed verse.
+
+        Args:
+            book: Book name
+            chapter: Chapter number
+            verse: Verse number
+            success: Whether the verse was generated and written
+            error: Failure reason (kept as last_error)
+            worker: Claiming worker; if given, the outcome is only recorded
+                while that worker still holds the claim (not after its
+                lease expired and the verse was reclaimed)
+
+        Returns:
+            True if recorded, False if the claim is no longer held
+        """
+        if success:
+            assignments, values = "status = ?, last_error = NULL", [STATUS_DONE]
+        else:
+            assignments, values = "status = ?, last_error = ?", [STATUS_FAILED, error or "processing failed"]
+
+        condition = "book = ? AND chapter = ? AND verse = ?"
+        params = [book, chapter, verse]
+        if worker is not None:
+            condition += " AND status = ? AND worker = ?"
+            params += [STATUS_IN_FLIGHT, worker]
+
+        conn = self._connect()
+        try:
+            cursor = conn.execute(
+                f"UPDATE jobs SET {assignments}, worker = NULL, updated_at = ? WHERE {condition}",
+                values + [self.clock()] + params
+            )
+            return cursor.rowcount > 0
+        finally:
+            conn.close()
+
+    def summary(self, scope: str = SCOPE_CANON, name: Optional[str] = None) -> Dict[str, int]:
+        """
+        Count jobs by status.
+
+        Args:
+            scope: canon, testament or book
+            name: Testament (OT/NT) or book name for narrower scopes
+
+        Returns:
+            Dict with total and a count for every status
+        """
+        condition, params = _scope_filter(scope, name)
+
+        conn = self._connect()
+        try:
+            counts = dict(conn.execute(
+                f"SELECT status, COUNT(*) FROM jobs WHERE {condition} GROUP BY status",
+                params
+            ).fetchall())
+        finally:
+            conn.close()
+
+        summary = {status: counts.get(status, 0)
+                   for status in (STATUS_PENDING, STATUS_IN_FLIGHT, STATUS_DONE, STATUS_FAILED)}
+        summary["total"] = sum(counts.values())
+        return summary
+
+    def failures(self, scope: str = SCOPE_CANON, name: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        List failed verses with their attempts and last error.
+
+        Args:
+            scope: canon, testament or book
+            name: Testament (OT/NT) or book name for narrower scopes
+
+        Returns:
+            List of {"book", "chapter", "verse", "attempts", "last_error"} dicts
+        """
+        condition, params = _scope_filter(scope, name)
+
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                f"""SELECT book, chapter, verse, attempts, last_error FROM jobs
+                    WHERE {condition} AND status = ? ORDER BY ordinal""",
+                params + [STATUS_FAILED]
+            ).fetchall()
+        finally:
+            conn.close()
+
+        return [
+            {"book": book, "chapter": chapter, "verse": verse, "attempts": attempts, "last_error": last_error}
+            for book, chapter, verse, attempts, last_error in rows
+        ]
+
+
+def run_jobs(
+    ledger: JobLedger,
+    process: Callable[..., Optional[bool]],
+    scope: str = SCOPE_CANON,
+    name: Optional[str] = None,
+    workers: int = 1,
+    max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+    worker_prefix: Optional[str] = None,
+    deferred: bool = False
+) -> Dict[str, int]:
+    """
+    Process claimable verses from the ledger until none are left.
+
+    Each worker thread claims a verse, runs `process` on it and records
+    the outcome. Failed verses are retried (by whichever worker claims
+    them next) until they reach max_attempts.
+
+    With deferred=True, `process` also gets a callback as a fourth
+    argument and may return None to report the outcome through it later
+    (e.g. once a batched verse store write commits). The verse stays in
+    flight until then, so work lost in a crash is claimed again once its
+    lease expires. Counts for outcomes reported after run_jobs returns
+    are added to the returned dict as they arrive.
+
+    Args:
+        ledger: Job ledger
+        process: Callable (book, chapter, verse[, on_commit]) -> success
+        scope: canon, testament or book
+        name: Testament (OT/NT) or book name for narrower scopes
+        workers: Worker threads in this process
+        max_attempts: Attempts per verse before giving up
+        worker_prefix: Worker id prefix (default: host, pid and a random tag)
+        deferred: Pass `process` an outcome callback (see above)
+
+    Returns:
+        Dict with processed, successful and failed counts for this run
+    """
+    _scope_filter(scope, name)  # Reject bad scopes before starting threads
+
+    if worker_prefix is None:
+        worker_prefix = f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:6]}"
+
+    results = {"processed": 0, "successful": 0, "failed": 0}
+    lock = threading.Lock()
+
+    def finish(job: Job, owner: str, success: bool, error: Optional[str] = None) -> None:
+        if not ledger.complete(*job, success, error, worker=owner):
+            return  # Lease expired and another worker reclaimed the verse
+        with lock:
+            results["processed"] += 1
+            results["successful" if success else "failed"] += 1
+
+    def work(worker_num: int) -> None:
+        worker = f"{worker_prefix}-{worker_num}"
+        for claims in itertools.count(1):
+            # A fresh owner per claim, so a late outcome for an expired
+            # claim never lands on the same worker's later reclaim
+            owner = f"{worker}.{claims}"
+            job = ledger.claim(owner, scope, name, max_attempts)
+            if job is None:
+                return
+
+            error = None
+            try:
+                if deferred:
+                    success = process(*job, functools.partial(finish, job, owner))
+                else:
+                    success = process(*job)
+            except Exception as e:
+                success = False
+                error = f"{type(e).__name__}: {e}"
+
+            if success is not None:
+                finish(job, owner, success, error)
+
+    workers = max(1, workers)
+    if workers == 1:
+        work(0)
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for future in [executor.submit(work, num) for num in range(workers)]:
+                future.result()
+
+    return results
@@ -0,0 +1,278 @@
+"""
+JSON Stream Module
+
+Incremental checker for the JSON object in a streamed model response.
+
+Text is fed in chunks as it arrives. The parser skips any preamble (prose
+or a ```json fence) up to the first "{", then tracks string, escape and
+bracket state across chunk boundaries, so it knows the moment the object
+closes and can stop reading. Output that cannot become valid JSON
+(mismatched brackets, stray text outside strings, raw control characters
+inside strings, too much preamble) is reported as soon as it is seen;
+a stream that ends before the object closes is reported as truncated.
+Each character is looked at once.
+
+The same scanner extracts the outermost object from a complete response:
+it starts inside a ```json fence when there is one, ignores trailing prose
+(braces included), and can close a truncated object when the text stops
+cleanly between values. Failures carry the offset where they occurred.
+
+Functions:
+    extract_json_object: Find (and optionally repair) the JSON object in a response
+
+Classes:
+    JSONStreamParser: Finds and checks one JSON object in streamed text
+"""
+
+import json
+import re
+from typing import Any, List, Optional
+
+
+# Characters of preamble allowed before the opening "{"
+DEFAULT_MAX_PREAMBLE = 4096
+
+# Candidate object starts extract_json_object tries (bounds the work to a
+# fixed number of passes over the text)
+DEFAULT_MAX_STARTS = 8
+
+_FENCE = "```json"
+
+# Outside strings: the next structural character, or one that cannot
+# appear in JSON outside a string (only numbers, true/false/null,
+# separators and whitespace can)
+_OUTSIDE = re.compile(r'[{}\[\]"]|[^\s,:0-9.+\-eEtrufalsn]')
+
+# Inside strings: the closing quote, an escape, or a raw control character
+_INSIDE = re.compile(r'["\\\x00-\x1f]')
+
+_CLOSERS = {"}": "{", "]": "["}
+_OPENERS = {"{": "}", "[": "]"}
+
+
+class JSONStreamParser:
+    """Finds and checks one JSON object in streamed text"""
+
+    def __init__(self, max_preamble: int = DEFAULT_MAX_PREAMBLE, origin: int = 0):
+        """
+        Args:
+            max_preamble: Characters allowed before the opening "{"
+            origin: Position of the first fed character in the whole
+                response (reported offsets are relative to the response)
+        """
+        self.max_preamble = max_preamble
+        self.error: Optional[str] = None
+        self.offset: Optional[int] = None
+        self.complete = False
+        self.repaired = False
+        self.value: Any = None
+        self._origin = origin
+        self._parts: List[str] = []
+        self._length = origin
+        self._start: Optional[int] = None
+        self._end: Optional[int] = None
+        self._stack: List[str] = []
+        self._in_string = False
+        self._escape = False
+
+    @property
+    def done(self) -> bool:
+        """True once the object has closed or the output was rejected."""
+        return self.complete or self.error is not None
+
+    @property
+    def text(self) -> str:
+        """All text fed so far."""
+        return "".join(self._parts)
+
+    @property
+    def start(self) -> Optional[int]:
+        """Position of the object's opening "{" (None if not found)."""
+        return self._start
+
+    def feed(self, chunk: str) -> None:
+        """
+        Scan the next chunk of the stream (ignored once done).
+
+        Args:
+            chunk: Next piece of response text
+        """
+        if self.done or not chunk:
+            return
+
+        base = self._length
+        self._parts.append(chunk)
+        self._length += len(chunk)
+        pos = 0
+
+        if self._start is None:
+            brace = chunk.find("{")
+            if brace < 0:
+                if self._length - self._origin > self.max_preamble:
+                    self._fail("no JSON object", self._length)
+                return
+            if base + brace - self._origin > self.max_preamble:
+                self._fail("no JSON object", base + brace)
+                return
+            self._start = base + brace
+            self._stack.append("{")
+            pos = brace + 1
+
+        self._scan(chunk, pos, base)
+
+    def close(self) -> None:
+        """Mark the end of the stream (an unfinished object is truncated)."""
+        if self.done:
+            return
+        if self._start is None:
+            self._fail("no JSON object", self._length)
+        else:
+            self._fail("truncated", self._length)
+
+    def repair(self) -> bool:
+        """
+        Close a truncated object when that is safe.
+
+        It is safe when the text stopped outside a string, right after a
+        complete value, a trailing comma (dropped) or an opening bracket,
+        and closing the open brackets gives valid JSON. The truncation
+        offset is kept in `offset`.
+
+        Returns:
+            True if the object was repaired (value is set, repaired is True)
+        """
+        if self.error != "truncated" or self._in_string or self._escape:
+            return False
+
+        body = self.text[self._start - self._origin:].rstrip()
+        if body.endswith(","):
+            body = body[:-1].rstrip()
+        elif not (body[-1] in '"]}[{' or body.endswith(("true", "false", "null"))):
+            return False
+
+        try:
+            value = json.loads(body + "".join(_OPENERS[char] for char in reversed(self._stack)))
+        except (json.JSONDecodeError, RecursionError):
+            return False
+
+        self.value = value
+        self.error = None
+        self.complete = True
+        self.repaired = True
+        return True
+
+    def _scan(self, chunk: str, pos: int, base: int) -> None:
+        """Advance the string/bracket state machine over chunk[pos:]."""
+        end = len(chunk)
+        stack = self._stack
+
+        while pos < end:
+            if self._escape:
+                self._escape = False
+                pos += 1
+                continue
+
+            if self._in_string:
+                match = _INSIDE.search(chunk, pos)
+                if match is None:
+                    return
+                char = match.group()
+                pos = match.end()
+                if char == '"':
+                    self._in_string = False
+                elif char == "\\":
+                    self._escape = True
+                else:
+                    self._fail("control character in string", base + match.start())
+                    return
+                continue
+
+            match = _OUTSIDE.search(chunk, pos)
+            if match is None:
+                return
+            char = match.group()
+            pos = match.end()
+
+            if char == '"':
+                self._in_string = True
+            elif char in "{[":
+                stack.append(char)
+            elif char in "}]":
+                if stack.pop() != _CLOSERS[char]:
+                    self._fail(f"mismatched '{char}'", base + match.start())
+                    return
+                if not stack:
+                    self._finish(base + pos)
+                    return
+            else:
+                self._fail(f"unexpected {char!r}", base + match.start())
+                return
+
+    def _finish(self, end: int) -> None:
+        """Decode the closed object (reporting where it is invalid, if it is)."""
+        self._end = end
+        text = self.text[self._start - self._origin:end - self._origin]
+        try:
+            self.value = json.loads(text)
+        except json.JSONDecodeError as e:
+            self._fail(f"invalid JSON ({e.msg})", self._start + e.pos)
+            return
+        except RecursionError:
+            self._fail("nested too deeply", self._start)
+            return
+        self.complete = True
+
+    def _fail(self, reason: str, offset: int) -> None:
+        """Reject the output."""
+        self.error = reason
+        self.offset = offset
+
+
+def extract_json_object(
+    text: str,
+    repair: bool = True,
+    max_starts: int = DEFAULT_MAX_STARTS
+) -> JSONStreamParser:
+    """
+    Find the outermost JSON object in a complete model response.
+
+    Scanning starts after a ```json fence if there is one, otherwise at the
+    first "{", and stops where that object closes, so trailing prose is
+    never read. If the candidate is rejected (e.g. a brace in preamble
+    prose) the scan restarts at the first "{" after the point where it
+    failed, never inside the rejected object, so a malformed response is
+    not mistaken for one of its nested objects. At most max_starts
+    candidates are tried, so the work stays linear in the text length.
+
+    Args:
+        text: Raw response text
+        repair: Close a truncated object when safe (see JSONStreamParser.repair)
+        max_starts: Candidate starting braces to try
+
+    Returns:
+        Parser of the first accepted candidate, or of the candidate that got
+        furthest; check value, error, offset and repaired
+    """
+    fence = text.find(_FENCE)
+    origin = fence + len(_FENCE) if fence >= 0 else 0
+    best = None
+
+    for _ in range(max(1, max_starts)):
+        parser = JSONStreamParser(max_preamble=len(text), origin=origin)
+        parser.feed(text[origin:])
+        parser.close()
+
+        if parser.complete or (repair and parser.repair()):
+            return parser
+        if parser.start is None:
+            # No further "{" (only report this if nothing else was found)
+            best = best or parser
+            break
+        if best is None or parser.offset > best.offset:
+            best = parser
+        if parser.error == "truncated":
+            break
+
+        origin = parser.offset + 1
+
+    return best
@@ -0,0 +1,359 @@
+"""
+Rate Limiter Module
+
+Token-bucket rate limiting for the LLM APIs (Gemini, Grok, OpenAI),
+enforcing config `rate_limit` settings: requests per minute, tokens per
+minute and a minimum spacing between requests.
+
+Bucket state lives in a small SQLite database and every acquisition is
+one `BEGIN IMMEDIATE` transaction, so threads and separate processes
+sharing the database draw from the same quota. Wait statistics are kept
+both for the bucket's lifetime (in the database) and for this process.
+
+Functions:
+    estimate_tokens: Rough token count for a prompt
+    get_rate_limiter: Get the shared limiter for a provider
+    get_rate_limit_db_path: Get the default bucket database location
+
+Classes:
+    RateLimiter: SQLite-backed token bucket with wait accounting
+"""
+
+import asyncio
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Any, Optional, Callable
+
+from src.config import get_project_root, get_rate_limit_config
+
+
+logger = logging.getLogger(__name__)
+
+# Seconds to wait for another process holding the bucket lock
+DB_LOCK_TIMEOUT = 30.0
+
+# Rough characters-per-token ratio for estimating prompt size
+CHARS_PER_TOKEN = 4
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS buckets (
+    name TEXT PRIMARY KEY,
+    requests REAL NOT NULL,
+    tokens REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    last_request REAL NOT NULL,
+    acquisitions INTEGER NOT NULL DEFAULT 0,
+    total_wait REAL NOT NULL DEFAULT 0,
+    max_wait REAL NOT NULL DEFAULT 0
+);
+"""
+
+# Shared limiters: (provider, db_path) -> RateLimiter
+_limiters: Dict[Any, "RateLimiter"] = {}
+_limiters_lock = threading.Lock()
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Rough token count for a prompt (about four characters per token).
+
+    Args:
+        text: Prompt text
+
+    Returns:
+        Estimated token count (at least 1)
+    """
+    return max(1, len(text) // CHARS_PER_TOKEN)
+
+
+def get_rate_limit_db_path() -> Path:
+    """
+    Get the default bucket database location.
+
+    Returns:
+        Path under the project's .cpf/state directory
+    """
+    return get_project_root() / ".cpf" / "state" / "rate_limits.sqlite"
+
+
+class RateLimiter:
+    """SQLite-backed token bucket with wait accounting"""
+
+    def __init__(
+        self,
+        name: str,
+        requests_per_minute: float,
+        tokens_per_minute: Optional[float] = None,
+        min_interval: float = 0.0,
+        db_path: Optional[Path] = None,
+        clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], None] = time.sleep
+    ):
+        """
+        Create a limiter for one quota.
+
+        Args:
+            name: Bucket name (limiters with the same name and database share quota)
+            requests_per_minute: Request quota; also the burst size
+            tokens_per_minute: Token quota (None disables token limiting)
+            min_interval: Minimum seconds between two requests
+            db_path: Bucket database (default: get_rate_limit_db_path())
+            clock: Wall-clock source (shared across processes)
+            sleep: Blocking sleep used by acquire()
+        """
+        if requests_per_minute <= 0:
+            raise ValueError("requests_per_minute must be positive")
+
+        self.name = name
+        self.requests_per_minute = float(requests_per_minute)
+        self.tokens_per_minute = float(tokens_per_minute) if tokens_per_minute else None
+        self.min_interval = max(0.0, float(min_interval))
+        self.db_path = db_path or get_rate_limit_db_path()
+        self.clock = clock
+        self.sleep = sleep
+        self._schema_ready = False
+
+        # Counters for this process (lifetime counters live in the database)
+        self.session_acquisitions = 0
+        self.session_total_wait = 0.0
+        self.session_max_wait = 0.0
+        self._session_lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection (one per call, so the limiter is thread-safe)."""
+        if not self._schema_ready:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        conn = sqlite3.connect(str(self.db_path), timeout=DB_LOCK_TIMEOUT, isolation_level=None)
+
+        if not self._schema_ready:
+            conn.executescript(_SCHEMA)
+            self._schema_ready = True
+        return conn
+
+    def _refilled(self, row, now: float):
+        """Bucket levels after refilling for the time since the last update."""
+        if row is None:
+            return self.requests_per_minute, self.tokens_per_minute or 0.0, 0.0
+
+        requests, tokens, updated_at, last_request = row
+        elapsed = max(0.0, now - updated_at)
+
+        requests = min(self.requests_per_minute, requests + elapsed * self.requests_per_minute / 60.0)
+        if self.tokens_per_minute:
+            tokens = min(self.tokens_per_minute, tokens + elapsed * self.tokens_per_minute / 60.0)
+
+        return requests, tokens, last_request
+
+    def try_acquire(self, tokens: int = 0, waited: float = 0.0) -> float:
+        """
+        Take capacity for one request if it is available now.
+
+        Args:
+            tokens: Tokens the request is expected to use
+            waited: Seconds the caller already waited (recorded on success)
+
+        Returns:
+            0.0 if capacity was taken, otherwise seconds until it should be
+        """
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            now = self.clock()
+
+            row = conn.execute(
+                "SELECT requests, tokens, updated_at, last_request FROM buckets WHERE name = ?",
+                (self.name,)
+            ).fetchone()
+            requests_level, tokens_level, last_request = self._refilled(row, now)
+
+            wait = 0.0
+            if requests_level < 1.0:
+                wait = max(wait, (1.0 - requests_level) * 60.0 / self.requests_per_minute)
+            if self.tokens_per_minute and tokens:
+                # A request larger than the whole bucket waits for a full bucket
+                needed = min(float(tokens), self.tokens_per_minute)
+                if tokens_level < needed:
+                    wait = max(wait, (needed - tokens_level) * 60.0 / self.tokens_per_minute)
+            if self.min_interval and last_request:
+                wait = max(wait, last_request + self.min_interval - now)
+
+            if wait > 0:
+                conn.execute("ROLLBACK")
+                return wait
+
+            if self.tokens_per_minute:
+                tokens_level -= tokens
+
+            conn.execute(
+                """INSERT INTO buckets (name, requests, tokens, updated_at, last_request, acquisitions, total_wait, max_wait)
+                   VALUES (?, ?, ?, ?, ?, 1, ?, ?)
+                   ON CONFLICT(name) DO UPDATE SET
+                       requests = excluded.requests,
+                       tokens = excluded.tokens,
+                       updated_at = excluded.updated_at,
+                       last_request = excluded.last_request,
+                       acquisitions = acquisitions + 1,
+                       total_wait = total_wait + excluded.total_wait,
+                       max_wait = MAX(max_wait, excluded.max_wait)""",
+                (self.name, requests_level - 1.0, tokens_level, now, now, waited, waited)
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+        with self._session_lock:
+            self.session_acquisitions += 1
+            self.session_total_wait += waited
+            self.session_max_wait = max(self.session_max_wait, waited)
+        return 0.0
+
+    def acquire(self, tokens: int = 0) -> float:
+        """
+        Block until capacity for one request is available and take it.
+
+        Args:
+            tokens: Tokens the request is expected to use
+
+        Returns:
+            Seconds spent waiting for capacity
+        """
+        waited = 0.0
+        while True:
+            wait = self.try_acquire(tokens, waited)
+            if wait <= 0:
+                break
+            self.sleep(wait)
+            waited += wait
+
+        if waited > 0:
+            logger.info(f"Rate limiter '{self.name}' waited {waited:.1f}s for capacity")
+        return waited
+
+    async def aacquire(self, tokens: int = 0) -> float:
+        """
+        Wait (without blocking the event loop) for capacity and take it.
+
+        The SQLite transaction runs in a worker thread, since another
+        process may hold the bucket lock for up to DB_LOCK_TIMEOUT.
+
+        Args:
+            tokens: Tokens the request is expected to use
+
+        Returns:
+            Seconds spent waiting for capacity
+        """
+        waited = 0.0
+        while True:
+            wait = await asyncio.to_thread(self.try_acquire, tokens, waited)
+            if wait <= 0:
+                break
+            await asyncio.sleep(wait)
+            waited += wait
+
+        if waited > 0:
+            logger.info(f"Rate limiter '{self.name}' waited {waited:.1f}s for capacity")
+        return waited
+
+    def record_usage(self, estimated_tokens: int, actual_tokens: int) -> None:
+        """
+        Correct the token bucket once a request's real usage is known.
+
+        Args:
+            estimated_tokens: Tokens taken by acquire()
+            actual_tokens: Tokens the API reported using
+        """
+        if not self.tokens_per_minute or actual_tokens == estimated_tokens:
+            return
+
+        conn = self._connect()
+        try:
+            conn.execute(
+                "UPDATE buckets SET tokens = MIN(?, tokens - ?) WHERE name = ?",
+                (self.tokens_per_minute, actual_tokens - estimated_tokens, self.name)
+            )
+        finally:
+            conn.close()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Wait statistics for this bucket.
+
+        Returns:
+            Dict with lifetime acquisitions, total_wait, max_wait and
+            average_wait (seconds, shared by every user of the bucket),
+            plus session_acquisitions, session_total_wait and
+            session_max_wait for this process
+        """
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                "SELECT acquisitions, total_wait, max_wait FROM buckets WHERE name = ?",
+                (self.name,)
+            ).fetchone()
+        finally:
+            conn.close()
+
+        acquisitions, total_wait, max_wait = row or (0, 0.0, 0.0)
+        return {
+            "acquisitions": acquisitions,
+            "total_wait": total_wait,
+            "max_wait": max_wait,
+            "average_wait": total_wait / acquisitions if acquisitions else 0.0,
+            "session_acquisitions": self.session_acquisitions,
+            "session_total_wait": self.session_total_wait,
+            "session_max_wait": self.session_max_wait
+        }
+
+    def reset(self) -> None:
+        """Refill the bucket and clear its statistics."""
+        conn = self._connect()
+        try:
+            conn.execute("DELETE FROM buckets WHERE name = ?", (self.name,))
+        finally:
+            conn.close()
+
+        with self._session_lock:
+            self.session_acquisitions = 0
+            self.session_total_wait = 0.0
+            self.session_max_wait = 0.0
+
+
+def get_rate_limiter(provider: str, db_path: Optional[Path] = None) -> RateLimiter:
+    """
+    Get the shared limiter for a provider ("gemini", "grok" or "openai").
+
+    Settings come from config rate_limit, with per-provider overrides
+    from rate_limit["providers"][provider].
+
+    Args:
+        provider: Provider name (also the bucket name)
+        db_path: Bucket database (default: get_rate_limit_db_path())
+
+    Returns:
+        RateLimiter instance
+    """
+    key = (provider, db_path)
+
+    with _limiters_lock:
+        limiter = _limiters.get(key)
+        if limiter is None:
+            settings = get_rate_limit_config()
+            settings = {**settings, **settings.get("providers", {}).get(provider, {})}
+
+            limiter = RateLimiter(
+                provider,
+                requests_per_minute=settings["requests_per_minute"],
+                tokens_per_minute=settings.get("tokens_per_minute"),
+                min_interval=settings.get("delay_between_requests", 0),
+                db_path=db_path
+            )
+            _limiters[key] = limiter
+        return limiter
@@ -0,0 +1,346 @@
+"""
+Response Cache Module
+
+Persistent, content-addressed cache of raw LLM response text, so rerunning
+a chapter after a validation or parsing fix does not re-bill the API.
+
+Entries are keyed by a SHA-256 of model name, generation parameters and
+the full prompt, stored compressed in SQLite (zstd when the `zstandard`
+package is installed, zlib otherwise) and evicted by age and total size.
+
+Functions:
+    make_cache_key: Hash model, parameters and prompt into a cache key
+    get_response_cache_path: Get the default cache database location
+    open_response_cache: Get the shared cache built from config settings
+
+Classes:
+    ResponseCache: SQLite-backed compressed response cache with stats
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Dict, Any, Optional, Callable, Iterator
+
+from src.config import get_project_root, get_response_cache_config
+
+try:
+    import zstandard
+except ImportError:  # Optional dependency
+    zstandard = None
+
+
+# Seconds to wait for another process holding the database lock
+DB_LOCK_TIMEOUT = 30.0
+
+CODEC_ZSTD = "zstd"
+CODEC_ZLIB = "zlib"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    model TEXT NOT NULL,
+    codec TEXT NOT NULL,
+    data BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed_at);
+CREATE TABLE IF NOT EXISTS counters (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+"""
+
+# Shared caches: resolved db path -> ResponseCache
+_caches: Dict[Path, "ResponseCache"] = {}
+_caches_lock = threading.Lock()
+
+
+def make_cache_key(model_name: str, prompt: str, params: Optional[Dict[str, Any]] = None) -> str:
+    """
+    Hash model, generation parameters and prompt into a cache key.
+
+    Args:
+        model_name: Model the prompt is sent to
+        prompt: Full prompt text
+        params: Generation parameters (temperature, max tokens, ...)
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    payload = json.dumps(
+        {"model": model_name, "params": params or {}, "prompt": prompt},
+        sort_keys=True,
+        ensure_ascii=False,
+        default=str
+    )
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def _compress(text: str):
+    """Compress response text with the best available codec."""
+    raw = text.encode('utf-8')
+    if zstandard is not None:
+        return CODEC_ZSTD, zstandard.ZstdCompressor(level=3).compress(raw)
+    return CODEC_ZLIB, zlib.compress(raw, 6)
+
+
+def _decompress(codec: str, data: bytes) -> Optional[str]:
+    """Decompress stored text (None if the codec is unavailable)."""
+    if codec == CODEC_ZSTD:
+        if zstandard is None:
+            return None
+        raw = zstandard.ZstdDecompressor().decompress(data)
+    elif codec == CODEC_ZLIB:
+        raw = zlib.decompress(data)
+    else:
+        return None
+    return raw.decode('utf-8')
+
+
+def get_response_cache_path() -> Path:
+    """
+    Get the default cache database location.
+
+    Returns:
+        Path under the project's .cpf/state directory
+    """
+    return get_project_root() / ".cpf" / "state" / "response_cache.sqlite"
+
+
+class ResponseCache:
+    """SQLite-backed compressed response cache with stats"""
+
+    def __init__(
+        self,
+        db_path: Optional[Path] = None,
+        max_bytes: int = 512 * 1024 * 1024,
+        max_age_seconds: Optional[float] = 30 * 24 * 3600,
+        clock: Callable[[], float] = time.time
+    ):
+        """
+        Create a cache.
+
+        Args:
+            db_path: Cache database (default: get_response_cache_path())
+            max_bytes: Compressed size budget; least recently used entries go first
+            max_age_seconds: Entries older than this are dropped (None keeps them)
+            clock: Wall-clock source
+        """
+        self.db_path = db_path or get_response_cache_path()
+        self.max_bytes = max_bytes
+        self.max_age_seconds = max_age_seconds
+        self.clock = clock
+        self._schema_ready = False
+
+        # Counters for this process (lifetime counters live in the database)
+        self.session_hits = 0
+        self.session_misses = 0
+        self._session_lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection (one per call, so the cache is thread-safe)."""
+        if not self._schema_ready:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        conn = sqlite3.connect(str(self.db_path), timeout=DB_LOCK_TIMEOUT, isolation_level=None)
+
+        if not self._schema_ready:
+            conn.executescript(_SCHEMA)
+            self._schema_ready = True
+        return conn
+
+    @staticmethod
+    def _count(conn: sqlite3.Connection, name: str) -> None:
+        conn.execute(
+            "INSERT INTO counters (name, value) VALUES (?, 1) "
+            "ON CONFLICT(name) DO UPDATE SET value = value + 1",
+            (name,)
+        )
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a cached response.
+
+        Args:
+            key: Key from make_cache_key
+
+        Returns:
+            Raw response text, or None on a miss (or expired entry)
+        """
+        now = self.clock()
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                "SELECT codec, data, created_at FROM responses WHERE key = ?",
+                (key,)
+            ).fetchone()
+
+            text = None
+            if row is not None:
+                codec, data, created_at = row
+                if self.max_age_seconds is not None and now - created_at > self.max_age_seconds:
+                    conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                else:
+                    text = _decompress(codec, data)
+
+            if text is None:
+                with self._session_lock:
+                    self.session_misses += 1
+                self._count(conn, "misses")
+                return None
+
+            conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+            with self._session_lock:
+                self.session_hits += 1
+            self._count(conn, "hits")
+            return text
+        finally:
+            conn.close()
+
+    def put(self, key: str, model_name: str, text: str) -> None:
+        """
+        Store a response and evict entries past the age and size limits.
+
+        Args:
+            key: Key from make_cache_key
+            model_name: Model that produced the response
+            text: Raw response text
+        """
+        codec, data = _compress(text)
+        now = self.clock()
+
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (key, model, codec, data, size, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, model_name, codec, data, len(data), now, now)
+            )
+            self._evict(conn, now)
+            conn.execute("COMMIT")
+        except Exception:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+    def _evict(self, conn: sqlite3.Connection, now: float) -> None:
+        """Drop expired entries, then least recently used ones over the size budget."""
+        if self.max_age_seconds is not None:
+            conn.execute("DELETE FROM responses WHERE created_at < ?", (now - self.max_age_seconds,))
+
+        (total,) = conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()
+        if total <= self.max_bytes:
+            return
+
+        excess = total - self.max_bytes
+        victims = []
+        for key, size in conn.execute("SELECT key, size FROM responses ORDER BY accessed_at, key"):
+            victims.append((key,))
+            excess -= size
+            if excess <= 0:
+                break
+        conn.executemany("DELETE FROM responses WHERE key = ?", victims)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Cache statistics.
+
+        Returns:
+            Dict with entries, bytes, lifetime hits/misses/hit_rate and
+            session_hits/session_misses for this process
+        """
+        conn = self._connect()
+        try:
+            entries, size = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+            counters = dict(conn.execute("SELECT name, value FROM counters").fetchall())
+        finally:
+            conn.close()
+
+        hits = counters.get("hits", 0)
+        misses = counters.get("misses", 0)
+        return {
+            "entries": entries,
+            "bytes": size,
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / (hits + misses) if hits + misses else 0.0,
+            "session_hits": self.session_hits,
+            "session_misses": self.session_misses
+        }
+
+    def iter_texts(self, limit: Optional[int] = None) -> Iterator[str]:
+        """
+        Iterate over stored raw responses, newest first (e.g. as a test corpus).
+
+        Does not count as hits or refresh access times.
+
+        Args:
+            limit: Most responses to return (None for all)
+
+        Yields:
+            Raw response text
+        """
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                "SELECT codec, data FROM responses ORDER BY created_at DESC, key LIMIT ?",
+                (-1 if limit is None else limit,)
+            ).fetchall()
+        finally:
+            conn.close()
+
+        for codec, data in rows:
+            text = _decompress(codec, data)
+            if text is not None:
+                yield text
+
+    def clear(self) -> None:
+        """Remove every entry and reset the counters."""
+        conn = self._connect()
+        try:
+            conn.execute("DELETE FROM responses")
+            conn.execute("DELETE FROM counters")
+        finally:
+            conn.close()
+        with self._session_lock:
+            self.session_hits = 0
+            self.session_misses = 0
+
+
+def open_response_cache(db_path: Optional[Path] = None) -> ResponseCache:
+    """
+    Get the shared cache built from config response_cache settings.
+
+    Args:
+        db_path: Cache database (default: get_response_cache_path())
+
+    Returns:
+        ResponseCache instance
+    """
+    db_path = db_path or get_response_cache_path()
+    key = db_path.resolve()
+
+    with _caches_lock:
+        cache = _caches.get(key)
+        if cache is None:
+            settings = get_response_cache_config()
+            max_age_days = settings.get("max_age_days")
+            cache = ResponseCache(
+                db_path,
+                max_bytes=settings["max_bytes"],
+                max_age_seconds=max_age_days * 24 * 3600 if max_age_days else None
+            )
+            _caches[key] = cache
+        return cache
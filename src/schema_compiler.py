@@ -0,0 +1,237 @@
+"""
+Schema Compiler Module
+
+Compiles a JSON schema ahead of time into a specialised Python function
+that returns True/False, in the style of fastjsonschema. The generated
+code walks the document once with plain isinstance/len/comparison checks,
+which is far faster than interpreting the schema with jsonschema on every
+verse.
+
+Only the keywords used by schemas/verse_schema.json are supported (type,
+required, properties, items, pattern, minLength, minItems, minimum,
+maximum, plus annotations such as title and description). Any other
+keyword, or nesting deeper than the generated code can express, raises
+ValueError so callers fall back to the full Draft 7 validator. The compiled function only answers valid/invalid; detailed
+error messages still come from jsonschema.
+
+Functions:
+    generate_validator_source: Generate Python source for a schema check
+    compile_schema: Compile a schema into a fast True/False check
+"""
+
+import re
+from typing import Dict, Any, List, Callable, Optional
+
+
+# Keywords with no effect on validity
+ANNOTATION_KEYWORDS = frozenset({
+    "$schema", "$id", "$comment", "title", "description", "default", "examples"
+})
+
+SUPPORTED_KEYWORDS = frozenset({
+    "type", "required", "properties", "items",
+    "pattern", "minLength", "minItems", "minimum", "maximum"
+})
+
+# Nesting limits for generated code (CPython allows 20 statically nested
+# blocks and 100 indentation levels; deep subschemas also cost recursion)
+MAX_LOOP_DEPTH = 16
+MAX_INDENT = 64
+MAX_SCHEMA_DEPTH = 128
+
+# Draft 7 type checks (booleans are not numbers; 1.0 is an integer)
+_TYPE_CHECKS = {
+    "string": "isinstance({v}, str)",
+    "object": "isinstance({v}, dict)",
+    "array": "isinstance({v}, list)",
+    "boolean": "isinstance({v}, bool)",
+    "null": "{v} is None",
+    "number": "(isinstance({v}, (int, float)) and not isinstance({v}, bool))",
+    "integer": "((isinstance({v}, int) and not isinstance({v}, bool))"
+               " or (isinstance({v}, float) and {v}.is_integer()))",
+}
+
+
+class _CodeGenerator:
+    """Emits nested early-return checks for one schema"""
+
+    def __init__(self):
+        self.lines: List[str] = []
+        self.indent = 1
+        self.namespace: Dict[str, Any] = {}
+        self._names = 0
+        self._loops = 0
+        self._depth = 0
+
+    def emit(self, line: str) -> None:
+        if self.indent > MAX_INDENT:
+            raise ValueError(f"Schema nested too deeply (over {MAX_INDENT} levels of checks)")
+        self.lines.append("    " * self.indent + line)
+
+    def name(self, prefix: str) -> str:
+        self._names += 1
+        return f"{prefix}{self._names}"
+
+    def guarded(self, condition: Optional[str], body: Callable[[], None]) -> None:
+        """Emit body, wrapped in `if condition:` unless the condition is known to hold."""
+        if condition is None:
+            body()
+            return
+        self.emit(f"if {condition}:")
+        self.indent += 1
+        start = len(self.lines)
+        body()
+        if len(self.lines) == start:
+            self.emit("pass")
+        self.indent -= 1
+
+    def schema(self, schema: Any, var: str) -> None:
+        """Emit checks that return False if `var` does not match `schema`."""
+        if schema is True or schema == {}:
+            return
+        if not isinstance(schema, dict):
+            raise ValueError(f"Unsupported schema: {schema!r}")
+        if self._depth >= MAX_SCHEMA_DEPTH:
+            raise ValueError(f"Schema nested too deeply (over {MAX_SCHEMA_DEPTH} subschemas)")
+        self._depth += 1
+
+        unknown = set(schema) - SUPPORTED_KEYWORDS - ANNOTATION_KEYWORDS
+        if unknown:
+            raise ValueError(f"Unsupported schema keywords: {', '.join(sorted(unknown))}")
+
+        known_type = None
+        if "type" in schema:
+            types = schema["type"]
+            types = [types] if isinstance(types, str) else list(types)
+            for type_name in types:
+                if type_name not in _TYPE_CHECKS:
+                    raise ValueError(f"Unsupported type: {type_name!r}")
+            checks = " or ".join(_TYPE_CHECKS[t].format(v=var) for t in types)
+            self.emit(f"if not ({checks}):")
+            self.emit("    return False")
+            if len(types) == 1:
+                known_type = types[0]
+
+        def guard(type_name: str) -> Optional[str]:
+            return None if known_type == type_name else _TYPE_CHECKS[type_name].format(v=var)
+
+        if "required" in schema or "properties" in schema:
+            self.guarded(guard("object"), lambda: self.object(schema, var))
+        if "items" in schema or "minItems" in schema:
+            self.guarded(guard("array"), lambda: self.array(schema, var))
+        if "pattern" in schema or "minLength" in schema:
+            self.guarded(guard("string"), lambda: self.string(schema, var))
+        if "minimum" in schema or "maximum" in schema:
+            self.guarded(guard("number"), lambda: self.number(schema, var))
+        self._depth -= 1
+
+    def object(self, schema: Dict[str, Any], var: str) -> None:
+        required = list(schema.get("required", []))
+        for key in required:
+            self.emit(f"if {key!r} not in {var}:")
+            self.emit("    return False")
+
+        properties = schema.get("properties", {})
+        if not isinstance(properties, dict):
+            raise ValueError("properties must be an object")
+
+        for key, subschema in properties.items():
+            child = self.name("v")
+            if key in required:
+                self.emit(f"{child} = {var}[{key!r}]")
+                self.schema(subschema, child)
+            else:
+                def body(key=key, child=child, subschema=subschema):
+                    self.emit(f"{child} = {var}[{key!r}]")
+                    self.schema(subschema, child)
+                self.guarded(f"{key!r} in {var}", body)
+
+    def array(self, schema: Dict[str, Any], var: str) -> None:
+        if "minItems" in schema:
+            self.emit(f"if len({var}) < {int(schema['minItems'])}:")
+            self.emit("    return False")
+
+        if "items" in schema:
+            items = schema["items"]
+            if not isinstance(items, (dict, bool)):
+                raise ValueError("Only a single items schema is supported")
+            if items is True or items == {}:
+                return
+            if self._loops >= MAX_LOOP_DEPTH:
+                raise ValueError(f"Schema nested too deeply (over {MAX_LOOP_DEPTH} nested arrays)")
+            child = self.name("v")
+            self.emit(f"for {child} in {var}:")
+            self.indent += 1
+            self._loops += 1
+            self.schema(items, child)
+            self._loops -= 1
+            self.indent -= 1
+
+    def string(self, schema: Dict[str, Any], var: str) -> None:
+        if "minLength" in schema:
+            self.emit(f"if len({var}) < {int(schema['minLength'])}:")
+            self.emit("    return False")
+
+        if "pattern" in schema:
+            regex = self.name("_pattern")
+            self.namespace[regex] = re.compile(schema["pattern"])
+            self.emit(f"if {regex}.search({var}) is None:")
+            self.emit("    return False")
+
+    def number(self, schema: Dict[str, Any], var: str) -> None:
+        if "minimum" in schema:
+            self.emit(f"if {var} < {schema['minimum']!r}:")
+            self.emit("    return False")
+        if "maximum" in schema:
+            self.emit(f"if {var} > {schema['maximum']!r}:")
+            self.emit("    return False")
+
+
+def _generate(schema: Dict[str, Any], name: str) -> _CodeGenerator:
+    generator = _CodeGenerator()
+    generator.schema(schema, "data")
+    generator.emit("return True")
+    generator.lines.insert(0, f"def {name}(data):")
+    return generator
+
+
+def generate_validator_source(schema: Dict[str, Any], name: str = "validate") -> str:
+    """
+    Generate Python source for a schema check.
+
+    Args:
+        schema: JSON schema dictionary
+        name: Name of the generated function
+
+    Returns:
+        Source of a function `name(data) -> bool` (regular expressions
+        are referenced as module globals named _patternN)
+
+    Raises:
+        ValueError: If the schema uses an unsupported keyword
+    """
+    return "\n".join(_generate(schema, name).lines) + "\n"
+
+
+def compile_schema(schema: Dict[str, Any]) -> Callable[[Any], bool]:
+    """
+    Compile a schema into a fast True/False check.
+
+    Args:
+        schema: JSON schema dictionary
+
+    Returns:
+        Function taking a document and returning True if it is valid
+
+    Raises:
+        ValueError: If the schema uses an unsupported keyword or cannot be
+            compiled (e.g. nested too deeply)
+    """
+    generator = _generate(schema, "validate")
+    namespace = dict(generator.namespace)
+    try:
+        code = compile("\n".join(generator.lines) + "\n", "<compiled schema>", "exec")
+        exec(code, namespace)
+    except (SyntaxError, RecursionError, MemoryError) as e:
+        raise ValueError(f"Generated validator does not compile: {e}") from e
+    return namespace["validate"]
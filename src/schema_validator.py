@@ -4,20 +4,44 @@ Schema Validator Module
 Validates biblical verse JSON data against the verse schema.
 Ensures all mandatory fields are present and properly formatted.
 
+Compiled validators are cached per schema file (keyed by path and
+modification time), so validating many verses parses and checks the
+schema once instead of once per verse. Schema files are also compiled
+into specialised Python checks (see schema_compiler) that decide
+valid/invalid quickly; the Draft 7 validator remains the fallback for
+unsupported schemas and the source of detailed error messages.
+
 Functions:
     load_schema: Load JSON schema from file
+    get_validator: Get the compiled (cached) validator for a schema
+    get_fast_validator: Get the quickest available True/False check
+    clear_validator_cache: Drop all cached validators
     validate_verse_json: Validate verse data against schema
+    validate_many: Validate many verses with one compiled validator
     validate_mandatory_fields: Check all mandatory fields present
+    get_mandatory_field_errors: List failed mandatory field checks
     get_validation_errors: Get list of validation error messages
     validate_verse_id_format: Validate verse ID format
     validate_coordinates: Validate geographic coordinates
 """
 
 import json
+import logging
+import os
 import re
+import threading
 from pathlib import Path
-from typing import Dict, Any, List, Union
-from jsonschema import validate, ValidationError, Draft7Validator
+from typing import Dict, Any, List, Union, Iterable, Tuple, Callable, Optional
+from jsonschema import Draft7Validator
+
+from src.schema_compiler import compile_schema
+
+
+logger = logging.getLogger(__name__)
+
+# Compiled validators: schema path string -> (mtime_ns, validator, fast check)
+_validators: Dict[str, Tuple[int, Draft7Validator, Optional[Callable[[Any], bool]]]] = {}
+_validators_lock = threading.Lock()
 
 
 def load_schema(schema_path: Union[Path, str]) -> Dict[str, Any]:
@@ -45,6 +69,99 @@ def load_schema(schema_path: Union[Path, str]) -> Dict[str, Any]:
     return schema
 
 
+def _compiled(
+    schema: Union[Dict[str, Any], Path, str]
+) -> Tuple[Draft7Validator, Optional[Callable[[Any], bool]]]:
+    """Draft 7 validator and fast check (None if unavailable) for a schema."""
+    if not isinstance(schema, (Path, str)):
+        # Dict schemas may be mutated between calls, so nothing is cached
+        Draft7Validator.check_schema(schema)
+        return Draft7Validator(schema), None
+
+    # Keyed by the path as given: resolving it would cost more than validating
+    key = os.fspath(schema)
+    try:
+        mtime = os.stat(key).st_mtime_ns
+    except OSError:
+        raise FileNotFoundError(f"Schema file not found: {schema}")
+
+    with _validators_lock:
+        cached = _validators.get(key)
+        if cached is not None and cached[0] == mtime:
+            return cached[1], cached[2]
+
+    schema_path = Path(schema)
+    schema_dict = load_schema(schema_path)
+    Draft7Validator.check_schema(schema_dict)
+    validator = Draft7Validator(schema_dict)
+
+    try:
+        fast = compile_schema(schema_dict)
+    except ValueError as e:
+        logger.debug(f"No fast validator for {schema_path}, using Draft 7: {e}")
+        fast = None
+
+    with _validators_lock:
+        _validators[key] = (mtime, validator, fast)
+    return validator, fast
+
+
+def get_validator(schema: Union[Dict[str, Any], Path, str]) -> Draft7Validator:
+    """
+    Get a compiled validator for a schema.
+
+    Validators for schema files are cached and rebuilt only when the
+    file's modification time changes. Dict schemas are compiled on every
+    call (they may be mutated between calls).
+
+    Args:
+        schema: Schema dict or path to schema file
+
+    Returns:
+        Draft7Validator for the schema
+
+    Raises:
+        FileNotFoundError: If schema file doesn't exist
+        json.JSONDecodeError: If schema is invalid JSON
+        jsonschema.SchemaError: If the schema itself is invalid
+    """
+    return _compiled(schema)[0]
+
+
+def get_fast_validator(schema: Union[Dict[str, Any], Path, str]) -> Callable[[Any], bool]:
+    """
+    Get the quickest available True/False check for a schema.
+
+    Schema files are compiled to specialised Python code (cached like
+    get_validator); otherwise the Draft 7 validator's is_valid is used.
+
+    Args:
+        schema: Schema dict or path to schema file
+
+    Returns:
+        Function taking verse data and returning True if it is valid
+
+    Raises:
+        FileNotFoundError: If schema file doesn't exist
+        json.JSONDecodeError: If schema is invalid JSON
+        jsonschema.SchemaError: If the schema itself is invalid
+    """
+    validator, fast = _compiled(schema)
+    return fast or validator.is_valid
+
+
+def clear_validator_cache() -> None:
+    """Drop all cached validators."""
+    with _validators_lock:
+        _validators.clear()
+
+
+def _format_error(error) -> str:
+    """Readable "path: message" string for a validation error."""
+    path = ".".join(str(p) for p in error.path) if error.path else "root"
+    return f"{path}: {error.message}"
+
+
 def validate_verse_json(
     verse_data: Dict[str, Any],
     schema: Union[Dict[str, Any], Path, str]
@@ -59,20 +176,38 @@ def validate_verse_json(
     Returns:
         True if valid, False otherwise
     """
-    # Load schema if path provided
-    if isinstance(schema, (Path, str)):
-        try:
-            schema = load_schema(schema)
-        except (FileNotFoundError, json.JSONDecodeError):
-            return False
-
-    # Validate against schema
     try:
-        validate(instance=verse_data, schema=schema)
-        return True
-    except ValidationError:
+        is_valid = get_fast_validator(schema)
+    except (FileNotFoundError, json.JSONDecodeError):
         return False
 
+    return is_valid(verse_data)
+
+
+def validate_many(
+    verses: Iterable[Dict[str, Any]],
+    schema: Union[Dict[str, Any], Path, str]
+) -> List[bool]:
+    """
+    Validate many verses against one schema.
+
+    The schema is loaded and compiled once for the whole batch.
+
+    Args:
+        verses: Verse data dictionaries
+        schema: Schema dict or path to schema file
+
+    Returns:
+        One True/False per verse, in input order (all False if the
+        schema cannot be loaded)
+    """
+    try:
+        is_valid = get_fast_validator(schema)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return [False for _ in verses]
+
+    return [is_valid(verse_data) for verse_data in verses]
+
 
 def validate_mandatory_fields(verse_data: Dict[str, Any]) -> bool:
     """
@@ -97,11 +232,29 @@ def validate_mandatory_fields(verse_data: Dict[str, Any]) -> bool:
     Returns:
         True if all mandatory fields present and valid, False otherwise
     """
+    return not get_mandatory_field_errors(verse_data)
+
+
+def get_mandatory_field_errors(verse_data: Dict[str, Any]) -> List[str]:
+    """
+    Get the mandatory field checks a verse fails.
+
+    Applies the same checks as validate_mandatory_fields(), reporting
+    every failure instead of stopping at the first.
+
+    Args:
+        verse_data: Verse data dictionary
+
+    Returns:
+        List of "field.path: problem" strings (empty if all checks pass)
+    """
+    errors = []
+
     # Check top-level required fields
     required_top = ["verse_id", "section_1_sacred_text", "section_3_life_application"]
     for field in required_top:
         if field not in verse_data:
-            return False
+            errors.append(f"{field}: missing")
 
     # Check section_1 required fields
     section_1 = verse_data.get("section_1_sacred_text", {})
@@ -112,38 +265,48 @@ def validate_mandatory_fields(verse_data: Dict[str, Any]) -> bool:
         "amplified_narrative_translation",
     ]
 
+    if not isinstance(section_1, dict):
+        errors.append("section_1_sacred_text: not an object")
+        section_1 = {}
+
     for field in required_section_1:
         if field not in section_1:
-            return False
+            if "section_1_sacred_text" in verse_data:
+                errors.append(f"section_1_sacred_text.{field}: missing")
         # Check non-empty
-        if not section_1[field] or not str(section_1[field]).strip():
-            return False
+        elif not section_1[field] or not str(section_1[field]).strip():
+            errors.append(f"section_1_sacred_text.{field}: empty")
 
     # Check section_2 if present
     section_2 = verse_data.get("section_2_exegetical_synthesis", {})
+    if section_2 and not isinstance(section_2, dict):
+        errors.append("section_2_exegetical_synthesis: not an object")
+        section_2 = {}
 
     if section_2:
+        prefix = "section_2_exegetical_synthesis"
+
         # Check historical context
         historical = section_2.get("historical_context_and_chronology", {})
         if historical:
-            if "dates" not in historical or not historical["dates"]:
-                return False
-            if "context" not in historical or not historical["context"]:
-                return False
+            for field in ("dates", "context"):
+                if field not in historical or not historical[field]:
+                    errors.append(f"{prefix}.historical_context_and_chronology.{field}: missing or empty")
 
         # Check geospatial data
         geospatial = section_2.get("geospatial_and_physical_geography", {})
         if geospatial:
+            path = f"{prefix}.geospatial_and_physical_geography.coordinates"
             if "coordinates" not in geospatial:
-                return False
+                errors.append(f"{path}: missing")
+            else:
+                coords = geospatial["coordinates"]
+                if not isinstance(coords, dict):
+                    errors.append(f"{path}: not an object")
+                elif "lat" not in coords or "long" not in coords:
+                    errors.append(f"{path}: needs lat and long")
 
-            coords = geospatial["coordinates"]
-            if not isinstance(coords, dict):
-                return False
-            if "lat" not in coords or "long" not in coords:
-                return False
-
-    return True
+    return errors
 
 
 def get_validation_errors(
@@ -160,24 +323,16 @@ def get_validation_errors(
     Returns:
         List of error message strings (empty if valid)
     """
-    # Load schema if path provided
-    if isinstance(schema, (Path, str)):
-        try:
-            schema = load_schema(schema)
-        except (FileNotFoundError, json.JSONDecodeError) as e:
-            return [f"Schema loading error: {str(e)}"]
-
-    # Collect validation errors
-    errors = []
-    validator = Draft7Validator(schema)
+    try:
+        validator, fast = _compiled(schema)
+    except (FileNotFoundError, json.JSONDecodeError) as e:
+        return [f"Schema loading error: {str(e)}"]
 
-    for error in validator.iter_errors(verse_data):
-        # Build readable error message
-        path = ".".join(str(p) for p in error.path) if error.path else "root"
-        message = f"{path}: {error.message}"
-        errors.append(message)
+    # Valid documents (the common case) skip the slow error walk
+    if fast is not None and fast(verse_data):
+        return []
 
-    return errors
+    return [_format_error(error) for error in validator.iter_errors(verse_data)]
 
 
 def validate_verse_id_format(verse_id: str) -> bool:
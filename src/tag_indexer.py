@@ -6,72 +6,377 @@ Extracts tags from all verse JSON files and generates:
 2. Category summaries (tag_categories.json)
 3. Pagefind-compatible HTML data attributes
 
+Incremental mode (--incremental) keeps a SQLite manifest of every verse
+file's path, mtime, size and hash, together with its serialized share of
+each output. Only new, changed or removed verse files are re-read, and
+only the outputs they affect are rewritten.
+
+Sharded outputs (--shards) split the index for lazy loading by pages:
+one posting shard per category (value -> verse IDs), one verse-tag shard
+per book (verse ID -> tags) and a small manifest listing them, written
+minified or pretty, optionally with gzip-precompressed copies. The
+monolithic tag_index.json and verse_tags.json are removed from
+website/_data so Eleventy no longer loads them as global data, and an
+incremental run on a sharded site (one with a shard manifest) leaves
+them out.
+
+Verse files are parsed across a process pool (--workers), in chunks;
+workers return compact (category, value) tuples that the parent merges
+in file order, so the outputs do not depend on the worker count.
+
 Author: Claude Sonnet 4.5
 Date: 2026-01-14
 """
 
+import argparse
+import gzip
+import hashlib
 import json
+import os
+import re
+import sqlite3
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
 from pathlib import Path
-from typing import Dict, List, Set
+from typing import Dict, Iterator, List, Optional, Tuple
 from collections import defaultdict
 
 
+OUTPUT_DIR = "website/_data"
+
+# Output name -> file name in OUTPUT_DIR
+OUTPUT_FILES = {
+    "tag_index": "tag_index.json",
+    "tag_categories": "tag_categories.json",
+    "verse_tags": "verse_tags.json",
+    "tag_statistics": "tag_statistics.json",
+}
+
+# Outputs replaced by shards in a sharded build
+SHARDED_OUTPUTS = ("tag_index", "verse_tags")
+
+# Files handed to a worker process at a time
+DEFAULT_CHUNK_SIZE = 250
+
+# Sharded outputs, copied to the site as-is (see website/.eleventy.js)
+SHARD_DIR = "website/tags"
+SHARD_FORMAT_VERSION = 1
+
+MANIFEST_PATH = ".cpf/state/tag_manifest.sqlite"
+MANIFEST_VERSION = 1
+
+_MANIFEST_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    sha256 TEXT NOT NULL,
+    verse_id TEXT,
+    tags TEXT,
+    entries INTEGER NOT NULL,
+    index_json TEXT NOT NULL,
+    verse_tags_json TEXT
+);
+CREATE TABLE IF NOT EXISTS category_values (
+    category TEXT NOT NULL,
+    value TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (category, value)
+);
+"""
+
+# (mtime_ns, size, sha256, verse_id, [(category, value), ...] or None if untagged)
+FileRecord = Tuple[int, int, str, Optional[str], Optional[List[Tuple[str, str]]]]
+
+
 class TagIndexer:
     """Generate search indexes from verse tags"""
 
-    def __init__(self, data_path: str = "data"):
+    def __init__(self, data_path: str = "data", manifest_path: str = MANIFEST_PATH):
         self.data_path = Path(data_path)
+        self.manifest_path = Path(manifest_path)
         self.tag_index = []  # Flat list of {verse_id, category, value}
         self.category_index = defaultdict(set)  # Category -> Set of values
         self.verse_tags = {}  # verse_id -> all tags
+        self.affected_outputs = set(OUTPUT_FILES)  # Outputs changed by the last update_index()
+
+        self._files: Dict[str, FileRecord] = {}  # Relative path -> record, once indexed in memory
+        self._entries: Dict[str, List[dict]] = {}  # Relative path -> its tag_index entries
+        self._value_counts = defaultdict(lambda: defaultdict(int))  # Category -> value -> entries
 
-    def index_all_verses(self):
-        """Index all verses in data directory"""
+    def index_all_verses(self, workers: Optional[int] = 1, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """
+        Index all verses in data directory
+
+        Args:
+            workers: Processes parsing verse files (None: CPU count; 1 runs in-process)
+            chunk_size: Files per task handed to a worker
+        """
         print("Indexing verses...")
+        start = time.perf_counter()
 
         # Find all JSON files
-        json_files = list(self.data_path.rglob("*.json"))
+        json_files = self._scan()
         print(f"Found {len(json_files)} verse files")
 
-        for json_file in json_files:
-            try:
-                self._index_verse_file(json_file)
-            except Exception as e:
-                print(f"Error indexing {json_file}: {e}")
+        records = self._read_verse_files(json_files, workers, chunk_size)
 
-        print(f"Indexed {len(self.verse_tags)} verses")
-        print(f"Found {len(self.tag_index)} total tag entries")
+        self._files = {}
+        self._entries = {}
+        self._value_counts.clear()
+        self.category_index.clear()
 
-    def _index_verse_file(self, json_file: Path):
-        """Index a single verse file"""
-        with open(json_file, 'r', encoding='utf-8') as f:
-            verse_data = json.load(f)
+        # Merge in path order, whatever order the workers finished in
+        for rel in json_files:
+            self._add_record(rel, records[rel])
+        self._rebuild_views()
 
-        verse_id = verse_data.get('verse_id', str(json_file.stem))
+        print(f"Indexed {len(self.verse_tags)} verses")
+        print(f"Found {len(self.tag_index)} total tag entries")
+        print(f"Indexing took {time.perf_counter() - start:.2f}s ({self._workers_label(workers, len(json_files), chunk_size)})")
+
+    def update_index(self, workers: Optional[int] = 1, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Dict[str, int]:
+        """
+        Re-index only the verse files that changed since the last update.
+
+        Compares the data directory against the manifest (by mtime and
+        size, then hash), records the new state of added, changed and
+        removed files, and sets affected_outputs to the outputs that
+        need rewriting. If this indexer already holds a full index from
+        index_all_verses(), tag_index, category_index and verse_tags are
+        patched in place as well.
+
+        Args:
+            workers: Processes parsing changed files (None: CPU count; 1 runs in-process)
+            chunk_size: Files per task handed to a worker
+
+        Returns:
+            Counts of added, changed, removed and unchanged files
+        """
+        json_files = self._scan()
+        counts = {"added": 0, "changed": 0, "removed": 0, "unchanged": 0}
+
+        conn = self._connect()
+        try:
+            known = {
+                path: (mtime_ns, size, sha256)
+                for path, mtime_ns, size, sha256 in conn.execute("SELECT path, mtime_ns, size, sha256 FROM files")
+            }
 
-        # Extract tags if present
-        tags = verse_data.get('tags', {})
+            stale = {}  # Files whose mtime or size changed
+            for rel, stat in json_files.items():
+                old = known.get(rel)
+                if old is not None and old[:2] == stat:
+                    counts["unchanged"] += 1
+                else:
+                    stale[rel] = stat
+
+            touched = []  # Rewritten with identical content
+            updates = {}  # Relative path -> new record, or None if removed
+            for rel, record in self._read_verse_files(stale, workers, chunk_size).items():
+                old = known.get(rel)
+                if old is not None and old[2] == record[2]:
+                    touched.append(rel)
+                    counts["unchanged"] += 1
+                    continue
+
+                updates[rel] = record
+                counts["added" if old is None else "changed"] += 1
+
+            for rel in known.keys() - json_files.keys():
+                updates[rel] = None
+                counts["removed"] += 1
+
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                for rel in touched:
+                    conn.execute(
+                        "UPDATE files SET mtime_ns = ?, size = ? WHERE path = ?",
+                        (*json_files[rel], rel)
+                    )
+                self.affected_outputs = self._apply_updates(conn, updates)
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+        finally:
+            conn.close()
+
+        if self._files:
+            for rel, record in updates.items():
+                self._remove_record(rel)
+                if record is not None:
+                    self._add_record(rel, record)
+            if self.affected_outputs:
+                self._rebuild_views()
+
+        return counts
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the manifest database, recreating it if its format changed."""
+        self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.manifest_path), timeout=30.0, isolation_level=None)
+
+        if conn.execute("PRAGMA user_version").fetchone()[0] != MANIFEST_VERSION:
+            conn.executescript("DROP TABLE IF EXISTS files; DROP TABLE IF EXISTS category_values;")
+            conn.execute(f"PRAGMA user_version = {MANIFEST_VERSION}")
+        conn.executescript(_MANIFEST_SCHEMA)
+        return conn
+
+    def _apply_updates(self, conn: sqlite3.Connection, updates: Dict[str, Optional[FileRecord]]) -> set:
+        """Write changed file records and category counts; return the affected outputs."""
+        deltas = defaultdict(int)  # (category, value) -> change in entries
+        tags_changed = False
+
+        for rel, record in updates.items():
+            row = conn.execute("SELECT verse_id, tags FROM files WHERE path = ?", (rel,)).fetchone()
+            old_verse_id, old_tags = (row[0], _load_tags(row[1])) if row else (None, None)
+
+            if record is None:
+                conn.execute("DELETE FROM files WHERE path = ?", (rel,))
+                new_verse_id, new_tags = None, None
+            else:
+                mtime_ns, size, sha256, new_verse_id, new_tags = record
+                conn.execute(
+                    "INSERT OR REPLACE INTO files "
+                    "(path, mtime_ns, size, sha256, verse_id, tags, entries, index_json, verse_tags_json) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        rel, mtime_ns, size, sha256, new_verse_id,
+                        None if new_tags is None else json.dumps(new_tags, ensure_ascii=False),
+                        len(new_tags or []),
+                        _index_fragment(new_verse_id, new_tags),
+                        _verse_tags_fragment(new_verse_id, new_tags)
+                    )
+                )
+
+            # The verse ID only shows up in the outputs of tagged verses
+            old_key = None if old_tags is None else (old_verse_id, old_tags)
+            if old_key == (None if new_tags is None else (new_verse_id, new_tags)):
+                continue
+            tags_changed = True
+            for pair in old_tags or []:
+                deltas[pair] -= 1
+            for pair in new_tags or []:
+                deltas[pair] += 1
+
+        categories_changed = False
+        for (category, value), delta in deltas.items():
+            if not delta:
+                continue
+            row = conn.execute(
+                "SELECT count FROM category_values WHERE category = ? AND value = ?",
+                (category, value)
+            ).fetchone()
+            old_count = row[0] if row else 0
+            new_count = old_count + delta
+
+            if new_count > 0:
+                conn.execute(
+                    "INSERT OR REPLACE INTO category_values (category, value, count) VALUES (?, ?, ?)",
+                    (category, value, new_count)
+                )
+            else:
+                conn.execute(
+                    "DELETE FROM category_values WHERE category = ? AND value = ?",
+                    (category, value)
+                )
+            categories_changed = categories_changed or (old_count == 0) != (new_count <= 0)
+
+        affected = set()
+        if tags_changed:
+            affected.update(("tag_index", "verse_tags", "tag_statistics"))
+        if categories_changed:
+            affected.update(("tag_categories", "tag_statistics"))
+        return affected
+
+    def _scan(self) -> Dict[str, Tuple[int, int]]:
+        """Map each JSON file under the data directory (relative path) to its mtime and size."""
+        found = {}
+        pending = [("", str(self.data_path))]
+        while pending:
+            prefix, directory = pending.pop()
+            try:
+                entries = list(os.scandir(directory))
+            except OSError:
+                continue
+            for entry in entries:
+                if entry.is_dir():
+                    pending.append((prefix + entry.name + "/", entry.path))
+                elif entry.name.endswith(".json"):
+                    st = entry.stat()
+                    found[prefix + entry.name] = (st.st_mtime_ns, st.st_size)
+        return dict(sorted(found.items()))
+
+    def _read_verse_files(
+        self,
+        json_files: Dict[str, Tuple[int, int]],
+        workers: Optional[int],
+        chunk_size: int
+    ) -> Dict[str, FileRecord]:
+        """Read verse files, across a process pool when there is more than one chunk"""
+        items = [(rel, mtime_ns, size) for rel, (mtime_ns, size) in json_files.items()]
+        chunk_size = max(1, chunk_size)
+        chunks = [items[i:i + chunk_size] for i in range(0, len(items), chunk_size)]
+        workers = workers or os.cpu_count() or 1
+
+        if workers == 1 or len(chunks) <= 1:
+            records = [self._read_verse_file(*item) for item in items]
+        else:
+            with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as executor:
+                data_path = [str(self.data_path)] * len(chunks)
+                records = list(chain.from_iterable(executor.map(_read_chunk, data_path, chunks)))
+
+        return {item[0]: record for item, record in zip(items, records)}
+
+    @staticmethod
+    def _workers_label(workers: Optional[int], file_count: int, chunk_size: int) -> str:
+        """How _read_verse_files() ran, for timing output"""
+        workers = workers or os.cpu_count() or 1
+        if workers == 1 or file_count <= max(1, chunk_size):
+            return "serial"
+        return f"{workers} workers"
+
+    def _read_verse_file(self, rel: str, mtime_ns: int, size: int) -> FileRecord:
+        """Read, hash and extract the tags of a single verse file"""
+        json_file = self.data_path / rel
+        raw = json_file.read_bytes()
+        sha256 = hashlib.sha256(raw).hexdigest()
+
+        try:
+            verse_data = json.loads(raw.decode('utf-8'))
+            verse_id = verse_data.get('verse_id', str(json_file.stem))
+            tags = self._extract_tags(verse_data.get('tags', {}))
+        except Exception as e:
+            print(f"Error indexing {json_file}: {e}")
+            return mtime_ns, size, sha256, None, None
+
+        return mtime_ns, size, sha256, verse_id, tags
+
+    def _extract_tags(self, tags) -> Optional[List[Tuple[str, str]]]:
+        """List the (category, value) pairs of a verse's tags (None if untagged)"""
         if not tags:
-            return
+            return None
 
-        verse_tag_list = []
+        pairs = []
 
         # Process all tag categories
         for category, values in tags.items():
             if isinstance(values, dict):
                 # Nested structure (e.g., people: {named_individuals: [...]})
-                self._process_nested_tags(verse_id, category, values, verse_tag_list)
+                self._process_nested_tags(category, values, pairs)
             elif isinstance(values, list):
                 # Simple list of values
                 for value in values:
-                    self._add_tag_entry(verse_id, category, str(value), verse_tag_list)
+                    self._add_tag_entry(category, str(value), pairs)
             elif values:
                 # Single value
-                self._add_tag_entry(verse_id, category, str(values), verse_tag_list)
+                self._add_tag_entry(category, str(values), pairs)
 
-        self.verse_tags[verse_id] = verse_tag_list
+        return pairs
 
-    def _process_nested_tags(self, verse_id: str, parent_category: str, nested_dict: dict, verse_tag_list: list):
+    def _process_nested_tags(self, parent_category: str, nested_dict: dict, pairs: list):
         """Process nested tag structures"""
         for subcategory, values in nested_dict.items():
             category_name = f"{parent_category}:{subcategory}"
@@ -81,100 +386,393 @@ class TagIndexer:
                     if isinstance(value, dict):
                         # Extract key information from objects
                         if 'name' in value:
-                            self._add_tag_entry(verse_id, category_name, value['name'], verse_tag_list)
+                            self._add_tag_entry(category_name, value['name'], pairs)
                         elif 'place' in value:
-                            self._add_tag_entry(verse_id, category_name, value['place'], verse_tag_list)
+                            self._add_tag_entry(category_name, value['place'], pairs)
                     else:
-                        self._add_tag_entry(verse_id, category_name, str(value), verse_tag_list)
+                        self._add_tag_entry(category_name, str(value), pairs)
             elif values:
-                self._add_tag_entry(verse_id, category_name, str(values), verse_tag_list)
+                self._add_tag_entry(category_name, str(values), pairs)
 
-    def _add_tag_entry(self, verse_id: str, category: str, value: str, verse_tag_list: list):
-        """Add a tag entry to all indexes"""
+    def _add_tag_entry(self, category: str, value: str, pairs: list):
+        """Add a tag entry to a verse's pairs"""
         if not value or value == "None":
             return
 
-        entry = {
-            "v": verse_id,
-            "cat": category,
-            "val": value
-        }
+        pairs.append((category, value))
+
+    def _add_record(self, rel: str, record: FileRecord):
+        """Add a verse file's tags to the in-memory indexes"""
+        verse_id, tags = record[3], record[4]
+        self._files[rel] = record
+        self._entries[rel] = [{"v": verse_id, "cat": category, "val": value} for category, value in tags or []]
+
+        for category, value in tags or []:
+            self._value_counts[category][value] += 1
+            self.category_index[category].add(value)
+
+    def _remove_record(self, rel: str):
+        """Remove a verse file's tags from the in-memory indexes"""
+        record = self._files.pop(rel, None)
+        self._entries.pop(rel, None)
+        if record is None:
+            return
 
-        self.tag_index.append(entry)
-        self.category_index[category].add(value)
-        verse_tag_list.append(f"{category}:{value}")
+        for category, value in record[4] or []:
+            counts = self._value_counts[category]
+            counts[value] -= 1
+            if counts[value] == 0:
+                del counts[value]
+                self.category_index[category].discard(value)
+            if not counts:
+                del self._value_counts[category]
+                del self.category_index[category]
+
+    def _rebuild_views(self):
+        """Regenerate tag_index and verse_tags in file order from the per-file entries"""
+        paths = sorted(self._files)
+        self.tag_index = list(chain.from_iterable(self._entries[rel] for rel in paths))
+        self.verse_tags = {}
+        for rel in paths:
+            record = self._files[rel]
+            if record[4] is not None:
+                self.verse_tags[record[3]] = [f"{category}:{value}" for category, value in record[4]]
+
+    def iter_verse_tags(self) -> Iterator[Tuple[str, Optional[str], List[Tuple[str, str]]]]:
+        """
+        Iterate over the tags held by index_all_verses(), in file order.
+
+        Yields:
+            Tuple of (path relative to data_path, verse_id, [(category, value), ...])
+        """
+        for rel in sorted(self._files):
+            record = self._files[rel]
+            yield rel, record[3], record[4] or []
 
     def save_flat_index(self, output_path: str = "website/_data/tag_index.json"):
         """Save flat tag index for JavaScript filtering"""
         output_file = Path(output_path)
-        output_file.parent.mkdir(parents=True, exist_ok=True)
-
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(self.tag_index, f, ensure_ascii=False, separators=(',', ':'))
+        _write_text(output_file, json.dumps(self.tag_index, ensure_ascii=False, separators=(',', ':')))
 
         print(f"Saved flat index: {output_file} ({len(self.tag_index)} entries)")
 
     def save_category_summary(self, output_path: str = "website/_data/tag_categories.json"):
         """Save category summary for browsing UI"""
         output_file = Path(output_path)
-
-        # Convert sets to sorted lists
-        summary = {}
-        for category, values in self.category_index.items():
-            summary[category] = {
-                "count": len(values),
-                "values": sorted(list(values))
-            }
-
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(summary, f, ensure_ascii=False, indent=2)
+        summary = _category_summary(self.category_index)
+        _write_text(output_file, json.dumps(summary, ensure_ascii=False, indent=2))
 
         print(f"Saved category summary: {output_file} ({len(summary)} categories)")
 
     def save_verse_tags(self, output_path: str = "website/_data/verse_tags.json"):
         """Save per-verse tag lists for HTML data attributes"""
         output_file = Path(output_path)
-
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(self.verse_tags, f, ensure_ascii=False, indent=2)
+        _write_text(output_file, json.dumps(self.verse_tags, ensure_ascii=False, indent=2))
 
         print(f"Saved verse tags: {output_file} ({len(self.verse_tags)} verses)")
 
-    def generate_statistics(self) -> Dict:
-        """Generate indexing statistics"""
-        stats = {
+    def remove_flat_outputs(self, output_dir: str = OUTPUT_DIR) -> List[str]:
+        """
+        Remove the monolithic tag_index.json and verse_tags.json (replaced by shards).
+
+        Args:
+            output_dir: Directory holding the output files
+
+        Returns:
+            Names of the files removed
+        """
+        removed = []
+        for name in SHARDED_OUTPUTS:
+            output_file = Path(output_dir) / OUTPUT_FILES[name]
+            if output_file.exists():
+                output_file.unlink()
+                removed.append(OUTPUT_FILES[name])
+                print(f"Removed {output_file} (replaced by shards)")
+        return removed
+
+    def save_sharded_outputs(self, output_dir: str = SHARD_DIR, minify: bool = True,
+                             gzip_variants: bool = False) -> Dict:
+        """
+        Save per-category posting shards, per-book verse-tag shards and their manifest.
+
+        Layout under output_dir:
+            manifest.json: shard list with file, sizes and content hash
+            categories/{category}.json: value -> verse IDs carrying it
+            books/{book}.json: verse ID -> "category:value" tags
+
+        Shards whose content is unchanged are not rewritten, and shards
+        of categories or books that no longer exist are removed.
+
+        Args:
+            output_dir: Directory for the shards and manifest
+            minify: Write compact JSON (otherwise indented)
+            gzip_variants: Also write a gzip-precompressed .json.gz next to each file
+
+        Returns:
+            The manifest
+        """
+        output_dir = Path(output_dir)
+        postings = defaultdict(lambda: defaultdict(dict))  # Category -> value -> verse IDs (ordered set)
+        books = defaultdict(dict)  # Book -> verse ID -> tags
+
+        for rel, verse_id, pairs in self.iter_verse_tags():
+            if self._files[rel][4] is None:
+                continue
+            parts = rel.split("/")
+            books[parts[1] if len(parts) == 4 else "_other"][verse_id] = [f"{c}:{v}" for c, v in pairs]
+            for category, value in pairs:
+                postings[category][value][verse_id] = None
+
+        manifest = {
+            "version": SHARD_FORMAT_VERSION,
+            "minified": minify,
+            "gzip": gzip_variants,
             "total_verses": len(self.verse_tags),
             "total_tag_entries": len(self.tag_index),
-            "total_categories": len(self.category_index),
-            "avg_tags_per_verse": len(self.tag_index) / max(len(self.verse_tags), 1),
-            "categories": {}
+            "categories": {},
+            "books": {},
         }
+        written = set()
+
+        for kind, shards in (("categories", postings), ("books", books)):
+            names = set()
+            for key in sorted(shards):
+                name = _shard_name(key, names)
+                if kind == "categories":
+                    content = {value: list(shards[key][value]) for value in sorted(shards[key])}
+                    entry = {"values": len(content), "verses": len(set().union(*content.values()))}
+                else:
+                    content = shards[key]
+                    entry = {"verses": len(content)}
+
+                file_name = f"{kind}/{name}.json"
+                entry.update(_write_shard(output_dir / file_name, content, minify, gzip_variants))
+                manifest[kind][key] = {"file": file_name, **entry}
+                written.add(file_name)
+
+        for kind in ("categories", "books"):
+            for stale in sorted((output_dir / kind).glob("*.json*")):
+                if stale.relative_to(output_dir).as_posix().replace(".json.gz", ".json") not in written \
+                        or (stale.suffix == ".gz" and not gzip_variants):
+                    stale.unlink()
+
+        _write_shard(output_dir / "manifest.json", manifest, minify, gzip_variants)
+        if not gzip_variants:
+            (output_dir / "manifest.json.gz").unlink(missing_ok=True)
+        print(f"Saved sharded outputs: {output_dir} ({len(manifest['categories'])} category shards, "
+              f"{len(manifest['books'])} book shards)")
+        return manifest
+
+    def generate_statistics(self) -> Dict:
+        """Generate indexing statistics"""
+        return _statistics(len(self.verse_tags), len(self.tag_index), self.category_index)
+
+    def save_affected_outputs(self, output_dir: str = OUTPUT_DIR, exclude: Tuple[str, ...] = ()) -> List[str]:
+        """
+        Rewrite the outputs affected by the last update_index() from the manifest.
+
+        Outputs missing from output_dir are written as well.
+
+        Args:
+            output_dir: Directory holding the output files
+            exclude: Output names never to write (e.g. SHARDED_OUTPUTS)
+
+        Returns:
+            Names of the outputs written
+        """
+        output_dir = Path(output_dir)
+        names = [
+            name for name, file_name in OUTPUT_FILES.items()
+            if name not in exclude
+            and (name in self.affected_outputs or not (output_dir / file_name).exists())
+        ]
+        if not names:
+            return names
+
+        conn = self._connect()
+        try:
+            category_index = defaultdict(list)
+            if "tag_categories" in names or "tag_statistics" in names:
+                for category, value in conn.execute(
+                    "SELECT category, value FROM category_values ORDER BY category, value"
+                ):
+                    category_index[category].append(value)
+
+            verse_tags = {}
+            if "verse_tags" in names or "tag_statistics" in names:
+                # Later files win on duplicate verse IDs, as in verse_tags
+                for verse_id, fragment in conn.execute(
+                    "SELECT verse_id, verse_tags_json FROM files "
+                    "WHERE verse_tags_json IS NOT NULL ORDER BY path"
+                ):
+                    verse_tags[verse_id] = fragment
+
+            for name in names:
+                output_file = output_dir / OUTPUT_FILES[name]
+                if name == "tag_index":
+                    fragments = conn.execute(
+                        "SELECT index_json FROM files WHERE entries > 0 ORDER BY path"
+                    ).fetchall()
+                    _write_text(output_file, "[" + ",".join(row[0] for row in fragments) + "]")
+                elif name == "verse_tags":
+                    text = "{\n" + ",\n".join(verse_tags.values()) + "\n}" if verse_tags else "{}"
+                    _write_text(output_file, text)
+                elif name == "tag_categories":
+                    summary = _category_summary(category_index)
+                    _write_text(output_file, json.dumps(summary, ensure_ascii=False, indent=2))
+                else:
+                    total_entries = conn.execute("SELECT COALESCE(SUM(entries), 0) FROM files").fetchone()[0]
+                    stats = _statistics(len(verse_tags), total_entries, category_index)
+                    _write_text(output_file, json.dumps(stats, ensure_ascii=False, indent=2))
+                print(f"Saved {output_file}")
+        finally:
+            conn.close()
+
+        return names
+
+
+def _read_chunk(data_path: str, chunk: List[Tuple[str, int, int]]) -> List[FileRecord]:
+    """Read a chunk of verse files (runs in a worker process)"""
+    indexer = TagIndexer(data_path)
+    return [indexer._read_verse_file(rel, mtime_ns, size) for rel, mtime_ns, size in chunk]
+
+
+def _shard_name(key: str, taken: set) -> str:
+    """File-safe, unique shard name for a category or book"""
+    base = re.sub(r"[^A-Za-z0-9_-]+", "-", key).strip("-") or "_"
+    name, suffix = base, 2
+    while name.lower() in taken:
+        name, suffix = f"{base}-{suffix}", suffix + 1
+    taken.add(name.lower())
+    return name
+
+
+def _write_shard(output_file: Path, content, minify: bool, gzip_variant: bool) -> Dict:
+    """Write a shard (and its .gz copy) unless unchanged; return its bytes and hash"""
+    if minify:
+        text = json.dumps(content, ensure_ascii=False, separators=(',', ':'))
+    else:
+        text = json.dumps(content, ensure_ascii=False, indent=2)
+    data = text.encode('utf-8')
+
+    try:
+        unchanged = output_file.read_bytes() == data
+    except OSError:
+        unchanged = False
+    if not unchanged:
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        output_file.write_bytes(data)
+
+    info = {"bytes": len(data), "hash": hashlib.sha256(data).hexdigest()[:16]}
+    if gzip_variant:
+        gz_file = output_file.with_name(output_file.name + ".gz")
+        compressed = gzip.compress(data, compresslevel=9, mtime=0)
+        if unchanged and gz_file.exists():
+            info["gzip_bytes"] = gz_file.stat().st_size
+        else:
+            gz_file.write_bytes(compressed)
+            info["gzip_bytes"] = len(compressed)
+    return info
+
+
+def _load_tags(text: Optional[str]) -> Optional[List[Tuple[str, str]]]:
+    """Decode the (category, value) pairs stored in the manifest"""
+    if text is None:
+        return None
+    return [(category, value) for category, value in json.loads(text)]
+
+
+def _index_fragment(verse_id: Optional[str], tags: Optional[List[Tuple[str, str]]]) -> str:
+    """A file's entries as they appear inside tag_index.json"""
+    entries = [{"v": verse_id, "cat": category, "val": value} for category, value in tags or []]
+    return json.dumps(entries, ensure_ascii=False, separators=(',', ':'))[1:-1]
+
+
+def _verse_tags_fragment(verse_id: Optional[str], tags: Optional[List[Tuple[str, str]]]) -> Optional[str]:
+    """A file's member of verse_tags.json (None if the verse is untagged)"""
+    if tags is None:
+        return None
+    member = {verse_id: [f"{category}:{value}" for category, value in tags]}
+    return json.dumps(member, ensure_ascii=False, indent=2)[2:-2]
+
+
+def _category_summary(category_index) -> Dict:
+    """Category -> count and sorted values"""
+    summary = {}
+    for category in sorted(category_index):
+        values = category_index[category]
+        summary[category] = {
+            "count": len(values),
+            "values": sorted(values)
+        }
+    return summary
+
+
+def _statistics(total_verses: int, total_entries: int, category_index) -> Dict:
+    """Indexing statistics from verse and entry totals and the category values"""
+    stats = {
+        "total_verses": total_verses,
+        "total_tag_entries": total_entries,
+        "total_categories": len(category_index),
+        "avg_tags_per_verse": total_entries / max(total_verses, 1),
+        "categories": {}
+    }
+
+    for category in sorted(category_index):
+        values = category_index[category]
+        stats["categories"][category] = {
+            "unique_values": len(values),
+            "most_common": sorted(values)[:10]  # Top 10
+        }
+
+    return stats
 
-        for category, values in self.category_index.items():
-            stats["categories"][category] = {
-                "unique_values": len(values),
-                "most_common": sorted(list(values))[:10]  # Top 10
-            }
 
-        return stats
+def _write_text(output_file: Path, text: str):
+    """Write an output file, creating its directory"""
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_file, 'w', encoding='utf-8') as f:
+        f.write(text)
 
 
-def build_tag_indexes():
+def is_sharded(shard_dir: str = SHARD_DIR) -> bool:
+    """Whether a sharded build has replaced the monolithic outputs"""
+    return (Path(shard_dir) / "manifest.json").exists()
+
+
+def build_tag_indexes(incremental: bool = False, workers: Optional[int] = None, shards: bool = False,
+                      minify: bool = True, gzip_variants: bool = False):
     """Main function to build all tag indexes"""
     indexer = TagIndexer()
 
-    # Index all verses
-    indexer.index_all_verses()
+    if incremental and not shards:
+        sharded = is_sharded()
+        counts = indexer.update_index(workers=workers)
+        written = indexer.save_affected_outputs(exclude=SHARDED_OUTPUTS if sharded else ())
 
-    # Save all indexes
-    indexer.save_flat_index()
+        print("\n=== Incremental Tag Indexing Complete ===")
+        print(f"Added: {counts['added']}  Changed: {counts['changed']}  "
+              f"Removed: {counts['removed']}  Unchanged: {counts['unchanged']}")
+        print(f"Rewritten: {', '.join(written) or 'nothing'}")
+        if sharded and indexer.affected_outputs & set(SHARDED_OUTPUTS):
+            print(f"Shards in {SHARD_DIR} are not updated incrementally; rebuild them with --shards")
+        return
+
+    # Index all verses
+    indexer.index_all_verses(workers=workers)
+
+    # Save all indexes (shards replace the full flat index and verse tags)
+    if shards:
+        indexer.save_sharded_outputs(minify=minify, gzip_variants=gzip_variants)
+        indexer.remove_flat_outputs()
+    else:
+        indexer.save_flat_index()
+        indexer.save_verse_tags()
     indexer.save_category_summary()
-    indexer.save_verse_tags()
 
     # Generate and save statistics
     stats = indexer.generate_statistics()
-    with open("website/_data/tag_statistics.json", 'w', encoding='utf-8') as f:
-        json.dump(stats, f, ensure_ascii=False, indent=2)
+    _write_text(Path(OUTPUT_DIR) / OUTPUT_FILES["tag_statistics"], json.dumps(stats, ensure_ascii=False, indent=2))
 
     print("\n=== Tag Indexing Complete ===")
     print(f"Verses: {stats['total_verses']}")
@@ -184,4 +782,16 @@ def build_tag_indexes():
 
 
 if __name__ == "__main__":
-    build_tag_indexes()
+    parser = argparse.ArgumentParser(description="Build the tag search indexes")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Only re-index verse files changed since the last incremental run")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Processes parsing verse files (default: CPU count; 1 for serial)")
+    parser.add_argument("--shards", action="store_true",
+                        help=f"Write per-category and per-book shards to {SHARD_DIR} instead of "
+                             "tag_index.json and verse_tags.json (always a full index)")
+    parser.add_argument("--pretty", action="store_true", help="Indent shards instead of minifying them")
+    parser.add_argument("--gzip", action="store_true", help="Also write gzip-precompressed shards")
+    args = parser.parse_args()
+    build_tag_indexes(incremental=args.incremental, workers=args.workers, shards=args.shards,
+                      minify=not args.pretty, gzip_variants=args.gzip)
@@ -0,0 +1,414 @@
+"""
+Tag Postings Module
+
+Inverted index over verse tags: each (category, value) pair maps to the
+sorted canonical ordinals (see bible_structure.get_verse_ordinal) of the
+verses carrying it, so tag queries no longer scan the flat tag_index.
+
+Layout:
+- term_offsets: CSR-style offsets into the deltas column, one slot per
+  (category, value) term, terms sorted by category then value
+- deltas: each term's ordinals, delta-encoded (first ordinal, then gaps)
+- indexed: ordinals of every indexed verse (the universe for NOT)
+
+Ordinals of the 31,102-verse canon fit in 16 bits, so deltas are stored
+as unsigned shorts. Queries decode a term once into a bitmap (a Python
+int with one bit per ordinal) and evaluate AND/OR/NOT with integer
+bitwise operations.
+
+Functions:
+    get_tag_postings_path: Get the default postings file location
+    build_tag_postings: Build postings from a TagIndexer's full index
+    open_tag_postings: Load (and reuse) a postings file
+    parse_tag_term: Parse "category=value" (or "category") into a query term
+
+Classes:
+    TagPostings: Posting lists with AND/OR/NOT queries and category counts
+"""
+
+import json
+import struct
+import sys
+import threading
+from array import array
+from itertools import accumulate
+from pathlib import Path
+from typing import Dict, List, Optional, Any, Iterable, Tuple
+
+from src.bible_structure import get_total_verse_count, get_verse_ordinal
+from src.config import get_project_root
+
+
+# File header
+POSTINGS_MAGIC = b"SBTAGPST"
+POSTINGS_FORMAT_VERSION = 1
+
+# Column name -> array typecode
+COLUMN_TYPES = {
+    "term_offsets": "I",
+    "deltas": "H",
+    "indexed": "H",
+}
+
+# A query term: (category, value), or (category, None) for any value
+Term = Tuple[str, Optional[str]]
+
+# Bytes per bitmap (one bit per canonical verse)
+_BITMAP_BYTES = (get_total_verse_count() + 7) // 8
+
+# Byte value -> positions of its set bits
+_BYTE_BITS = [tuple(bit for bit in range(8) if byte >> bit & 1) for byte in range(256)]
+
+# Loaded postings: resolved path -> (mtime_ns, TagPostings)
+_open_postings: Dict[Path, Any] = {}
+_open_postings_lock = threading.Lock()
+
+
+def _to_bitmap(ordinals: Iterable[int]) -> int:
+    """Bitmap with the bit of each ordinal set."""
+    buf = bytearray(_BITMAP_BYTES)
+    for ordinal in ordinals:
+        buf[ordinal >> 3] |= 1 << (ordinal & 7)
+    return int.from_bytes(buf, 'little')
+
+
+def _from_bitmap(bits: int) -> List[int]:
+    """Sorted ordinals whose bits are set."""
+    ordinals = []
+    for index, byte in enumerate(bits.to_bytes(_BITMAP_BYTES, 'little')):
+        if byte:
+            base = index << 3
+            ordinals.extend(base + bit for bit in _BYTE_BITS[byte])
+    return ordinals
+
+
+class TagPostings:
+    """Posting lists with AND/OR/NOT queries and category counts"""
+
+    def __init__(self, terms: List[Tuple[str, str]], columns: Dict[str, array], verse_ids: List[Optional[str]]):
+        self.terms = terms
+        self.columns = columns
+        self.verse_ids = verse_ids  # Aligned with columns["indexed"]
+
+        self._term_ids = {term: term_id for term_id, term in enumerate(terms)}
+        self._categories: Dict[str, List[int]] = {}  # Category -> its term ids
+        for term_id, (category, _) in enumerate(terms):
+            self._categories.setdefault(category, []).append(term_id)
+
+        self._bitmaps: Dict[Any, int] = {}
+        self._bitmaps_lock = threading.Lock()
+        self._universe = _to_bitmap(columns["indexed"])
+        self._verse_id_by_ordinal = dict(zip(columns["indexed"], verse_ids))
+
+    def __len__(self) -> int:
+        """Number of (category, value) terms"""
+        return len(self.terms)
+
+    def verse_count(self) -> int:
+        """Number of indexed verses"""
+        return len(self.columns["indexed"])
+
+    def categories(self) -> List[str]:
+        """All categories, sorted"""
+        return list(self._categories)
+
+    def ordinals(self, category: str, value: str) -> List[int]:
+        """
+        Get the posting list of one tag.
+
+        Args:
+            category: Tag category (e.g. "people:named_individuals")
+            value: Tag value
+
+        Returns:
+            Sorted verse ordinals (empty if the tag is unknown)
+        """
+        term_id = self._term_ids.get((category, value))
+        if term_id is None:
+            return []
+        offsets = self.columns["term_offsets"]
+        return list(accumulate(self.columns["deltas"][offsets[term_id]:offsets[term_id + 1]]))
+
+    def _term_bitmap(self, term_id: int) -> int:
+        bits = self._bitmaps.get(term_id)
+        if bits is None:
+            bits = _to_bitmap(self.ordinals(*self.terms[term_id]))
+            with self._bitmaps_lock:
+                self._bitmaps[term_id] = bits
+        return bits
+
+    def _bitmap(self, term: Term) -> int:
+        """Bitmap of a term; (category, None) matches any value of the category."""
+        category, value = term
+        if value is not None:
+            term_id = self._term_ids.get((category, value))
+            return 0 if term_id is None else self._term_bitmap(term_id)
+
+        bits = self._bitmaps.get(category)
+        if bits is None:
+            bits = 0
+            for term_id in self._categories.get(category, ()):
+                bits |= self._term_bitmap(term_id)
+            with self._bitmaps_lock:
+                self._bitmaps[category] = bits
+        return bits
+
+    def _match(self, all_of: Iterable[Term], any_of: Iterable[Term], none_of: Iterable[Term]) -> int:
+        """Bitmap of verses matching every all_of term, some any_of term and no none_of term."""
+        bits = self._universe
+        for term in all_of:
+            bits &= self._bitmap(term)
+
+        any_of = list(any_of)
+        if any_of:
+            either = 0
+            for term in any_of:
+                either |= self._bitmap(term)
+            bits &= either
+
+        for term in none_of:
+            bits &= ~self._bitmap(term)
+        return bits
+
+    def query(
+        self,
+        all_of: Iterable[Term] = (),
+        any_of: Iterable[Term] = (),
+        none_of: Iterable[Term] = ()
+    ) -> List[int]:
+        """
+        Find verses by tag set algebra: all_of AND (any_of OR ...) AND NOT none_of.
+
+        Args:
+            all_of: Terms every match must carry
+            any_of: Terms of which a match must carry at least one (ignored if empty)
+            none_of: Terms no match may carry
+
+        Returns:
+            Sorted ordinals of the matching indexed verses
+        """
+        return _from_bitmap(self._match(all_of, any_of, none_of))
+
+    def count(self, all_of: Iterable[Term] = (), any_of: Iterable[Term] = (), none_of: Iterable[Term] = ()) -> int:
+        """Number of verses query() would return"""
+        return bin(self._match(all_of, any_of, none_of)).count("1")
+
+    def category_counts(
+        self,
+        all_of: Iterable[Term] = (),
+        any_of: Iterable[Term] = (),
+        none_of: Iterable[Term] = ()
+    ) -> Dict[str, int]:
+        """
+        Count matching verses per category (verses carrying any value of it).
+
+        Args:
+            all_of, any_of, none_of: Restrict the counts to a query's matches
+
+        Returns:
+            Category -> verse count, for categories with at least one match
+        """
+        matched = self._match(all_of, any_of, none_of)
+        counts = {}
+        for category in self._categories:
+            count = bin(matched & self._bitmap((category, None))).count("1")
+            if count:
+                counts[category] = count
+        return counts
+
+    def value_counts(
+        self,
+        category: str,
+        all_of: Iterable[Term] = (),
+        any_of: Iterable[Term] = (),
+        none_of: Iterable[Term] = ()
+    ) -> Dict[str, int]:
+        """
+        Count matching verses per value of one category.
+
+        Args:
+            category: Tag category
+            all_of, any_of, none_of: Restrict the counts to a query's matches
+
+        Returns:
+            Value -> verse count, for values with at least one match
+        """
+        matched = self._match(all_of, any_of, none_of)
+        counts = {}
+        for term_id in self._categories.get(category, ()):
+            count = bin(matched & self._term_bitmap(term_id)).count("1")
+            if count:
+                counts[self.terms[term_id][1]] = count
+        return counts
+
+    def verse_id(self, ordinal: int) -> Optional[str]:
+        """verse_id of an indexed verse, by ordinal"""
+        return self._verse_id_by_ordinal.get(ordinal)
+
+    def save(self, output_path: Path) -> None:
+        """
+        Write the postings as header + raw column bytes (atomic rename).
+
+        Args:
+            output_path: Destination file
+        """
+        header = {
+            "format_version": POSTINGS_FORMAT_VERSION,
+            "byteorder": sys.byteorder,
+            "terms": self.terms,
+            "verse_ids": self.verse_ids,
+            "columns": [
+                {"name": name, "typecode": COLUMN_TYPES[name], "length": len(self.columns[name])}
+                for name in COLUMN_TYPES
+            ],
+        }
+        header_bytes = json.dumps(header, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = output_path.with_suffix(".tmp")
+        with open(tmp_path, 'wb') as f:
+            f.write(POSTINGS_MAGIC)
+            f.write(struct.pack("<I", len(header_bytes)))
+            f.write(header_bytes)
+            for name in COLUMN_TYPES:
+                self.columns[name].tofile(f)
+        tmp_path.replace(output_path)
+
+    @classmethod
+    def load(cls, postings_path: Path) -> "TagPostings":
+        """
+        Load postings written by save().
+
+        Args:
+            postings_path: Path to the postings file
+
+        Returns:
+            TagPostings
+
+        Raises:
+            ValueError: If the file is not a postings file of this version
+            OSError: If the file cannot be read
+        """
+        with open(postings_path, 'rb') as f:
+            if f.read(len(POSTINGS_MAGIC)) != POSTINGS_MAGIC:
+                raise ValueError(f"Not a tag postings file: {postings_path}")
+
+            (header_len,) = struct.unpack("<I", f.read(4))
+            header = json.loads(f.read(header_len).decode('utf-8'))
+            if header.get("format_version") != POSTINGS_FORMAT_VERSION:
+                raise ValueError(f"Unsupported tag postings version: {header.get('format_version')}")
+
+            columns = {}
+            for spec in header["columns"]:
+                column = array(spec["typecode"])
+                column.fromfile(f, spec["length"])
+                if header["byteorder"] != sys.byteorder:
+                    column.byteswap()
+                columns[spec["name"]] = column
+
+        return cls([tuple(term) for term in header["terms"]], columns, header["verse_ids"])
+
+
+def get_tag_postings_path() -> Path:
+    """
+    Get the default postings file location.
+
+    Returns:
+        Path under the project's .cpf/state directory
+    """
+    return get_project_root() / ".cpf" / "state" / "tag_postings.bin"
+
+
+def _path_ordinal(rel_path: str) -> Optional[int]:
+    """Ordinal of a verse file at {OT,NT}/{BOOK}/{CH}/{VS}.json (None if not a verse file)."""
+    parts = rel_path.split("/")
+    if len(parts) != 4 or not parts[3].endswith(".json"):
+        return None
+    try:
+        return get_verse_ordinal(parts[1], int(parts[2]), int(parts[3][:-len(".json")]))
+    except ValueError:
+        return None
+
+
+def build_tag_postings(indexer) -> TagPostings:
+    """
+    Build postings from a TagIndexer's full index.
+
+    Verses are identified by their file location; files outside the
+    data/{OT,NT}/{BOOK}/{CH}/{VS}.json layout are skipped.
+
+    Args:
+        indexer: TagIndexer after index_all_verses()
+
+    Returns:
+        The built TagPostings
+    """
+    postings: Dict[Tuple[str, str], List[int]] = {}
+    verse_ids: Dict[int, Optional[str]] = {}
+
+    for rel_path, verse_id, pairs in indexer.iter_verse_tags():
+        ordinal = _path_ordinal(rel_path)
+        if ordinal is None or not pairs:
+            continue
+        verse_ids[ordinal] = verse_id
+        for pair in pairs:
+            postings.setdefault((str(pair[0]), str(pair[1])), []).append(ordinal)
+
+    terms = sorted(postings)
+    columns = {name: array(typecode) for name, typecode in COLUMN_TYPES.items()}
+    columns["term_offsets"].append(0)
+
+    for term in terms:
+        previous = 0
+        for ordinal in sorted(set(postings[term])):
+            columns["deltas"].append(ordinal - previous)
+            previous = ordinal
+        columns["term_offsets"].append(len(columns["deltas"]))
+
+    indexed = sorted(verse_ids)
+    columns["indexed"].extend(indexed)
+    return TagPostings(terms, columns, [verse_ids[ordinal] for ordinal in indexed])
+
+
+def open_tag_postings(postings_path: Optional[Path] = None) -> Optional[TagPostings]:
+    """
+    Load a postings file, reusing it until the file changes.
+
+    Args:
+        postings_path: Path to the postings file (default: get_tag_postings_path())
+
+    Returns:
+        TagPostings, or None if the file is missing or unreadable
+    """
+    try:
+        key = (postings_path or get_tag_postings_path()).resolve()
+        mtime_ns = key.stat().st_mtime_ns
+    except OSError:
+        return None
+
+    with _open_postings_lock:
+        cached = _open_postings.get(key)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+
+        try:
+            postings = TagPostings.load(key)
+        except (OSError, ValueError, EOFError, json.JSONDecodeError):
+            return None
+
+        _open_postings[key] = (mtime_ns, postings)
+        return postings
+
+
+def parse_tag_term(text: str) -> Term:
+    """
+    Parse a query term.
+
+    Args:
+        text: "category=value", or "category" for any value of the category
+
+    Returns:
+        (category, value) tuple, value None for a bare category
+    """
+    category, sep, value = text.partition("=")
+    return (category.strip(), value.strip() if sep else None)
@@ -0,0 +1,321 @@
+"""
+Token Store Module
+
+Compact columnar storage of interlinear source tokens (surface form,
+lemma, Strong's number, morph code and word position) for every verse
+of the canon, built once from OSHB and SBLGNT.
+
+Layout:
+- verse_offsets: CSR-style offsets into the token columns, indexed by
+  canonical verse ordinal (see bible_structure.get_verse_ordinal)
+- position: 1-based word position within the verse
+- surface/lemma/strongs/morph: dictionary-encoded string columns
+
+Columns are typed arrays from the standard library `array` module, so the
+file loads with a handful of bulk reads and no third-party dependency.
+
+Functions:
+    get_token_store_path: Get the default token store location
+    build_token_store: Extract tokens for every verse and write the store
+    open_token_store: Load (and reuse) a store written by build_token_store
+    prefill_interlinear: Turn source tokens into interlinear_analysis entries
+
+Classes:
+    TokenStore: Columnar token storage with per-verse lookups
+"""
+
+import json
+import struct
+import sys
+import threading
+from array import array
+from pathlib import Path
+from typing import Dict, List, Optional, Any
+
+from src.bible_structure import BIBLE_STRUCTURE, get_total_verse_count, get_verse_ordinal
+from src.verse_extractor import iter_book_verses
+
+
+# Default file name inside the sources directory
+TOKEN_STORE_FILENAME = "interlinear_tokens.bin"
+
+# File header
+STORE_MAGIC = b"SBTOKENS"
+STORE_FORMAT_VERSION = 1
+
+# Dictionary-encoded string columns (id 0 means "no value")
+STRING_COLUMNS = ("surface", "lemma", "strongs", "morph")
+
+# Column name -> array typecode
+COLUMN_TYPES = {
+    "verse_offsets": "I",
+    "position": "H",
+    "surface": "I",
+    "lemma": "I",
+    "strongs": "I",
+    "morph": "I",
+}
+
+# Loaded stores: resolved path -> (mtime_ns, TokenStore)
+_open_stores: Dict[Path, Any] = {}
+_open_stores_lock = threading.Lock()
+
+
+class TokenStore:
+    """Columnar token storage with per-verse lookups"""
+
+    def __init__(self, columns: Dict[str, array], strings: Dict[str, List[str]]):
+        self.columns = columns
+        self.strings = strings
+
+    def __len__(self) -> int:
+        """Total number of tokens in the store"""
+        return len(self.columns["position"])
+
+    def verse_count(self) -> int:
+        """Number of verse slots (one per canonical verse)"""
+        return len(self.columns["verse_offsets"]) - 1
+
+    def column(self, name: str) -> array:
+        """Get a raw column (string columns hold ids into self.strings[name])"""
+        return self.columns[name]
+
+    def get_tokens_by_ordinal(self, ordinal: int) -> List[Dict[str, Any]]:
+        """
+        Get the tokens of a verse by canonical ordinal.
+
+        Args:
+            ordinal: 0-based canonical verse ordinal
+
+        Returns:
+            List of {"position", "surface", "lemma", "strongs", "morph"} dicts
+        """
+        offsets = self.columns["verse_offsets"]
+        if ordinal < 0 or ordinal + 1 >= len(offsets):
+            return []
+
+        start, end = offsets[ordinal], offsets[ordinal + 1]
+        positions = self.columns["position"]
+
+        tokens = []
+        for i in range(start, end):
+            token = {"position": positions[i]}
+            for name in STRING_COLUMNS:
+                token[name] = self.strings[name][self.columns[name][i]] or None
+            tokens.append(token)
+        return tokens
+
+    def get_tokens(self, book: str, chapter: int, verse: int) -> Optional[List[Dict[str, Any]]]:
+        """
+        Get the tokens of a verse.
+
+        Args:
+            book: Book name
+            chapter: Chapter number
+            verse: Verse number
+
+        Returns:
+            List of token dicts, or None if the verse has no tokens stored
+        """
+        ordinal = get_verse_ordinal(book, chapter, verse)
+        if ordinal is None:
+            return None
+        return self.get_tokens_by_ordinal(ordinal) or None
+
+    def save(self, output_path: Path) -> None:
+        """
+        Write the store as header + raw column bytes (atomic rename).
+
+        Args:
+            output_path: Destination file
+        """
+        header = {
+            "format_version": STORE_FORMAT_VERSION,
+            "byteorder": sys.byteorder,
+            "strings": self.strings,
+            "columns": [
+                {"name": name, "typecode": COLUMN_TYPES[name], "length": len(self.columns[name])}
+                for name in COLUMN_TYPES
+            ],
+        }
+        header_bytes = json.dumps(header, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = output_path.with_suffix(".tmp")
+        with open(tmp_path, 'wb') as f:
+            f.write(STORE_MAGIC)
+            f.write(struct.pack("<I", len(header_bytes)))
+            f.write(header_bytes)
+            for name in COLUMN_TYPES:
+                self.columns[name].tofile(f)
+        tmp_path.replace(output_path)
+
+    @classmethod
+    def load(cls, store_path: Path) -> "TokenStore":
+        """
+        Load a store written by save().
+
+        Args:
+            store_path: Path to the store file
+
+        Returns:
+            TokenStore
+
+        Raises:
+            ValueError: If the file is not a token store of this version
+            OSError: If the file cannot be read
+        """
+        with open(store_path, 'rb') as f:
+            if f.read(len(STORE_MAGIC)) != STORE_MAGIC:
+                raise ValueError(f"Not a token store: {store_path}")
+
+            (header_len,) = struct.unpack("<I", f.read(4))
+            header = json.loads(f.read(header_len).decode('utf-8'))
+            if header.get("format_version") != STORE_FORMAT_VERSION:
+                raise ValueError(f"Unsupported token store version: {header.get('format_version')}")
+
+            columns = {}
+            for spec in header["columns"]:
+                column = array(spec["typecode"])
+                column.fromfile(f, spec["length"])
+                if header["byteorder"] != sys.byteorder:
+                    column.byteswap()
+                columns[spec["name"]] = column
+
+        return cls(columns, header["strings"])
+
+
+class _StringTable:
+    """Assigns dense ids to strings while building a dictionary-encoded column."""
+
+    def __init__(self):
+        self.values = [""]
+        self.ids = {"": 0}
+
+    def id_for(self, value: Optional[str]) -> int:
+        if not value:
+            return 0
+        string_id = self.ids.get(value)
+        if string_id is None:
+            string_id = self.ids[value] = len(self.values)
+            self.values.append(value)
+        return string_id
+
+
+def get_token_store_path(sources_dir: Path) -> Path:
+    """
+    Get the default token store location.
+
+    Args:
+        sources_dir: Sources directory (see config.get_sources_directory)
+
+    Returns:
+        Path to the token store file
+    """
+    return sources_dir / TOKEN_STORE_FILENAME
+
+
+def build_token_store(oshb_path: Path, sblgnt_path: Path, output_path: Path) -> TokenStore:
+    """
+    Extract tokens for every verse of the canon and write the store.
+
+    Each book is streamed once with iter_book_verses. Verses that are
+    missing from the sources (or outside the canonical structure) get an
+    empty token range.
+
+    Args:
+        oshb_path: Path to OSHB directory
+        sblgnt_path: Path to SBLGNT directory
+        output_path: Destination file
+
+    Returns:
+        The built TokenStore
+    """
+    verse_total = get_total_verse_count()
+    verse_words: List[Optional[list]] = [None] * verse_total
+
+    for testament in ["OT", "NT"]:
+        for book_name in BIBLE_STRUCTURE[testament]:
+            for chapter, verse, _, words in iter_book_verses(book_name, oshb_path, sblgnt_path):
+                ordinal = get_verse_ordinal(book_name, chapter, verse)
+                if ordinal is not None and verse_words[ordinal] is None:
+                    verse_words[ordinal] = words
+
+    tables = {name: _StringTable() for name in STRING_COLUMNS}
+    columns = {name: array(typecode) for name, typecode in COLUMN_TYPES.items()}
+    columns["verse_offsets"].append(0)
+
+    for words in verse_words:
+        for position, word in enumerate(words or [], start=1):
+            columns["position"].append(position)
+            columns["surface"].append(tables["surface"].id_for(word["text"]))
+            columns["lemma"].append(tables["lemma"].id_for(word["lemma"]))
+            columns["strongs"].append(tables["strongs"].id_for(word["strongs"]))
+            columns["morph"].append(tables["morph"].id_for(word["morph"]))
+        columns["verse_offsets"].append(len(columns["position"]))
+
+    store = TokenStore(columns, {name: table.values for name, table in tables.items()})
+    store.save(output_path)
+    return store
+
+
+def open_token_store(store_path: Path) -> Optional[TokenStore]:
+    """
+    Load a token store, reusing it until the file changes.
+
+    Args:
+        store_path: Path to the store file
+
+    Returns:
+        TokenStore, or None if the file is missing or unreadable
+    """
+    try:
+        key = store_path.resolve()
+        mtime_ns = key.stat().st_mtime_ns
+    except OSError:
+        return None
+
+    with _open_stores_lock:
+        cached = _open_stores.get(key)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+
+        try:
+            store = TokenStore.load(key)
+        except (OSError, ValueError, EOFError, json.JSONDecodeError):
+            return None
+
+        _open_stores[key] = (mtime_ns, store)
+        return store
+
+
+def prefill_interlinear(tokens: List[Dict[str, Any]], testament: str) -> List[Dict[str, Any]]:
+    """
+    Turn source tokens into interlinear_analysis entries.
+
+    Fills the fields that come straight from the source text; glosses,
+    transliterations and expanded parsing are left for the model. OSHB
+    lemma attributes are Strong's-based codes rather than dictionary
+    forms, so Hebrew entries carry no lemma.
+
+    Args:
+        tokens: Tokens from TokenStore.get_tokens or extract_verse_tokens
+        testament: "OT" or "NT"
+
+    Returns:
+        List of partial interlinear entries in word order
+    """
+    word_field = "greek_word" if testament == "NT" else "hebrew_word"
+
+    entries = []
+    for token in tokens:
+        entry = {"word_number": token["position"], word_field: token["surface"]}
+        if testament == "NT" and token["lemma"]:
+            entry["lemma"] = token["lemma"]
+        if token["strongs"]:
+            entry["strongs_number"] = token["strongs"]
+        if token["morph"]:
+            entry["source_morph"] = token["morph"]
+        entries.append(entry)
+
+    return entries
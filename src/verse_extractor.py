@@ -9,14 +9,39 @@ Functions:
     extract_hebrew_verse: Extract verse from OSHB XML
     extract_greek_verse: Extract verse from SBLGNT text
     extract_verse: Universal verse extractor (routes to correct source)
+    iter_book_verses: Stream every verse of a book in one pass
+    extract_verse_tokens: Extract per-token interlinear records for a verse
+    strongs_from_oshb_lemma: Derive a Strong's number from an OSHB lemma
+    extract_chapter_verses: Collect the verse texts of one chapter in one pass
     book_name_to_osis_id: Convert book name to OSIS identifier
+    load_hebrew_book: Parse an OSHB book file (through the book cache)
+    get_book_cache_stats: Inspect the parsed-book cache
+    clear_book_cache: Empty the parsed-book cache
+    configure_book_cache: Set the parsed-book cache byte budget
+
+Hebrew lookups are served from the pre-compiled OSHB index (see
+src/corpus_index.py) when one exists, instead of re-parsing the book XML.
+Greek lookups go through a per-file byte-offset index instead of a
+line-by-line scan of the SBLGNT text. Without a compiled index, parsed
+OSHB books are kept in a process-wide LRU cache bounded by a byte budget.
 """
 
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Dict, Any, List, Tuple, Hashable, Iterator
 import re
+import sys
+import threading
 from lxml import etree
 
+from src.corpus_index import (
+    OSIS_NS,
+    open_oshb_index,
+    open_sblgnt_index,
+    morphgnt_verse_key,
+    parse_oshb_book,
+)
+
 
 # OSIS ID mappings for biblical books
 BOOK_TO_OSIS = {
@@ -64,6 +89,165 @@ NT_BOOKS = {
 }
 
 
+# Default byte budget for the parsed-book cache (256 MiB)
+DEFAULT_BOOK_CACHE_BYTES = 256 * 1024 * 1024
+
+# Verse words as (text, lemma, morph) tuples, keyed by osisID
+HebrewBook = Dict[str, List[Tuple[str, Optional[str], Optional[str]]]]
+
+
+class BookCache:
+    """Thread-safe LRU cache bounded by an approximate byte budget"""
+
+    def __init__(self, max_bytes: int = DEFAULT_BOOK_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Hashable, Tuple[Any, int]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Get a cached value (marking it most recently used) or None"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: Hashable, value: Any, size: int) -> None:
+        """Store a value, evicting least recently used entries to fit"""
+        with self._lock:
+            if key in self._entries:
+                self._bytes -= self._entries.pop(key)[1]
+
+            # Values larger than the whole budget are not cached
+            if size > self.max_bytes:
+                return
+
+            self._entries[key] = (value, size)
+            self._bytes += size
+            self._evict_to(self.max_bytes)
+
+    def discard_where(self, predicate) -> None:
+        """Drop every entry whose key matches predicate(key)"""
+        with self._lock:
+            for key in [k for k in self._entries if predicate(k)]:
+                self._bytes -= self._entries.pop(key)[1]
+
+    def _evict_to(self, max_bytes: int) -> None:
+        """Evict least recently used entries until within max_bytes (lock held)"""
+        while self._bytes > max_bytes and self._entries:
+            _, (_, size) = self._entries.popitem(last=False)
+            self._bytes -= size
+            self.evictions += 1
+
+    def resize(self, max_bytes: int) -> None:
+        """Change the byte budget, evicting entries if it shrank"""
+        with self._lock:
+            self.max_bytes = max_bytes
+            self._evict_to(max_bytes)
+
+    def clear(self) -> None:
+        """Remove all entries and reset the counters"""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Get hit/miss/eviction counters and current usage"""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+
+# Process-wide cache of parsed OSHB books, keyed by (resolved path, mtime)
+_book_cache = BookCache()
+
+
+def _estimate_book_size(verses: HebrewBook) -> int:
+    """Approximate the memory held by a parsed book in bytes."""
+    size = sys.getsizeof(verses)
+    for osis_id, words in verses.items():
+        size += sys.getsizeof(osis_id) + sys.getsizeof(words)
+        for word in words:
+            size += sys.getsizeof(word) + sum(sys.getsizeof(field) for field in word if field)
+    return size
+
+
+def load_hebrew_book(xml_file: Path) -> HebrewBook:
+    """
+    Parse an OSHB book file into verse words, using the book cache.
+
+    Entries are keyed by resolved path and mtime, so an edited file is
+    re-parsed and its old entry dropped. Concurrent misses on the same
+    book may both parse it; the cache itself stays consistent.
+
+    Args:
+        xml_file: Path to OSHB book XML file
+
+    Returns:
+        Dict of osisID -> [(text, lemma, morph), ...]
+
+    Raises:
+        etree.XMLSyntaxError: If the file is not well-formed
+        OSError: If the file cannot be read
+    """
+    resolved = str(xml_file.resolve())
+    key = (resolved, xml_file.stat().st_mtime_ns)
+
+    verses = _book_cache.get(key)
+    if verses is not None:
+        return verses
+
+    verses = {}
+    for osis_id, words in parse_oshb_book(xml_file):
+        # First occurrence wins, as with the original XPath lookup
+        verses.setdefault(osis_id, words)
+
+    _book_cache.discard_where(lambda k: k[0] == resolved and k != key)
+    _book_cache.put(key, verses, _estimate_book_size(verses))
+    return verses
+
+
+def get_book_cache_stats() -> Dict[str, int]:
+    """
+    Get statistics for the parsed-book cache.
+
+    Returns:
+        Dict with hits, misses, evictions, entries, bytes and max_bytes
+    """
+    return _book_cache.stats()
+
+
+def clear_book_cache() -> None:
+    """Empty the parsed-book cache and reset its counters."""
+    _book_cache.clear()
+
+
+def configure_book_cache(max_bytes: int) -> None:
+    """
+    Set the byte budget of the parsed-book cache.
+
+    Args:
+        max_bytes: Approximate memory budget; 0 disables caching
+    """
+    _book_cache.resize(max_bytes)
+
+
 def book_name_to_osis_id(book_name: str) -> Optional[str]:
     """
     Convert book name to OSIS identifier.
@@ -78,12 +262,43 @@ def book_name_to_osis_id(book_name: str) -> Optional[str]:
     return BOOK_TO_OSIS.get(normalized)
 
 
+def _resolve_oshb_file(osis_id: str, oshb_path: Path) -> Path:
+    """Locate the OSHB XML file for a book (the path itself if it is a file)."""
+    # If path is directory, look for the book file
+    if oshb_path.is_dir():
+        # OSHB structure: wlc/Genesis.xml or similar
+        xml_file = oshb_path / "wlc" / f"{osis_id}.xml"
+        if not xml_file.exists():
+            # Try alternate location
+            xml_file = oshb_path / f"{osis_id}.xml"
+        return xml_file
+    return oshb_path
+
+
+def _resolve_sblgnt_file(book: str, sblgnt_path: Path) -> Path:
+    """Locate the SBLGNT text file for a book (the path itself if it is a file)."""
+    # If path is directory, look for the book file
+    if sblgnt_path.is_dir():
+        # Try multiple possible locations for SBLGNT text files
+        # Format 1: data/sblgnt/text/BookName.txt (Faithlife/SBLGNT)
+        text_file = sblgnt_path / "data" / "sblgnt" / "text" / f"{book}.txt"
+        if not text_file.exists():
+            # Format 2: sblgnt.txt (MorphGNT combined file)
+            text_file = sblgnt_path / "sblgnt.txt"
+        if not text_file.exists():
+            # Format 3: data/sblgnt.txt
+            text_file = sblgnt_path / "data" / "sblgnt.txt"
+        return text_file
+    return sblgnt_path
+
+
 def extract_hebrew_verse(
     book: str,
     chapter: int,
     verse: int,
     oshb_path: Path,
-    strip_marks: bool = False
+    strip_marks: bool = False,
+    use_index: bool = True
 ) -> Optional[str]:
     """
     Extract Hebrew verse text from OSHB XML.
@@ -94,6 +309,7 @@ def extract_hebrew_verse(
         verse: Verse number
         oshb_path: Path to OSHB directory or XML file
         strip_marks: If True, remove cantillation marks
+        use_index: If True, use the compiled OSHB index when available
 
     Returns:
         Hebrew text string or None if not found
@@ -104,43 +320,28 @@ def extract_hebrew_verse(
         if not osis_id:
             return None
 
-        # If path is directory, look for the book file
-        if oshb_path.is_dir():
-            # OSHB structure: wlc/Genesis.xml or similar
-            xml_file = oshb_path / "wlc" / f"{osis_id}.xml"
-            if not xml_file.exists():
-                # Try alternate location
-                xml_file = oshb_path / f"{osis_id}.xml"
-        else:
-            xml_file = oshb_path
-
-        if not xml_file.exists():
-            return None
-
-        # Parse XML
-        tree = etree.parse(str(xml_file))
-        root = tree.getroot()
-
-        # Define namespace
-        ns = {"osis": "http://www.bibletechnologies.net/2003/OSIS/namespace"}
-
         # Build verse ID (e.g., "Gen.1.1")
         verse_id = f"{osis_id}.{chapter}.{verse}"
 
-        # Find the verse element
-        verse_elem = root.find(f".//osis:verse[@osisID='{verse_id}']", ns)
+        # Serve from the compiled index when one is available
+        if use_index:
+            index = open_oshb_index(oshb_path)
+            if index is not None:
+                hebrew_text = index.get_text(verse_id)
+                if not hebrew_text:
+                    return None
+                return _strip_cantillation(hebrew_text) if strip_marks else hebrew_text
 
-        if verse_elem is None:
+        xml_file = _resolve_oshb_file(osis_id, oshb_path)
+
+        if not xml_file.exists():
             return None
 
-        # Extract all word elements
-        words = verse_elem.findall(".//osis:w", ns)
+        # Parse the book once; later verses are served from the book cache
+        verses = load_hebrew_book(xml_file)
 
-        # Get text from each word
-        text_parts = []
-        for word in words:
-            if word.text:
-                text_parts.append(word.text)
+        # Get text from each word of the verse
+        text_parts = [text for text, _, _ in verses.get(verse_id, [])]
 
         if not text_parts:
             return None
@@ -150,8 +351,7 @@ def extract_hebrew_verse(
 
         # Optionally strip cantillation marks
         if strip_marks:
-            # Remove cantillation marks (Unicode range U+0591 to U+05BD, U+05BF to U+05C7)
-            hebrew_text = re.sub(r'[\u0591-\u05bd\u05bf-\u05c7]', '', hebrew_text)
+            hebrew_text = _strip_cantillation(hebrew_text)
 
         return hebrew_text
 
@@ -159,6 +359,11 @@ def extract_hebrew_verse(
         return None
 
 
+def _strip_cantillation(hebrew_text: str) -> str:
+    """Remove cantillation marks (Unicode range U+0591 to U+05BD, U+05BF to U+05C7)."""
+    return re.sub(r'[\u0591-\u05bd\u05bf-\u05c7]', '', hebrew_text)
+
+
 def extract_greek_verse(
     book: str,
     chapter: int,
@@ -168,8 +373,11 @@ def extract_greek_verse(
     """
     Extract Greek verse text from SBLGNT text file.
 
-    SBLGNT format: Each line has fields separated by spaces:
-    [book_num] [pos] [parsing] [text] [word] [normalized] [lemma] ...
+    Supported layouts:
+    - Tab-delimited (Faithlife/SBLGNT): "Acts 10:44<tab>Greek text"
+    - Space-delimited MorphGNT, one word per line:
+      [book_num] [chapter] [verse] [text] [word] [normalized] [lemma] ...
+      (the words of the verse are joined with spaces)
 
     Args:
         book: Book name (e.g., "Acts")
@@ -188,61 +396,23 @@ def extract_greek_verse(
         if book_num is None:
             return None
 
-        # If path is directory, look for the book file
-        if sblgnt_path.is_dir():
-            # Try multiple possible locations for SBLGNT text files
-            # Format 1: data/sblgnt/text/BookName.txt (Faithlife/SBLGNT)
-            text_file = sblgnt_path / "data" / "sblgnt" / "text" / f"{book}.txt"
-            if not text_file.exists():
-                # Format 2: sblgnt.txt (MorphGNT combined file)
-                text_file = sblgnt_path / "sblgnt.txt"
-            if not text_file.exists():
-                # Format 3: data/sblgnt.txt
-                text_file = sblgnt_path / "data" / "sblgnt.txt"
-        else:
-            text_file = sblgnt_path
+        text_file = _resolve_sblgnt_file(book, sblgnt_path)
 
         if not text_file.exists():
             return None
 
-        # Read and parse the file
+        # Look the verse up through the file's offset index (built once per file)
+        index = open_sblgnt_index(text_file)
+
         # Try tab-delimited format first (Faithlife/SBLGNT): "Acts 1:1<tab>Greek text"
-        verse_ref = f"{book} {chapter}:{verse}"
-        with open(text_file, 'r', encoding='utf-8') as f:
-            for line in f:
-                line = line.strip()
-                if not line or line.startswith('#'):
-                    continue
-
-                # Try tab-delimited format
-                if '\t' in line:
-                    parts = line.split('\t', 1)
-                    if len(parts) == 2 and parts[0] == verse_ref:
-                        return parts[1].strip()
-                else:
-                    # Try space-delimited MorphGNT format: book_num chapter verse word ...
-                    parts = line.split()
-                    if len(parts) < 4:
-                        continue
-
-                    try:
-                        line_book = int(parts[0])
-                        line_chapter = int(parts[1])
-                        line_verse = int(parts[2])
-                        word_text = parts[3]
-
-                        # Check if this is our verse
-                        if (line_book == book_num and
-                            line_chapter == chapter and
-                            line_verse == verse):
-                            return word_text
-
-                    except (ValueError, IndexError):
-                        continue
+        greek_text = index.get_text(f"{book} {chapter}:{verse}")
+        if greek_text is None:
+            # Space-delimited MorphGNT format: book_num chapter verse word ...
+            greek_text = index.get_text(morphgnt_verse_key(book_num, chapter, verse))
 
-        return None
+        return greek_text or None
 
-    except (IOError, OSError) as e:
+    except (IOError, OSError, UnicodeDecodeError) as e:
         return None
 
 
@@ -273,3 +443,270 @@ def extract_verse(
         return extract_greek_verse(book, chapter, verse, sblgnt_path)
     else:
         return extract_hebrew_verse(book, chapter, verse, oshb_path)
+
+
+# One streamed verse: (chapter, verse, text, words)
+BookVerse = Tuple[int, int, str, List[Dict[str, Optional[str]]]]
+
+
+def _iter_hebrew_book(xml_file: Path) -> Iterator[BookVerse]:
+    """Stream the verses of an OSHB book file with iterparse."""
+    verse_tag = f"{{{OSIS_NS}}}verse"
+    word_tag = f"{{{OSIS_NS}}}w"
+
+    for _, verse_elem in etree.iterparse(str(xml_file), events=("end",), tag=verse_tag):
+        osis_id = verse_elem.get("osisID") or ""
+        parts = osis_id.split(".")
+
+        words = [
+            _hebrew_word(word.text, word.get("lemma"), word.get("morph"))
+            for word in verse_elem.iter(word_tag)
+            if word.text
+        ]
+
+        # Free the consumed verse and any earlier siblings so memory stays flat
+        verse_elem.clear()
+        while verse_elem.getprevious() is not None:
+            del verse_elem.getparent()[0]
+
+        if len(parts) != 3 or not words:
+            continue
+        try:
+            chapter, verse = int(parts[1]), int(parts[2])
+        except ValueError:
+            continue
+
+        yield chapter, verse, " ".join(word["text"] for word in words), words
+
+
+def strongs_from_oshb_lemma(lemma: Optional[str]) -> Optional[str]:
+    """
+    Derive a Strong's number from an OSHB lemma attribute.
+
+    OSHB lemmas list prefix morphemes before the main lemma, separated by
+    "/", and may carry a disambiguating letter (e.g., "c/d/b/7225" ->
+    "H7225", "b/1254 a" -> "H1254a").
+
+    Args:
+        lemma: OSHB lemma attribute
+
+    Returns:
+        Strong's number with "H" prefix, or None if there is none
+    """
+    if not lemma:
+        return None
+    match = re.match(r'^(\d+)\s*([a-z])?$', lemma.split("/")[-1].strip())
+    if not match:
+        return None
+    return f"H{match.group(1)}{match.group(2) or ''}"
+
+
+def _hebrew_word(text: str, lemma: Optional[str], morph: Optional[str]) -> Dict[str, Optional[str]]:
+    """Word dict for an OSHB <w> element."""
+    return {"text": text, "lemma": lemma, "morph": morph, "strongs": strongs_from_oshb_lemma(lemma)}
+
+
+def _parse_morphgnt_line(parts: List[str]) -> Dict[str, Optional[str]]:
+    """Word dict for a MorphGNT line: book chapter verse text lemma normalized pos parsing strongs ..."""
+    return {
+        "text": parts[3],
+        "lemma": parts[4] if len(parts) > 4 else None,
+        "morph": " ".join(parts[6:8]) if len(parts) > 7 else None,
+        "strongs": f"G{parts[8]}" if len(parts) > 8 and parts[8].isdigit() else None,
+    }
+
+
+def _parse_tab_word(word: str) -> Dict[str, Optional[str]]:
+    """Word dict for the tab-delimited layout, which carries no morphology."""
+    return {"text": word, "lemma": None, "morph": None, "strongs": None}
+
+
+def _iter_greek_book(book: str, book_num: int, text_file: Path) -> Iterator[BookVerse]:
+    """Stream the verses of one book from an SBLGNT text file."""
+    ref_pattern = re.compile(rf"^{re.escape(book)} (\d+):(\d+)$")
+
+    current_ref = None
+    current_words: List[Dict[str, Optional[str]]] = []
+
+    with open(text_file, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+
+            if '\t' in line:
+                # Tab-delimited: "Acts 10:44<tab>Greek text" (one verse per line)
+                ref, text = line.split('\t', 1)
+                match = ref_pattern.match(ref.strip())
+                if match and text.strip():
+                    words = [_parse_tab_word(word) for word in text.split()]
+                    yield int(match.group(1)), int(match.group(2)), text.strip(), words
+                continue
+
+            # Space-delimited MorphGNT: one word per line, grouped by verse
+            parts = line.split()
+            if len(parts) < 4:
+                continue
+            try:
+                line_book, line_chapter, line_verse = int(parts[0]), int(parts[1]), int(parts[2])
+            except ValueError:
+                continue
+            if line_book != book_num:
+                continue
+
+            if (line_chapter, line_verse) != current_ref:
+                if current_words:
+                    yield (*current_ref, " ".join(w["text"] for w in current_words), current_words)
+                current_ref = (line_chapter, line_verse)
+                current_words = []
+            current_words.append(_parse_morphgnt_line(parts))
+
+    if current_words:
+        yield (*current_ref, " ".join(w["text"] for w in current_words), current_words)
+
+
+def iter_book_verses(
+    book: str,
+    oshb_path: Path,
+    sblgnt_path: Path
+) -> Iterator[BookVerse]:
+    """
+    Stream every verse of a book from its source file in a single pass.
+
+    OSHB books are read with lxml iterparse and each verse element is
+    cleared once consumed, so peak memory does not grow with book size.
+    SBLGNT books are read line by line in either supported layout.
+
+    Args:
+        book: Book name (e.g., "Genesis", "Acts")
+        oshb_path: Path to OSHB directory or XML file
+        sblgnt_path: Path to SBLGNT directory or text file
+
+    Yields:
+        Tuple of (chapter, verse, text, words) where words is a list of
+        {"text", "lemma", "morph", "strongs"} dicts in verse order
+    """
+    book_normalized = book.lower().replace(" ", "")
+
+    if book_normalized in NT_BOOKS:
+        book_num = BOOK_TO_SBLGNT_NUMBER[book_normalized]
+        text_file = _resolve_sblgnt_file(book, sblgnt_path)
+        if text_file.exists():
+            yield from _iter_greek_book(book, book_num, text_file)
+        return
+
+    osis_id = book_name_to_osis_id(book)
+    if not osis_id:
+        return
+
+    xml_file = _resolve_oshb_file(osis_id, oshb_path)
+    if xml_file.exists():
+        yield from _iter_hebrew_book(xml_file)
+
+
+def extract_chapter_verses(
+    book: str,
+    chapter: int,
+    oshb_path: Path,
+    sblgnt_path: Path
+) -> Dict[int, str]:
+    """
+    Collect the verse texts of one chapter in a single streaming pass.
+
+    Reading stops as soon as the book moves past the requested chapter.
+
+    Args:
+        book: Book name
+        chapter: Chapter number
+        oshb_path: Path to OSHB directory or XML file
+        sblgnt_path: Path to SBLGNT directory or text file
+
+    Returns:
+        Dict of verse number -> verse text (empty if the source is missing)
+    """
+    texts: Dict[int, str] = {}
+    try:
+        for verse_chapter, verse, text, _ in iter_book_verses(book, oshb_path, sblgnt_path):
+            if verse_chapter == chapter:
+                texts.setdefault(verse, text)
+            elif texts:
+                break
+    except (etree.XMLSyntaxError, IOError, OSError, UnicodeDecodeError):
+        return texts
+
+    return texts
+
+
+def extract_verse_tokens(
+    book: str,
+    chapter: int,
+    verse: int,
+    oshb_path: Path,
+    sblgnt_path: Path
+) -> Optional[List[Dict[str, Any]]]:
+    """
+    Extract structured interlinear tokens for a verse.
+
+    Unlike extract_verse, which returns joined text, this keeps every
+    word's lemma, Strong's number and morphology code from the source.
+    Sources without morphology (tab-delimited SBLGNT) give None fields.
+
+    Args:
+        book: Book name
+        chapter: Chapter number
+        verse: Verse number
+        oshb_path: Path to OSHB directory or XML file
+        sblgnt_path: Path to SBLGNT directory or text file
+
+    Returns:
+        List of {"position", "surface", "lemma", "strongs", "morph"} dicts
+        (position is 1-based), or None if the verse is not found
+    """
+    book_normalized = book.lower().replace(" ", "")
+
+    try:
+        if book_normalized in NT_BOOKS:
+            text_file = _resolve_sblgnt_file(book, sblgnt_path)
+            if not text_file.exists():
+                return None
+
+            index = open_sblgnt_index(text_file)
+            fields = index.get_word_fields(f"{book} {chapter}:{verse}")
+            if not fields:
+                book_num = BOOK_TO_SBLGNT_NUMBER[book_normalized]
+                fields = index.get_word_fields(morphgnt_verse_key(book_num, chapter, verse))
+            words = [
+                _parse_morphgnt_line(parts) if len(parts) >= 4 else _parse_tab_word(parts[0])
+                for parts in fields
+            ]
+        else:
+            osis_id = book_name_to_osis_id(book)
+            if not osis_id:
+                return None
+            verse_id = f"{osis_id}.{chapter}.{verse}"
+
+            index = open_oshb_index(oshb_path)
+            if index is not None:
+                words = [_hebrew_word(w["text"], w["lemma"], w["morph"]) for w in index.get_words(verse_id)]
+            else:
+                xml_file = _resolve_oshb_file(osis_id, oshb_path)
+                if not xml_file.exists():
+                    return None
+                words = [_hebrew_word(*word) for word in load_hebrew_book(xml_file).get(verse_id, [])]
+
+    except (etree.XMLSyntaxError, IOError, OSError, UnicodeDecodeError):
+        return None
+
+    if not words:
+        return None
+
+    return [
+        {
+            "position": position,
+            "surface": word["text"],
+            "lemma": word["lemma"],
+            "strongs": word["strongs"],
+            "morph": word["morph"],
+        }
+        for position, word in enumerate(words, start=1)
+    ]
@@ -0,0 +1,520 @@
+"""
+Verse Store Module
+
+SQLite-backed store for generated verses, so consumers (tag indexing,
+fact checking, the website build) can query verses instead of walking
+and re-parsing the data/ tree.
+
+Each verse row keeps the full verse JSON plus extracted columns: verse
+id, canonical ordinal, testament, book, chapter, verse and coordinates.
+Tags are flattened into a verse_tags table (tier, category, value) for
+tag queries. Rows are keyed by canonical verse ordinal, so range scans
+come back in canonical order.
+
+Functions:
+    get_verse_store_path: Get the default store database location
+
+Classes:
+    VerseStore: SQLite verse store with a query API
+    VerseBatchWriter: Buffers verse writes and commits them in batches
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Any, Optional, Iterable, Tuple, List, Callable
+
+from src.config import get_project_root
+from src.bible_structure import get_book_info, get_verse_ordinal
+
+
+# Seconds to wait for another process holding the database lock
+DB_LOCK_TIMEOUT = 30.0
+
+DEFAULT_BATCH_SIZE = 50
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS verses (
+    ordinal INTEGER PRIMARY KEY,
+    verse_id TEXT,
+    testament TEXT NOT NULL,
+    book TEXT NOT NULL,
+    chapter INTEGER NOT NULL,
+    verse INTEGER NOT NULL,
+    lat REAL,
+    long REAL,
+    data TEXT NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS verses_book ON verses (book, chapter, verse);
+CREATE INDEX IF NOT EXISTS verses_verse_id ON verses (verse_id);
+CREATE TABLE IF NOT EXISTS verse_tags (
+    ordinal INTEGER NOT NULL,
+    tier TEXT NOT NULL,
+    category TEXT NOT NULL,
+    value TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS verse_tags_value ON verse_tags (tier, category, value);
+CREATE INDEX IF NOT EXISTS verse_tags_ordinal ON verse_tags (ordinal);
+"""
+
+# Summary columns returned by VerseStore.query()
+_SUMMARY_COLUMNS = ("verse_id", "testament", "book", "chapter", "verse", "lat", "long")
+
+VerseRecord = Tuple[str, int, int, Dict[str, Any]]
+
+# A queued record and the callback told whether it was committed
+PendingVerse = Tuple[VerseRecord, Optional[Callable[[bool], None]]]
+
+
+def get_verse_store_path() -> Path:
+    """
+    Get the default store database location.
+
+    Returns:
+        Path under the project's .cpf/state directory
+    """
+    return get_project_root() / ".cpf" / "state" / "verse_store.sqlite"
+
+
+def _coordinates(verse_data: Dict[str, Any]) -> Tuple[Optional[float], Optional[float]]:
+    """Latitude/longitude from section_2 geospatial data, if numeric."""
+    section_2 = verse_data.get("section_2_exegetical_synthesis")
+    geo = section_2.get("geospatial_and_physical_geography") if isinstance(section_2, dict) else None
+    coords = geo.get("coordinates") if isinstance(geo, dict) else None
+    if not isinstance(coords, dict):
+        return None, None
+
+    def number(value):
+        return float(value) if isinstance(value, (int, float)) and not isinstance(value, bool) else None
+
+    return number(coords.get("lat")), number(coords.get("long"))
+
+
+def _tag_rows(ordinal: int, verse_data: Dict[str, Any]) -> List[Tuple[int, str, str, str]]:
+    """Flatten tags ({tier: {category: [values]}}) into verse_tags rows."""
+    tags = verse_data.get("tags")
+    if not isinstance(tags, dict):
+        return []
+
+    rows = []
+    for tier, categories in tags.items():
+        if isinstance(categories, dict):
+            items = categories.items()
+        else:
+            items = [("", categories)]
+
+        for category, values in items:
+            if not isinstance(values, list):
+                values = [values]
+            for value in values:
+                if isinstance(value, dict):
+                    value = value.get("name") or value.get("place")
+                if value not in (None, ""):
+                    rows.append((ordinal, tier, category, str(value)))
+    return rows
+
+
+class VerseStore:
+    """SQLite verse store with a query API"""
+
+    def __init__(self, db_path: Optional[Path] = None, clock: Callable[[], float] = time.time):
+        """
+        Open (or create) a store.
+
+        Args:
+            db_path: Store database (default: get_verse_store_path())
+            clock: Wall-clock source for updated_at
+        """
+        self.db_path = db_path or get_verse_store_path()
+        self.clock = clock
+        self._schema_ready = False
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection (one per call, so the store is thread-safe)."""
+        if not self._schema_ready:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        conn = sqlite3.connect(str(self.db_path), timeout=DB_LOCK_TIMEOUT, isolation_level=None)
+
+        if not self._schema_ready:
+            conn.executescript(_SCHEMA)
+            self._schema_ready = True
+        return conn
+
+    def put_many(self, records: Iterable[VerseRecord]) -> int:
+        """
+        Insert or replace verses in a single transaction.
+
+        Either every record is stored or (on error) none are.
+
+        Args:
+            records: (book, chapter, verse, verse_data) tuples
+
+        Returns:
+            Number of verses stored
+
+        Raises:
+            ValueError: If a verse reference is invalid
+        """
+        rows = []
+        tag_rows = []
+        now = self.clock()
+        for book, chapter, verse, verse_data in records:
+            ordinal = get_verse_ordinal(book, chapter, verse)
+            if ordinal is None:
+                raise ValueError(f"Invalid verse reference: {book} {chapter}:{verse}")
+
+            book_info = get_book_info(book)
+            lat, long = _coordinates(verse_data)
+            verse_id = verse_data.get("verse_id")
+            rows.append((
+                ordinal, verse_id if isinstance(verse_id, str) else None,
+                book_info["testament"], book_info["name"], chapter, verse, lat, long,
+                json.dumps(verse_data, ensure_ascii=False, separators=(',', ':')), now
+            ))
+            tag_rows.extend(_tag_rows(ordinal, verse_data))
+
+        if not rows:
+            return 0
+
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.executemany("DELETE FROM verse_tags WHERE ordinal = ?", [(row[0],) for row in rows])
+            conn.executemany(
+                "INSERT OR REPLACE INTO verses "
+                "(ordinal, verse_id, testament, book, chapter, verse, lat, long, data, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows
+            )
+            conn.executemany(
+                "INSERT INTO verse_tags (ordinal, tier, category, value) VALUES (?, ?, ?, ?)",
+                tag_rows
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+        return len(rows)
+
+    def put(self, book: str, chapter: int, verse: int, verse_data: Dict[str, Any]) -> None:
+        """
+        Insert or replace one verse.
+
+        Args:
+            book: Book name
+            chapter: Chapter number
+            verse: Verse number
+            verse_data: Complete verse exegesis data
+        """
+        self.put_many([(book, chapter, verse, verse_data)])
+
+    def get(self, book: str, chapter: int, verse: int) -> Optional[Dict[str, Any]]:
+        """
+        Get one verse.
+
+        Args:
+            book: Book name
+            chapter: Chapter number
+            verse: Verse number
+
+        Returns:
+            Verse data dictionary, or None if not stored
+        """
+        ordinal = get_verse_ordinal(book, chapter, verse)
+        if ordinal is None:
+            return None
+
+        conn = self._connect()
+        try:
+            row = conn.execute("SELECT data FROM verses WHERE ordinal = ?", (ordinal,)).fetchone()
+        finally:
+            conn.close()
+        return json.loads(row[0]) if row else None
+
+    def get_by_id(self, verse_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get one verse by its verse_id (e.g. "ACTS-10-1").
+
+        Args:
+            verse_id: Verse identifier
+
+        Returns:
+            Verse data dictionary, or None if not stored
+        """
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                "SELECT data FROM verses WHERE verse_id = ? ORDER BY ordinal LIMIT 1", (verse_id,)
+            ).fetchone()
+        finally:
+            conn.close()
+        return json.loads(row[0]) if row else None
+
+    def get_range(
+        self,
+        book: str,
+        first_chapter: int = 1,
+        last_chapter: Optional[int] = None,
+        first_verse: int = 1,
+        last_verse: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Range scan over a book: a whole book, a chapter span or a verse span.
+
+        The span runs from first_chapter:first_verse to
+        last_chapter:last_verse inclusive.
+
+        Args:
+            book: Book name
+            first_chapter: First chapter of the span
+            last_chapter: Last chapter (default: end of book)
+            first_verse: First verse within first_chapter
+            last_verse: Last verse within last_chapter (default: end of chapter)
+
+        Returns:
+            Verse data dictionaries in canonical order
+
+        Raises:
+            ValueError: If the book is unknown
+        """
+        book_info = get_book_info(book)
+        if book_info is None:
+            raise ValueError(f"Unknown book: {book}")
+
+        last_chapter = last_chapter if last_chapter is not None else book_info["chapters"]
+        last_verse = last_verse if last_verse is not None else 10_000
+
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                """SELECT data FROM verses
+                   WHERE book = ? AND chapter BETWEEN ? AND ?
+                     AND (chapter > ? OR verse >= ?)
+                     AND (chapter < ? OR verse <= ?)
+                   ORDER BY ordinal""",
+                (book_info["name"], first_chapter, last_chapter,
+                 first_chapter, first_verse, last_chapter, last_verse)
+            ).fetchall()
+        finally:
+            conn.close()
+        return [json.loads(data) for (data,) in rows]
+
+    def query(
+        self,
+        testament: Optional[str] = None,
+        book: Optional[str] = None,
+        chapter: Optional[int] = None,
+        tier: Optional[str] = None,
+        category: Optional[str] = None,
+        tag: Optional[str] = None,
+        has_coordinates: Optional[bool] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Find verses by extracted columns, without loading their JSON.
+
+        Args:
+            testament: "OT" or "NT"
+            book: Book name
+            chapter: Chapter number (with book)
+            tier: Tag tier (e.g. "tier_1_foundational_theology")
+            category: Tag category (e.g. "soteriology")
+            tag: Tag value (e.g. "grace")
+            has_coordinates: Only verses with (True) or without (False) coordinates
+
+        Returns:
+            Dicts with verse_id, testament, book, chapter, verse, lat and
+            long, in canonical order
+        """
+        conditions = []
+        params: List[Any] = []
+
+        if testament is not None:
+            conditions.append("testament = ?")
+            params.append(testament.upper())
+        if book is not None:
+            book_info = get_book_info(book)
+            conditions.append("book = ?")
+            params.append(book_info["name"] if book_info else book)
+        if chapter is not None:
+            conditions.append("chapter = ?")
+            params.append(chapter)
+        if has_coordinates is not None:
+            conditions.append("lat IS NOT NULL AND long IS NOT NULL" if has_coordinates
+                              else "(lat IS NULL OR long IS NULL)")
+
+        tag_conditions = []
+        for column, value in (("tier", tier), ("category", category), ("value", tag)):
+            if value is not None:
+                tag_conditions.append(f"{column} = ?")
+                params.append(value)
+        if tag_conditions:
+            conditions.append(
+                f"ordinal IN (SELECT ordinal FROM verse_tags WHERE {' AND '.join(tag_conditions)})"
+            )
+
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                f"SELECT {', '.join(_SUMMARY_COLUMNS)} FROM verses {where} ORDER BY ordinal",
+                params
+            ).fetchall()
+        finally:
+            conn.close()
+        return [dict(zip(_SUMMARY_COLUMNS, row)) for row in rows]
+
+    def count(self) -> int:
+        """Number of stored verses."""
+        conn = self._connect()
+        try:
+            (count,) = conn.execute("SELECT COUNT(*) FROM verses").fetchone()
+        finally:
+            conn.close()
+        return count
+
+    def import_tree(self, base_path: Path, batch_size: int = 500) -> int:
+        """
+        Load every verse file under base_path/data into the store.
+
+        Files whose path is not a valid verse reference are skipped.
+
+        Args:
+            base_path: Base project directory
+            batch_size: Verses per transaction
+
+        Returns:
+            Number of verses stored
+        """
+        total = 0
+        batch: List[VerseRecord] = []
+        for testament in ("OT", "NT"):
+            testament_dir = base_path / "data" / testament
+            if not testament_dir.is_dir():
+                continue
+            for path in sorted(testament_dir.glob("*/*/*.json")):
+                try:
+                    book, chapter, verse = path.parent.parent.name, int(path.parent.name), int(path.stem)
+                except ValueError:
+                    continue
+                if get_verse_ordinal(book, chapter, verse) is None:
+                    continue
+
+                with open(path, 'r', encoding='utf-8') as f:
+                    batch.append((book, chapter, verse, json.load(f)))
+                if len(batch) >= batch_size:
+                    total += self.put_many(batch)
+                    batch = []
+
+        return total + self.put_many(batch)
+
+
+class VerseBatchWriter:
+    """Buffers verse writes and commits them in batches"""
+
+    def __init__(self, store: VerseStore, batch_size: int = DEFAULT_BATCH_SIZE):
+        """
+        Args:
+            store: Destination store (or anything with a put_many, such as
+                data_writer.PackedVerseSink)
+            batch_size: Verses per transaction
+        """
+        self.store = store
+        self.batch_size = max(1, batch_size)
+        self._pending: List[PendingVerse] = []
+        self._lock = threading.Lock()
+
+    def add(
+        self,
+        book: str,
+        chapter: int,
+        verse: int,
+        verse_data: Dict[str, Any],
+        on_commit: Optional[Callable[[bool], None]] = None
+    ) -> bool:
+        """
+        Queue a verse, committing the batch once it is full.
+
+        A queued verse is not durable yet: on_commit is called with True
+        once its batch commits, or with False if it is dropped by
+        fail_pending(). A failed commit keeps the batch queued for retry.
+
+        Args:
+            book: Book name
+            chapter: Chapter number
+            verse: Verse number
+            verse_data: Complete verse exegesis data
+            on_commit: Called with the verse's outcome (not called if
+                the verse is rejected)
+
+        Returns:
+            True if queued, False if the reference is invalid
+        """
+        if get_verse_ordinal(book, chapter, verse) is None:
+            return False
+
+        with self._lock:
+            self._pending.append(((book, chapter, verse, verse_data), on_commit))
+            if len(self._pending) < self.batch_size:
+                return True
+            committed = self._flush_locked()
+
+        _notify(committed, True)
+        return True
+
+    def flush(self) -> bool:
+        """
+        Commit all queued verses in one transaction.
+
+        Returns:
+            True if committed (or nothing was queued), False on error
+        """
+        with self._lock:
+            committed = self._flush_locked()
+
+        _notify(committed, True)
+        return committed is not None
+
+    def fail_pending(self) -> int:
+        """
+        Drop all queued verses, reporting each as failed to its on_commit.
+
+        Returns:
+            Number of verses dropped
+        """
+        with self._lock:
+            dropped, self._pending = self._pending, []
+
+        _notify(dropped, False)
+        return len(dropped)
+
+    def _flush_locked(self) -> Optional[List[PendingVerse]]:
+        """Commit the queue; returns the committed entries, or None on error."""
+        batch, self._pending = self._pending, []
+        try:
+            self.store.put_many(record for record, _ in batch)
+            return batch
+        except (sqlite3.Error, OSError, ValueError):
+            # Keep the batch so a later flush can retry it
+            self._pending = batch + self._pending
+            return None
+
+    @property
+    def pending(self) -> int:
+        """Number of queued, uncommitted verses."""
+        with self._lock:
+            return len(self._pending)
+
+
+def _notify(entries: Optional[List[PendingVerse]], success: bool) -> None:
+    """Report the outcome to each entry's on_commit (called outside the writer lock)."""
+    for _, on_commit in entries or []:
+        if on_commit is not None:
+            on_commit(success)
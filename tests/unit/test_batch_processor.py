@@ -175,3 +175,226 @@ class TestBatchProcessor:
 
         # Should create checkpoint for each verse
         assert mock_checkpoint.call_count >= 2
+
+    def test_process_chapter_passes_streamed_verse_text(self, mock_config):
+        """Test that process_chapter() hands pre-extracted text to each verse."""
+        from src.batch_processor import process_chapter
+
+        with patch('src.batch_processor.get_verse_count', return_value=2):
+            with patch('src.batch_processor.extract_chapter_verses', return_value={1: "text one"}) as mock_extract:
+                with patch('src.batch_processor.process_verse', return_value=True) as mock_process:
+                    process_chapter("Genesis", 1, mock_config)
+
+        mock_extract.assert_called_once_with("Genesis", 1, mock_config["oshb_path"], mock_config["sblgnt_path"])
+        assert mock_process.call_args_list[0].kwargs["verse_text"] == "text one"
+        assert mock_process.call_args_list[1].kwargs["verse_text"] is None
+
+    def test_process_chapter_batches_consecutive_verses(self, mock_config):
+        """Test that batch mode sends consecutive verses together and checkpoints each."""
+        from src.batch_processor import process_chapter
+
+        mock_config["batch_size"] = 3
+        texts = {1: "one", 2: "two", 3: "three", 4: "four", 6: "six"}
+
+        def fake_batch(book, chapter, verse_texts, config, on_commit=None):
+            return {verse: verse != 2 for verse in verse_texts}
+
+        with patch('src.batch_processor.get_verse_count', return_value=6):
+            with patch('src.batch_processor.extract_chapter_verses', return_value=texts):
+                with patch('src.batch_processor.process_verse_batch', side_effect=fake_batch) as mock_batch:
+                    with patch('src.batch_processor.process_verse', return_value=True) as mock_process:
+                        with patch('src.batch_processor.create_checkpoint') as mock_checkpoint:
+                            result = process_chapter("Genesis", 1, mock_config)
+
+        assert [call.args[2] for call in mock_batch.call_args_list] == [{1: "one", 2: "two", 3: "three"}]
+        assert [call.args[2] for call in mock_process.call_args_list] == [4, 5, 6]
+        assert result == {"total": 6, "successful": 5, "failed": 1}
+        assert [call.args[0]["verse"] for call in mock_checkpoint.call_args_list] == [1, 2, 3, 4, 5, 6]
+
+    def test_process_verse_batch_saves_each_verse(self, mock_config):
+        """Test that each verse of a batch is validated and written on its own."""
+        from src.batch_processor import process_verse_batch
+
+        generated = {1: {"verse_id": "GEN-1-1"}, 2: None}
+
+        with patch('src.batch_processor.generate_batch_exegesis', return_value=generated) as mock_generate:
+            with patch('src.batch_processor.validate_verse_json', return_value=True):
+                with patch('src.batch_processor.write_verse_json', return_value=True) as mock_write:
+                    result = process_verse_batch("Genesis", 1, {1: "one", 2: "two"}, mock_config)
+
+        assert result == {1: True, 2: False}
+        assert mock_generate.call_args.args[7] == mock_config["base_path"] / "schemas" / "verse_schema.json"
+        mock_write.assert_called_once()
+
+    def test_process_chapter_async_keeps_verses_in_flight(self, mock_config):
+        """Test that process_chapter_async() overlaps API requests up to the cap."""
+        import asyncio
+        from src.batch_processor import process_chapter_async
+        from src.gemini_client import AsyncGeminiClient
+        from tests.unit.test_gemini_client import FakeAsyncModel
+
+        fake = FakeAsyncModel()
+        client = AsyncGeminiClient("test_key", max_concurrency=3, model=fake)
+
+        with patch('src.batch_processor.get_verse_count', return_value=6):
+            with patch('src.batch_processor.extract_chapter_verses', return_value={n: f"text {n}" for n in range(1, 7)}):
+                with patch('src.exegesis_generator.build_exegesis_prompt', return_value="prompt"):
+                    with patch('src.batch_processor.validate_verse_json', return_value=True):
+                        with patch('src.batch_processor.write_verse_json', return_value=True):
+                            results = asyncio.run(process_chapter_async("Genesis", 1, mock_config, client=client))
+
+        assert results == {"total": 6, "successful": 6, "failed": 0}
+        assert fake.max_in_flight == 3
+
+    def test_process_chapter_async_checkpoints_in_verse_order(self, mock_config):
+        """Test that checkpoints advance in verse order even if verses finish out of order."""
+        import asyncio
+        from src.batch_processor import process_chapter_async
+
+        async def finish_out_of_order(book, chapter, verse, config, verse_text=None, client=None, on_commit=None):
+            await asyncio.sleep(0.01 * (4 - verse))
+            return verse != 2
+
+        with patch('src.batch_processor.get_verse_count', return_value=3):
+            with patch('src.batch_processor.extract_chapter_verses', return_value={}):
+                with patch('src.batch_processor.aprocess_verse', side_effect=finish_out_of_order):
+                    with patch('src.batch_processor.create_checkpoint') as mock_checkpoint:
+                        results = asyncio.run(process_chapter_async("Genesis", 1, mock_config, client=MagicMock()))
+
+        checkpoints = [call.args[0] for call in mock_checkpoint.call_args_list]
+        assert [c["verse"] for c in checkpoints] == [1, 2, 3]
+        assert [c["completed"] for c in checkpoints] == [True, False, True]
+        assert results == {"total": 3, "successful": 2, "failed": 1}
+
+    def test_process_chapter_async_counts_verse_exception_and_flushes(self, mock_config):
+        """Test that one crashing verse fails alone and queued verses are still committed."""
+        import asyncio
+        from src.batch_processor import process_chapter_async
+
+        async def crash_on_two(book, chapter, verse, config, verse_text=None, client=None, on_commit=None):
+            if verse == 2:
+                raise RuntimeError("store flush failed")
+            return True
+
+        with patch('src.batch_processor.get_verse_count', return_value=3):
+            with patch('src.batch_processor.extract_chapter_verses', return_value={}):
+                with patch('src.batch_processor.aprocess_verse', side_effect=crash_on_two):
+                    with patch('src.batch_processor.flush_verse_writer') as mock_flush:
+                        results = asyncio.run(process_chapter_async("Genesis", 1, mock_config, client=MagicMock()))
+
+        assert results == {"total": 3, "successful": 2, "failed": 1}
+        mock_flush.assert_called_once_with(mock_config)
+
+    def test_aprocess_verse_writes_off_the_event_loop(self, mock_config):
+        """Test that validation and the write run in a worker thread."""
+        import asyncio
+        import threading
+        from src.batch_processor import aprocess_verse
+
+        loop_thread = threading.get_ident()
+        write_threads = []
+
+        async def fake_generate(*args, **kwargs):
+            return {"verse_id": "GEN-1-1"}
+
+        def fake_write(*args, **kwargs):
+            write_threads.append(threading.get_ident())
+            return True
+
+        with patch('src.batch_processor.agenerate_verse_exegesis', side_effect=fake_generate):
+            with patch('src.batch_processor.validate_verse_json', return_value=True):
+                with patch('src.batch_processor.write_verse_json', side_effect=fake_write):
+                    assert asyncio.run(aprocess_verse("Genesis", 1, 1, mock_config)) is True
+
+        assert write_threads and write_threads[0] != loop_thread
+
+    def test_process_chapter_with_workers_runs_in_parallel(self, mock_config):
+        """Test that workers > 1 overlaps verse processing."""
+        import threading
+        import time
+        from src.batch_processor import process_chapter
+
+        lock = threading.Lock()
+        active = {"now": 0, "max": 0}
+
+        def slow_verse(book, chapter, verse, config, verse_text=None, on_commit=None):
+            with lock:
+                active["now"] += 1
+                active["max"] = max(active["max"], active["now"])
+            time.sleep(0.02)
+            with lock:
+                active["now"] -= 1
+            return verse != 3
+
+        with patch('src.batch_processor.get_verse_count', return_value=8):
+            with patch('src.batch_processor.extract_chapter_verses', return_value={}):
+                with patch('src.batch_processor.process_verse', side_effect=slow_verse):
+                    with patch('src.batch_processor.create_checkpoint'):
+                        results = process_chapter("Genesis", 1, mock_config, workers=4)
+
+        assert results == {"total": 8, "successful": 7, "failed": 1}
+        assert active["max"] > 1
+
+    def test_process_chapter_with_workers_checkpoints_in_order(self, mock_config):
+        """Test that checkpoints stay in verse order under parallel completion."""
+        import time
+        from src.batch_processor import process_chapter
+
+        def reversed_finish(book, chapter, verse, config, verse_text=None, on_commit=None):
+            time.sleep(0.01 * (6 - verse))
+            return True
+
+        with patch('src.batch_processor.get_verse_count', return_value=5):
+            with patch('src.batch_processor.extract_chapter_verses', return_value={}):
+                with patch('src.batch_processor.process_verse', side_effect=reversed_finish):
+                    with patch('src.batch_processor.create_checkpoint') as mock_checkpoint:
+                        process_chapter("Genesis", 1, mock_config, start_verse=2, workers=4)
+
+        assert [call.args[0]["verse"] for call in mock_checkpoint.call_args_list] == [2, 3, 4, 5]
+
+    def test_process_chapter_counts_verse_exception_as_failure(self, mock_config):
+        """Test that one crashing verse does not stop the rest of the chapter."""
+        from src.batch_processor import process_chapter
+
+        def crash_on_two(book, chapter, verse, config, verse_text=None, on_commit=None):
+            if verse == 2:
+                raise RuntimeError("boom")
+            return True
+
+        with patch('src.batch_processor.get_verse_count', return_value=3):
+            with patch('src.batch_processor.extract_chapter_verses', return_value={}):
+                with patch('src.batch_processor.process_verse', side_effect=crash_on_two):
+                    with patch('src.batch_processor.create_checkpoint'):
+                        results = process_chapter("Genesis", 1, mock_config, workers=2)
+
+        assert results == {"total": 3, "successful": 2, "failed": 1}
+
+    def test_process_book_spans_chapters(self, mock_config):
+        """Test that process_book() covers every verse from the start point."""
+        from src.batch_processor import process_book
+
+        verse_counts = {1: 3, 2: 2, 3: 4}
+        streamed = [(1, 1, "one", []), (2, 1, "two", []), (3, 4, "three", [])]
+
+        with patch('src.batch_processor.get_book_info', return_value={"chapters": 3}):
+            with patch('src.batch_processor.get_verse_count', side_effect=lambda book, chapter: verse_counts[chapter]):
+                with patch('src.batch_processor.iter_book_verses', return_value=iter(streamed)):
+                    with patch('src.batch_processor.process_verse', return_value=True) as mock_process:
+                        with patch('src.batch_processor.create_checkpoint') as mock_checkpoint:
+                            results = process_book("Ruth", mock_config, start_chapter=2, start_verse=2, workers=3)
+
+        processed = sorted((call.args[1], call.args[2]) for call in mock_process.call_args_list)
+        assert processed == [(2, 2), (3, 1), (3, 2), (3, 3), (3, 4)]
+        assert results == {"total": 5, "successful": 5, "failed": 0}
+
+        last = mock_checkpoint.call_args_list[-1].args[0]
+        assert (last["chapter"], last["verse"]) == (3, 4)
+
+        texts = {(call.args[1], call.args[2]): call.kwargs["verse_text"] for call in mock_process.call_args_list}
+        assert texts[(3, 4)] == "three"
+
+    def test_process_book_unknown_book(self, mock_config):
+        """Test that unknown books produce empty results."""
+        from src.batch_processor import process_book
+
+        assert process_book("Nonexistent", mock_config) == {"total": 0, "successful": 0, "failed": 0}
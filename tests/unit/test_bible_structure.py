@@ -243,3 +243,36 @@ class TestBibleStructure:
 
         # Romans 8 is important - Romans 8 should have 39 verses
         assert get_verse_count("Romans", 8) == 39
+
+
+@pytest.mark.unit
+class TestVerseOrdinal:
+    """Test canonical verse ordinals"""
+
+    def test_first_and_last_verse(self):
+        """Ordinals span 0 to 31,101 in canonical order"""
+        from src.bible_structure import get_verse_ordinal
+
+        assert get_verse_ordinal("Genesis", 1, 1) == 0
+        assert get_verse_ordinal("Revelation", 22, 21) == 31101
+
+    def test_ordinals_follow_get_all_verses(self):
+        """Ordinal matches position in get_all_verses()"""
+        from src.bible_structure import get_verse_ordinal, get_all_verses
+
+        for ordinal, (book, chapter, verse) in enumerate(get_all_verses()):
+            if ordinal % 997 == 0:
+                assert get_verse_ordinal(book, chapter, verse) == ordinal
+
+    def test_case_insensitive(self):
+        """Book lookup ignores case"""
+        from src.bible_structure import get_verse_ordinal
+
+        assert get_verse_ordinal("acts", 10, 1) == get_verse_ordinal("Acts", 10, 1)
+
+    def test_invalid_reference_returns_none(self):
+        """Invalid references have no ordinal"""
+        from src.bible_structure import get_verse_ordinal
+
+        assert get_verse_ordinal("Genesis", 1, 32) is None
+        assert get_verse_ordinal("InvalidBook", 1, 1) is None
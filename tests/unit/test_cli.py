@@ -184,3 +184,35 @@ class TestCLI:
         required_keys = ["base_path", "oshb_path", "sblgnt_path", "api_key", "study_prompt_path"]
         for key in required_keys:
             assert key in config
+
+    def test_generate_chapter_cache_flag_enables_cache(self, runner):
+        """Test that --cache attaches the response cache and reports hit rate."""
+        from src.cli import cli
+
+        results = {"total": 2, "successful": 2, "failed": 0}
+        cache = MagicMock()
+        cache.stats.return_value = {
+            "entries": 2, "bytes": 4096, "hits": 2, "misses": 0,
+            "hit_rate": 1.0, "session_hits": 2, "session_misses": 0
+        }
+
+        with patch('src.cli.load_config', return_value={}):
+            with patch('src.cli.open_response_cache', return_value=cache):
+                with patch('src.cli.process_chapter', return_value=results) as mock_process:
+                    result = runner.invoke(cli, ['generate-chapter', 'Genesis', '1', '--cache'])
+
+        assert mock_process.call_args[0][2]["response_cache"] is cache
+        assert "2/2 hits" in result.output
+
+    def test_generate_book_command_passes_workers(self, runner):
+        """Test that generate-book runs process_book with the worker count."""
+        from src.cli import cli
+
+        results = {"total": 85, "successful": 85, "failed": 0}
+
+        with patch('src.cli.load_config', return_value={}):
+            with patch('src.cli.process_book', return_value=results) as mock_process:
+                result = runner.invoke(cli, ['generate-book', 'Ruth', '--workers', '4'])
+
+        assert mock_process.call_args.kwargs["workers"] == 4
+        assert "85" in result.output
@@ -0,0 +1,282 @@
+"""
+Unit tests for corpus_index module.
+Tests the pre-compiled verse-keyed indexes over the source texts.
+"""
+
+import pytest
+import os
+import shutil
+from pathlib import Path
+
+
+class TestOSHBIndex:
+    """Test suite for the compiled OSHB index."""
+
+    @pytest.fixture
+    def oshb_dir(self, tmp_path):
+        """OSHB directory layout with the sample book as wlc/Gen.xml."""
+        wlc_dir = tmp_path / "morphhb" / "wlc"
+        wlc_dir.mkdir(parents=True)
+        sample_path = Path(__file__).parent.parent / "fixtures" / "oshb_sample.xml"
+        shutil.copy(sample_path, wlc_dir / "Gen.xml")
+        return tmp_path / "morphhb"
+
+    def test_get_oshb_index_path_for_directory(self, oshb_dir):
+        """Test that the index for a directory lives inside it."""
+        from src.corpus_index import get_oshb_index_path
+
+        assert get_oshb_index_path(oshb_dir) == oshb_dir / "oshb_index.sqlite"
+
+    def test_get_oshb_index_path_for_file(self, oshb_dir):
+        """Test that the index for a single file sits next to it."""
+        from src.corpus_index import get_oshb_index_path
+
+        xml_file = oshb_dir / "wlc" / "Gen.xml"
+
+        assert get_oshb_index_path(xml_file) == oshb_dir / "wlc" / "Gen.index.sqlite"
+
+    def test_compile_oshb_index_creates_file(self, oshb_dir):
+        """Test that compile_oshb_index() writes the index file."""
+        from src.corpus_index import compile_oshb_index
+
+        index_path = compile_oshb_index(oshb_dir)
+
+        assert index_path.exists()
+        assert not index_path.with_suffix(".tmp").exists()
+
+    def test_compile_oshb_index_missing_sources_raises(self, tmp_path):
+        """Test that compiling without any XML files raises."""
+        from src.corpus_index import compile_oshb_index
+
+        with pytest.raises(FileNotFoundError):
+            compile_oshb_index(tmp_path)
+
+    def test_index_text_matches_xml_extraction(self, oshb_dir):
+        """Test that indexed text is identical to the XML parsing path."""
+        from src.corpus_index import compile_oshb_index, open_oshb_index
+        from src.verse_extractor import extract_hebrew_verse
+
+        compile_oshb_index(oshb_dir)
+        index = open_oshb_index(oshb_dir)
+
+        for chapter, verse in [(1, 1), (1, 2), (2, 1)]:
+            expected = extract_hebrew_verse("Genesis", chapter, verse, oshb_dir, use_index=False)
+            assert index.get_text(f"Gen.{chapter}.{verse}") == expected
+
+    def test_index_words_include_lemma_and_morph(self, oshb_dir):
+        """Test that words keep their lemma and morph attributes in order."""
+        from src.corpus_index import compile_oshb_index, open_oshb_index
+
+        compile_oshb_index(oshb_dir)
+        words = open_oshb_index(oshb_dir).get_words("Gen.1.1")
+
+        assert len(words) == 7
+        assert words[0] == {"text": "בְּרֵאשִׁ֖ית", "lemma": "c/d/b/7225", "morph": "HR/Td/Ncfsa"}
+        assert words[2]["lemma"] == "430"
+
+    def test_index_missing_verse_returns_none(self, oshb_dir):
+        """Test that unknown verses are not found."""
+        from src.corpus_index import compile_oshb_index, open_oshb_index
+
+        compile_oshb_index(oshb_dir)
+        index = open_oshb_index(oshb_dir)
+
+        assert index.get_text("Gen.999.1") is None
+        assert index.get_words("Gen.999.1") == []
+
+    def test_open_oshb_index_without_index_returns_none(self, oshb_dir):
+        """Test that open_oshb_index() returns None before compiling."""
+        from src.corpus_index import open_oshb_index
+
+        assert open_oshb_index(oshb_dir) is None
+
+    def test_open_oshb_index_reuses_handle(self, oshb_dir):
+        """Test that repeated opens share one index handle."""
+        from src.corpus_index import compile_oshb_index, open_oshb_index
+
+        compile_oshb_index(oshb_dir)
+
+        assert open_oshb_index(oshb_dir) is open_oshb_index(oshb_dir)
+
+    def test_stale_index_is_ignored(self, oshb_dir):
+        """Test that an index is not used after its source file changes."""
+        from src.corpus_index import compile_oshb_index, open_oshb_index
+
+        index_path = compile_oshb_index(oshb_dir)
+        xml_file = oshb_dir / "wlc" / "Gen.xml"
+        stat = xml_file.stat()
+        os.utime(xml_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        # Drop any handle cached by other tests for this path
+        from src.corpus_index import _close_cached_index
+        _close_cached_index(index_path)
+
+        assert open_oshb_index(oshb_dir) is None
+
+    def test_index_freshness_is_rechecked_only_on_change(self, oshb_dir):
+        """Test that a cached index (or stale verdict) follows source and index changes."""
+        from src.corpus_index import compile_oshb_index, open_oshb_index, OSHBIndex
+        from unittest.mock import patch
+
+        compile_oshb_index(oshb_dir)
+        xml_file = oshb_dir / "wlc" / "Gen.xml"
+        assert open_oshb_index(oshb_dir) is not None
+
+        stat = xml_file.stat()
+        os.utime(xml_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert open_oshb_index(oshb_dir) is None
+
+        with patch.object(OSHBIndex, "is_stale", side_effect=AssertionError("rechecked")):
+            assert open_oshb_index(oshb_dir) is None
+
+        compile_oshb_index(oshb_dir)
+        assert open_oshb_index(oshb_dir) is not None
+
+    def test_extract_hebrew_verse_uses_index(self, oshb_dir):
+        """Test that extract_hebrew_verse() reads from the index when present."""
+        from src.corpus_index import compile_oshb_index
+        from src.verse_extractor import extract_hebrew_verse
+        from unittest.mock import patch
+
+        compile_oshb_index(oshb_dir)
+
+        with patch("src.verse_extractor.etree.parse") as mock_parse:
+            result = extract_hebrew_verse("Genesis", 1, 1, oshb_dir)
+
+        mock_parse.assert_not_called()
+        assert "בְּרֵאשִׁ֖ית" in result
+
+    def test_extract_hebrew_verse_index_strips_marks(self, oshb_dir):
+        """Test that strip_marks gives the same result through the index."""
+        from src.corpus_index import compile_oshb_index
+        from src.verse_extractor import extract_hebrew_verse
+
+        expected = extract_hebrew_verse("Genesis", 1, 1, oshb_dir, strip_marks=True)
+        compile_oshb_index(oshb_dir)
+
+        assert extract_hebrew_verse("Genesis", 1, 1, oshb_dir, strip_marks=True) == expected
+
+
+class TestSBLGNTIndex:
+    """Test suite for the SBLGNT byte-offset index."""
+
+    @pytest.fixture
+    def morphgnt_file(self, tmp_path):
+        """Space-delimited MorphGNT sample copied to a temp directory."""
+        sample_path = Path(__file__).parent.parent / "fixtures" / "sblgnt_sample.txt"
+        target = tmp_path / "sblgnt.txt"
+        shutil.copy(sample_path, target)
+        return target
+
+    @pytest.fixture
+    def tab_file(self, tmp_path):
+        """Tab-delimited Faithlife/SBLGNT sample."""
+        target = tmp_path / "Acts.txt"
+        target.write_text(
+            "# SBLGNT Acts\n"
+            "Acts 10:43\tτούτῳ πάντες οἱ προφῆται μαρτυροῦσιν\n"
+            "Acts 10:44\tἜτι λαλοῦντος τοῦ Πέτρου τὰ ῥήματα ταῦτα\n",
+            encoding="utf-8"
+        )
+        return target
+
+    def test_build_sblgnt_index_records_offsets(self, tab_file):
+        """Test that tab-delimited verses map to the byte range of their text."""
+        from src.corpus_index import build_sblgnt_index
+
+        index_data = build_sblgnt_index(tab_file)
+        offset, length, layout = index_data["entries"]["Acts 10:44"]
+
+        raw = tab_file.read_bytes()[offset:offset + length].decode("utf-8")
+        assert raw.strip() == "Ἔτι λαλοῦντος τοῦ Πέτρου τὰ ῥήματα ταῦτα"
+        assert layout == "tab"
+
+    def test_build_sblgnt_index_spans_morphgnt_lines(self, morphgnt_file):
+        """Test that a MorphGNT verse covers all of its word lines."""
+        from src.corpus_index import build_sblgnt_index
+
+        index_data = build_sblgnt_index(morphgnt_file)
+        offset, length, layout = index_data["entries"]["44.10.44"]
+
+        assert offset == 0
+        assert length == morphgnt_file.stat().st_size
+        assert layout == "morphgnt"
+
+    def test_tab_lookup_returns_verse_text(self, tab_file):
+        """Test lookups in the tab-delimited layout."""
+        from src.corpus_index import open_sblgnt_index
+
+        index = open_sblgnt_index(tab_file)
+
+        assert index.get_text("Acts 10:43") == "τούτῳ πάντες οἱ προφῆται μαρτυροῦσιν"
+        assert index.get_text("Acts 10:99") is None
+
+    def test_morphgnt_lookup_joins_words(self, morphgnt_file):
+        """Test that MorphGNT lookups join every word of the verse."""
+        from src.corpus_index import open_sblgnt_index
+
+        text = open_sblgnt_index(morphgnt_file).get_text("44.10.44")
+
+        assert text.startswith("Πέτρος ἔτι λαλοῦντος")
+        assert text.endswith("τὸν λόγον")
+        assert len(text.split()) == 17
+
+    def test_index_is_persisted_next_to_file(self, tab_file):
+        """Test that the offset index is written once and reused."""
+        from src.corpus_index import open_sblgnt_index, get_sblgnt_index_path
+        from unittest.mock import patch
+
+        open_sblgnt_index(tab_file)
+        assert get_sblgnt_index_path(tab_file).exists()
+
+        # A fresh process (empty handle cache) loads the stored offsets
+        with patch.dict("src.corpus_index._sblgnt_indexes", clear=True):
+            with patch("src.corpus_index.build_sblgnt_index") as mock_build:
+                open_sblgnt_index(tab_file)
+
+        mock_build.assert_not_called()
+
+    def test_index_rebuilt_when_content_changes(self, tab_file):
+        """Test that changing the file invalidates the offsets."""
+        from src.corpus_index import open_sblgnt_index
+
+        open_sblgnt_index(tab_file)
+        tab_file.write_text("Acts 10:44\tνέον κείμενον\n", encoding="utf-8")
+
+        assert open_sblgnt_index(tab_file).get_text("Acts 10:44") == "νέον κείμενον"
+
+    def test_touched_file_with_same_hash_reuses_index(self, tab_file):
+        """Test that an mtime-only change is resolved by the content hash."""
+        from src.corpus_index import open_sblgnt_index
+        from unittest.mock import patch
+
+        open_sblgnt_index(tab_file)
+        stat = tab_file.stat()
+        os.utime(tab_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        with patch.dict("src.corpus_index._sblgnt_indexes", clear=True):
+            with patch("src.corpus_index.build_sblgnt_index") as mock_build:
+                index = open_sblgnt_index(tab_file)
+
+        mock_build.assert_not_called()
+        assert index.get_text("Acts 10:44").startswith("Ἔτι")
+
+    def test_extract_greek_verse_tab_layout(self, tab_file):
+        """Test that extract_greek_verse() reads tab-delimited files via the index."""
+        from src.verse_extractor import extract_greek_verse
+
+        result = extract_greek_verse("Acts", 10, 44, tab_file)
+
+        assert result == "Ἔτι λαλοῦντος τοῦ Πέτρου τὰ ῥήματα ταῦτα"
+
+    def test_find_sblgnt_text_files(self, tmp_path, tab_file):
+        """Test discovery of per-book and combined SBLGNT text files."""
+        from src.corpus_index import find_sblgnt_text_files
+
+        text_dir = tmp_path / "data" / "sblgnt" / "text"
+        text_dir.mkdir(parents=True)
+        (text_dir / "Acts.txt").write_text("", encoding="utf-8")
+        (tmp_path / "sblgnt.txt").write_text("", encoding="utf-8")
+
+        assert find_sblgnt_text_files(tmp_path) == [tmp_path / "data" / "sblgnt" / "text" / "Acts.txt", tmp_path / "sblgnt.txt"]
+        assert find_sblgnt_text_files(tab_file) == [tab_file]
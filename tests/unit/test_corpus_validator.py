@@ -0,0 +1,117 @@
+"""
+Unit tests for corpus_validator module.
+Tests bulk validation of written verse files and the validate command.
+"""
+
+import pytest
+import json
+import shutil
+from pathlib import Path
+from unittest.mock import patch
+
+
+SCHEMA_PATH = Path(__file__).parent.parent.parent / "schemas" / "verse_schema.json"
+FIXTURES = Path(__file__).parent.parent / "fixtures"
+
+
+class TestCorpusValidator:
+    """Test suite for bulk verse file validation."""
+
+    @pytest.fixture
+    def data_dir(self, tmp_path):
+        """Data tree with two valid verses, one bad one and one broken file."""
+        data_dir = tmp_path / "data"
+        for testament, book, verse, fixture in [
+            ("OT", "Genesis", "01", "valid_verse.json"),
+            ("OT", "Genesis", "02", "invalid_verse_bad_coordinates.json"),
+            ("NT", "John", "01", "valid_verse.json"),
+        ]:
+            target = data_dir / testament / book / "1" / f"{verse}.json"
+            target.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy(FIXTURES / fixture, target)
+
+        (data_dir / "NT" / "John" / "1" / "02.json").write_text("{not json", encoding='utf-8')
+        (data_dir / "notes.json").write_text("{}", encoding='utf-8')
+        return data_dir
+
+    def test_find_verse_files_only_walks_testaments(self, data_dir):
+        """Test that files outside data/OT and data/NT are ignored."""
+        from src.corpus_validator import find_verse_files
+
+        files = find_verse_files(data_dir)
+
+        assert len(files) == 4
+        assert all(path.relative_to(data_dir).parts[0] in ("OT", "NT") for path in files)
+
+    def test_check_valid_file_returns_none(self):
+        """Test that a valid verse produces no failure."""
+        from src.corpus_validator import check_verse_file
+
+        assert check_verse_file(FIXTURES / "valid_verse.json", SCHEMA_PATH) is None
+
+    def test_check_reports_schema_and_mandatory_paths(self):
+        """Test that failures list the check and error path of each problem."""
+        from src.corpus_validator import check_verse_file
+
+        failure = check_verse_file(FIXTURES / "invalid_verse_missing_field.json", SCHEMA_PATH)
+
+        checks = {error["check"] for error in failure["errors"]}
+        assert checks == {"schema", "mandatory"}
+        assert all(error["path"] and error["message"] for error in failure["errors"])
+
+    def test_check_reports_broken_json(self, data_dir):
+        """Test that unreadable files are reported rather than raising."""
+        from src.corpus_validator import check_verse_file
+
+        failure = check_verse_file(data_dir / "NT" / "John" / "1" / "02.json", SCHEMA_PATH)
+
+        assert failure["verse_id"] is None
+        assert failure["errors"][0]["check"] == "json"
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_validate_files_report(self, data_dir, workers):
+        """Test the report in-process and across a process pool."""
+        from src.corpus_validator import find_verse_files, validate_files
+
+        finished = []
+        report = validate_files(
+            find_verse_files(data_dir), SCHEMA_PATH,
+            workers=workers, chunk_size=1, on_progress=finished.append, base_dir=data_dir
+        )
+
+        assert report["checked"] == 4
+        assert report["failed"] == 2
+        assert sum(finished) == 4
+        assert [failure["file"] for failure in report["failures"]] == [
+            "NT/John/1/02.json", "OT/Genesis/1/02.json"
+        ]
+        assert any(
+            error["path"].endswith("coordinates.lat") for error in report["failures"][1]["errors"]
+        )
+
+    def test_validate_command_writes_report(self, data_dir, tmp_path):
+        """Test `validate --all` end to end."""
+        from click.testing import CliRunner
+        from src.cli import cli
+
+        report_path = tmp_path / "report.json"
+
+        with patch('src.cli.get_project_root', return_value=data_dir.parent):
+            shutil.copytree(SCHEMA_PATH.parent, data_dir.parent / "schemas")
+            result = CliRunner().invoke(cli, ['validate', '--all', '--workers', '1', '--report', str(report_path)])
+
+        report = json.loads(report_path.read_text(encoding='utf-8'))
+        assert result.exit_code == 1
+        assert report["checked"] == 4
+        assert report["failures"][1]["verse_id"] == "GEN-1-1"
+        assert "Failed: 2" in result.output
+
+    def test_validate_command_requires_files(self):
+        """Test that the command refuses to run with nothing to check."""
+        from click.testing import CliRunner
+        from src.cli import cli
+
+        result = CliRunner().invoke(cli, ['validate'])
+
+        assert result.exit_code == 1
+        assert "--all" in result.output
@@ -275,3 +275,273 @@ class TestDataWriter:
         assert result is False
         # Temp file should be cleaned up
         assert not (target_path.with_suffix('.tmp')).exists()
+
+
+class TestWriteFormats:
+    """Test suite for compact/canonical writes, hash verification and latency stats."""
+
+    @pytest.fixture
+    def sample_verse_data(self):
+        """Sample verse data with keys out of order."""
+        return {
+            "verse_id": "GEN-1-1",
+            "section_3_life_application": "Application",
+            "section_1_sacred_text": {"original_script": "בְּרֵאשִׁית"},
+        }
+
+    @pytest.mark.parametrize("fmt", ["pretty", "compact", "canonical"])
+    def test_formats_round_trip(self, tmp_path, sample_verse_data, fmt):
+        """Test that every format writes JSON equal to the input."""
+        from src.data_writer import write_verse_json, get_verse_path
+
+        assert write_verse_json("Genesis", 1, 1, sample_verse_data, tmp_path, fmt=fmt) is True
+
+        path = get_verse_path("Genesis", 1, 1, tmp_path)
+        assert json.loads(path.read_text(encoding='utf-8')) == sample_verse_data
+
+    def test_compact_has_no_whitespace(self, sample_verse_data):
+        """Test that compact output drops indentation and separators' spaces."""
+        from src.data_writer import serialize_verse
+
+        content = serialize_verse(sample_verse_data, "compact").decode('utf-8')
+
+        assert "\n" not in content
+        assert '","' in content and '":"' in content
+        assert "בְּרֵאשִׁית" in content
+
+    def test_canonical_is_key_order_independent(self, sample_verse_data):
+        """Test that canonical output is byte-identical regardless of key order."""
+        from src.data_writer import serialize_verse
+
+        reordered = dict(reversed(list(sample_verse_data.items())))
+
+        assert serialize_verse(sample_verse_data, "canonical") == serialize_verse(reordered, "canonical")
+        assert serialize_verse(sample_verse_data, "compact") != serialize_verse(reordered, "compact")
+
+    def test_unknown_format_raises(self, sample_verse_data):
+        """Test that an unknown format is rejected."""
+        from src.data_writer import serialize_verse
+
+        with pytest.raises(ValueError):
+            serialize_verse(sample_verse_data, "yaml")
+
+    def test_verify_by_hash_does_not_parse(self, tmp_path, sample_verse_data):
+        """Test that writes are verified by hash, without re-parsing JSON."""
+        from src.data_writer import write_verse_json
+
+        with patch('src.data_writer.json.load') as mock_load:
+            assert write_verse_json("Genesis", 1, 1, sample_verse_data, tmp_path, fmt="compact") is True
+
+        mock_load.assert_not_called()
+
+    def test_verify_file_hash_detects_changes(self, tmp_path):
+        """Test hash verification against a modified file."""
+        from src.data_writer import atomic_write_bytes, verify_file_hash
+
+        target = tmp_path / "verse.json"
+        digest = atomic_write_bytes(target, b'{"a":1}')
+
+        assert verify_file_hash(target, digest) is True
+        target.write_bytes(b'{"a":2}')
+        assert verify_file_hash(target, digest) is False
+        assert verify_file_hash(tmp_path / "missing.json", digest) is False
+
+    def test_fsync_flushes_file_and_directory(self, tmp_path):
+        """Test that fsync=True syncs the temp file and the parent directory."""
+        from src.data_writer import atomic_write_bytes
+
+        with patch('src.data_writer.os.fsync') as mock_fsync:
+            atomic_write_bytes(tmp_path / "verse.json", b"{}", fsync=True)
+            assert mock_fsync.call_count == 2
+
+            mock_fsync.reset_mock()
+            atomic_write_bytes(tmp_path / "verse.json", b"{}")
+            mock_fsync.assert_not_called()
+
+    def test_write_stats_record_latency(self, tmp_path, sample_verse_data):
+        """Test that each write adds to the latency statistics."""
+        from src.data_writer import write_verse_json, get_write_stats, reset_write_stats, serialize_verse
+
+        reset_write_stats()
+        for verse in (1, 2):
+            write_verse_json("Genesis", 1, verse, sample_verse_data, tmp_path, fmt="canonical")
+        stats = get_write_stats()
+
+        assert stats["writes"] == 2
+        assert stats["bytes"] == 2 * len(serialize_verse(sample_verse_data, "canonical"))
+        assert 0 < stats["max_seconds"] <= stats["total_seconds"]
+        assert stats["average_seconds"] == pytest.approx(stats["total_seconds"] / 2)
+
+        reset_write_stats()
+        assert get_write_stats()["writes"] == 0
+
+
+class TestVersePack:
+    """Test suite for the packed per-book storage backend."""
+
+    @pytest.fixture
+    def verse(self):
+        """Factory for small distinct verse records."""
+        def make(chapter, verse):
+            return {
+                "verse_id": f"ACTS-{chapter}-{verse}",
+                "section_1_sacred_text": {"original_script": "Ἀνὴρ δέ τις"},
+                "section_3_life_application": "Go and do likewise. " * (10 + verse),
+            }
+        return make
+
+    @pytest.fixture
+    def files_tree(self, tmp_path, verse):
+        """Acts 10:1-3 and 11:1 in the per-verse file layout."""
+        from src.data_writer import write_verse_json
+
+        for chapter, number in [(10, 1), (10, 2), (10, 3), (11, 1)]:
+            write_verse_json("Acts", chapter, number, verse(chapter, number), tmp_path)
+        return tmp_path
+
+    def test_packed_write_and_read_match_files(self, tmp_path, verse):
+        """Test write_verse_json/read_verse parity between the two layouts."""
+        from src.data_writer import write_verse_json, read_verse, get_pack_path, get_verse_path
+
+        for storage in ("files", "packed"):
+            assert write_verse_json("Acts", 10, 2, verse(10, 2), tmp_path, storage=storage) is True
+
+        assert get_pack_path("Acts", tmp_path).name == "Acts.pack"
+        assert get_verse_path("Acts", 10, 2, tmp_path).exists()
+        assert read_verse("Acts", 10, 2, tmp_path, storage="packed") == verse(10, 2)
+        assert read_verse("Acts", 10, 2, tmp_path, storage="files") == verse(10, 2)
+
+    def test_packed_writes_replace_and_add(self, tmp_path, verse):
+        """Test that writing into an existing pack keeps the other verses."""
+        from src.data_writer import write_verse_json, read_verse, open_verse_pack, get_pack_path
+
+        write_verse_json("Acts", 10, 1, verse(10, 1), tmp_path, storage="packed")
+        write_verse_json("Acts", 10, 2, verse(10, 2), tmp_path, storage="packed")
+        write_verse_json("Acts", 10, 1, {"verse_id": "ACTS-10-1"}, tmp_path, storage="packed")
+
+        pack = open_verse_pack(get_pack_path("Acts", tmp_path))
+        assert pack.verses() == [(10, 1), (10, 2)]
+        assert read_verse("Acts", 10, 1, tmp_path, storage="packed") == {"verse_id": "ACTS-10-1"}
+        assert read_verse("Acts", 10, 2, tmp_path, storage="packed") == verse(10, 2)
+        assert read_verse("Acts", 10, 3, tmp_path, storage="packed") is None
+
+    def test_read_verse_falls_back_to_pack(self, files_tree, verse):
+        """Test that read_verse() without a storage finds packed-only verses."""
+        import shutil
+        from src.data_writer import pack_book, read_verse
+
+        pack_book("Acts", files_tree)
+        shutil.rmtree(files_tree / "data" / "NT" / "Acts")
+
+        assert read_verse("Acts", 11, 1, files_tree) == verse(11, 1)
+        assert read_verse("Acts", 12, 1, files_tree) is None
+
+    def test_pack_and_unpack_round_trip(self, files_tree, tmp_path_factory, verse):
+        """Test export to a pack and import back into verse files."""
+        import shutil
+        from src.data_writer import pack_book, unpack_book, read_verse, get_pack_path, list_books
+
+        assert pack_book("Acts", files_tree) == 4
+        assert list_books(files_tree, "packed") == ["Acts"]
+
+        restored = tmp_path_factory.mktemp("restored")
+        target = restored / "data" / "NT"
+        target.mkdir(parents=True)
+        shutil.copy(get_pack_path("Acts", files_tree), target / "Acts.pack")
+
+        assert unpack_book("Acts", restored, fmt="compact") == 4
+        assert list_books(restored) == ["Acts"]
+        for chapter, number in [(10, 1), (10, 2), (10, 3), (11, 1)]:
+            assert read_verse("Acts", chapter, number, restored, storage="files") == verse(chapter, number)
+
+    def test_pack_is_smaller_than_files(self, files_tree):
+        """Test that the pack compresses the verse records."""
+        from src.data_writer import pack_book, get_pack_path
+
+        pack_book("Acts", files_tree)
+        files_size = sum(p.stat().st_size for p in (files_tree / "data" / "NT" / "Acts").rglob("*.json"))
+
+        assert get_pack_path("Acts", files_tree).stat().st_size < files_size
+
+    def test_corrupt_pack_is_unreadable(self, tmp_path):
+        """Test that a file without the pack header is rejected."""
+        from src.data_writer import open_verse_pack, read_verse, get_pack_path
+
+        path = get_pack_path("Acts", tmp_path)
+        path.parent.mkdir(parents=True)
+        path.write_bytes(b"not a pack")
+
+        assert open_verse_pack(path) is None
+        assert read_verse("Acts", 10, 1, tmp_path, storage="packed") is None
+
+    def test_concurrent_packed_writes_keep_every_verse(self, tmp_path, verse):
+        """Test that threads writing one book's pack do not lose updates."""
+        from concurrent.futures import ThreadPoolExecutor
+        from src.data_writer import write_verse_json, open_verse_pack, get_pack_path
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(
+                lambda number: write_verse_json("Acts", 10, number, verse(10, number), tmp_path, storage="packed"),
+                range(1, 21)
+            ))
+
+        assert all(results)
+        assert len(open_verse_pack(get_pack_path("Acts", tmp_path))) == 20
+
+    def test_pack_locks_stay_out_of_data(self, tmp_path, verse):
+        """Test that pack write locks live under .cpf/state, not next to the packs."""
+        from src.data_writer import write_verse_json
+
+        write_verse_json("Acts", 10, 1, verse(10, 1), tmp_path, storage="packed")
+
+        assert sorted(path.name for path in (tmp_path / "data" / "NT").iterdir()) == ["Acts.pack"]
+        assert not list((tmp_path / "data").rglob("*.lock"))
+
+    def test_batched_packed_writes_rewrite_each_pack_once(self, tmp_path, verse):
+        """Test that a VerseBatchWriter over a PackedVerseSink rewrites a book's pack once per flush."""
+        from src import data_writer
+        from src.data_writer import PackedVerseSink, read_verse
+        from src.verse_store import VerseBatchWriter
+
+        writer = VerseBatchWriter(PackedVerseSink(tmp_path), batch_size=100)
+        for number in range(1, 11):
+            writer.add("Acts", 10, number, verse(10, number))
+        writer.add("Ruth", 1, 1, {"verse_id": "RUTH-1-1"})
+
+        with patch('src.data_writer._update_pack', wraps=data_writer._update_pack) as mock_update:
+            assert writer.flush() is True
+
+        assert sorted(call.args[0] for call in mock_update.call_args_list) == ["Acts", "Ruth"]
+        assert read_verse("Acts", 10, 7, tmp_path, storage="packed") == verse(10, 7)
+        assert read_verse("Ruth", 1, 1, tmp_path, storage="packed") == {"verse_id": "RUTH-1-1"}
+
+    def test_failed_pack_rewrite_keeps_batch_queued(self, tmp_path, verse):
+        """Test that a pack that cannot be written leaves the verses queued."""
+        from src.data_writer import PackedVerseSink, read_verse
+        from src.verse_store import VerseBatchWriter
+
+        writer = VerseBatchWriter(PackedVerseSink(tmp_path), batch_size=100)
+        writer.add("Acts", 10, 1, verse(10, 1))
+
+        with patch('src.data_writer.atomic_write_bytes', return_value=None):
+            assert writer.flush() is False
+        assert writer.pending == 1
+
+        assert writer.flush() is True
+        assert read_verse("Acts", 10, 1, tmp_path, storage="packed") == verse(10, 1)
+
+    def test_pack_command(self, files_tree):
+        """Test the pack/unpack CLI commands."""
+        from click.testing import CliRunner
+        from src.cli import cli
+
+        with patch('src.cli.get_project_root', return_value=files_tree):
+            packed = CliRunner().invoke(cli, ['pack', '--all'])
+            unpacked = CliRunner().invoke(cli, ['unpack', 'Acts'])
+            missing = CliRunner().invoke(cli, ['unpack'])
+
+        assert packed.exit_code == 0
+        assert "Acts: packed 4 verses" in packed.output
+        assert unpacked.exit_code == 0
+        assert "wrote 4 verse files" in unpacked.output
+        assert missing.exit_code == 1
@@ -47,6 +47,59 @@ class TestExegesisGenerator:
         with pytest.raises((FileNotFoundError, IOError)):
             load_study_prompt(Path("/nonexistent/prompt.md"))
 
+    def test_load_study_prompt_reads_file_once(self, tmp_path):
+        """Test that the template is cached and re-read when the file changes."""
+        import os
+        from src.exegesis_generator import load_study_prompt, clear_study_prompt_cache
+
+        path = tmp_path / "StudyPrompt.md"
+        path.write_text("first", encoding='utf-8')
+        clear_study_prompt_cache()
+
+        with patch('builtins.open', wraps=open) as spy:
+            assert load_study_prompt(path) == "first"
+            assert load_study_prompt(path) == "first"
+        assert spy.call_count == 1
+
+        path.write_text("second version", encoding='utf-8')
+        os.utime(path, ns=(0, path.stat().st_mtime_ns + 1_000_000))
+        assert load_study_prompt(path) == "second version"
+
+    def test_prompt_is_prefix_plus_verse_suffix(self, study_prompt_path, mock_verse_text):
+        """Test the split into a shared prefix and a per-verse suffix."""
+        from src.exegesis_generator import (
+            build_exegesis_prompt, build_verse_suffix, get_prompt_prefix, load_study_prompt
+        )
+
+        prefix = get_prompt_prefix(study_prompt_path)
+        prompt = build_exegesis_prompt("Genesis", 1, 1, mock_verse_text, study_prompt_path)
+        suffix = build_verse_suffix("Genesis", 1, 1, mock_verse_text)
+
+        assert prompt == prefix.text + suffix
+        assert load_study_prompt(study_prompt_path) in prefix.text
+        assert "Genesis 1:1" not in prefix.text
+        assert "GEN-1-1" in suffix and mock_verse_text in suffix
+        assert len(prefix.key) == 64
+        assert prefix.token_estimate > 1000
+
+    def test_prompt_prefix_is_shared_across_verses(self, tmp_path):
+        """Test that every verse reuses one prefix object until the prompt changes."""
+        import os
+        from src.exegesis_generator import get_prompt_prefix, clear_study_prompt_cache
+
+        path = tmp_path / "StudyPrompt.md"
+        path.write_text("instructions", encoding='utf-8')
+        clear_study_prompt_cache()
+
+        first = get_prompt_prefix(path)
+        assert get_prompt_prefix(path) is first
+
+        path.write_text("new instructions", encoding='utf-8')
+        os.utime(path, ns=(0, path.stat().st_mtime_ns + 1_000_000))
+        changed = get_prompt_prefix(path)
+        assert changed is not first
+        assert changed.key != first.key
+
     def test_build_exegesis_prompt_returns_string(self, study_prompt_path, mock_verse_text):
         """Test that build_exegesis_prompt() returns a prompt string."""
         from src.exegesis_generator import build_exegesis_prompt
@@ -147,6 +200,48 @@ class TestExegesisGenerator:
 
         mock_extract.assert_called_once()
 
+    def test_generate_verse_exegesis_uses_supplied_verse_text(self, study_prompt_path):
+        """Test that pre-extracted verse text skips extract_verse()."""
+        from src.exegesis_generator import generate_verse_exegesis
+
+        with patch('src.exegesis_generator.extract_verse') as mock_extract:
+            with patch('src.exegesis_generator.generate_exegesis', return_value={}) as mock_generate:
+                generate_verse_exegesis(
+                    "Genesis", 1, 1,
+                    Path("/fake/oshb"),
+                    Path("/fake/sblgnt"),
+                    "fake_api_key",
+                    study_prompt_path,
+                    verse_text="Streamed text"
+                )
+
+        mock_extract.assert_not_called()
+        assert "Streamed text" in mock_generate.call_args[0][0]
+
+    def test_agenerate_verse_exegesis_passes_client(self, study_prompt_path):
+        """Test that agenerate_verse_exegesis() sends the prompt through the given client."""
+        import asyncio
+        from src.exegesis_generator import agenerate_verse_exegesis
+
+        client = MagicMock()
+
+        async def fake_agenerate(prompt, api_key, max_retries=3, client=None, prefix=None):
+            return {"verse_id": "GEN-1-1", "client": client}
+
+        with patch('src.exegesis_generator.agenerate_exegesis', side_effect=fake_agenerate) as mock_generate:
+            result = asyncio.run(agenerate_verse_exegesis(
+                "Genesis", 1, 1,
+                Path("/fake/oshb"),
+                Path("/fake/sblgnt"),
+                "fake_api_key",
+                study_prompt_path,
+                verse_text="Streamed text",
+                client=client
+            ))
+
+        assert result["client"] is client
+        assert "Streamed text" in mock_generate.call_args[0][0]
+
     def test_generate_verse_exegesis_calls_generate_exegesis(self, study_prompt_path):
         """Test that generate_verse_exegesis() calls generate_exegesis()."""
         from src.exegesis_generator import generate_verse_exegesis
@@ -228,3 +323,122 @@ class TestExegesisGenerator:
 
         assert format_verse_id("genesis", 1, 1) == "GEN-1-1"
         assert format_verse_id("acts", 10, 44) == "ACTS-10-44"
+
+
+class TestVerseBatches:
+    """Test suite for multi-verse batched prompts."""
+
+    @pytest.fixture
+    def study_prompt_path(self):
+        """Path to StudyPrompt.md file."""
+        return Path(__file__).parent.parent.parent / "StudyPrompt.md"
+
+    @staticmethod
+    def verse(verse_id, valid=True):
+        """Generated verse object; valid ones carry a marker the fake validator checks."""
+        return {"verse_id": verse_id, "valid": valid}
+
+    @staticmethod
+    def is_valid(data, schema):
+        return data.get("valid", False)
+
+    def generate(self, study_prompt_path, responses, verse_texts=None):
+        """Run generate_batch_exegesis with canned API answers; return results and prompts."""
+        from src.exegesis_generator import generate_batch_exegesis
+
+        verse_texts = verse_texts or {1: "one", 2: "two", 3: "three"}
+        prompts = []
+
+        def fake_generate(prompt, api_key, **kwargs):
+            prompts.append(prompt)
+            return responses.pop(0)
+
+        with patch('src.exegesis_generator.generate_exegesis', side_effect=fake_generate):
+            with patch('src.exegesis_generator.validate_verse_json', side_effect=self.is_valid):
+                results = generate_batch_exegesis(
+                    "Romans", 16, verse_texts,
+                    Path("/fake/oshb"), Path("/fake/sblgnt"), "key",
+                    study_prompt_path, Path("/fake/schema.json")
+                )
+        return results, prompts
+
+    def test_batch_prompt_shares_prefix_and_lists_verses(self, study_prompt_path):
+        """Test the batched prompt layout."""
+        from src.exegesis_generator import build_batch_prompt, get_prompt_prefix
+
+        prompt = build_batch_prompt("Romans", 16, [(1, "alpha"), (2, "beta")], study_prompt_path)
+
+        assert prompt.startswith(get_prompt_prefix(study_prompt_path).text)
+        assert "Romans 16:1-2" in prompt
+        assert "ROMANS-16-1, ROMANS-16-2" in prompt
+        assert "alpha" in prompt and "beta" in prompt
+
+    def test_split_batch_response(self):
+        """Test that verses are split out by key and mismatched entries dropped."""
+        from src.exegesis_generator import split_batch_response
+
+        response = {
+            "ROMANS-16-1": {"verse_id": "ROMANS-16-1"},
+            "ROMANS-16-2": {"verse_id": "ROMANS-16-9"},
+            "ROMANS-16-3": "not an object",
+        }
+
+        assert split_batch_response(response, "Romans", 16, [1, 2, 3, 4]) == {
+            1: {"verse_id": "ROMANS-16-1"}, 2: None, 3: None, 4: None
+        }
+
+    def test_plan_verse_batches(self):
+        """Test grouping by count, token budget, gaps and missing text."""
+        from src.exegesis_generator import plan_verse_batches
+
+        short = {verse: "x" * 40 for verse in range(1, 8)}
+        assert plan_verse_batches(short, 3, token_budget=10_000, output_tokens_per_verse=100) == [
+            [1, 2, 3], [4, 5, 6], [7]
+        ]
+        assert plan_verse_batches(short, 8, token_budget=250, output_tokens_per_verse=100) == [
+            [1, 2], [3, 4], [5, 6], [7]
+        ]
+
+        mixed = {1: "a", 2: "b" * 4000, 3: "c", 5: "e", 6: None, 7: "g"}
+        assert plan_verse_batches(mixed, 8, token_budget=1000, output_tokens_per_verse=100) == [
+            [1], [2], [3], [5], [6], [7]
+        ]
+        assert plan_verse_batches(mixed, 8, token_budget=5000, output_tokens_per_verse=100) == [
+            [1, 2, 3], [5], [6], [7]
+        ]
+
+    def test_one_request_for_a_valid_batch(self, study_prompt_path):
+        """Test that a fully valid answer needs no further requests."""
+        response = {f"ROMANS-16-{n}": self.verse(f"ROMANS-16-{n}") for n in (1, 2, 3)}
+
+        results, prompts = self.generate(study_prompt_path, [response])
+
+        assert len(prompts) == 1
+        assert results == {n: self.verse(f"ROMANS-16-{n}") for n in (1, 2, 3)}
+
+    def test_invalid_and_missing_verses_retried_singly(self, study_prompt_path):
+        """Test single-verse retries for verses the batch got wrong."""
+        response = {
+            "ROMANS-16-1": self.verse("ROMANS-16-1"),
+            "ROMANS-16-2": self.verse("ROMANS-16-2", valid=False),
+        }
+        single_2 = self.verse("ROMANS-16-2")
+        single_3 = self.verse("ROMANS-16-3")
+
+        results, prompts = self.generate(study_prompt_path, [response, single_2, single_3])
+
+        assert len(prompts) == 3
+        assert "**Verse ID:** ROMANS-16-2" in prompts[1] and "ROMANS-16-3" not in prompts[1]
+        assert results == {1: self.verse("ROMANS-16-1"), 2: single_2, 3: single_3}
+
+    def test_unparseable_answer_halves_the_batch(self, study_prompt_path):
+        """Test that a batch with no usable answer is split and retried."""
+        verse_texts = {n: f"text {n}" for n in range(1, 5)}
+        first_half = {f"ROMANS-16-{n}": self.verse(f"ROMANS-16-{n}") for n in (1, 2)}
+        second_half = {f"ROMANS-16-{n}": self.verse(f"ROMANS-16-{n}") for n in (3, 4)}
+
+        results, prompts = self.generate(study_prompt_path, [None, first_half, second_half], verse_texts)
+
+        assert len(prompts) == 3
+        assert "Romans 16:1-2" in prompts[1] and "Romans 16:3-4" in prompts[2]
+        assert all(results[n] == self.verse(f"ROMANS-16-{n}") for n in range(1, 5))
@@ -166,6 +166,23 @@ class TestGeminiClient:
 
         assert result == sample_json_response
 
+    def test_parse_json_response_ignores_trailing_prose_with_braces(self, sample_json_response):
+        """Test that braces after the object do not break parsing."""
+        from src.gemini_client import parse_json_response
+
+        json_text = f"{json.dumps(sample_json_response)}\n\nNote: fields like {{verse_id}} follow the schema."
+        result = parse_json_response(json_text)
+
+        assert result == sample_json_response
+
+    def test_parse_json_response_repairs_truncated_object(self):
+        """Test that an object cut off between values is closed."""
+        from src.gemini_client import parse_json_response
+
+        result = parse_json_response('```json\n{"verse_id": "GEN-1-1", "tags": ["creation", ')
+
+        assert result == {"verse_id": "GEN-1-1", "tags": ["creation"]}
+
     def test_parse_json_response_invalid_returns_none(self):
         """Test that parse_json_response() returns None for invalid JSON."""
         from src.gemini_client import parse_json_response
@@ -262,3 +279,441 @@ class TestGeminiClient:
                     result = generate_exegesis("Test prompt", mock_api_key, max_retries=3)
 
                 assert result is not None
+
+
+class FakeAsyncModel:
+    """Offline stand-in for GenerativeModel that records concurrency."""
+
+    def __init__(self, text='{"verse_id": "GEN-1-1"}', failures=0, delay=0.01):
+        self.text = text
+        self.failures = failures
+        self.delay = delay
+        self.calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.prompts = []
+
+    async def generate_content_async(self, prompt):
+        import asyncio
+
+        self.calls += 1
+        self.prompts.append(prompt)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+            if self.failures > 0:
+                self.failures -= 1
+                raise Exception("API Error")
+            return MagicMock(text=self.text)
+        finally:
+            self.in_flight -= 1
+
+
+class TestAsyncGeminiClient:
+    """Test suite for the asyncio Gemini client."""
+
+    def test_configures_once_and_reuses_model(self):
+        """Test that the API is configured once for many requests."""
+        import asyncio
+        from src.gemini_client import AsyncGeminiClient
+
+        fake = FakeAsyncModel()
+
+        with patch('google.generativeai.configure') as mock_configure:
+            with patch('google.generativeai.GenerativeModel', return_value=fake) as mock_model:
+                client = AsyncGeminiClient("test_key")
+
+                async def run():
+                    return await asyncio.gather(*(client.generate_exegesis(f"p{i}") for i in range(5)))
+
+                results = asyncio.run(run())
+
+        mock_configure.assert_called_once_with(api_key="test_key")
+        mock_model.assert_called_once()
+        assert fake.calls == 5
+        assert all(result == {"verse_id": "GEN-1-1"} for result in results)
+
+    def test_semaphore_caps_in_flight_requests(self):
+        """Test that no more than max_concurrency requests run at once."""
+        import asyncio
+        from src.gemini_client import AsyncGeminiClient
+
+        fake = FakeAsyncModel()
+        client = AsyncGeminiClient("test_key", max_concurrency=3, model=fake)
+
+        async def run():
+            await asyncio.gather(*(client.generate_text(f"p{i}") for i in range(10)))
+
+        asyncio.run(run())
+
+        assert fake.calls == 10
+        assert fake.max_in_flight == 3
+
+    def test_client_usable_across_event_loops(self):
+        """Test that one client works in successive asyncio.run() calls."""
+        import asyncio
+        from src.gemini_client import AsyncGeminiClient
+
+        fake = FakeAsyncModel()
+        client = AsyncGeminiClient("test_key", max_concurrency=1, model=fake)
+
+        async def run():
+            await asyncio.wait_for(
+                asyncio.gather(client.generate_text("a"), client.generate_text("b")), timeout=5
+            )
+
+        for _ in range(2):
+            asyncio.run(run())
+
+        assert fake.calls == 4
+
+    def test_retries_then_succeeds(self):
+        """Test that failed attempts are retried with backoff."""
+        import asyncio
+        from src.gemini_client import AsyncGeminiClient, DEFAULT_BASE_DELAY
+
+        fake = FakeAsyncModel(failures=1, delay=0)
+        client = AsyncGeminiClient("test_key", model=fake)
+
+        async def no_sleep(delay):
+            return None
+
+        with patch('src.gemini_client.asyncio.sleep', side_effect=no_sleep) as mock_sleep:
+            result = asyncio.run(client.generate_exegesis("p", max_retries=2))
+
+        assert result == {"verse_id": "GEN-1-1"}
+        assert fake.calls == 2
+        mock_sleep.assert_any_call(DEFAULT_BASE_DELAY)
+
+    def test_returns_none_after_max_retries(self):
+        """Test that None is returned once every attempt fails."""
+        import asyncio
+        from src.gemini_client import AsyncGeminiClient
+
+        fake = FakeAsyncModel(failures=5, delay=0)
+        client = AsyncGeminiClient("test_key", model=fake)
+
+        result = asyncio.run(client.generate_text("p", max_retries=2, base_delay=0))
+
+        assert result is None
+        assert fake.calls == 2
+
+    def test_agenerate_exegesis_shares_client(self):
+        """Test that agenerate_exegesis() reuses one client per key and model."""
+        import asyncio
+        from src.gemini_client import agenerate_exegesis, get_async_client
+
+        fake = FakeAsyncModel()
+
+        with patch.dict('src.gemini_client._async_clients', clear=True):
+            with patch('google.generativeai.configure'):
+                with patch('google.generativeai.GenerativeModel', return_value=fake) as mock_model:
+                    first = asyncio.run(agenerate_exegesis("Prompt A", "shared_key"))
+                    second = asyncio.run(agenerate_exegesis("Prompt B", "shared_key"))
+
+                    assert get_async_client("shared_key") is get_async_client("shared_key")
+
+        mock_model.assert_called_once()
+        assert first == second == {"verse_id": "GEN-1-1"}
+        assert fake.prompts == ["Prompt A", "Prompt B"]
+
+
+class FakeContextBackend:
+    """Offline stand-in for Gemini cached contents that records creation and reuse."""
+
+    def __init__(self, fail_creates=0, cached_tokens=None):
+        self.fail_creates = fail_creates
+        self.cached_tokens = cached_tokens
+        self.created = []
+        self.refreshed = []
+        self.deleted = []
+        self.sent = []
+
+    def create(self, model_name, text, ttl):
+        if self.fail_creates > 0:
+            self.fail_creates -= 1
+            raise Exception("cache too small")
+        self.created.append((model_name, text, ttl))
+        return f"cachedContents/{len(self.created)}"
+
+    def refresh(self, context, ttl):
+        self.refreshed.append((context, ttl))
+
+    def delete(self, context):
+        self.deleted.append(context)
+
+    def model(self, context):
+        backend = self
+
+        def answer(contents):
+            backend.sent.append((context, contents))
+            usage = MagicMock(cached_content_token_count=backend.cached_tokens)
+            return MagicMock(text='{"verse_id": "GEN-1-1"}', usage_metadata=usage)
+
+        class CachedModel:
+            def generate_content(self, contents):
+                return answer(contents)
+
+            async def generate_content_async(self, contents):
+                return answer(contents)
+
+        return CachedModel()
+
+
+class TestContextCache:
+    """Test suite for context-cache mode."""
+
+    @pytest.fixture
+    def prefix(self):
+        """Shared prompt prefix."""
+        from src.exegesis_generator import PromptPrefix
+
+        return PromptPrefix("STUDY INSTRUCTIONS " * 200)
+
+    @pytest.fixture
+    def clock(self):
+        """Controllable time source."""
+        return Mock(return_value=1000.0)
+
+    def test_prefix_sent_once_and_suffixes_reused(self, prefix, clock):
+        """Test that the prefix is cached once and only verse suffixes are sent."""
+        from src.gemini_client import ContextCache, generate_exegesis
+
+        backend = FakeContextBackend()
+        context_cache = ContextCache(backend, ttl=600, refresh_margin=60, clock=clock)
+        full_model = MagicMock()
+
+        with patch('src.gemini_client.initialize_client', return_value=full_model):
+            for verse in range(1, 4):
+                result = generate_exegesis(
+                    prefix.text + f"verse {verse}", "key",
+                    context_cache=context_cache, prefix=prefix
+                )
+                assert result == {"verse_id": "GEN-1-1"}
+
+        assert backend.created == [(context_cache.model_name, prefix.text, 600)]
+        assert [contents for _, contents in backend.sent] == ["verse 1", "verse 2", "verse 3"]
+        full_model.generate_content.assert_not_called()
+        stats = context_cache.stats()
+        assert stats["cached_requests"] == 3
+        assert stats["tokens_saved"] == 3 * prefix.token_estimate
+
+    def test_refreshes_before_expiry_and_recreates_after(self, prefix, clock):
+        """Test TTL refresh inside the margin and recreation once expired."""
+        from src.gemini_client import ContextCache
+
+        backend = FakeContextBackend()
+        context_cache = ContextCache(backend, ttl=600, refresh_margin=60, clock=clock)
+
+        first = context_cache.model_for(prefix)
+        clock.return_value = 1500.0
+        assert context_cache.model_for(prefix) is first
+        assert context_cache.peek(prefix) is first
+        assert backend.refreshed == []
+
+        clock.return_value = 1560.0
+        assert context_cache.peek(prefix) is None
+        assert context_cache.model_for(prefix) is first
+        assert backend.refreshed == [("cachedContents/1", 600)]
+
+        clock.return_value = 2200.0
+        context_cache.model_for(prefix)
+        assert len(backend.created) == 2
+        assert backend.deleted == ["cachedContents/1"]
+        assert context_cache.stats()["refreshes"] == 1
+
+    def test_new_prefix_replaces_context(self, prefix, clock):
+        """Test that a changed study prompt gets a new context."""
+        from src.exegesis_generator import PromptPrefix
+        from src.gemini_client import ContextCache
+
+        backend = FakeContextBackend()
+        context_cache = ContextCache(backend, clock=clock)
+
+        context_cache.model_for(prefix)
+        context_cache.model_for(PromptPrefix("NEW INSTRUCTIONS"))
+        context_cache.close()
+
+        assert [text for _, text, _ in backend.created] == [prefix.text, "NEW INSTRUCTIONS"]
+        assert backend.deleted == ["cachedContents/1", "cachedContents/2"]
+
+    def test_falls_back_to_full_prompt_when_create_fails(self, prefix, clock):
+        """Test that failed creation sends full prompts and retries later."""
+        from src.gemini_client import ContextCache, generate_exegesis
+
+        backend = FakeContextBackend(fail_creates=1)
+        context_cache = ContextCache(backend, ttl=600, refresh_margin=60, clock=clock)
+        full_model = MagicMock()
+        full_model.generate_content.return_value = MagicMock(text='{"verse_id": "GEN-1-1"}')
+        prompt = prefix.text + "verse 1"
+
+        with patch('src.gemini_client.initialize_client', return_value=full_model):
+            generate_exegesis(prompt, "key", context_cache=context_cache, prefix=prefix)
+            generate_exegesis(prompt, "key", context_cache=context_cache, prefix=prefix)
+            clock.return_value = 1060.0
+            generate_exegesis(prompt, "key", context_cache=context_cache, prefix=prefix)
+
+        assert full_model.generate_content.call_count == 2
+        full_model.generate_content.assert_called_with(prompt)
+        assert len(backend.created) == 1
+        stats = context_cache.stats()
+        assert (stats["failures"], stats["full_requests"], stats["cached_requests"]) == (1, 2, 1)
+
+    def test_async_client_sends_suffix_against_context(self, prefix, clock):
+        """Test context-cache mode in the async client, using reported cached tokens."""
+        import asyncio
+        from src.gemini_client import AsyncGeminiClient, ContextCache
+
+        backend = FakeContextBackend(cached_tokens=3000)
+        context_cache = ContextCache(backend, clock=clock)
+        fake = FakeAsyncModel()
+        client = AsyncGeminiClient("test_key", model=fake, context_cache=context_cache)
+
+        async def run():
+            return await asyncio.gather(*(
+                client.generate_exegesis(prefix.text + f"verse {n}", prefix=prefix) for n in range(4)
+            ))
+
+        results = asyncio.run(run())
+
+        assert all(result == {"verse_id": "GEN-1-1"} for result in results)
+        assert fake.calls == 0
+        assert len(backend.created) == 1
+        assert sorted(contents for _, contents in backend.sent) == [f"verse {n}" for n in range(4)]
+        assert context_cache.stats()["tokens_saved"] == 4 * 3000
+
+    def test_prompt_without_prefix_is_sent_in_full(self, prefix, clock):
+        """Test that prompts not starting with the prefix bypass the context."""
+        import asyncio
+        from src.gemini_client import AsyncGeminiClient, ContextCache
+
+        backend = FakeContextBackend()
+        fake = FakeAsyncModel()
+        client = AsyncGeminiClient("test_key", model=fake, context_cache=ContextCache(backend, clock=clock))
+
+        asyncio.run(client.generate_text("other prompt", prefix=prefix))
+
+        assert fake.prompts == ["other prompt"]
+        assert backend.created == []
+
+
+class FakeStreamingModel:
+    """Offline stand-in for a streaming GenerativeModel; each call streams the next canned answer."""
+
+    def __init__(self, answers, chunk_size=8):
+        self.answers = list(answers)
+        self.chunk_size = chunk_size
+        self.calls = []
+        self.chunks_read = []
+
+    def _chunks(self, text):
+        self.chunks_read.append(0)
+        for start in range(0, len(text), self.chunk_size):
+            self.chunks_read[-1] += 1
+            yield MagicMock(text=text[start:start + self.chunk_size])
+
+    def generate_content(self, contents, stream=False):
+        self.calls.append((contents, stream))
+        return self._chunks(self.answers.pop(0))
+
+    async def generate_content_async(self, contents, stream=False):
+        self.calls.append((contents, stream))
+        chunks = self._chunks(self.answers.pop(0))
+
+        async def agen():
+            for chunk in chunks:
+                yield chunk
+
+        return agen()
+
+
+class TestStreaming:
+    """Test suite for streamed response consumption."""
+
+    GOOD = 'Analysis:\n```json\n{"verse_id": "GEN-1-1", "notes": "{not a brace}"}\n```'
+    BAD = '{"verse_id": "GEN-1-1", "notes": "x", Unfortunately the rest of this answer goes on and on' + "." * 500
+
+    @pytest.fixture(autouse=True)
+    def clean_stats(self):
+        """Start each test with empty request statistics."""
+        from src.gemini_client import reset_request_stats
+
+        reset_request_stats()
+        yield
+        reset_request_stats()
+
+    def test_streamed_answer_is_parsed_incrementally(self):
+        """Test that a streamed answer is parsed without the full-text regex."""
+        from src.gemini_client import generate_exegesis, get_request_stats
+
+        fake = FakeStreamingModel([self.GOOD])
+
+        with patch('src.gemini_client.initialize_client', return_value=fake):
+            with patch('src.gemini_client.parse_json_response') as mock_parse:
+                result = generate_exegesis("prompt", "key", stream=True)
+
+        assert result == {"verse_id": "GEN-1-1", "notes": "{not a brace}"}
+        assert fake.calls == [("prompt", True)]
+        mock_parse.assert_not_called()
+        stats = get_request_stats()
+        assert (stats["requests"], stats["streamed"], stats["aborted"]) == (1, 1, 0)
+        assert stats["last_ttfb_seconds"] <= stats["last_latency_seconds"]
+
+    def test_malformed_stream_is_aborted_early_and_retried(self):
+        """Test that malformed output stops the stream and triggers a retry."""
+        from src.gemini_client import generate_exegesis, get_request_stats
+
+        fake = FakeStreamingModel([self.BAD, self.GOOD])
+
+        with patch('src.gemini_client.initialize_client', return_value=fake):
+            with patch('time.sleep'):
+                result = generate_exegesis("prompt", "key", stream=True)
+
+        assert result["verse_id"] == "GEN-1-1"
+        assert len(fake.calls) == 2
+        assert fake.chunks_read[0] < len(self.BAD) // fake.chunk_size / 2
+        assert get_request_stats()["aborted"] == 1
+
+    def test_truncated_stream_fails_after_retries(self):
+        """Test that an answer cut off mid-object is never accepted."""
+        from src.gemini_client import generate_exegesis, get_request_stats
+
+        fake = FakeStreamingModel(['{"verse_id": "GEN-1-1", "notes": ['] * 2)
+
+        with patch('src.gemini_client.initialize_client', return_value=fake):
+            with patch('time.sleep'):
+                result = generate_exegesis("prompt", "key", max_retries=2, stream=True)
+
+        assert result is None
+        assert get_request_stats()["aborted"] == 2
+
+    def test_non_streamed_requests_are_timed(self):
+        """Test latency recording without streaming."""
+        from src.gemini_client import generate_exegesis, get_request_stats
+
+        model = MagicMock()
+        model.generate_content.return_value = MagicMock(text='{"verse_id": "GEN-1-1"}')
+
+        with patch('src.gemini_client.initialize_client', return_value=model):
+            generate_exegesis("prompt", "key")
+
+        model.generate_content.assert_called_once_with("prompt")
+        stats = get_request_stats()
+        assert (stats["requests"], stats["streamed"]) == (1, 0)
+        assert stats["last_ttfb_seconds"] == stats["last_latency_seconds"]
+
+    def test_async_client_streams_and_retries(self):
+        """Test streaming through the async client."""
+        import asyncio
+        from src.gemini_client import AsyncGeminiClient, get_request_stats
+
+        fake = FakeStreamingModel([self.BAD, self.GOOD])
+        client = AsyncGeminiClient("test_key", model=fake, stream=True)
+
+        result = asyncio.run(client.generate_text("prompt", base_delay=0))
+
+        assert result == self.GOOD
+        assert fake.calls == [("prompt", True), ("prompt", True)]
+        stats = get_request_stats()
+        assert (stats["requests"], stats["streamed"], stats["aborted"]) == (2, 2, 1)
@@ -0,0 +1,244 @@
+"""
+Unit tests for job_ledger module.
+Tests the persistent per-verse work ledger and its runner.
+"""
+
+import pytest
+import threading
+from unittest.mock import MagicMock, patch
+
+
+RUTH_1 = [("Ruth", 1, verse) for verse in range(1, 6)]
+
+
+class TestJobLedger:
+    """Test suite for the SQLite job ledger."""
+
+    @pytest.fixture
+    def clock(self):
+        """Mutable fake wall clock."""
+        return MagicMock(return_value=1_000_000.0)
+
+    @pytest.fixture
+    def ledger(self, tmp_path, clock):
+        """Ledger seeded with Ruth 1:1-5."""
+        from src.job_ledger import JobLedger
+
+        ledger = JobLedger(tmp_path / "ledger.sqlite", lease_seconds=600, clock=clock)
+        ledger.seed(RUTH_1)
+        return ledger
+
+    def test_seed_is_idempotent(self, ledger):
+        """Test that reseeding does not duplicate or reset jobs."""
+        ledger.claim("w1")
+
+        assert ledger.seed(RUTH_1) == 0
+        assert ledger.summary()["total"] == 5
+        assert ledger.summary()["in_flight"] == 1
+
+    def test_seed_whole_canon(self, tmp_path):
+        """Test that the default seed covers every verse."""
+        from src.job_ledger import JobLedger
+
+        ledger = JobLedger(tmp_path / "ledger.sqlite")
+
+        assert ledger.seed() == 31102
+
+    def test_claims_follow_canonical_order(self, ledger):
+        """Test that verses are handed out in order."""
+        assert ledger.claim("w1") == ("Ruth", 1, 1)
+        assert ledger.claim("w1") == ("Ruth", 1, 2)
+
+    def test_done_verses_are_not_reclaimed(self, ledger):
+        """Test that finished work is skipped on resume."""
+        ledger.complete(*ledger.claim("w1"), True)
+
+        assert ledger.claim("w2") == ("Ruth", 1, 2)
+        assert ledger.summary()["done"] == 1
+
+    def test_failures_keep_error_and_retry_until_cap(self, ledger):
+        """Test that failed verses are retried up to max_attempts."""
+        for _ in range(2):
+            job = ledger.claim("w1", max_attempts=2)
+            assert job == ("Ruth", 1, 1)
+            ledger.complete(*job, False, "schema validation failed")
+
+        assert ledger.claim("w1", max_attempts=2) == ("Ruth", 1, 2)
+        assert ledger.failures() == [{
+            "book": "Ruth", "chapter": 1, "verse": 1,
+            "attempts": 2, "last_error": "schema validation failed"
+        }]
+
+    def test_expired_lease_is_reclaimable(self, ledger, clock):
+        """Test that work abandoned by a crashed worker is picked up again."""
+        job = ledger.claim("crashed")
+        for _ in range(4):
+            ledger.claim("w1")
+
+        assert ledger.claim("w2") is None
+
+        clock.return_value += 601
+
+        assert ledger.claim("w2") == job
+
+    def test_stale_worker_cannot_overwrite_reclaimed_verse(self, ledger, clock):
+        """Test that an outcome from an expired claim is ignored."""
+        job = ledger.claim("slow")
+        clock.return_value += 601
+        assert ledger.claim("w2") == job
+
+        assert ledger.complete(*job, True, worker="w2") is True
+        assert ledger.complete(*job, False, "timed out", worker="slow") is False
+
+        assert ledger.summary()["done"] == 1
+        assert ledger.failures() == []
+
+    def test_expired_claim_on_last_attempt_is_marked_failed(self, ledger, clock):
+        """Test that a verse whose final attempt crashed does not stay in flight."""
+        job = ledger.claim("crashed", max_attempts=1)
+        clock.return_value += 601
+
+        assert ledger.claim("w2", max_attempts=1) == ("Ruth", 1, 2)
+
+        assert ledger.summary()["in_flight"] == 1
+        assert ledger.failures() == [{
+            "book": job[0], "chapter": job[1], "verse": job[2],
+            "attempts": 1, "last_error": "lease expired (worker crashed)"
+        }]
+
+    def test_scope_filters(self, tmp_path):
+        """Test testament and book scopes."""
+        from src.job_ledger import JobLedger
+
+        ledger = JobLedger(tmp_path / "ledger.sqlite")
+        ledger.seed([("Genesis", 1, 1), ("Ruth", 1, 1), ("Acts", 10, 1)])
+
+        assert ledger.claim("w", "testament", "NT") == ("Acts", 10, 1)
+        assert ledger.claim("w", "book", "ruth") == ("Ruth", 1, 1)
+        assert ledger.summary("testament", "OT")["total"] == 2
+
+    def test_invalid_scope_raises(self, ledger):
+        """Test that bad scopes are rejected."""
+        with pytest.raises(ValueError):
+            ledger.claim("w", "book", "Nonexistent")
+        with pytest.raises(ValueError):
+            ledger.claim("w", "testament", "XT")
+        with pytest.raises(ValueError):
+            ledger.claim("w", "chapter")
+
+    def test_concurrent_claims_never_collide(self, tmp_path):
+        """Test that racing ledgers (as separate processes would) claim each verse once."""
+        from src.job_ledger import JobLedger
+
+        db_path = tmp_path / "ledger.sqlite"
+        JobLedger(db_path).seed([("Ruth", 1, verse) for verse in range(1, 23)])
+
+        claimed = []
+        lock = threading.Lock()
+
+        def worker(num):
+            ledger = JobLedger(db_path)
+            while True:
+                job = ledger.claim(f"w{num}")
+                if job is None:
+                    return
+                with lock:
+                    claimed.append(job)
+
+        threads = [threading.Thread(target=worker, args=(num,)) for num in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert sorted(claimed) == [("Ruth", 1, verse) for verse in range(1, 23)]
+
+
+class TestRunJobs:
+    """Test suite for the ledger-driven runner."""
+
+    @pytest.fixture
+    def ledger(self, tmp_path):
+        """Ledger seeded with Ruth 1:1-5."""
+        from src.job_ledger import JobLedger
+
+        ledger = JobLedger(tmp_path / "ledger.sqlite")
+        ledger.seed(RUTH_1)
+        return ledger
+
+    def test_run_processes_everything(self, ledger):
+        """Test that a run drains the ledger."""
+        from src.job_ledger import run_jobs
+
+        process = MagicMock(return_value=True)
+        results = run_jobs(ledger, process, workers=3)
+
+        assert results == {"processed": 5, "successful": 5, "failed": 0}
+        assert ledger.summary()["done"] == 5
+        assert process.call_count == 5
+
+    def test_run_retries_failures_with_cap(self, ledger):
+        """Test that a failing verse is retried, then left failed."""
+        from src.job_ledger import run_jobs
+
+        def process(book, chapter, verse):
+            if verse == 3:
+                raise RuntimeError("API unavailable")
+            return True
+
+        results = run_jobs(ledger, process, max_attempts=2)
+
+        assert results == {"processed": 6, "successful": 4, "failed": 2}
+        assert ledger.failures()[0]["last_error"] == "RuntimeError: API unavailable"
+
+    def test_rerun_resumes_where_it_stopped(self, ledger):
+        """Test that a second run only processes unfinished verses."""
+        from src.job_ledger import run_jobs
+
+        run_jobs(ledger, lambda book, chapter, verse: verse != 4, max_attempts=1)
+        process = MagicMock(return_value=True)
+        run_jobs(ledger, process, max_attempts=2)
+
+        process.assert_called_once_with("Ruth", 1, 4)
+        assert ledger.summary()["done"] == 5
+
+    def test_deferred_outcomes_complete_on_callback(self, ledger):
+        """Test that deferred verses stay in flight until their outcome is reported."""
+        from src.job_ledger import run_jobs
+
+        callbacks = []
+
+        def process(book, chapter, verse, on_commit):
+            if verse == 1:
+                return True
+            callbacks.append(on_commit)
+            return None
+
+        results = run_jobs(ledger, process, deferred=True)
+
+        assert results == {"processed": 1, "successful": 1, "failed": 0}
+        assert ledger.summary()["in_flight"] == 4
+
+        callbacks[0](True)
+        callbacks[1](False)
+
+        assert results == {"processed": 3, "successful": 2, "failed": 1}
+        assert ledger.summary()["done"] == 2
+        assert ledger.summary()["failed"] == 1
+
+    def test_run_command_uses_ledger(self, tmp_path):
+        """Test the `run` CLI command end to end with a stubbed processor."""
+        from click.testing import CliRunner
+        from src.cli import cli
+        from src.job_ledger import JobLedger
+
+        ledger = JobLedger(tmp_path / "ledger.sqlite")
+
+        with patch('src.cli.load_config', return_value={}):
+            with patch('src.cli.JobLedger', return_value=ledger):
+                with patch('src.cli.process_verse', return_value=True) as mock_process:
+                    result = CliRunner().invoke(cli, ['run', '--scope', 'book', '--name', 'Ruth', '--workers', '2'])
+
+        assert result.exit_code == 0
+        assert mock_process.call_count == 85
+        assert "85/85 done" in result.output
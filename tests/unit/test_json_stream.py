@@ -0,0 +1,212 @@
+"""
+Unit tests for json_stream module.
+Tests incremental JSON object detection over chunked text.
+"""
+
+import pytest
+import json
+
+
+def feed_in_chunks(text, size, **kwargs):
+    """Parser fed text `size` characters at a time, stopping once done."""
+    from src.json_stream import JSONStreamParser
+
+    parser = JSONStreamParser(**kwargs)
+    for start in range(0, len(text), size):
+        parser.feed(text[start:start + size])
+        if parser.done:
+            break
+    parser.close()
+    return parser
+
+
+class TestJSONStreamParser:
+    """Test suite for the incremental JSON parser."""
+
+    @pytest.fixture
+    def verse(self):
+        """Verse object with nesting, escapes, brackets in strings and Hebrew."""
+        return {
+            "verse_id": "GEN-1-1",
+            "section_1_sacred_text": {"original_script": "בְּרֵאשִׁית", "notes": "a \"quoted\" {brace} [and] \\ slash"},
+            "numbers": [1, -2.5, 3e10, True, False, None],
+            "empty": {"list": [], "object": {}},
+        }
+
+    @pytest.mark.parametrize("size", [1, 2, 3, 7, 64, 100000])
+    def test_any_chunking_gives_the_object(self, verse, size):
+        """Test that chunk boundaries (inside strings, escapes, numbers) do not matter."""
+        text = "Here is the analysis:\n```json\n" + json.dumps(verse, ensure_ascii=False, indent=2) + "\n```\n"
+
+        parser = feed_in_chunks(text, size)
+
+        assert parser.complete and parser.error is None
+        assert parser.value == verse
+
+    def test_stops_reading_when_object_closes(self):
+        """Test that text after the object is not needed and later chunks are ignored."""
+        from src.json_stream import JSONStreamParser
+
+        parser = JSONStreamParser()
+        parser.feed('{"a": 1}\n```')
+        assert parser.done and parser.complete
+        parser.feed("trailing chunk")
+        assert parser.text == '{"a": 1}\n```'
+
+    @pytest.mark.parametrize("text, error, offset", [
+        ('{"a": [1, 2}', "mismatched '}'", 11),
+        ('{"a": yes}', "unexpected 'y'", 6),
+        ('{"a": "line\nbreak"}', "control character in string", 11),
+        ('{"a" 1}', "invalid JSON (Expecting ':' delimiter)", 5),
+        ('{"a": {"b": 1}', "truncated", 14),
+        ("I cannot help with that.", "no JSON object", 24),
+    ])
+    def test_rejects_bad_output_with_offset(self, text, error, offset):
+        """Test error reasons and offsets."""
+        parser = feed_in_chunks(text, 4)
+
+        assert not parser.complete
+        assert (parser.error, parser.offset) == (error, offset)
+
+    def test_rejects_malformed_output_before_the_stream_ends(self):
+        """Test that a stray character is caught without reading further chunks."""
+        from src.json_stream import JSONStreamParser
+
+        parser = JSONStreamParser()
+        parser.feed('{"verse_id": "GEN-1-1", "section": ')
+        assert not parser.done
+        parser.feed('Sorry, ')
+        assert parser.error == "unexpected 'S'"
+
+    def test_long_preamble_is_rejected(self):
+        """Test the preamble limit."""
+        parser = feed_in_chunks("x" * 50 + '{"a": 1}', 10, max_preamble=20)
+
+        assert parser.error == "no JSON object"
+        assert parser.offset == 30
+
+
+class TestExtractJSONObject:
+    """Test suite for extracting the JSON object from a complete response."""
+
+    @pytest.fixture
+    def verse_text(self):
+        """A real generated verse, as the model's JSON text."""
+        from pathlib import Path
+
+        path = Path(__file__).parent.parent.parent / "data" / "NT" / "Acts" / "10" / "01.json"
+        return path.read_text(encoding='utf-8')
+
+    @pytest.mark.parametrize("template", [
+        "{json}",
+        "```json\n{json}\n```",
+        "Here is the analysis for {{verse}}:\n\n{json}\n\nLet me know if {{anything}} needs changing.",
+        "Sure! ```json\n{json}\n``` Notes: the object above uses {{braces}}.",
+    ])
+    def test_finds_object_despite_noise(self, verse_text, template):
+        """Test preamble and trailing prose with braces (the greedy regex failed on these)."""
+        from src.json_stream import extract_json_object
+
+        parser = extract_json_object(template.format(json=verse_text))
+
+        assert parser.error is None and not parser.repaired
+        assert parser.value == json.loads(verse_text)
+
+    @pytest.mark.parametrize("text, expected", [
+        ('{"a": [1, {"b": 2}, ', {"a": [1, {"b": 2}]}),
+        ('{"a": [1, 2],\n  "c": {', {"a": [1, 2], "c": {}}),
+        ('{"a": true', {"a": True}),
+    ])
+    def test_repairs_safe_truncations(self, text, expected):
+        """Test closing unclosed arrays and objects."""
+        from src.json_stream import extract_json_object
+
+        parser = extract_json_object(text)
+
+        assert parser.repaired
+        assert parser.value == expected
+        assert parser.offset == len(text)
+
+    @pytest.mark.parametrize("text", [
+        '{"a": "cut off mid str',
+        '{"a": 12',
+        '{"a": 1, "b"',
+        '{"a":',
+    ])
+    def test_unsafe_truncations_are_not_repaired(self, text):
+        """Test that ambiguous cut-offs are reported, not guessed."""
+        from src.json_stream import extract_json_object
+
+        parser = extract_json_object(text)
+
+        assert parser.value is None
+        assert (parser.error, parser.offset) == ("truncated", len(text))
+        assert extract_json_object(text, repair=False).error == "truncated"
+
+    @pytest.mark.parametrize("text", [
+        '{"verse_id": "A", "s": {"b": 1},}',
+        '{"verse_id": "A", "s": {"b": 1}, oops}',
+        '{"verse_id" {"b": 1}}',
+    ])
+    def test_malformed_object_does_not_yield_nested_object(self, text):
+        """Test that a rejected object is not replaced by one nested inside it."""
+        from src.json_stream import extract_json_object
+        from src.gemini_client import parse_json_response
+
+        parser = extract_json_object(text)
+
+        assert parser.value is None
+        assert parser.start == 0 and parser.error is not None
+        assert parse_json_response(text) is None
+
+    def test_reports_offset_in_whole_response(self):
+        """Test that failure offsets point into the original text."""
+        from src.json_stream import extract_json_object
+
+        text = 'Result:\n```json\n{"a": 1, "b": nope}\n```'
+        parser = extract_json_object(text)
+
+        assert parser.error == "unexpected 'o'"
+        assert text[parser.offset] == "o"
+
+    def test_deep_nesting_is_rejected_not_raised(self):
+        """Test that input deeper than json's recursion limit fails cleanly."""
+        from src.json_stream import extract_json_object
+
+        closed = extract_json_object('{"a": ' + "[" * 100_000 + "]" * 100_000 + "}")
+        truncated = extract_json_object('{"a": ' + "[" * 100_000)
+
+        assert closed.error == "nested too deeply" and closed.offset == 0
+        assert truncated.error == "truncated" and not truncated.repaired
+
+    def test_fuzzed_responses_never_raise(self, verse_text):
+        """Fuzz: truncated and corrupted responses give a value or an error with an offset."""
+        import random
+        from src.json_stream import extract_json_object
+
+        rng = random.Random(20240501)
+        expected = json.loads(verse_text)
+        noise = ["{", "}", "[", "]", '"', "\\", ",", ":", "\n", "x", "```"]
+
+        for _ in range(300):
+            text = verse_text
+            mutation = rng.choice(["truncate", "insert", "delete", "wrap"])
+            cut = rng.randrange(len(text))
+            if mutation == "truncate":
+                text = text[:cut]
+            elif mutation == "insert":
+                text = text[:cut] + rng.choice(noise) + text[cut:]
+            elif mutation == "delete":
+                text = text[:cut] + text[cut + 1:]
+            else:
+                text = "Prefix {note}\n```json\n" + text + "\n```\nSuffix } ] {"
+
+            parser = extract_json_object(text)
+
+            if parser.error is None:
+                assert isinstance(parser.value, dict)
+                if mutation == "wrap":
+                    assert parser.value == expected
+            else:
+                assert parser.value is None
+                assert 0 <= parser.offset <= len(text)
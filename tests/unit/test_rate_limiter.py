@@ -0,0 +1,235 @@
+"""
+Unit tests for rate_limiter module.
+Tests the SQLite-backed token bucket with a fake clock.
+"""
+
+import pytest
+import threading
+from unittest.mock import patch, MagicMock
+
+
+class FakeClock:
+    """Manually advanced clock whose sleep() moves time forward."""
+
+    def __init__(self, start=1_000_000.0):
+        self.now = start
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TestRateLimiter:
+    """Test suite for the token-bucket limiter."""
+
+    @pytest.fixture
+    def clock(self):
+        """Fake clock starting at a fixed time."""
+        return FakeClock()
+
+    @pytest.fixture
+    def make_limiter(self, tmp_path, clock):
+        """Factory for limiters sharing one bucket database."""
+        from src.rate_limiter import RateLimiter
+
+        def make(**kwargs):
+            kwargs.setdefault("requests_per_minute", 60)
+            return RateLimiter(
+                kwargs.pop("name", "gemini"),
+                db_path=tmp_path / "rate_limits.sqlite",
+                clock=clock,
+                sleep=clock.sleep,
+                **kwargs
+            )
+        return make
+
+    def test_burst_up_to_requests_per_minute(self, make_limiter, clock):
+        """Test that a full bucket grants requests_per_minute without waiting."""
+        limiter = make_limiter(requests_per_minute=5)
+
+        assert [limiter.acquire() for _ in range(5)] == [0.0] * 5
+        assert clock.sleeps == []
+
+    def test_waits_for_refill_when_empty(self, make_limiter, clock):
+        """Test that an empty bucket waits one refill interval."""
+        limiter = make_limiter(requests_per_minute=6)
+
+        for _ in range(6):
+            limiter.acquire()
+        waited = limiter.acquire()
+
+        assert waited == pytest.approx(10.0)
+        assert clock.sleeps == [pytest.approx(10.0)]
+
+    def test_min_interval_spaces_requests(self, make_limiter, clock):
+        """Test that delay_between_requests is enforced between requests."""
+        limiter = make_limiter(requests_per_minute=15, min_interval=4)
+
+        limiter.acquire()
+        clock.now += 1
+        waited = limiter.acquire()
+
+        assert waited == pytest.approx(3.0)
+
+    def test_tokens_per_minute_limits_large_requests(self, make_limiter, clock):
+        """Test that the token bucket delays requests once tokens run out."""
+        limiter = make_limiter(requests_per_minute=100, tokens_per_minute=6000)
+
+        assert limiter.acquire(tokens=6000) == 0.0
+        waited = limiter.acquire(tokens=3000)
+
+        assert waited == pytest.approx(30.0)
+
+    def test_oversized_request_waits_for_full_bucket(self, make_limiter, clock):
+        """Test that a request larger than the bucket does not wait forever."""
+        limiter = make_limiter(requests_per_minute=100, tokens_per_minute=1000)
+
+        limiter.acquire(tokens=500)
+        waited = limiter.acquire(tokens=5000)
+
+        assert waited == pytest.approx(30.0)
+
+    def test_record_usage_debits_extra_tokens(self, make_limiter, clock):
+        """Test that actual usage above the estimate reduces remaining tokens."""
+        limiter = make_limiter(requests_per_minute=100, tokens_per_minute=6000)
+
+        limiter.acquire(tokens=1000)
+        limiter.record_usage(1000, 6000)
+
+        assert limiter.try_acquire(tokens=1000) == pytest.approx(10.0)
+
+    def test_limiters_share_bucket_through_database(self, make_limiter, clock):
+        """Test that two limiter objects (e.g. two processes) share one quota."""
+        first = make_limiter(requests_per_minute=2)
+        second = make_limiter(requests_per_minute=2)
+
+        first.acquire()
+        second.acquire()
+
+        assert first.try_acquire() > 0
+        assert second.try_acquire() > 0
+
+    def test_different_names_have_separate_buckets(self, make_limiter, clock):
+        """Test that providers do not consume each other's quota."""
+        gemini = make_limiter(name="gemini", requests_per_minute=1)
+        grok = make_limiter(name="grok", requests_per_minute=1)
+
+        gemini.acquire()
+
+        assert grok.try_acquire() == 0.0
+
+    def test_stats_report_waits(self, make_limiter, clock):
+        """Test that wait time is accumulated per bucket."""
+        limiter = make_limiter(requests_per_minute=6)
+
+        for _ in range(7):
+            limiter.acquire()
+        stats = limiter.stats()
+
+        assert stats["acquisitions"] == 7
+        assert stats["total_wait"] == pytest.approx(10.0)
+        assert stats["max_wait"] == pytest.approx(10.0)
+
+    def test_session_stats_cover_this_process_only(self, make_limiter, clock):
+        """Test that lifetime totals persist while session counters start fresh."""
+        earlier = make_limiter(requests_per_minute=6)
+        for _ in range(7):
+            earlier.acquire()
+
+        limiter = make_limiter(requests_per_minute=6)
+        limiter.acquire()
+        stats = limiter.stats()
+
+        assert stats["acquisitions"] == 8
+        assert stats["session_acquisitions"] == 1
+        assert stats["session_total_wait"] == pytest.approx(10.0)
+        assert stats["total_wait"] == pytest.approx(20.0)
+
+    def test_reset_refills_and_clears_stats(self, make_limiter, clock):
+        """Test that reset() restores a full bucket."""
+        limiter = make_limiter(requests_per_minute=1)
+
+        limiter.acquire()
+        limiter.reset()
+
+        assert limiter.try_acquire() == 0.0
+        assert limiter.stats()["acquisitions"] == 1
+
+    def test_concurrent_threads_never_exceed_quota(self, tmp_path):
+        """Test that threads racing for a bucket get exactly its capacity."""
+        from src.rate_limiter import RateLimiter
+
+        limiter = RateLimiter("gemini", requests_per_minute=10, db_path=tmp_path / "rate_limits.sqlite")
+        granted = []
+
+        def worker():
+            for _ in range(5):
+                if limiter.try_acquire() == 0.0:
+                    granted.append(1)
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(granted) == 10
+
+    def test_aacquire_waits_without_blocking(self, make_limiter, clock):
+        """Test the asyncio variant."""
+        import asyncio
+
+        limiter = make_limiter(requests_per_minute=6)
+        for _ in range(6):
+            limiter.acquire()
+
+        async def fake_sleep(seconds):
+            clock.now += seconds
+
+        with patch("src.rate_limiter.asyncio.sleep", side_effect=fake_sleep):
+            with patch("src.rate_limiter.asyncio.to_thread", wraps=asyncio.to_thread) as mock_to_thread:
+                waited = asyncio.run(limiter.aacquire())
+
+        assert waited == pytest.approx(10.0)
+        assert mock_to_thread.call_count == 2  # The SQLite transaction never runs on the event loop
+
+    def test_get_rate_limiter_applies_provider_overrides(self, tmp_path):
+        """Test that provider settings override the Gemini defaults."""
+        from src.rate_limiter import get_rate_limiter
+        from src.config import get_rate_limit_config
+
+        settings = get_rate_limit_config()
+        db_path = tmp_path / "rate_limits.sqlite"
+
+        with patch.dict("src.rate_limiter._limiters", clear=True):
+            gemini = get_rate_limiter("gemini", db_path=db_path)
+            grok = get_rate_limiter("grok", db_path=db_path)
+
+            assert get_rate_limiter("gemini", db_path=db_path) is gemini
+
+        assert gemini.requests_per_minute == settings["requests_per_minute"]
+        assert gemini.min_interval == settings["delay_between_requests"]
+        assert grok.requests_per_minute == settings["providers"]["grok"]["requests_per_minute"]
+        assert grok.tokens_per_minute is None
+
+    def test_generate_exegesis_acquires_before_each_attempt(self):
+        """Test that the Gemini client takes capacity per attempt."""
+        from src.gemini_client import generate_exegesis
+
+        limiter = MagicMock()
+
+        with patch('google.generativeai.configure'):
+            with patch('google.generativeai.GenerativeModel') as mock_model:
+                mock_model.return_value.generate_content.side_effect = [
+                    Exception("429"),
+                    MagicMock(text='{"verse_id": "GEN-1-1"}')
+                ]
+                with patch('time.sleep'):
+                    result = generate_exegesis("Test prompt", "key", max_retries=2, rate_limiter=limiter)
+
+        assert result == {"verse_id": "GEN-1-1"}
+        assert limiter.acquire.call_count == 2
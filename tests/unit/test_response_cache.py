@@ -0,0 +1,235 @@
+"""
+Unit tests for response_cache module.
+Tests the content-addressed LLM response cache.
+"""
+
+import pytest
+from unittest.mock import patch, MagicMock
+
+
+class TestResponseCache:
+    """Test suite for the persistent response cache."""
+
+    @pytest.fixture
+    def clock(self):
+        """Mutable fake wall clock."""
+        return MagicMock(return_value=1_000_000.0)
+
+    @pytest.fixture
+    def cache(self, tmp_path, clock):
+        """Cache backed by a temp database."""
+        from src.response_cache import ResponseCache
+
+        return ResponseCache(tmp_path / "cache.sqlite", clock=clock)
+
+    def test_make_cache_key_depends_on_all_inputs(self):
+        """Test that model, parameters and prompt all change the key."""
+        from src.response_cache import make_cache_key
+
+        base = make_cache_key("gemini-2.5-pro", "prompt", {"temperature": 0.7})
+
+        assert base == make_cache_key("gemini-2.5-pro", "prompt", {"temperature": 0.7})
+        assert base != make_cache_key("gemini-2.5-flash", "prompt", {"temperature": 0.7})
+        assert base != make_cache_key("gemini-2.5-pro", "prompt.", {"temperature": 0.7})
+        assert base != make_cache_key("gemini-2.5-pro", "prompt", {"temperature": 0.2})
+
+    def test_round_trip(self, cache):
+        """Test that stored text comes back unchanged."""
+        text = '{"verse_id": "GEN-1-1", "original_script": "בְּרֵאשִׁית"}'
+
+        cache.put("k1", "gemini-2.5-pro", text)
+
+        assert cache.get("k1") == text
+
+    def test_miss_returns_none(self, cache):
+        """Test that unknown keys miss."""
+        assert cache.get("missing") is None
+
+    def test_entries_are_compressed(self, cache):
+        """Test that stored size is smaller than repetitive input."""
+        cache.put("k1", "m", "exegesis " * 1000)
+
+        assert cache.stats()["bytes"] < len("exegesis " * 1000) / 10
+
+    def test_zlib_fallback_without_zstandard(self, tmp_path):
+        """Test that the cache works when zstandard is not installed."""
+        from src.response_cache import ResponseCache
+
+        with patch("src.response_cache.zstandard", None):
+            cache = ResponseCache(tmp_path / "cache.sqlite")
+            cache.put("k1", "m", "text")
+
+            assert cache.get("k1") == "text"
+
+    def test_expired_entries_miss(self, cache, clock):
+        """Test age-based eviction."""
+        cache.put("k1", "m", "text")
+        clock.return_value += cache.max_age_seconds + 1
+
+        assert cache.get("k1") is None
+        assert cache.stats()["entries"] == 0
+
+    def test_size_budget_evicts_least_recently_used(self, tmp_path, clock):
+        """Test that the oldest-accessed entries go once over budget."""
+        import os
+        from src.response_cache import ResponseCache
+
+        cache = ResponseCache(tmp_path / "cache.sqlite", max_bytes=1600, clock=clock)
+        payloads = {key: os.urandom(600).hex() for key in ["a", "b", "c"]}
+
+        cache.put("a", "m", payloads["a"])
+        clock.return_value += 1
+        cache.put("b", "m", payloads["b"])
+        clock.return_value += 1
+        cache.get("a")  # a is now more recent than b
+        clock.return_value += 1
+        cache.put("c", "m", payloads["c"])
+
+        assert cache.get("b") is None
+        assert cache.get("a") == payloads["a"]
+        assert cache.get("c") == payloads["c"]
+
+    def test_stats_track_hit_rate(self, cache):
+        """Test hit/miss counters."""
+        cache.put("k1", "m", "text")
+        cache.get("k1")
+        cache.get("k1")
+        cache.get("k2")
+
+        stats = cache.stats()
+
+        assert stats["hits"] == 2
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == pytest.approx(2 / 3)
+        assert stats["session_hits"] == 2
+
+    def test_session_counters_are_thread_safe(self, cache):
+        """Test that concurrent lookups do not lose hit/miss counts."""
+        import threading
+
+        cache.put("k1", "m", "text")
+
+        def lookup():
+            for _ in range(50):
+                cache.get("k1")
+                cache.get("missing")
+
+        threads = [threading.Thread(target=lookup) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert (cache.session_hits, cache.session_misses) == (400, 400)
+
+    def test_iter_texts_newest_first_without_counting(self, cache, clock):
+        """Test corpus iteration over stored responses."""
+        cache.put("k1", "m", "older")
+        clock.return_value += 10
+        cache.put("k2", "m", "newer")
+
+        assert list(cache.iter_texts()) == ["newer", "older"]
+        assert list(cache.iter_texts(limit=1)) == ["newer"]
+        assert cache.stats()["hits"] == 0
+
+    def test_clear(self, cache):
+        """Test that clear() removes entries and counters."""
+        cache.put("k1", "m", "text")
+        cache.get("k1")
+        cache.clear()
+
+        stats = cache.stats()
+        assert stats["entries"] == 0
+        assert stats["hits"] == 0
+
+
+class TestCachedGeneration:
+    """Test suite for the cache in front of generate_exegesis."""
+
+    def test_second_call_skips_api(self, tmp_path):
+        """Test that an unchanged prompt is served from the cache."""
+        from src.gemini_client import generate_exegesis
+        from src.response_cache import ResponseCache
+
+        cache = ResponseCache(tmp_path / "cache.sqlite")
+
+        with patch('google.generativeai.configure'):
+            with patch('google.generativeai.GenerativeModel') as mock_model:
+                mock_model.return_value.generate_content.return_value = MagicMock(text='{"verse_id": "GEN-1-1"}')
+
+                first = generate_exegesis("Prompt", "key", cache=cache)
+                second = generate_exegesis("Prompt", "key", cache=cache)
+
+        assert first == second == {"verse_id": "GEN-1-1"}
+        assert mock_model.return_value.generate_content.call_count == 1
+
+    def test_unparseable_response_is_still_cached(self, tmp_path):
+        """Test that raw text is kept so parser fixes can be replayed."""
+        from src.gemini_client import generate_exegesis, DEFAULT_MODEL
+        from src.response_cache import ResponseCache, make_cache_key
+
+        cache = ResponseCache(tmp_path / "cache.sqlite")
+
+        with patch('google.generativeai.configure'):
+            with patch('google.generativeai.GenerativeModel') as mock_model:
+                mock_model.return_value.generate_content.return_value = MagicMock(text="not json")
+                result = generate_exegesis("Prompt", "key", cache=cache)
+
+        assert result is None
+        assert cache.get(make_cache_key(DEFAULT_MODEL, "Prompt")) == "not json"
+
+    def test_failed_request_is_not_cached(self, tmp_path):
+        """Test that API failures leave no entry."""
+        from src.gemini_client import generate_exegesis
+        from src.response_cache import ResponseCache
+
+        cache = ResponseCache(tmp_path / "cache.sqlite")
+
+        with patch('google.generativeai.configure'):
+            with patch('google.generativeai.GenerativeModel') as mock_model:
+                mock_model.return_value.generate_content.side_effect = Exception("API Error")
+                with patch('time.sleep'):
+                    generate_exegesis("Prompt", "key", max_retries=2, cache=cache)
+
+        assert cache.stats()["entries"] == 0
+
+    def test_async_client_uses_cache(self, tmp_path):
+        """Test that the async client serves repeated prompts from the cache."""
+        import asyncio
+        from src.gemini_client import AsyncGeminiClient
+        from src.response_cache import ResponseCache
+        from tests.unit.test_gemini_client import FakeAsyncModel
+
+        fake = FakeAsyncModel(delay=0)
+        client = AsyncGeminiClient("key", model=fake, cache=ResponseCache(tmp_path / "cache.sqlite"))
+
+        asyncio.run(client.generate_text("Prompt"))
+        result = asyncio.run(client.generate_text("Prompt"))
+
+        assert result == '{"verse_id": "GEN-1-1"}'
+        assert fake.calls == 1
+
+    def test_async_client_reads_cache_off_the_event_loop(self, tmp_path):
+        """Test that cache lookups and writes run in worker threads."""
+        import asyncio
+        import threading
+        from src.gemini_client import AsyncGeminiClient
+        from src.response_cache import ResponseCache
+        from tests.unit.test_gemini_client import FakeAsyncModel
+
+        cache = ResponseCache(tmp_path / "cache.sqlite")
+        threads = []
+        for name in ("get", "put"):
+            original = getattr(cache, name)
+
+            def record(*args, _original=original):
+                threads.append(threading.current_thread())
+                return _original(*args)
+
+            setattr(cache, name, record)
+
+        client = AsyncGeminiClient("key", model=FakeAsyncModel(delay=0), cache=cache)
+        asyncio.run(client.generate_text("Prompt"))
+
+        assert len(threads) == 2
+        assert threading.main_thread() not in threads
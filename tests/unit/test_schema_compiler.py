@@ -0,0 +1,193 @@
+"""
+Unit tests for schema_compiler module.
+Tests that compiled schema checks agree with the Draft 7 validator.
+"""
+
+import pytest
+import copy
+import json
+import random
+from pathlib import Path
+
+
+SCHEMA_PATH = Path(__file__).parent.parent.parent / "schemas" / "verse_schema.json"
+FIXTURES = Path(__file__).parent.parent / "fixtures"
+
+# Replacement values covering every type and boundary the schema checks
+MUTATIONS = ["", "x", "GEN-1-1", "gen-1-1", 0, -91, 90, 180.5, 1.5, True, None, [], [""], ["ok"], {}, {"lat": 0}]
+
+
+def _paths(node, prefix=()):
+    """Every (path) into a JSON document."""
+    yield prefix
+    if isinstance(node, dict):
+        for key, value in node.items():
+            yield from _paths(value, prefix + (key,))
+    elif isinstance(node, list):
+        for index, value in enumerate(node):
+            yield from _paths(value, prefix + (index,))
+
+
+def _mutate(document, rng):
+    """Copy of document with one value replaced or one key deleted."""
+    mutated = copy.deepcopy(document)
+    path = rng.choice(list(_paths(mutated))[1:])
+    parent = mutated
+    for step in path[:-1]:
+        parent = parent[step]
+
+    if isinstance(parent, dict) and rng.random() < 0.3:
+        del parent[path[-1]]
+    else:
+        parent[path[-1]] = copy.deepcopy(rng.choice(MUTATIONS))
+    return mutated
+
+
+class TestSchemaCompiler:
+    """Test suite for compiled schema checks."""
+
+    @pytest.fixture
+    def schema(self):
+        """Verse schema dictionary."""
+        with open(SCHEMA_PATH) as f:
+            return json.load(f)
+
+    @pytest.fixture
+    def valid_verse(self):
+        """Valid verse fixture data."""
+        with open(FIXTURES / "valid_verse.json") as f:
+            return json.load(f)
+
+    def test_fixtures_match_draft7(self, schema):
+        """Test verdicts on the shared valid and invalid fixtures."""
+        from jsonschema import Draft7Validator
+        from src.schema_compiler import compile_schema
+
+        check = compile_schema(schema)
+        validator = Draft7Validator(schema)
+
+        for name in ("valid_verse.json", "invalid_verse_missing_field.json",
+                     "invalid_verse_bad_coordinates.json"):
+            with open(FIXTURES / name) as f:
+                document = json.load(f)
+            assert check(document) == validator.is_valid(document), name
+
+    def test_random_mutations_match_draft7(self, schema, valid_verse):
+        """Test verdicts on many single-field corruptions of a valid verse."""
+        from jsonschema import Draft7Validator
+        from src.schema_compiler import compile_schema
+
+        check = compile_schema(schema)
+        validator = Draft7Validator(schema)
+        rng = random.Random(7)
+
+        verdicts = set()
+        for _ in range(2000):
+            document = _mutate(valid_verse, rng)
+            verdict = validator.is_valid(document)
+            assert check(document) == verdict, json.dumps(document)[:500]
+            verdicts.add(verdict)
+
+        assert verdicts == {True, False}
+
+    @pytest.mark.parametrize("schema, instance, expected", [
+        ({"type": "number"}, True, False),
+        ({"type": "number"}, 3, True),
+        ({"type": "integer"}, 2.0, True),
+        ({"type": "integer"}, 2.5, False),
+        ({"type": ["string", "null"]}, None, True),
+        ({"minimum": 0}, "not a number", True),
+        ({"minLength": 2}, 5, True),
+        ({"required": ["a"]}, [], True),
+        ({"pattern": "^a"}, "ba", False),
+        ({"pattern": "a"}, "ba", True),
+        ({"items": {"type": "string"}, "minItems": 1}, ["x", 1], False),
+    ])
+    def test_keyword_semantics(self, schema, instance, expected):
+        """Test Draft 7 edge cases (booleans, integral floats, type guards)."""
+        from jsonschema import Draft7Validator
+        from src.schema_compiler import compile_schema
+
+        assert compile_schema(schema)(instance) is expected
+        assert Draft7Validator(schema).is_valid(instance) is expected
+
+    def test_unsupported_keyword_raises(self):
+        """Test that schemas outside the supported subset are rejected."""
+        from src.schema_compiler import compile_schema
+
+        with pytest.raises(ValueError):
+            compile_schema({"type": "object", "additionalProperties": False})
+        with pytest.raises(ValueError):
+            compile_schema({"items": [{"type": "string"}]})
+
+    def test_generated_source_is_readable(self, schema):
+        """Test that the generated source is a plain function."""
+        from src.schema_compiler import generate_validator_source
+
+        source = generate_validator_source(schema, name="validate_verse")
+
+        assert source.startswith("def validate_verse(data):")
+        assert "'section_3_life_application' not in data" in source
+
+
+class TestFastValidation:
+    """Test suite for the fast path in schema_validator."""
+
+    def test_fast_validator_used_for_schema_file(self):
+        """Test that schema files get a compiled check rather than Draft 7."""
+        from src.schema_validator import get_fast_validator, get_validator
+
+        check = get_fast_validator(SCHEMA_PATH)
+
+        assert check is get_fast_validator(SCHEMA_PATH)
+        assert check != get_validator(SCHEMA_PATH).is_valid
+
+    def test_unsupported_schema_falls_back_to_draft7(self, tmp_path):
+        """Test that a schema the compiler rejects is still validated."""
+        from src.schema_validator import validate_verse_json, get_validation_errors
+
+        schema_path = tmp_path / "strict.json"
+        schema_path.write_text(json.dumps({
+            "type": "object",
+            "properties": {"verse_id": {"type": "string"}},
+            "additionalProperties": False
+        }))
+
+        assert validate_verse_json({"verse_id": "GEN-1-1"}, schema_path) is True
+        assert validate_verse_json({"extra": 1}, schema_path) is False
+        assert len(get_validation_errors({"extra": 1}, schema_path)) == 1
+
+    @pytest.mark.parametrize("depth, wrap", [
+        (25, lambda inner: {"type": "array", "items": inner}),
+        (120, lambda inner: {"type": "object", "properties": {"a": inner}}),
+    ])
+    def test_deeply_nested_schema_falls_back_to_draft7(self, tmp_path, depth, wrap):
+        """Test that nesting the generated code cannot express raises ValueError, not SyntaxError."""
+        from src.schema_compiler import compile_schema
+        from src.schema_validator import validate_verse_json, get_validation_errors
+
+        schema = {"type": "string"}
+        valid = "leaf"
+        for _ in range(depth):
+            schema = wrap(schema)
+            valid = [valid] if schema["type"] == "array" else {"a": valid}
+        invalid = json.loads(json.dumps(valid).replace('"leaf"', '1'))
+        schema_path = tmp_path / "deep.json"
+        schema_path.write_text(json.dumps(schema))
+
+        with pytest.raises(ValueError, match="nested too deeply"):
+            compile_schema(schema)
+        assert validate_verse_json(valid, schema_path) is True
+        assert validate_verse_json(invalid, schema_path) is False
+        assert len(get_validation_errors(invalid, schema_path)) == 1
+
+    def test_errors_still_detailed(self):
+        """Test that invalid verses still get Draft 7 error messages."""
+        from src.schema_validator import get_validation_errors
+
+        with open(FIXTURES / "invalid_verse_bad_coordinates.json") as f:
+            document = json.load(f)
+
+        errors = get_validation_errors(document, SCHEMA_PATH)
+
+        assert any("coordinates.lat" in error for error in errors)
@@ -238,6 +238,31 @@ class TestSchemaValidator:
 
         assert result is False
 
+    def test_get_mandatory_field_errors_lists_every_failure(self):
+        """Test that get_mandatory_field_errors() reports each failing path."""
+        from src.schema_validator import get_mandatory_field_errors
+
+        verse_data = {
+            "section_1_sacred_text": {
+                "original_script": " ",
+                "faithful_direct_translation": "text",
+                "standalone_english_translation": "text",
+            },
+            "section_2_exegetical_synthesis": {
+                "geospatial_and_physical_geography": {"coordinates": {"lat": 31.7}}
+            },
+            "section_3_life_application": "text",
+        }
+
+        errors = get_mandatory_field_errors(verse_data)
+
+        assert errors == [
+            "verse_id: missing",
+            "section_1_sacred_text.original_script: empty",
+            "section_1_sacred_text.amplified_narrative_translation: missing",
+            "section_2_exegetical_synthesis.geospatial_and_physical_geography.coordinates: needs lat and long",
+        ]
+
     def test_get_validation_errors_returns_list(self, schema_path, invalid_verse_missing_field_path):
         """Test that get_validation_errors() returns list of error messages."""
         from src.schema_validator import get_validation_errors
@@ -300,3 +325,76 @@ class TestSchemaValidator:
 
         assert validate_coordinates(32.5, 200) is False
         assert validate_coordinates(32.5, -200) is False
+
+
+class TestValidatorCache:
+    """Test suite for compiled validator caching."""
+
+    @pytest.fixture
+    def schema_copy(self, tmp_path):
+        """Writable copy of the verse schema."""
+        source = Path(__file__).parent.parent.parent / "schemas" / "verse_schema.json"
+        path = tmp_path / "verse_schema.json"
+        path.write_text(source.read_text(encoding='utf-8'), encoding='utf-8')
+        return path
+
+    @pytest.fixture
+    def valid_verse(self):
+        """Valid verse fixture data."""
+        with open(Path(__file__).parent.parent / "fixtures" / "valid_verse.json") as f:
+            return json.load(f)
+
+    def test_validator_compiled_once_per_path(self, schema_copy, valid_verse):
+        """Test that repeated validations reuse one compiled validator."""
+        from unittest.mock import patch
+        from src.schema_validator import get_validator, validate_verse_json, load_schema
+
+        with patch('src.schema_validator.load_schema', wraps=load_schema) as mock_load:
+            for _ in range(5):
+                assert validate_verse_json(valid_verse, schema_copy) is True
+
+        assert mock_load.call_count == 1
+        assert get_validator(schema_copy) is get_validator(str(schema_copy))
+
+    def test_validator_rebuilt_when_schema_changes(self, schema_copy, valid_verse):
+        """Test that editing the schema file invalidates the cached validator."""
+        import os
+        from src.schema_validator import validate_verse_json
+
+        assert validate_verse_json(valid_verse, schema_copy) is True
+
+        schema = json.loads(schema_copy.read_text(encoding='utf-8'))
+        schema["required"] = schema["required"] + ["not_a_real_field"]
+        schema_copy.write_text(json.dumps(schema), encoding='utf-8')
+        stat = schema_copy.stat()
+        os.utime(schema_copy, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert validate_verse_json(valid_verse, schema_copy) is False
+
+    def test_missing_schema_fails_validation(self, tmp_path, valid_verse):
+        """Test that a missing schema fails validation."""
+        from src.schema_validator import validate_verse_json, get_validation_errors
+
+        missing = tmp_path / "missing.json"
+
+        assert validate_verse_json(valid_verse, missing) is False
+        assert get_validation_errors(valid_verse, missing)[0].startswith("Schema loading error")
+
+    def test_validate_many_matches_single_validation(self, schema_copy, valid_verse):
+        """Test that validate_many() returns per-verse verdicts in order."""
+        from src.schema_validator import validate_many, validate_verse_json
+
+        broken = dict(valid_verse)
+        del broken["verse_id"]
+        verses = [valid_verse, broken, valid_verse]
+
+        results = validate_many(verses, schema_copy)
+
+        assert results == [True, False, True]
+        assert results == [validate_verse_json(v, schema_copy) for v in verses]
+
+    def test_validate_many_missing_schema(self, tmp_path, valid_verse):
+        """Test that validate_many() fails every verse without a schema."""
+        from src.schema_validator import validate_many
+
+        assert validate_many([valid_verse, valid_verse], tmp_path / "missing.json") == [False, False]
@@ -0,0 +1,295 @@
+"""
+Unit tests for tag_indexer module.
+Tests tag extraction and incremental re-indexing against the manifest.
+"""
+
+import pytest
+import json
+import os
+from pathlib import Path
+
+
+def write_verse(data_dir, rel, verse_id, tags, **fields):
+    """Write a verse file and bump its mtime so the change is always seen."""
+    path = Path(data_dir) / rel
+    path.parent.mkdir(parents=True, exist_ok=True)
+    existed = path.exists()
+    old_mtime = path.stat().st_mtime_ns if existed else 0
+    path.write_text(json.dumps({"verse_id": verse_id, "tags": tags, **fields}), encoding='utf-8')
+    if existed:
+        os.utime(path, ns=(old_mtime + 1_000_000_000, old_mtime + 1_000_000_000))
+    return path
+
+
+def read_outputs(output_dir):
+    """Output file name -> bytes."""
+    return {path.name: path.read_bytes() for path in sorted(Path(output_dir).glob("*.json"))}
+
+
+class TestTagIndexer:
+    """Test suite for full and incremental tag indexing."""
+
+    @pytest.fixture
+    def data_dir(self, tmp_path):
+        """Data tree with three tagged verses and one untagged verse."""
+        data_dir = tmp_path / "data"
+        write_verse(data_dir, "NT/Acts/10/01.json", "ACTS-10-1", {
+            "people": {"named_individuals": [{"name": "Cornelius"}, "Peter"]},
+            "themes": ["grace", None],
+        })
+        write_verse(data_dir, "NT/Acts/10/02.json", "ACTS-10-2", {
+            "themes": ["grace", "prayer"],
+            "genre": "narrative",
+        })
+        write_verse(data_dir, "NT/Acts/11/01.json", "ACTS-11-1", {"themes": ["mission"]})
+        write_verse(data_dir, "OT/Genesis/1/01.json", "GEN-1-1", {})
+        return data_dir
+
+    def full_outputs(self, data_dir, output_dir):
+        """Outputs of a full, in-memory index."""
+        from src.tag_indexer import TagIndexer
+
+        indexer = TagIndexer(data_dir)
+        indexer.index_all_verses()
+        indexer.save_flat_index(output_dir / "tag_index.json")
+        indexer.save_category_summary(output_dir / "tag_categories.json")
+        indexer.save_verse_tags(output_dir / "verse_tags.json")
+        return read_outputs(output_dir)
+
+    def test_extracts_nested_list_and_single_tags(self, data_dir, tmp_path):
+        """Test the flat index, category index and verse tags of a full index."""
+        from src.tag_indexer import TagIndexer
+
+        indexer = TagIndexer(data_dir, tmp_path / "manifest.sqlite")
+        indexer.index_all_verses()
+
+        assert indexer.tag_index[:3] == [
+            {"v": "ACTS-10-1", "cat": "people:named_individuals", "val": "Cornelius"},
+            {"v": "ACTS-10-1", "cat": "people:named_individuals", "val": "Peter"},
+            {"v": "ACTS-10-1", "cat": "themes", "val": "grace"},
+        ]
+        assert indexer.category_index["themes"] == {"grace", "prayer", "mission"}
+        assert indexer.verse_tags["ACTS-10-2"] == ["themes:grace", "themes:prayer", "genre:narrative"]
+        assert "GEN-1-1" not in indexer.verse_tags
+        assert indexer.generate_statistics()["total_tag_entries"] == 7
+
+    def test_first_incremental_run_matches_full_index(self, data_dir, tmp_path):
+        """Test that outputs built from the manifest are byte-identical."""
+        from src.tag_indexer import TagIndexer
+
+        indexer = TagIndexer(data_dir, tmp_path / "manifest.sqlite")
+        counts = indexer.update_index()
+        written = indexer.save_affected_outputs(tmp_path / "incremental")
+
+        assert counts == {"added": 4, "changed": 0, "removed": 0, "unchanged": 0}
+        assert len(written) == 4
+
+        incremental = read_outputs(tmp_path / "incremental")
+        stats = json.loads(incremental.pop("tag_statistics.json"))
+        assert incremental == self.full_outputs(data_dir, tmp_path / "full")
+        assert stats["total_verses"] == 3
+        assert stats["total_tag_entries"] == 7
+
+    def test_changed_and_removed_files_are_patched(self, data_dir, tmp_path):
+        """Test that later runs only re-read and re-emit what changed."""
+        from src.tag_indexer import TagIndexer
+
+        manifest = tmp_path / "manifest.sqlite"
+        output_dir = tmp_path / "incremental"
+        TagIndexer(data_dir, manifest).update_index()
+        TagIndexer(data_dir, manifest).save_affected_outputs(output_dir)
+
+        write_verse(data_dir, "NT/Acts/10/02.json", "ACTS-10-2", {"themes": ["grace", "fasting"]})
+        (data_dir / "NT/Acts/11/01.json").unlink()
+
+        indexer = TagIndexer(data_dir, manifest)
+        counts = indexer.update_index()
+        indexer.save_affected_outputs(output_dir)
+
+        assert counts == {"added": 0, "changed": 1, "removed": 1, "unchanged": 2}
+        assert indexer.affected_outputs == {"tag_index", "verse_tags", "tag_categories", "tag_statistics"}
+
+        incremental = read_outputs(output_dir)
+        incremental.pop("tag_statistics.json")
+        assert incremental == self.full_outputs(data_dir, tmp_path / "full")
+        categories = json.loads(incremental["tag_categories.json"])
+        assert categories["themes"]["values"] == ["fasting", "grace"]
+        assert "genre" not in categories
+
+    def test_unaffected_outputs_are_not_rewritten(self, data_dir, tmp_path):
+        """Test re-emission of only the outputs a change affects."""
+        from src.tag_indexer import TagIndexer
+
+        manifest = tmp_path / "manifest.sqlite"
+        TagIndexer(data_dir, manifest).update_index()
+
+        # Same values, different verse: categories are unaffected
+        write_verse(data_dir, "NT/Acts/11/01.json", "ACTS-11-1", {"themes": ["mission", "grace"]})
+        indexer = TagIndexer(data_dir, manifest)
+        indexer.update_index()
+        assert indexer.affected_outputs == {"tag_index", "verse_tags", "tag_statistics"}
+
+        # Non-tag fields only: nothing is affected
+        write_verse(data_dir, "NT/Acts/11/01.json", "ACTS-11-1", {"themes": ["mission", "grace"]}, note="edited")
+        assert indexer.update_index()["changed"] == 1
+        assert indexer.affected_outputs == set()
+
+        # Rewritten with identical content: counted as unchanged
+        write_verse(data_dir, "NT/Acts/11/01.json", "ACTS-11-1", {"themes": ["mission", "grace"]}, note="edited")
+        assert indexer.update_index()["unchanged"] == 4
+        assert indexer.affected_outputs == set()
+
+        output_dir = tmp_path / "incremental"
+        assert len(indexer.save_affected_outputs(output_dir)) == 4  # Missing outputs are written
+        assert indexer.save_affected_outputs(output_dir) == []
+
+    def test_update_patches_in_memory_index(self, data_dir, tmp_path):
+        """Test that a held full index is patched in place."""
+        from src.tag_indexer import TagIndexer
+
+        indexer = TagIndexer(data_dir, tmp_path / "manifest.sqlite")
+        indexer.index_all_verses()
+        indexer.update_index()
+
+        write_verse(data_dir, "NT/Acts/10/01.json", "ACTS-10-1", {"themes": ["grace"]})
+        write_verse(data_dir, "NT/Acts/12/01.json", "ACTS-12-1", {"themes": ["release"]})
+        category_index = indexer.category_index
+        indexer.update_index()
+
+        assert indexer.category_index is category_index
+        assert "people:named_individuals" not in indexer.category_index
+        assert indexer.category_index["themes"] == {"grace", "prayer", "mission", "release"}
+        assert indexer.verse_tags["ACTS-10-1"] == ["themes:grace"]
+        assert [entry["v"] for entry in indexer.tag_index] == [
+            "ACTS-10-1", "ACTS-10-2", "ACTS-10-2", "ACTS-10-2", "ACTS-11-1", "ACTS-12-1"
+        ]
+
+    @pytest.mark.parametrize("incremental", [False, True])
+    def test_process_pool_matches_serial(self, data_dir, tmp_path, incremental):
+        """Test that parsing across workers merges in file order."""
+        from src.tag_indexer import TagIndexer
+
+        for index in range(20):
+            write_verse(data_dir, f"NT/Acts/12/{index + 1:02d}.json", f"ACTS-12-{index + 1}", {"themes": [f"t{index % 3}"]})
+
+        if incremental:
+            serial_dir, parallel_dir = tmp_path / "serial", tmp_path / "parallel"
+            serial = TagIndexer(data_dir, tmp_path / "serial.sqlite")
+            parallel = TagIndexer(data_dir, tmp_path / "parallel.sqlite")
+            assert serial.update_index(workers=1) == parallel.update_index(workers=2, chunk_size=3)
+            serial.save_affected_outputs(serial_dir)
+            parallel.save_affected_outputs(parallel_dir)
+            assert read_outputs(serial_dir) == read_outputs(parallel_dir)
+        else:
+            serial = TagIndexer(data_dir)
+            serial.index_all_verses(workers=1)
+            parallel = TagIndexer(data_dir)
+            parallel.index_all_verses(workers=2, chunk_size=3)
+
+            assert parallel.tag_index == serial.tag_index
+            assert list(parallel.verse_tags.items()) == list(serial.verse_tags.items())
+            assert parallel.category_index == serial.category_index
+
+
+class TestShardedOutputs:
+    """Test suite for per-category and per-book shards."""
+
+    @pytest.fixture
+    def indexer(self, tmp_path):
+        """Full index over verses in two books."""
+        from src.tag_indexer import TagIndexer
+
+        data_dir = tmp_path / "data"
+        write_verse(data_dir, "NT/Acts/10/01.json", "ACTS-10-1", {
+            "people": {"named_individuals": [{"name": "Cornelius"}]},
+            "themes": ["grace", "grace"],
+        })
+        write_verse(data_dir, "NT/Acts/10/02.json", "ACTS-10-2", {"themes": ["prayer", "grace"]})
+        write_verse(data_dir, "OT/1 Samuel/1/01.json", "1SA-1-1", {"themes": ["prayer"]})
+
+        indexer = TagIndexer(data_dir)
+        indexer.index_all_verses()
+        return indexer
+
+    def test_shards_and_manifest(self, indexer, tmp_path):
+        """Test the shard layout and contents."""
+        output_dir = tmp_path / "tags"
+        manifest = indexer.save_sharded_outputs(output_dir)
+
+        assert manifest["total_verses"] == 3
+        assert manifest["categories"]["themes"]["verses"] == 3
+        assert manifest["categories"]["people:named_individuals"]["file"] == "categories/people-named_individuals.json"
+        assert manifest["books"]["1 Samuel"]["file"] == "books/1-Samuel.json"
+        assert json.loads((output_dir / "manifest.json").read_text(encoding='utf-8')) == manifest
+
+        themes = json.loads((output_dir / "categories" / "themes.json").read_text(encoding='utf-8'))
+        assert themes == {"grace": ["ACTS-10-1", "ACTS-10-2"], "prayer": ["ACTS-10-2", "1SA-1-1"]}
+        acts = json.loads((output_dir / "books" / "Acts.json").read_text(encoding='utf-8'))
+        assert acts == {k: v for k, v in indexer.verse_tags.items() if k.startswith("ACTS")}
+
+    def test_minified_pretty_and_gzip_variants(self, indexer, tmp_path):
+        """Test the output variants and their manifest sizes."""
+        import gzip
+
+        output_dir = tmp_path / "tags"
+        manifest = indexer.save_sharded_outputs(output_dir, minify=True, gzip_variants=True)
+        minified = (output_dir / "books" / "Acts.json").read_bytes()
+
+        assert b"\n" not in minified
+        assert gzip.decompress((output_dir / "books" / "Acts.json.gz").read_bytes()) == minified
+        assert manifest["books"]["Acts"]["gzip_bytes"] == (output_dir / "books" / "Acts.json.gz").stat().st_size
+
+        manifest = indexer.save_sharded_outputs(output_dir, minify=False)
+        pretty = (output_dir / "books" / "Acts.json").read_bytes()
+
+        assert json.loads(pretty) == json.loads(minified)
+        assert manifest["books"]["Acts"]["bytes"] == len(pretty) > len(minified)
+        assert not list(output_dir.rglob("*.gz"))
+
+    def test_unchanged_shards_kept_and_stale_removed(self, indexer, tmp_path):
+        """Test that reruns only touch shards whose content changed."""
+        output_dir = tmp_path / "tags"
+        indexer.save_sharded_outputs(output_dir)
+        acts = output_dir / "books" / "Acts.json"
+        os.utime(acts, ns=(0, 0))
+
+        (indexer.data_path / "OT/1 Samuel/1/01.json").unlink()
+        indexer.index_all_verses()
+        manifest = indexer.save_sharded_outputs(output_dir)
+
+        assert acts.stat().st_mtime_ns == 0
+        assert "1 Samuel" not in manifest["books"]
+        assert not (output_dir / "books" / "1-Samuel.json").exists()
+
+    def test_shards_remove_monolithic_outputs(self, indexer, tmp_path):
+        """Test that stale tag_index.json and verse_tags.json do not outlive a sharded build."""
+        output_dir = tmp_path / "_data"
+        indexer.save_flat_index(output_dir / "tag_index.json")
+        indexer.save_verse_tags(output_dir / "verse_tags.json")
+        indexer.save_category_summary(output_dir / "tag_categories.json")
+
+        assert indexer.remove_flat_outputs(output_dir) == ["tag_index.json", "verse_tags.json"]
+        assert sorted(path.name for path in output_dir.iterdir()) == ["tag_categories.json"]
+        assert indexer.remove_flat_outputs(output_dir) == []
+
+    def test_incremental_run_keeps_sharded_site_sharded(self, tmp_path, monkeypatch):
+        """Test that --incremental after --shards does not recreate the monolithic outputs."""
+        from src.tag_indexer import build_tag_indexes
+
+        monkeypatch.chdir(tmp_path)
+        write_verse(tmp_path / "data", "NT/Acts/10/01.json", "ACTS-10-1", {"themes": ["grace"]})
+        build_tag_indexes(workers=1, shards=True)
+
+        write_verse(tmp_path / "data", "NT/Acts/10/02.json", "ACTS-10-2", {"themes": ["prayer"]})
+        build_tag_indexes(incremental=True, workers=1)
+
+        outputs = read_outputs(tmp_path / "website" / "_data")
+        assert sorted(outputs) == ["tag_categories.json", "tag_statistics.json"]
+        assert "prayer" in json.loads(outputs["tag_categories.json"])["themes"]["values"]
+
+    def test_shard_names_are_unique(self):
+        """Test that keys differing only in punctuation or case get distinct files."""
+        from src.tag_indexer import _shard_name
+
+        taken = set()
+        assert [_shard_name(key, taken) for key in ["a:b", "a b", "A-B", "???"]] == ["a-b", "a-b-2", "A-B-3", "_"]
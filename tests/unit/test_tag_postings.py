@@ -0,0 +1,143 @@
+"""
+Unit tests for tag_postings module.
+Tests posting list building, set algebra queries, counts and storage.
+"""
+
+import pytest
+import json
+from pathlib import Path
+
+
+def write_verse(data_dir, rel, verse_id, tags):
+    """Write a minimal verse file."""
+    path = Path(data_dir) / rel
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({"verse_id": verse_id, "tags": tags}), encoding='utf-8')
+
+
+class TestTagPostings:
+    """Test suite for the inverted tag index."""
+
+    @pytest.fixture
+    def indexer(self, tmp_path):
+        """Full index of four tagged verses, one untagged verse and a stray file."""
+        from src.tag_indexer import TagIndexer
+
+        data_dir = tmp_path / "data"
+        write_verse(data_dir, "OT/Genesis/1/01.json", "GEN-1-1", {"themes": ["creation", "grace"]})
+        write_verse(data_dir, "OT/Genesis/1/02.json", "GEN-1-2", {"themes": ["creation"], "genre": "narrative"})
+        write_verse(data_dir, "NT/Acts/10/01.json", "ACTS-10-1", {
+            "themes": ["grace"],
+            "people": {"named_individuals": [{"name": "Cornelius"}]},
+        })
+        write_verse(data_dir, "NT/Acts/10/02.json", "ACTS-10-2", {"themes": ["prayer"], "genre": "narrative"})
+        write_verse(data_dir, "NT/Acts/10/03.json", "ACTS-10-3", {})
+        write_verse(data_dir, "notes.json", "NOTE", {"themes": ["grace"]})
+
+        indexer = TagIndexer(data_dir)
+        indexer.index_all_verses()
+        return indexer
+
+    @pytest.fixture
+    def postings(self, indexer):
+        """Postings built from the fixture index."""
+        from src.tag_postings import build_tag_postings
+
+        return build_tag_postings(indexer)
+
+    def ids(self, postings, ordinals):
+        return [postings.verse_id(ordinal) for ordinal in ordinals]
+
+    def test_posting_lists_are_sorted_ordinals(self, postings):
+        """Test that terms map to canonical ordinals, skipping non-verse files."""
+        from src.bible_structure import get_verse_ordinal
+
+        assert postings.ordinals("themes", "grace") == [
+            get_verse_ordinal("Genesis", 1, 1), get_verse_ordinal("Acts", 10, 1)
+        ]
+        assert postings.ordinals("themes", "missing") == []
+        assert postings.verse_count() == 4
+        assert ("people:named_individuals", "Cornelius") in postings.terms
+
+    def test_and_or_not(self, postings):
+        """Test set algebra over tags."""
+        assert self.ids(postings, postings.query(all_of=[("themes", "grace"), ("themes", "creation")])) == ["GEN-1-1"]
+        assert self.ids(postings, postings.query(any_of=[("themes", "prayer"), ("themes", "creation")])) == [
+            "GEN-1-1", "GEN-1-2", "ACTS-10-2"
+        ]
+        assert self.ids(postings, postings.query(none_of=[("genre", "narrative")])) == ["GEN-1-1", "ACTS-10-1"]
+        assert self.ids(postings, postings.query(
+            all_of=[("genre", "narrative")], any_of=[("themes", "prayer"), ("themes", "grace")]
+        )) == ["ACTS-10-2"]
+        assert postings.query(all_of=[("themes", "unknown")]) == []
+        assert postings.count() == 4
+
+    def test_bare_category_matches_any_value(self, postings):
+        """Test (category, None) terms."""
+        assert self.ids(postings, postings.query(all_of=[("genre", None)])) == ["GEN-1-2", "ACTS-10-2"]
+        assert self.ids(postings, postings.query(none_of=[("people:named_individuals", None)])) == [
+            "GEN-1-1", "GEN-1-2", "ACTS-10-2"
+        ]
+
+    def test_counts_by_category_and_value(self, postings):
+        """Test facet counts, overall and within a query."""
+        assert postings.category_counts() == {"genre": 2, "people:named_individuals": 1, "themes": 4}
+        assert postings.category_counts(all_of=[("themes", "grace")]) == {
+            "people:named_individuals": 1, "themes": 2
+        }
+        assert postings.value_counts("themes") == {"creation": 2, "grace": 2, "prayer": 1}
+        assert postings.value_counts("themes", none_of=[("genre", None)]) == {"creation": 1, "grace": 2}
+
+    def test_save_and_load_round_trip(self, postings, tmp_path):
+        """Test the on-disk format and the reuse of loaded postings."""
+        from src.tag_postings import TagPostings, open_tag_postings
+
+        path = tmp_path / "tag_postings.bin"
+        postings.save(path)
+        loaded = TagPostings.load(path)
+
+        assert loaded.terms == postings.terms
+        assert loaded.query(any_of=[("themes", "grace")]) == postings.query(any_of=[("themes", "grace")])
+        assert loaded.verse_id(loaded.ordinals("themes", "prayer")[0]) == "ACTS-10-2"
+        assert open_tag_postings(path) is open_tag_postings(path)
+
+    def test_rejects_foreign_files(self, tmp_path):
+        """Test that other files are not read as postings."""
+        from src.tag_postings import TagPostings, open_tag_postings
+
+        path = tmp_path / "other.bin"
+        path.write_bytes(b"NOTPOSTINGS")
+
+        with pytest.raises(ValueError):
+            TagPostings.load(path)
+        assert open_tag_postings(path) is None
+        assert open_tag_postings(tmp_path / "missing.bin") is None
+
+    @pytest.mark.parametrize("text, expected", [
+        ("themes=grace", ("themes", "grace")),
+        ("people:named_individuals = Cornelius", ("people:named_individuals", "Cornelius")),
+        ("genre", ("genre", None)),
+        ("themes=a=b", ("themes", "a=b")),
+    ])
+    def test_parse_tag_term(self, text, expected):
+        """Test query term parsing."""
+        from src.tag_postings import parse_tag_term
+
+        assert parse_tag_term(text) == expected
+
+    def test_tag_search_command(self, postings, tmp_path):
+        """Test `tag-search` end to end."""
+        from unittest.mock import patch
+        from click.testing import CliRunner
+        from src.cli import cli
+
+        path = tmp_path / "tag_postings.bin"
+        postings.save(path)
+
+        with patch('src.tag_postings.get_tag_postings_path', return_value=path):
+            result = CliRunner().invoke(cli, ['tag-search', '--any', 'themes=grace', '--not', 'genre', '--counts'])
+
+        assert result.exit_code == 0
+        assert "2 matching verses" in result.output
+        assert "ACTS-10-1" in result.output
+        assert "people:named_individuals: 1" in result.output
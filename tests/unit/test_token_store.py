@@ -0,0 +1,182 @@
+"""
+Unit tests for token_store module.
+Tests the columnar interlinear token store and interlinear pre-fill.
+"""
+
+import pytest
+import shutil
+from pathlib import Path
+
+
+class TestTokenStore:
+    """Test suite for building and reading the token store."""
+
+    @pytest.fixture
+    def sources(self, tmp_path):
+        """OSHB and SBLGNT directory layouts holding the sample fixtures."""
+        fixtures = Path(__file__).parent.parent / "fixtures"
+
+        oshb_dir = tmp_path / "morphhb"
+        (oshb_dir / "wlc").mkdir(parents=True)
+        shutil.copy(fixtures / "oshb_sample.xml", oshb_dir / "wlc" / "Gen.xml")
+
+        sblgnt_dir = tmp_path / "sblgnt"
+        sblgnt_dir.mkdir()
+        shutil.copy(fixtures / "sblgnt_sample.txt", sblgnt_dir / "sblgnt.txt")
+
+        return oshb_dir, sblgnt_dir
+
+    @pytest.fixture
+    def store_path(self, sources, tmp_path):
+        """Token store built from the sample sources."""
+        from src.token_store import build_token_store
+
+        oshb_dir, sblgnt_dir = sources
+        path = tmp_path / "tokens.bin"
+        build_token_store(oshb_dir, sblgnt_dir, path)
+        return path
+
+    def test_store_has_slot_for_every_verse(self, store_path):
+        """Test that verse offsets cover the whole canon."""
+        from src.token_store import TokenStore
+        from src.bible_structure import get_total_verse_count
+
+        store = TokenStore.load(store_path)
+
+        assert store.verse_count() == get_total_verse_count()
+        assert store.column("verse_offsets")[-1] == len(store)
+
+    def test_tokens_match_direct_extraction(self, sources, store_path):
+        """Test that stored tokens equal extract_verse_tokens() output."""
+        from src.token_store import TokenStore
+        from src.verse_extractor import extract_verse_tokens
+
+        oshb_dir, sblgnt_dir = sources
+        store = TokenStore.load(store_path)
+
+        for book, chapter, verse in [("Genesis", 1, 1), ("Genesis", 2, 1), ("Acts", 10, 44)]:
+            expected = extract_verse_tokens(book, chapter, verse, oshb_dir, sblgnt_dir)
+            assert store.get_tokens(book, chapter, verse) == expected
+
+    def test_missing_verse_returns_none(self, store_path):
+        """Test that verses absent from the sources have no tokens."""
+        from src.token_store import TokenStore
+
+        store = TokenStore.load(store_path)
+
+        assert store.get_tokens("Exodus", 1, 1) is None
+        assert store.get_tokens("Genesis", 99, 1) is None
+
+    def test_string_columns_are_dictionary_encoded(self, store_path):
+        """Test that repeated strings share one id."""
+        from src.token_store import TokenStore
+
+        store = TokenStore.load(store_path)
+        strongs = store.strings["strongs"]
+
+        assert len(strongs) == len(set(strongs))
+        assert strongs[0] == ""
+        assert max(store.column("strongs")) < len(strongs)
+
+    def test_load_rejects_other_files(self, tmp_path):
+        """Test that a file without the store header is rejected."""
+        from src.token_store import TokenStore
+
+        bogus = tmp_path / "bogus.bin"
+        bogus.write_bytes(b"not a token store")
+
+        with pytest.raises(ValueError):
+            TokenStore.load(bogus)
+
+    def test_open_token_store_reuses_loaded_store(self, store_path):
+        """Test that repeated opens share one loaded store."""
+        from src.token_store import open_token_store
+
+        assert open_token_store(store_path) is open_token_store(store_path)
+
+    def test_open_token_store_missing_file_returns_none(self, tmp_path):
+        """Test that a missing store is not an error."""
+        from src.token_store import open_token_store
+
+        assert open_token_store(tmp_path / "missing.bin") is None
+
+    def test_generated_interlinear_takes_source_words(self, store_path):
+        """Test that generation overwrites source fields and keeps model glosses."""
+        from src.exegesis_generator import apply_source_interlinear
+        from src.token_store import TokenStore
+
+        tokens = TokenStore.load(store_path).get_tokens("Acts", 10, 44)
+        data = {"interlinear_analysis": [
+            {"word_number": 1, "greek_word": "wrong", "strongs_number": "G9999", "english_gloss": "still"}
+        ]}
+
+        apply_source_interlinear(data, "Acts", 10, 44, store_path)
+        entry = data["interlinear_analysis"][0]
+
+        assert entry["greek_word"] == tokens[0]["surface"]
+        assert entry["strongs_number"] == tokens[0]["strongs"]
+        assert entry["english_gloss"] == "still"
+
+    def test_missing_interlinear_is_prefilled(self, store_path):
+        """Test that a verse without interlinear gets the source entries."""
+        from src.exegesis_generator import apply_source_interlinear
+        from src.token_store import TokenStore, prefill_interlinear
+
+        tokens = TokenStore.load(store_path).get_tokens("Genesis", 1, 1)
+        data = apply_source_interlinear({"verse_id": "GEN-1-1"}, "Genesis", 1, 1, store_path)
+
+        assert data["interlinear_analysis"] == prefill_interlinear(tokens, "OT")
+
+    def test_fact_checker_reads_token_store(self, store_path):
+        """Test that the interlinear check uses the store instead of the sources."""
+        from unittest.mock import patch
+        from src.fact_checker import FactChecker, FactCheckResult
+
+        checker = FactChecker()
+        checker.sources_path = store_path.parent
+        verse_data = {"interlinear_analysis": [{"word_number": 1, "strongs_number": "G9999"}]}
+        result = FactCheckResult()
+
+        with patch("src.fact_checker.get_token_store_path", return_value=store_path):
+            with patch("src.fact_checker.extract_verse_tokens") as mock_extract:
+                checker._check_interlinear(verse_data, "Acts", 10, 44, result)
+
+        mock_extract.assert_not_called()
+        assert result.passed is False
+
+
+class TestPrefillInterlinear:
+    """Test suite for interlinear pre-fill from source tokens."""
+
+    def test_greek_entries(self):
+        """Test that Greek entries carry word, lemma, Strong's and morph."""
+        from src.token_store import prefill_interlinear
+
+        tokens = [{"position": 1, "surface": "Πέτρος", "lemma": "Πέτρος", "strongs": "G4074", "morph": "N- ----NSM-"}]
+
+        assert prefill_interlinear(tokens, "NT") == [{
+            "word_number": 1,
+            "greek_word": "Πέτρος",
+            "lemma": "Πέτρος",
+            "strongs_number": "G4074",
+            "source_morph": "N- ----NSM-",
+        }]
+
+    def test_hebrew_entries_omit_lemma(self):
+        """Test that OSHB lemma codes are not used as dictionary forms."""
+        from src.token_store import prefill_interlinear
+
+        tokens = [{"position": 3, "surface": "אֱלֹהִ֑ים", "lemma": "430", "strongs": "H430", "morph": "HNcmpa"}]
+        entry = prefill_interlinear(tokens, "OT")[0]
+
+        assert entry["hebrew_word"] == "אֱלֹהִ֑ים"
+        assert entry["strongs_number"] == "H430"
+        assert "lemma" not in entry
+
+    def test_missing_fields_are_left_out(self):
+        """Test that tokens without morphology give minimal entries."""
+        from src.token_store import prefill_interlinear
+
+        tokens = [{"position": 1, "surface": "Ἔτι", "lemma": None, "strongs": None, "morph": None}]
+
+        assert prefill_interlinear(tokens, "NT") == [{"word_number": 1, "greek_word": "Ἔτι"}]
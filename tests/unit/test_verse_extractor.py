@@ -251,3 +251,292 @@ class TestVerseExtractor:
         result = extract_greek_verse("Acts", 10, 44, tmp_path / "nonexistent.txt")
 
         assert result is None
+
+
+class TestBookCache:
+    """Test suite for the parsed-book LRU cache."""
+
+    @pytest.fixture(autouse=True)
+    def fresh_cache(self):
+        """Start every test with an empty cache at the default budget."""
+        from src.verse_extractor import clear_book_cache, configure_book_cache, DEFAULT_BOOK_CACHE_BYTES
+
+        clear_book_cache()
+        yield
+        configure_book_cache(DEFAULT_BOOK_CACHE_BYTES)
+        clear_book_cache()
+
+    @pytest.fixture
+    def oshb_file(self, tmp_path):
+        """Sample OSHB book copied to a temp file (no compiled index)."""
+        import shutil
+        target = tmp_path / "Gen.xml"
+        shutil.copy(Path(__file__).parent.parent / "fixtures" / "oshb_sample.xml", target)
+        return target
+
+    def test_repeated_verses_parse_book_once(self, oshb_file):
+        """Test that a book is parsed once for many verse lookups."""
+        from src.verse_extractor import extract_hebrew_verse, get_book_cache_stats
+
+        with patch("src.corpus_index.etree.parse", wraps=__import__("lxml.etree").etree.parse) as mock_parse:
+            for chapter, verse in [(1, 1), (1, 2), (2, 1)]:
+                assert extract_hebrew_verse("Genesis", chapter, verse, oshb_file) is not None
+
+        assert mock_parse.call_count == 1
+        stats = get_book_cache_stats()
+        assert stats["misses"] == 1
+        assert stats["hits"] == 2
+        assert stats["entries"] == 1
+        assert stats["bytes"] > 0
+
+    def test_cached_text_matches_uncached(self, oshb_file):
+        """Test that cached lookups return the same text as a fresh parse."""
+        from src.verse_extractor import extract_hebrew_verse, configure_book_cache
+
+        configure_book_cache(0)
+        uncached = extract_hebrew_verse("Genesis", 1, 2, oshb_file)
+        configure_book_cache(10 * 1024 * 1024)
+        extract_hebrew_verse("Genesis", 1, 1, oshb_file)
+
+        assert extract_hebrew_verse("Genesis", 1, 2, oshb_file) == uncached
+
+    def test_zero_budget_disables_caching(self, oshb_file):
+        """Test that a zero byte budget keeps nothing in the cache."""
+        from src.verse_extractor import extract_hebrew_verse, configure_book_cache, get_book_cache_stats
+
+        configure_book_cache(0)
+        extract_hebrew_verse("Genesis", 1, 1, oshb_file)
+        extract_hebrew_verse("Genesis", 1, 2, oshb_file)
+
+        stats = get_book_cache_stats()
+        assert stats["entries"] == 0
+        assert stats["misses"] == 2
+
+    def test_modified_file_is_reparsed(self, oshb_file):
+        """Test that a new mtime replaces the old cache entry."""
+        import os
+        from src.verse_extractor import extract_hebrew_verse, get_book_cache_stats
+
+        extract_hebrew_verse("Genesis", 1, 1, oshb_file)
+        stat = oshb_file.stat()
+        os.utime(oshb_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        extract_hebrew_verse("Genesis", 1, 1, oshb_file)
+
+        stats = get_book_cache_stats()
+        assert stats["misses"] == 2
+        assert stats["entries"] == 1
+
+    def test_lru_eviction_respects_budget(self):
+        """Test that least recently used entries are evicted first."""
+        from src.verse_extractor import BookCache
+
+        cache = BookCache(max_bytes=100)
+        cache.put("a", 1, 40)
+        cache.put("b", 2, 40)
+        cache.get("a")
+        cache.put("c", 3, 40)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert cache.stats()["evictions"] == 1
+        assert cache.stats()["bytes"] == 80
+
+    def test_clear_resets_entries_and_counters(self, oshb_file):
+        """Test that clear_book_cache() empties the cache."""
+        from src.verse_extractor import extract_hebrew_verse, clear_book_cache, get_book_cache_stats
+
+        extract_hebrew_verse("Genesis", 1, 1, oshb_file)
+        clear_book_cache()
+
+        stats = get_book_cache_stats()
+        assert stats["entries"] == 0
+        assert stats["bytes"] == 0
+        assert stats["hits"] == stats["misses"] == stats["evictions"] == 0
+
+    def test_cache_is_thread_safe(self, oshb_file):
+        """Test concurrent lookups from several threads."""
+        from concurrent.futures import ThreadPoolExecutor
+        from src.verse_extractor import extract_hebrew_verse, get_book_cache_stats
+
+        refs = [(1, 1), (1, 2), (2, 1)] * 20
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(lambda r: extract_hebrew_verse("Genesis", r[0], r[1], oshb_file), refs))
+
+        assert all(results)
+        stats = get_book_cache_stats()
+        assert stats["hits"] + stats["misses"] == len(refs)
+        assert stats["entries"] == 1
+
+
+class TestIterBookVerses:
+    """Test suite for streaming whole-book extraction."""
+
+    @pytest.fixture
+    def oshb_sample_path(self):
+        """Path to OSHB sample XML fixture."""
+        return Path(__file__).parent.parent / "fixtures" / "oshb_sample.xml"
+
+    @pytest.fixture
+    def sblgnt_sample_path(self):
+        """Path to SBLGNT sample text fixture."""
+        return Path(__file__).parent.parent / "fixtures" / "sblgnt_sample.txt"
+
+    def test_iter_hebrew_book_yields_all_verses(self, oshb_sample_path, sblgnt_sample_path):
+        """Test that every OSHB verse is yielded in document order."""
+        from src.verse_extractor import iter_book_verses
+
+        refs = [(c, v) for c, v, _, _ in iter_book_verses("Genesis", oshb_sample_path, sblgnt_sample_path)]
+
+        assert refs == [(1, 1), (1, 2), (2, 1)]
+
+    def test_iter_hebrew_book_matches_extract(self, oshb_sample_path, sblgnt_sample_path):
+        """Test that streamed text matches extract_hebrew_verse()."""
+        from src.verse_extractor import iter_book_verses, extract_hebrew_verse
+
+        for chapter, verse, text, words in iter_book_verses("Genesis", oshb_sample_path, sblgnt_sample_path):
+            assert text == extract_hebrew_verse("Genesis", chapter, verse, oshb_sample_path, use_index=False)
+            assert text == " ".join(word["text"] for word in words)
+
+    def test_iter_hebrew_book_words_have_lemma_and_morph(self, oshb_sample_path, sblgnt_sample_path):
+        """Test that streamed Hebrew words keep lemma and morph attributes."""
+        from src.verse_extractor import iter_book_verses
+
+        _, _, _, words = next(iter_book_verses("Genesis", oshb_sample_path, sblgnt_sample_path))
+
+        assert words[1] == {"text": "בָּרָ֣א", "lemma": "b/1254 a", "morph": "HVqp3ms", "strongs": "H1254a"}
+
+    def test_iter_greek_morphgnt_groups_words(self, oshb_sample_path, sblgnt_sample_path):
+        """Test that MorphGNT word lines are grouped into one verse."""
+        from src.verse_extractor import iter_book_verses, extract_greek_verse
+
+        verses = list(iter_book_verses("Acts", oshb_sample_path, sblgnt_sample_path))
+
+        assert len(verses) == 1
+        chapter, verse, text, words = verses[0]
+        assert (chapter, verse) == (10, 44)
+        assert len(words) == 17
+        assert words[2] == {"text": "λαλοῦντος", "lemma": "λαλέω", "morph": "V- -PAP-GSM", "strongs": "G2980"}
+        assert text == extract_greek_verse("Acts", 10, 44, sblgnt_sample_path)
+
+    def test_iter_greek_tab_layout(self, tmp_path, oshb_sample_path):
+        """Test streaming a tab-delimited SBLGNT book file."""
+        from src.verse_extractor import iter_book_verses
+
+        text_file = tmp_path / "Acts.txt"
+        text_file.write_text("Acts 10:43\tτούτῳ πάντες\nActs 10:44\tἜτι λαλοῦντος\n", encoding="utf-8")
+
+        verses = [(c, v, t) for c, v, t, _ in iter_book_verses("Acts", oshb_sample_path, text_file)]
+
+        assert verses == [(10, 43, "τούτῳ πάντες"), (10, 44, "Ἔτι λαλοῦντος")]
+
+    def test_iter_book_verses_missing_source_yields_nothing(self, tmp_path):
+        """Test that a missing source file yields no verses."""
+        from src.verse_extractor import iter_book_verses
+
+        assert list(iter_book_verses("Genesis", tmp_path / "none.xml", tmp_path / "none.txt")) == []
+        assert list(iter_book_verses("InvalidBook", tmp_path, tmp_path)) == []
+
+    def test_iter_hebrew_book_clears_consumed_elements(self, oshb_sample_path, sblgnt_sample_path):
+        """Test that consumed verse elements are emptied as the stream advances."""
+        from lxml import etree
+        from src.verse_extractor import iter_book_verses
+
+        consumed = []
+        real_iterparse = etree.iterparse
+
+        def recording_iterparse(*args, **kwargs):
+            for event, elem in real_iterparse(*args, **kwargs):
+                consumed.append(elem)
+                yield event, elem
+
+        with patch("src.verse_extractor.etree.iterparse", side_effect=recording_iterparse):
+            verses = list(iter_book_verses("Genesis", oshb_sample_path, sblgnt_sample_path))
+
+        assert len(verses) == 3
+        assert all(len(elem) == 0 and not elem.attrib for elem in consumed)
+
+    def test_extract_chapter_verses(self, oshb_sample_path, sblgnt_sample_path):
+        """Test collecting one chapter's verses in a single pass."""
+        from src.verse_extractor import extract_chapter_verses
+
+        texts = extract_chapter_verses("Genesis", 1, oshb_sample_path, sblgnt_sample_path)
+
+        assert sorted(texts) == [1, 2]
+        assert "בְּרֵאשִׁ֖ית" in texts[1]
+
+    def test_extract_chapter_verses_missing_source_returns_empty(self, tmp_path):
+        """Test that a missing source gives an empty mapping."""
+        from src.verse_extractor import extract_chapter_verses
+
+        assert extract_chapter_verses("Genesis", 1, tmp_path / "none.xml", tmp_path / "none.txt") == {}
+
+
+
+class TestExtractVerseTokens:
+    """Test suite for structured interlinear token extraction."""
+
+    @pytest.fixture
+    def oshb_sample_path(self):
+        """Path to OSHB sample XML fixture."""
+        return Path(__file__).parent.parent / "fixtures" / "oshb_sample.xml"
+
+    @pytest.fixture
+    def sblgnt_sample_path(self):
+        """Path to SBLGNT sample text fixture."""
+        return Path(__file__).parent.parent / "fixtures" / "sblgnt_sample.txt"
+
+    def test_strongs_from_oshb_lemma(self):
+        """Test that prefixes are dropped and letter suffixes kept."""
+        from src.verse_extractor import strongs_from_oshb_lemma
+
+        assert strongs_from_oshb_lemma("c/d/b/7225") == "H7225"
+        assert strongs_from_oshb_lemma("b/1254 a") == "H1254a"
+        assert strongs_from_oshb_lemma("430") == "H430"
+        assert strongs_from_oshb_lemma(None) is None
+
+    def test_hebrew_tokens_keep_lemma_and_morph(self, oshb_sample_path, sblgnt_sample_path):
+        """Test per-word records for a Hebrew verse."""
+        from src.verse_extractor import extract_verse_tokens
+
+        tokens = extract_verse_tokens("Genesis", 1, 1, oshb_sample_path, sblgnt_sample_path)
+
+        assert len(tokens) == 7
+        assert tokens[0] == {
+            "position": 1,
+            "surface": "בְּרֵאשִׁ֖ית",
+            "lemma": "c/d/b/7225",
+            "strongs": "H7225",
+            "morph": "HR/Td/Ncfsa",
+        }
+        assert [t["position"] for t in tokens] == list(range(1, 8))
+
+    def test_hebrew_tokens_match_joined_text(self, oshb_sample_path, sblgnt_sample_path):
+        """Test that token surfaces rebuild the extracted verse text."""
+        from src.verse_extractor import extract_verse_tokens, extract_hebrew_verse
+
+        tokens = extract_verse_tokens("Genesis", 1, 2, oshb_sample_path, sblgnt_sample_path)
+
+        assert " ".join(t["surface"] for t in tokens) == extract_hebrew_verse("Genesis", 1, 2, oshb_sample_path)
+
+    def test_greek_tokens_from_morphgnt(self, oshb_sample_path, sblgnt_sample_path):
+        """Test per-word records for a MorphGNT verse."""
+        from src.verse_extractor import extract_verse_tokens
+
+        tokens = extract_verse_tokens("Acts", 10, 44, oshb_sample_path, sblgnt_sample_path)
+
+        assert len(tokens) == 17
+        assert tokens[2] == {
+            "position": 3,
+            "surface": "λαλοῦντος",
+            "lemma": "λαλέω",
+            "strongs": "G2980",
+            "morph": "V- -PAP-GSM",
+        }
+
+    def test_missing_verse_returns_none(self, oshb_sample_path, sblgnt_sample_path):
+        """Test that unknown verses give None."""
+        from src.verse_extractor import extract_verse_tokens
+
+        assert extract_verse_tokens("Genesis", 99, 1, oshb_sample_path, sblgnt_sample_path) is None
+        assert extract_verse_tokens("Acts", 10, 99, oshb_sample_path, sblgnt_sample_path) is None
@@ -0,0 +1,246 @@
+"""
+Unit tests for verse_store module.
+Tests the SQLite verse store, its query API and batched writes.
+"""
+
+import pytest
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+
+FIXTURES = Path(__file__).parent.parent / "fixtures"
+
+
+def make_verse(book_abbr, chapter, verse, tags=None, coordinates=None):
+    """Small verse record with optional tags and coordinates."""
+    data = {
+        "verse_id": f"{book_abbr}-{chapter}-{verse}",
+        "section_1_sacred_text": {"original_script": "text"},
+        "section_3_life_application": "Apply it.",
+    }
+    if coordinates is not None:
+        data["section_2_exegetical_synthesis"] = {
+            "geospatial_and_physical_geography": {"coordinates": coordinates}
+        }
+    if tags is not None:
+        data["tags"] = tags
+    return data
+
+
+class TestVerseStore:
+    """Test suite for the SQLite verse store."""
+
+    @pytest.fixture
+    def store(self, tmp_path):
+        """Store holding Acts 10:1-3, Acts 11:1 and Genesis 1:1."""
+        from src.verse_store import VerseStore
+
+        store = VerseStore(tmp_path / "verses.sqlite")
+        store.put_many([
+            ("Acts", 10, 1, make_verse("ACTS", 10, 1, coordinates={"lat": 32.5, "long": 34.9},
+                                       tags={"tier_1_foundational_theology": {"soteriology": ["grace"]}})),
+            ("Acts", 10, 2, make_verse("ACTS", 10, 2,
+                                       tags={"tier_2_applied_theology": {"prayer": ["grace", "alms"]}})),
+            ("Acts", 10, 3, make_verse("ACTS", 10, 3)),
+            ("Acts", 11, 1, make_verse("ACTS", 11, 1)),
+            ("Genesis", 1, 1, make_verse("GEN", 1, 1)),
+        ])
+        return store
+
+    def test_get_round_trips_json(self, store):
+        """Test that stored verses come back unchanged."""
+        assert store.get("acts", 10, 1) == make_verse(
+            "ACTS", 10, 1, coordinates={"lat": 32.5, "long": 34.9},
+            tags={"tier_1_foundational_theology": {"soteriology": ["grace"]}}
+        )
+        assert store.get_by_id("GEN-1-1")["verse_id"] == "GEN-1-1"
+        assert store.get("Acts", 12, 1) is None
+
+    def test_put_replaces_existing_verse_and_tags(self, store):
+        """Test that rewriting a verse replaces its row and tag rows."""
+        store.put("Acts", 10, 2, make_verse("ACTS", 10, 2, tags={"tier_2_applied_theology": {"prayer": ["fasting"]}}))
+
+        assert store.count() == 5
+        assert store.query(tag="alms") == []
+        assert [row["verse"] for row in store.query(tag="fasting")] == [2]
+
+    def test_range_scans(self, store):
+        """Test book, chapter span and verse span scans in canonical order."""
+        def ids(verses):
+            return [verse["verse_id"] for verse in verses]
+
+        assert ids(store.get_range("Acts")) == ["ACTS-10-1", "ACTS-10-2", "ACTS-10-3", "ACTS-11-1"]
+        assert ids(store.get_range("Acts", 11, 11)) == ["ACTS-11-1"]
+        assert ids(store.get_range("Acts", 10, 11, first_verse=2, last_verse=1)) == [
+            "ACTS-10-2", "ACTS-10-3", "ACTS-11-1"
+        ]
+        assert ids(store.get_range("Acts", 10, 10, first_verse=2, last_verse=2)) == ["ACTS-10-2"]
+
+        with pytest.raises(ValueError):
+            store.get_range("Nonexistent")
+
+    def test_query_by_columns_and_tags(self, store):
+        """Test queries on extracted columns and tag tiers."""
+        assert [row["verse_id"] for row in store.query(testament="OT")] == ["GEN-1-1"]
+        assert len(store.query(book="Acts", chapter=10)) == 3
+        assert [row["verse"] for row in store.query(tag="grace")] == [1, 2]
+        assert [row["verse"] for row in store.query(tier="tier_1_foundational_theology")] == [1]
+        assert [row["verse"] for row in store.query(category="prayer", tag="grace")] == [2]
+
+        located = store.query(has_coordinates=True)
+        assert [(row["verse_id"], row["lat"], row["long"]) for row in located] == [("ACTS-10-1", 32.5, 34.9)]
+
+    def test_batch_is_all_or_nothing(self, store):
+        """Test that an invalid reference rolls back the whole batch."""
+        with pytest.raises(ValueError):
+            store.put_many([
+                ("Acts", 12, 1, make_verse("ACTS", 12, 1)),
+                ("Acts", 99, 1, make_verse("ACTS", 99, 1)),
+            ])
+
+        assert store.get("Acts", 12, 1) is None
+        assert store.count() == 5
+
+    def test_import_tree(self, tmp_path):
+        """Test loading the verse file layout into the store."""
+        from src.data_writer import write_verse_json
+        from src.verse_store import VerseStore
+
+        with open(FIXTURES / "valid_verse.json") as f:
+            verse_data = json.load(f)
+        write_verse_json("Genesis", 1, 1, verse_data, tmp_path)
+        write_verse_json("Acts", 10, 44, make_verse("ACTS", 10, 44), tmp_path)
+
+        store = VerseStore(tmp_path / "verses.sqlite")
+
+        assert store.import_tree(tmp_path, batch_size=1) == 2
+        assert store.get("Genesis", 1, 1) == verse_data
+        assert store.query(book="Genesis")[0]["lat"] is not None
+
+
+class TestVerseBatchWriter:
+    """Test suite for batched verse store writes."""
+
+    def test_commits_when_batch_fills_and_on_flush(self, tmp_path):
+        """Test that verses are committed per batch, with the remainder on flush."""
+        from src.verse_store import VerseStore, VerseBatchWriter
+
+        store = VerseStore(tmp_path / "verses.sqlite")
+        writer = VerseBatchWriter(store, batch_size=2)
+
+        assert writer.add("Acts", 10, 1, make_verse("ACTS", 10, 1))
+        assert store.count() == 0
+        assert writer.add("Acts", 10, 2, make_verse("ACTS", 10, 2))
+        assert store.count() == 2
+
+        writer.add("Acts", 10, 3, make_verse("ACTS", 10, 3))
+        assert writer.pending == 1
+        assert writer.flush() is True
+        assert store.count() == 3
+
+    def test_failed_commit_keeps_batch(self, tmp_path):
+        """Test that a failed commit leaves the verses queued for retry."""
+        import sqlite3
+        from src.verse_store import VerseStore, VerseBatchWriter
+
+        store = VerseStore(tmp_path / "verses.sqlite")
+        writer = VerseBatchWriter(store, batch_size=10)
+        writer.add("Acts", 10, 1, make_verse("ACTS", 10, 1))
+
+        with patch.object(store, 'put_many', side_effect=sqlite3.OperationalError("locked")):
+            assert writer.flush() is False
+        assert writer.pending == 1
+
+        assert writer.flush() is True
+        assert store.count() == 1
+
+    def test_on_commit_reports_only_after_commit(self, tmp_path):
+        """Test that queued verses are reported when committed, not when queued."""
+        import sqlite3
+        from src.verse_store import VerseStore, VerseBatchWriter
+
+        store = VerseStore(tmp_path / "verses.sqlite")
+        writer = VerseBatchWriter(store, batch_size=2)
+        outcomes = []
+
+        writer.add("Acts", 10, 1, make_verse("ACTS", 10, 1), on_commit=lambda ok: outcomes.append((1, ok)))
+        assert outcomes == []
+
+        with patch.object(store, 'put_many', side_effect=sqlite3.OperationalError("locked")):
+            assert writer.add("Acts", 10, 2, make_verse("ACTS", 10, 2), on_commit=lambda ok: outcomes.append((2, ok)))
+        assert outcomes == []
+        assert writer.pending == 2
+
+        assert writer.flush() is True
+        assert outcomes == [(1, True), (2, True)]
+
+    def test_fail_pending_reports_failure(self, tmp_path):
+        """Test that dropped verses are reported as failed."""
+        from src.verse_store import VerseStore, VerseBatchWriter
+
+        writer = VerseBatchWriter(VerseStore(tmp_path / "verses.sqlite"), batch_size=10)
+        outcomes = []
+        writer.add("Acts", 10, 1, make_verse("ACTS", 10, 1), on_commit=outcomes.append)
+
+        assert writer.fail_pending() == 1
+        assert outcomes == [False]
+        assert writer.pending == 0
+
+    def test_process_chapter_writes_to_store(self, tmp_path):
+        """Test that batch processing targets the store when configured."""
+        from src.batch_processor import process_chapter
+        from src.verse_store import VerseStore, VerseBatchWriter
+
+        store = VerseStore(tmp_path / "verses.sqlite")
+        config = {
+            "base_path": tmp_path,
+            "oshb_path": Path("/fake"),
+            "sblgnt_path": Path("/fake"),
+            "api_key": "key",
+            "study_prompt_path": Path("/fake/prompt.md"),
+            "verse_writer": VerseBatchWriter(store, batch_size=4),
+        }
+
+        def generate(book, chapter, verse, *args, **kwargs):
+            return make_verse("RUTH", chapter, verse)
+
+        with patch('src.batch_processor.extract_chapter_verses', return_value={}):
+            with patch('src.batch_processor.generate_verse_exegesis', side_effect=generate):
+                with patch('src.batch_processor.validate_verse_json', return_value=True):
+                    with patch('src.batch_processor.write_verse_json') as mock_write:
+                        results = process_chapter("Ruth", 1, config, workers=3)
+
+        assert results == {"total": 22, "successful": 22, "failed": 0}
+        assert store.count() == 22
+        assert config["verse_writer"].pending == 0
+        mock_write.assert_not_called()
+
+    def test_process_chapter_counts_uncommitted_verses_as_failed(self, tmp_path):
+        """Test that a failing final commit is not reported as success."""
+        import sqlite3
+        from src.batch_processor import process_chapter
+        from src.verse_store import VerseStore, VerseBatchWriter
+
+        store = VerseStore(tmp_path / "verses.sqlite")
+        config = {
+            "base_path": tmp_path,
+            "oshb_path": Path("/fake"),
+            "sblgnt_path": Path("/fake"),
+            "api_key": "key",
+            "study_prompt_path": Path("/fake/prompt.md"),
+            "verse_writer": VerseBatchWriter(store, batch_size=10),
+        }
+
+        def generate(book, chapter, verse, *args, **kwargs):
+            return make_verse("RUTH", chapter, verse)
+
+        with patch('src.batch_processor.extract_chapter_verses', return_value={}):
+            with patch('src.batch_processor.generate_verse_exegesis', side_effect=generate):
+                with patch('src.batch_processor.validate_verse_json', return_value=True):
+                    with patch.object(store, 'put_many', side_effect=sqlite3.OperationalError("disk I/O error")):
+                        with patch('src.batch_processor.create_checkpoint') as mock_checkpoint:
+                            results = process_chapter("Ruth", 1, config)
+
+        assert results == {"total": 22, "successful": 0, "failed": 22}
+        assert not any(call.args[0]["completed"] for call in mock_checkpoint.call_args_list)
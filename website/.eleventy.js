@@ -14,6 +14,10 @@ module.exports = function(eleventyConfig) {
 
   // Don't need to copy data directory as it's read at build time by _data files
 
+  // Tag shards (python3 src/tag_indexer.py --shards) are fetched by pages on demand,
+  // so copy them as-is instead of loading them as global data
+  eleventyConfig.addPassthroughCopy("tags");
+
   // Set input/output directories
   return {
     dir: {